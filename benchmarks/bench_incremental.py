@@ -0,0 +1,48 @@
+"""
+Benchmark incremental export of figures with many subplots
+
+For a grid of subplots of which the data of a single line are updated
+between exports, this reports the time taken by a full export with
+``fig_to_dict``, and by an incremental export with
+``fig_to_dict(fig, incremental=True)``, which only exports again the
+changed subplot.
+
+Usage: python benchmarks/bench_incremental.py [numbers of subplots...]
+"""
+import sys
+import time
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import mpld3
+
+
+def refresh_time(fig, lines, incremental, repeat):
+    mpld3.fig_to_dict(fig, incremental=incremental)
+    x = np.linspace(0, 10, len(lines[0].get_xdata()))
+    t0 = time.time()
+    for i in range(repeat):
+        lines[i % len(lines)].set_ydata(np.sin(x + i))
+        mpld3.fig_to_dict(fig, incremental=incremental)
+    return (time.time() - t0) / repeat
+
+
+def main(sizes, points=1000, repeat=10):
+    print("{0:>8} {1:>12} {2:>12} {3:>8}".format(
+        "subplots", "full", "incremental", "speedup"))
+    for n in sizes:
+        fig, axes = plt.subplots(n // 5, 5, figsize=(10, 2 * n // 5))
+        x = np.linspace(0, 10, points)
+        lines = [ax.plot(x, np.sin(x))[0] for ax in axes.flat]
+        t_full = refresh_time(fig, lines, False, repeat)
+        t_incremental = refresh_time(fig, lines, True, repeat)
+        plt.close(fig)
+        print("{0:>8} {1:>11.1f}ms {2:>11.1f}ms {3:>7.1f}x".format(
+            n, 1E3 * t_full, 1E3 * t_incremental, t_full / t_incremental))
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [10, 40])
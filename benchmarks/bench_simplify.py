@@ -0,0 +1,70 @@
+"""
+Benchmark path simplification on scaled-up contourf plots
+
+This uses the plot of ``mpld3/test_plots/test_contourf.py`` on increasingly
+fine grids, and reports for each simplification tolerance (in pixels) the
+number of exported vertices, the size of the JSON and the export time.
+
+Usage: python benchmarks/bench_simplify.py [grid sizes...]
+"""
+import sys
+import json
+import time
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import mpld3
+from mpld3._display import NumpyEncoder
+from mpld3.test_plots.test_contourf import bivariate_normal
+
+TOLERANCES = [None, 0.1, 0.5, 1.0]
+
+
+def create_plot(n):
+    x = np.linspace(-3.0, 3.0, n)
+    y = np.linspace(-2.0, 2.0, n)
+    X, Y = np.meshgrid(x, y)
+    Z1 = bivariate_normal(X, Y, 1.0, 1.0, 0.0, 0.0)
+    Z2 = bivariate_normal(X, Y, 1.5, 0.5, 1, 1)
+    Z = 10.0 * (Z2 - Z1)
+
+    fig, ax = plt.subplots()
+    ax.contourf(X, Y, Z, 30)
+    return fig
+
+
+def count_vertices(fig_dict):
+    count = 0
+    for ax in fig_dict['axes']:
+        for collection in ax['collections']:
+            paths = collection['paths']
+            if isinstance(paths, dict):
+                paths = paths['palette']
+            for vertices, codes in paths:
+                if isinstance(vertices, dict):
+                    count += vertices['shape'][0]
+                else:
+                    count += len(vertices)
+    return count
+
+
+def main(sizes):
+    print("{0:>6} {1:>9} {2:>10} {3:>12} {4:>9}".format(
+        "grid", "tolerance", "vertices", "json bytes", "seconds"))
+    for n in sizes:
+        fig = create_plot(n)
+        for tolerance in TOLERANCES:
+            t0 = time.time()
+            fig_dict = mpld3.fig_to_dict(fig, simplify_tolerance=tolerance)
+            elapsed = time.time() - t0
+            size = len(json.dumps(fig_dict, cls=NumpyEncoder))
+            print("{0:>6} {1:>9} {2:>10} {3:>12} {4:>9.3f}".format(
+                n, str(tolerance), count_vertices(fig_dict), size, elapsed))
+        plt.close(fig)
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [30, 100, 300, 1000])
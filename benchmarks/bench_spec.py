@@ -0,0 +1,68 @@
+"""
+Benchmark mpld3.spec against the export of matplotlib figures
+
+For simple charts (two lines and a scatter plot with axis labels, a title
+and a grid) of increasing numbers of points, this reports the time taken
+to produce the figure dictionary by building it with :mod:`mpld3.spec` and
+by plotting it with matplotlib and exporting it with ``fig_to_dict``, and
+the resulting throughput ratio.
+
+Usage: python benchmarks/bench_spec.py [numbers of points...]
+"""
+import sys
+import time
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import mpld3
+from mpld3 import spec
+
+
+def matplotlib_chart(x, y1, y2):
+    fig, ax = plt.subplots()
+    ax.plot(x, y1)
+    ax.plot(x, y2)
+    ax.scatter(x[::10], y1[::10], s=20)
+    ax.set_xlabel("time")
+    ax.set_ylabel("value")
+    ax.set_title("chart")
+    ax.grid(True)
+    fig_dict = mpld3.fig_to_dict(fig)
+    plt.close(fig)
+    return fig_dict
+
+
+def spec_chart(x, y1, y2):
+    fig = spec.Figure()
+    ax = fig.add_axes(xlabel="time", ylabel="value", title="chart",
+                      grid=True)
+    ax.line(x, y1)
+    ax.line(x, y2)
+    ax.scatter(x[::10], y1[::10], s=20)
+    return fig.to_dict()
+
+
+def timeit(func, args, repeat):
+    t0 = time.time()
+    for i in range(repeat):
+        func(*args)
+    return (time.time() - t0) / repeat
+
+
+def main(sizes, repeat=20):
+    print("{0:>8} {1:>12} {2:>12} {3:>8}".format(
+        "points", "matplotlib", "spec", "speedup"))
+    for n in sizes:
+        x = np.linspace(0, 10, n)
+        args = (x, np.sin(x), np.cos(x))
+        t_mpl = timeit(matplotlib_chart, args, repeat)
+        t_spec = timeit(spec_chart, args, repeat)
+        print("{0:>8} {1:>11.2f}ms {2:>11.2f}ms {3:>7.1f}x".format(
+            n, 1E3 * t_mpl, 1E3 * t_spec, t_mpl / t_spec))
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [100, 1000, 10000])
@@ -0,0 +1,76 @@
+"""
+Benchmark the scaling of exports across threads
+
+This reports the throughput of ``fig_to_html`` for a simple chart, and that
+of the parts of an export which release the GIL (the NumPy reductions and
+the zlib compression of images), when run from increasing numbers of
+threads.  As matplotlib is not thread-safe, figures are drawn and crawled
+one at a time, so that only the rest of an export may scale.
+
+Usage: python benchmarks/bench_threads.py [numbers of threads...]
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import mpld3
+from mpld3._tiles import block_mean
+from mpld3.spec import png_bytes
+
+
+def chart():
+    fig, ax = plt.subplots()
+    x = np.linspace(0, 10, 1000)
+    ax.plot(x, np.sin(x))
+    ax.scatter(x[::10], np.cos(x[::10]), c=x[::10])
+    ax.set_title("chart")
+    return fig
+
+
+def export(fig):
+    mpld3.fig_to_html(fig)
+
+
+def encode(rgba):
+    png_bytes(block_mean(rgba))
+
+
+def throughput(func, args, n_threads, n_tasks):
+    """Tasks per second of func(*args) run n_tasks times over n_threads"""
+    def run():
+        for i in range(n_tasks // n_threads):
+            func(*args)
+
+    threads = [threading.Thread(target=run) for i in range(n_threads)]
+    t0 = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return n_threads * (n_tasks // n_threads) / (time.time() - t0)
+
+
+def main(thread_counts, n_tasks=32):
+    fig = chart()
+    rgba = np.random.RandomState(0).uniform(size=(1024, 1024, 4))
+    benchmarks = [("fig_to_html", export, (fig,)),
+                  ("encoding", encode, (rgba,))]
+    print("{0:>12} {1:>8} {2:>12} {3:>8}".format(
+        "task", "threads", "tasks/s", "speedup"))
+    for name, func, args in benchmarks:
+        base = None
+        for n_threads in thread_counts:
+            rate = throughput(func, args, n_threads, n_tasks)
+            base = base or rate
+            print("{0:>12} {1:>8} {2:>12.1f} {3:>7.2f}x".format(
+                name, n_threads, rate, rate / base))
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [1, 2, 4, 8])
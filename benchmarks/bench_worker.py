@@ -0,0 +1,85 @@
+"""
+Benchmark exports in warm worker processes against fresh processes
+
+This reports the time per figure of exporting pickled charts in a new
+Python process each, as a batch job would, and in a pool of warm workers
+started once with :class:`mpld3.worker.WorkerPool`, along with the pool's
+latency percentiles.
+
+Usage: python benchmarks/bench_worker.py [number of figures]
+"""
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from mpld3.worker import WorkerPool, serve_stream
+
+COLD_EXPORT = """
+import pickle, sys
+import matplotlib
+matplotlib.use('Agg')
+import mpld3
+with open(sys.argv[1], 'rb') as f:
+    mpld3.fig_to_html(pickle.load(f))
+"""
+
+
+def chart():
+    fig, ax = plt.subplots()
+    x = np.linspace(0, 10, 1000)
+    ax.plot(x, np.sin(x))
+    ax.scatter(x[::10], np.cos(x[::10]), c=x[::10])
+    ax.set_title("chart")
+    return fig
+
+
+def main(n_figures=20):
+    fig = chart()
+    handle, path = tempfile.mkstemp(suffix=".pkl")
+    with os.fdopen(handle, 'wb') as f:
+        pickle.dump(fig, f)
+    plt.close(fig)
+
+    try:
+        t0 = time.time()
+        for i in range(n_figures):
+            subprocess.check_call([sys.executable, "-c", COLD_EXPORT, path])
+        cold = (time.time() - t0) / n_figures
+
+        pool = WorkerPool()
+        requests = b"".join(json.dumps({"id": i, "path": path}).encode() +
+                            b"\n" for i in range(n_figures))
+        # start the workers before timing, as a long-running service would
+        serve_stream(pool, io.BytesIO(requests[:requests.index(b"\n")]),
+                     io.BytesIO())
+        t0 = time.time()
+        serve_stream(pool, io.BytesIO(requests), io.BytesIO())
+        warm = (time.time() - t0) / n_figures
+        stats = pool.stats()
+        pool.shutdown()
+    finally:
+        os.remove(path)
+
+    print("{0:>24} {1:>10}".format("", "ms/figure"))
+    print("{0:>24} {1:>10.1f}".format("fresh process", 1000 * cold))
+    print("{0:>24} {1:>10.1f}".format("warm pool", 1000 * warm))
+    print("{0:>24} {1:>10.1f}".format("warm export p50",
+                                      stats['export_ms']['p50']))
+    print("pool latencies (ms): " + ", ".join(
+        "{0} p50={1:.1f} p99={2:.1f}".format(key, stats[key]['p50'],
+                                             stats[key]['p99'])
+        for key in ['wait_ms', 'export_ms', 'total_ms']))
+
+
+if __name__ == '__main__':
+    main(*[int(n) for n in sys.argv[1:]])
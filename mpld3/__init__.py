@@ -19,6 +19,54 @@ Functions: General Use
 :func:`save_json`
     save a JSON representation of a figure to file
 
+:func:`set_cache_dir`
+    cache the exports of figures on disk, for re-runs producing them again
+
+:func:`build_bundle`
+    build an mpld3 library holding only the elements and plugins figures use
+
+
+Functions: Large Data
+---------------------
+:func:`lazy_line`
+    plot a line from chunked data too large for memory, e.g. a memmap
+
+:func:`lazy_scatter`
+    scatter plot chunked data too large for memory
+
+:mod:`spec`
+    build figures directly from arrays, without matplotlib figures
+
+:class:`Template`
+    export a figure once, and render it repeatedly with new data
+
+
+Functions: asyncio
+------------------
+:func:`fig_to_html_async`
+    convert a figure to an html string without blocking the event loop
+
+:func:`fig_to_html_chunks`
+    the html of a figure in chunks, for streaming without blocking
+
+:func:`serve_async`
+    serve figures from the running event loop
+
+
+Functions: Web Applications
+---------------------------
+:func:`wsgi_app`
+    a WSGI application serving the figures of a :class:`FigureRegistry`
+
+:func:`asgi_app`
+    an ASGI application serving the figures of a :class:`FigureRegistry`
+
+:func:`serve_gallery`
+    serve a gallery of figure scripts or pickles, exported on first view
+
+:mod:`worker`
+    a pool of warm export processes, run with ``python -m mpld3.worker``
+
 
 Functions: IPython Notebook
 ---------------------------
@@ -33,6 +81,7 @@ Functions: IPython Notebook
 """
 
 import os
+import sys
 import matplotlib
 
 if os.environ.get('HIDE_PLOTS', False):
@@ -47,9 +96,27 @@ SCREENSHOT_BIN = os.path.join(BIN_PATH, "screenshot")
 __all__ = ["__version__",
            "fig_to_html", "fig_to_dict", "fig_to_d3", "display_d3",
            "display", "show_d3", "show", "save_html", "save_json",
-           "enable_notebook", "disable_notebook", "plugins", "urls"]
+           "enable_notebook", "disable_notebook", "plugins", "urls",
+           "ChunkedSource", "lazy_line", "lazy_scatter", "spec",
+           "Template", "FigureRegistry", "wsgi_app", "set_cache_dir",
+           "build_bundle"]
 
 from .__about__ import __version__
 from . import plugins
 from . import urls
 from ._display import *
+from ._lazy import ChunkedSource, lazy_line, lazy_scatter
+from . import spec
+from ._template import Template
+from ._app import FigureRegistry, wsgi_app
+from ._cache import set_cache_dir
+from ._bundle import build_bundle
+
+if sys.version_info >= (3, 5):
+    from ._gallery import gallery_app, serve_gallery
+    __all__ += ["gallery_app", "serve_gallery"]
+if sys.version_info >= (3, 7):
+    from ._async import (fig_to_html_async, fig_to_html_chunks, serve_async,
+                         asgi_app)
+    __all__ += ["fig_to_html_async", "fig_to_html_chunks", "serve_async",
+                "asgi_app"]
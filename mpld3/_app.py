@@ -0,0 +1,432 @@
+"""
+WSGI application
+================
+
+Serving of figures in production, from any WSGI server (or ASGI server, see
+:func:`mpld3.asgi_app`).  For each figure of a :class:`FigureRegistry`, the
+application serves
+
+``/<name>``
+    an HTML page showing the figure
+``/<name>.json``
+    the JSON representation of the figure, as produced by ``fig_to_dict``
+``/<name>/data/<label>``
+    each dataset of the figure, as the little-endian float64 bytes of its
+    [N, M] array, whose shape is given by the ``X-Array-Shape`` header
+
+along with an index of the figures at ``/``, and the d3 and mpld3
+libraries at ``/assets/d3.js`` and ``/assets/mpld3.js``.  Figures are
+exported on first request, and their exports kept in a least recently used
+cache of bounded size.  Responses carry ETags and cache headers, text
+responses are gzip-compressed for clients accepting it, and datasets can
+be requested by byte ranges.
+"""
+import collections
+import hashlib
+import json
+import re
+import threading
+import traceback
+import zlib
+
+import numpy as np
+from matplotlib.figure import Figure
+
+try:
+    # Python 3.x
+    from urllib.parse import quote
+except ImportError:
+    # Python 2.x
+    from urllib import quote
+
+from . import urls
+from .mpld3renderer import MPLD3Renderer, MPLD3Exporter
+from ._display import NumpyEncoder, dict_to_html
+from ._server import html_page
+
+__all__ = ["FigureRegistry", "wsgi_app"]
+
+STATUS = {200: "200 OK",
+          206: "206 Partial Content",
+          304: "304 Not Modified",
+          404: "404 Not Found",
+          405: "405 Method Not Allowed",
+          416: "416 Range Not Satisfiable",
+          500: "500 Internal Server Error"}
+
+# text responses smaller than this are not worth compressing
+MIN_COMPRESSED_SIZE = 1024
+
+ASSETS = {"/assets/d3.js": urls.D3_LOCAL,
+          "/assets/mpld3.js": urls.MPLD3_LOCAL}
+ASSETS_CACHE_CONTROL = "public, max-age=3600"
+FIGURES_CACHE_CONTROL = "no-cache"
+
+
+def gzip_compress(data):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def parse_range(header, size):
+    """The (start, stop) bytes of a Range header
+
+    Returns None for headers which should be ignored, such as those
+    requesting several ranges, and raises a ValueError for ranges which
+    can't be satisfied.
+    """
+    match = re.match(r"^bytes=(\d*)-(\d*)$", header.strip())
+    if match is None or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if not start:
+        start, stop = max(size - int(end), 0), size
+    else:
+        start = int(start)
+        stop = min(int(end) + 1, size) if end else size
+    if start >= stop:
+        raise ValueError("Range not satisfiable")
+    return start, stop
+
+
+class Content(object):
+    """A response body, with its ETag and compressed version"""
+    def __init__(self, body, content_type, cache_control=FIGURES_CACHE_CONTROL,
+                 headers=None, ranges=False):
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.headers = headers or []
+        self.ranges = ranges
+        self.etag = '"{0}"'.format(hashlib.sha1(body).hexdigest())
+        self.gzipped = None
+        if (len(body) >= MIN_COMPRESSED_SIZE and not ranges and
+                content_type.split('/')[0] in ('text', 'application')):
+            self.gzipped = gzip_compress(body)
+
+    @property
+    def nbytes(self):
+        return len(self.body) + len(self.gzipped or b"")
+
+    def response(self, headers):
+        """The (status, headers, body) of a response to a GET request"""
+        response_headers = [("ETag", self.etag),
+                            ("Cache-Control", self.cache_control),
+                            ("Vary", "Accept-Encoding")]
+        if self.ranges:
+            response_headers.append(("Accept-Ranges", "bytes"))
+        response_headers.extend(self.headers)
+
+        if_none_match = headers.get('if-none-match', '')
+        if if_none_match.strip() == '*' or self.etag in [
+                tag.strip() for tag in if_none_match.split(',')]:
+            return STATUS[304], response_headers, b""
+
+        status, body = STATUS[200], self.body
+        if self.ranges and 'range' in headers:
+            try:
+                byte_range = parse_range(headers['range'], len(body))
+            except ValueError:
+                response_headers.append(
+                    ("Content-Range", "bytes */{0}".format(len(body))))
+                return STATUS[416], response_headers, b""
+            if byte_range is not None:
+                start, stop = byte_range
+                response_headers.append(
+                    ("Content-Range", "bytes {0}-{1}/{2}".format(
+                        start, stop - 1, len(body))))
+                status, body = STATUS[206], body[start:stop]
+        elif (self.gzipped is not None and
+                'gzip' in headers.get('accept-encoding', '')):
+            response_headers.append(("Content-Encoding", "gzip"))
+            body = self.gzipped
+
+        response_headers.extend([("Content-Type", self.content_type),
+                                 ("Content-Length", str(len(body)))])
+        return status, response_headers, body
+
+
+def export_figure(figure):
+    """The figure dictionary, extra CSS and extra JavaScript of a figure
+
+    The figure may be a matplotlib figure, a :class:`mpld3.spec.Figure`,
+    a :class:`mpld3.Template` or a figure dictionary.
+    """
+    from .spec import Figure as SpecFigure
+    from ._template import Template
+
+    if isinstance(figure, Figure):
+        renderer = MPLD3Renderer()
+        MPLD3Exporter(renderer, close_mpl=False).run(figure)
+        return renderer.finished_figures[0][1:]
+    elif isinstance(figure, SpecFigure):
+        return (figure.to_dict(),
+                "".join(plugin.css() for plugin in figure.plugins),
+                "".join(plugin.javascript() for plugin in figure.plugins))
+    elif isinstance(figure, Template):
+        return figure.render_dict(), figure.extra_css, figure.extra_js
+    elif isinstance(figure, dict):
+        return figure, "", ""
+    raise ValueError("Cannot serve {0!r}: figures must be matplotlib "
+                     "figures, mpld3.spec figures, templates or figure "
+                     "dictionaries".format(figure))
+
+
+class FigureExport(object):
+    """The page, JSON and binary datasets of an exported figure"""
+    def __init__(self, figure):
+        figure_dict, extra_css, extra_js = export_figure(figure)
+        html = dict_to_html(figure_dict, extra_css, extra_js,
+                            d3_url="assets/d3.js",
+                            mpld3_url="assets/mpld3.js",
+                            template_type="simple")
+        self.page = Content(html_page(html).encode('utf-8'),
+                            "text/html; charset=utf-8")
+        self.json = Content(
+            json.dumps(figure_dict, cls=NumpyEncoder).encode('utf-8'),
+            "application/json")
+        self.data = {}
+        for label, dataset in figure_dict['data'].items():
+            dataset = np.asarray(dataset, dtype='<f8')
+            self.data[label] = Content(
+                dataset.tobytes(), "application/octet-stream",
+                headers=[("X-Array-Shape",
+                          ",".join(map(str, dataset.shape)))],
+                ranges=True)
+
+    @property
+    def nbytes(self):
+        return (self.page.nbytes + self.json.nbytes +
+                sum(content.nbytes for content in self.data.values()))
+
+
+class FigureRegistry(object):
+    """The figures served by :func:`wsgi_app` and :func:`mpld3.asgi_app`
+
+    Parameters
+    ----------
+    figures : dict or callable (optional)
+        The figures by name: matplotlib figures, :class:`mpld3.spec.Figure`
+        figures, :class:`mpld3.Template` templates or figure dictionaries,
+        or functions returning one of these, called on first request.
+        Alternatively, a function of the name returning the figure, and
+        raising a KeyError or returning None for unknown names.  Names must
+        not contain "/".
+    max_bytes : int (optional)
+        The size of the exports to keep in memory.  When exceeded, the least
+        recently requested exports are discarded.
+
+    Subclasses may override :meth:`get_figure` and :meth:`names` to look up
+    figures elsewhere.  The exports of matplotlib figures are kept until
+    the figures are registered again or invalidated, so figures modified
+    after their first request should be invalidated.
+    """
+    def __init__(self, figures=None, max_bytes=2 ** 26):
+        self.figures = {} if figures is None else figures
+        self.max_bytes = max_bytes
+        self.exports = collections.OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.RLock()
+
+    def register(self, name, figure):
+        """Add or replace a figure"""
+        if '/' in name:
+            raise ValueError("Figure names must not contain '/'")
+        self.figures[name] = figure
+        self.invalidate(name)
+
+    def invalidate(self, name=None):
+        """Discard the export of a figure, or of all figures"""
+        with self.lock:
+            names = list(self.exports) if name is None else [name]
+            for name in names:
+                if name in self.exports:
+                    self.nbytes -= self.exports.pop(name).nbytes
+
+    def names(self):
+        """The names of the figures, or None if they can't be listed"""
+        if callable(self.figures):
+            return None
+        return sorted(self.figures)
+
+    def lookup(self, name):
+        """The figure, or function returning it, registered under a name
+
+        Returns None if there is none.
+        """
+        if not callable(self.figures):
+            return self.figures.get(name)
+        try:
+            return self.figures(name)
+        except KeyError:
+            return None
+
+    def get_figure(self, name):
+        """The figure of the given name, or None if there is none"""
+        figure = self.lookup(name)
+        if callable(figure):
+            figure = figure()
+        return figure
+
+    def export(self, name):
+        """The export of the figure of the given name, or None if there is
+        none"""
+        with self.lock:
+            if name in self.exports:
+                figure_export = self.exports.pop(name)
+                self.exports[name] = figure_export
+                return figure_export
+
+        # figures are exported outside the lock, so that requests for
+        # other figures aren't held up
+        figure = self.get_figure(name)
+        if figure is None:
+            return None
+        figure_export = FigureExport(figure)
+        with self.lock:
+            if name in self.exports:
+                self.nbytes -= self.exports.pop(name).nbytes
+            self.exports[name] = figure_export
+            self.nbytes += figure_export.nbytes
+            while self.nbytes > self.max_bytes and len(self.exports) > 1:
+                self.nbytes -= self.exports.popitem(last=False)[1].nbytes
+        return figure_export
+
+
+def as_registry(registry):
+    if isinstance(registry, FigureRegistry):
+        return registry
+    return FigureRegistry(registry)
+
+
+asset_contents = {}
+
+
+def index_page(registry):
+    names = registry.names()
+    if names is None:
+        items = ""
+    else:
+        items = "".join('<li><a href="{0}">{1}</a></li>\n'.format(
+            quote(name.encode('utf-8')), name.replace('&', '&amp;')
+            .replace('<', '&lt;')) for name in names)
+    return Content(html_page("<ul>\n{0}</ul>\n".format(items))
+                   .encode('utf-8'), "text/html; charset=utf-8")
+
+
+def asset_content(path):
+    """The content of a bundled library, raising a KeyError if there is none"""
+    if path not in asset_contents:
+        with open(ASSETS[path], 'rb') as f:
+            asset_contents[path] = Content(
+                f.read(), "application/javascript",
+                cache_control=ASSETS_CACHE_CONTROL)
+    return asset_contents[path]
+
+
+def find_content(registry, path):
+    """The content at a path, or None if there is none"""
+    if path == '/':
+        return index_page(registry)
+    if path in ASSETS:
+        return asset_content(path)
+
+    parts = path[1:].split('/')
+    if len(parts) == 3 and parts[1] == 'data':
+        name, key = parts[0], 'data'
+    elif len(parts) == 1 and parts[0].endswith('.json'):
+        name, key = parts[0][:-len('.json')], 'json'
+    elif len(parts) == 1:
+        name, key = parts[0], 'page'
+    else:
+        return None
+
+    # only figures missing from the registry are not found: errors of
+    # their export are errors of the server
+    figure_export = registry.export(name)
+    if figure_export is None:
+        return None
+    if key == 'data':
+        return figure_export.data.get(parts[2])
+    return getattr(figure_export, key)
+
+
+def respond(registry, method, path, headers):
+    """The (status, headers, body) of the response to a request
+
+    Parameters
+    ----------
+    registry : FigureRegistry
+        The figures served.
+    method : string
+        The request method.
+    path : string
+        The unquoted path of the request, relative to the application.
+    headers : dict
+        The request headers, by lowercase name.
+    """
+    if method not in ('GET', 'HEAD'):
+        return (STATUS[405], [("Allow", "GET, HEAD"),
+                              ("Content-Type", "text/plain"),
+                              ("Content-Length", "0")], b"")
+    content = find_content(registry, path or '/')
+    if content is None:
+        body = STATUS[404].encode()
+        return (STATUS[404], [("Content-Type", "text/plain"),
+                              ("Content-Length", str(len(body)))], body)
+    status, response_headers, body = content.response(headers)
+    if method == 'HEAD':
+        body = b""
+    return status, response_headers, body
+
+
+def wsgi_app(registry=None):
+    """A WSGI application serving figures
+
+    Parameters
+    ----------
+    registry : FigureRegistry, dict or callable (optional)
+        The figures to serve, as a :class:`FigureRegistry`, or as the
+        figures argument of one.  Figures may be added later on with
+        ``app.registry.register(name, figure)``.
+
+    Returns
+    -------
+    app : callable
+        The WSGI application.  See the :mod:`mpld3._app` module for the
+        paths served.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import mpld3
+    >>> fig, ax = plt.subplots()
+    >>> lines = ax.plot(range(10))
+    >>> app = mpld3.wsgi_app({"line": fig})  # e.g. gunicorn module:app
+    """
+    registry = as_registry(registry)
+
+    def app(environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not isinstance(path, bytes):
+            # WSGI paths are latin-1 decoded bytes
+            path = path.encode('latin-1')
+        headers = dict((key[5:].replace('_', '-').lower(), value)
+                       for key, value in environ.items()
+                       if key.startswith('HTTP_'))
+        try:
+            status, response_headers, body = respond(
+                registry, environ['REQUEST_METHOD'], path.decode('utf-8'),
+                headers)
+        except Exception:
+            # the traceback goes to the server's log, not to clients
+            environ['wsgi.errors'].write(traceback.format_exc())
+            body = STATUS[500][4:].encode()
+            status, response_headers = STATUS[500], [
+                ("Content-Type", "text/plain"),
+                ("Content-Length", str(len(body)))]
+        start_response(status, response_headers)
+        return [body]
+
+    app.registry = registry
+    return app
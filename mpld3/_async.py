@@ -0,0 +1,312 @@
+"""
+asyncio support
+===============
+
+Export and serving of figures from an asyncio event loop, and the ASGI
+counterpart of :func:`mpld3.wsgi_app`.  Figures are exported in an
+executor, so that the event loop isn't blocked while matplotlib draws them,
+and responses are written in chunks, waiting for each to be sent, so that a
+single event loop can serve many concurrent requests without a thread per
+request.  :func:`fig_to_html_chunks` yields the HTML of a figure in chunks,
+so that it can be streamed without building the page as one string.
+
+This module requires Python 3.7 or later.
+"""
+import asyncio
+import functools
+import inspect
+import random
+import re
+import uuid
+
+from .utils import get_id
+from ._display import fig_to_html, export_json, json_to_html
+from ._server import html_page, find_open_port
+from ._app import as_registry, respond
+
+__all__ = ["fig_to_html_async", "fig_to_html_chunks", "serve_async",
+           "asgi_app"]
+
+# the arguments of fig_to_html which concern its HTML, not the export
+HTML_ARGUMENTS = ['d3_url', 'mpld3_url', 'no_extras', 'template_type',
+                  'use_http', 'include_libraries', 'lazy']
+
+STATUS_REASONS = {200: "OK",
+                  404: "Not Found",
+                  500: "Internal Server Error",
+                  501: "Not Implemented"}
+
+
+async def fig_to_html_async(fig, executor=None, **kwargs):
+    """Output html representation of the figure, from an event loop
+
+    The figure is exported in an executor, so that the event loop can run
+    other tasks in the meantime.  As matplotlib is not thread-safe, exports
+    draw figures one at a time, while the rest of each export runs
+    concurrently.
+
+    Parameters
+    ----------
+    fig : matplotlib figure
+        The figure to display
+    executor : concurrent.futures.Executor (optional)
+        The executor in which to export the figure, typically a
+        ``ThreadPoolExecutor``.  If not specified, the default executor of
+        the event loop is used.
+    **kwargs :
+        Additional keyword arguments passed to :func:`fig_to_html`
+
+    Returns
+    -------
+    fig_html : string
+        the HTML representation of the figure
+
+    See Also
+    --------
+    :func:`fig_to_html_chunks` : the HTML of the figure in chunks
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(fig_to_html, fig, **kwargs))
+
+
+async def fig_to_html_chunks(fig, executor=None, chunk_size=2 ** 16,
+                             figid=None, **kwargs):
+    """Output html representation of the figure in chunks, from an event loop
+
+    The figure is exported in an executor, as by :func:`fig_to_html_async`,
+    and its HTML is then yielded in strings of at most chunk_size
+    characters, so that it can be written to a response chunk by chunk.
+    The HTML templates are rendered around the figure JSON, which is
+    sliced rather than copied into the page, so that the page is never
+    held as a single string.
+
+    Parameters
+    ----------
+    fig : matplotlib figure
+        The figure to display
+    executor : concurrent.futures.Executor (optional)
+        The executor in which to export the figure.  If not specified, the
+        default executor of the event loop is used.
+    chunk_size : int (optional)
+        The maximum number of characters of each chunk.
+    figid : string (optional)
+        As for :func:`fig_to_html`.
+    **kwargs :
+        Additional keyword arguments passed to :func:`fig_to_html`
+
+    Yields
+    ------
+    chunk : string
+        The consecutive parts of the HTML representation of the figure,
+        which joined give the output of :func:`fig_to_html`.
+    """
+    if figid is None:
+        figid = 'fig_' + get_id(fig) + str(int(random.random() * 1E10))
+    elif re.search(r'\s', figid):
+        raise ValueError("figid must not contain spaces")
+    html_kwargs = dict((key, kwargs.pop(key)) for key in HTML_ARGUMENTS
+                       if key in kwargs)
+
+    loop = asyncio.get_running_loop()
+    figure_json, extra_css, extra_js = await loop.run_in_executor(
+        executor, functools.partial(export_json, fig, **kwargs))
+
+    # the templates may hold the figure JSON several times
+    placeholder = uuid.uuid4().hex
+    parts = json_to_html(placeholder, figid, extra_css, extra_js,
+                         **html_kwargs).split(placeholder)
+    for i, part in enumerate(parts):
+        if i > 0:
+            for start in range(0, len(figure_json), chunk_size):
+                yield figure_json[start:start + chunk_size]
+        for start in range(0, len(part), chunk_size):
+            yield part[start:start + chunk_size]
+
+
+async def write_response(writer, status, content_type, content, chunk_size,
+                         head=False):
+    """Write an HTTP response, in chunks of chunk_size bytes"""
+    if not isinstance(content, bytes):
+        content = content.encode()
+    writer.write(("HTTP/1.0 {0} {1}\r\n"
+                  "Content-Type: {2}\r\n"
+                  "Content-Length: {3}\r\n"
+                  "Connection: close\r\n\r\n").format(
+                      status, STATUS_REASONS[status], content_type,
+                      len(content)).encode())
+    if not head:
+        for start in range(0, len(content), chunk_size):
+            writer.write(content[start:start + chunk_size])
+            await writer.drain()
+    await writer.drain()
+
+
+async def write_stream(writer, status, content_type, chunks, head=False):
+    """Write an HTTP response of unknown length, from an async iterator"""
+    writer.write(("HTTP/1.0 {0} {1}\r\n"
+                  "Content-Type: {2}\r\n"
+                  "Connection: close\r\n\r\n").format(
+                      status, STATUS_REASONS[status],
+                      content_type).encode())
+    if not head:
+        async for chunk in chunks:
+            writer.write(chunk.encode())
+            await writer.drain()
+    await writer.drain()
+
+
+async def page_chunks(chunks):
+    """The chunks of the page of a figure, from the chunks of its HTML"""
+    placeholder = uuid.uuid4().hex
+    header, footer = html_page(placeholder).split(placeholder)
+    yield header
+    async for chunk in chunks:
+        yield chunk
+    yield footer
+
+
+def generate_handler(html, files=None, chunk_size=2 ** 16):
+    if files is None:
+        files = {}
+
+    async def handle(reader, writer):
+        try:
+            request = (await reader.readline()).decode('latin-1').split()
+            # the headers are not needed
+            while (await reader.readline()).strip():
+                pass
+            if len(request) < 2:
+                return
+            method, path = request[:2]
+            head = method == 'HEAD'
+            if method not in ('GET', 'HEAD'):
+                await write_response(writer, 501, "text/plain",
+                                     STATUS_REASONS[501], chunk_size)
+                return
+            if path in files:
+                content_type, content = files[path]
+                await write_response(writer, 200, content_type, content,
+                                     chunk_size, head)
+                return
+
+            try:
+                if callable(html):
+                    page = html(path)
+                    if inspect.isawaitable(page):
+                        page = await page
+                else:
+                    page = html if path == '/' else None
+            except Exception:
+                await write_response(writer, 500, "text/plain",
+                                     STATUS_REASONS[500], chunk_size)
+                raise
+            if page is None:
+                await write_response(writer, 404, "text/plain",
+                                     STATUS_REASONS[404], chunk_size, head)
+            elif hasattr(page, '__aiter__'):
+                await write_stream(writer, 200, "text/html",
+                                   page_chunks(page), head)
+            else:
+                await write_response(writer, 200, "text/html",
+                                     html_page(page), chunk_size, head)
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve_async(html, ip='127.0.0.1', port=8888, n_retries=50,
+                      files=None, chunk_size=2 ** 16):
+    """Start a server serving the given HTML from the running event loop
+
+    Parameters
+    ----------
+    html : string or callable
+        HTML to serve at "/", or a function of the requested path returning
+        the HTML to serve at this path, or None if there is none.  The
+        function may return an awaitable, e.g. be a coroutine function
+        calling :func:`fig_to_html_async`, so that figures are exported
+        per request without blocking the server, or an asynchronous
+        iterator of strings, such as :func:`fig_to_html_chunks`, which are
+        sent as they come, without a Content-Length.
+    ip : string (default = '127.0.0.1')
+        ip address at which the HTML will be served.
+    port : int (default = 8888)
+        the port at which to serve the HTML
+    n_retries : int (default = 50)
+        the number of nearby ports to search if the specified port is in use.
+    files : dictionary (optional)
+        dictionary of extra content to serve, as [content type, content]
+        by path
+    chunk_size : int (optional)
+        the number of bytes to send at a time
+
+    Returns
+    -------
+    server : asyncio.Server
+        The server, which serves requests for as long as the event loop
+        runs, until it is closed.  Its port is given by
+        ``server.sockets[0].getsockname()[1]``.
+    """
+    port = find_open_port(ip, port, n_retries)
+    return await asyncio.start_server(
+        generate_handler(html, files, chunk_size), ip, port)
+
+
+def asgi_app(registry=None, executor=None, chunk_size=2 ** 16):
+    """An ASGI application serving figures
+
+    This serves the same paths as :func:`mpld3.wsgi_app`.  Figures are
+    exported in an executor, so that the event loop isn't blocked.
+
+    Parameters
+    ----------
+    registry : FigureRegistry, dict or callable (optional)
+        The figures to serve, as for :func:`mpld3.wsgi_app`.
+    executor : concurrent.futures.Executor (optional)
+        The executor in which to handle requests.  If not specified, the
+        default executor of the event loop is used.
+    chunk_size : int (optional)
+        the number of bytes to send at a time
+
+    Returns
+    -------
+    app : coroutine function
+        The ASGI application, e.g. to run with uvicorn.
+    """
+    registry = as_registry(registry)
+
+    async def app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+
+        headers = dict((key.decode('latin-1').lower(),
+                        value.decode('latin-1'))
+                       for key, value in scope['headers'])
+        loop = asyncio.get_running_loop()
+        status, response_headers, body = await loop.run_in_executor(
+            executor, respond, registry, scope['method'], scope['path'],
+            headers)
+        await send({'type': 'http.response.start',
+                    'status': int(status.split()[0]),
+                    'headers': [(key.lower().encode('latin-1'),
+                                 value.encode('latin-1'))
+                                for key, value in response_headers]})
+        for start in range(0, len(body), chunk_size):
+            await send({'type': 'http.response.body',
+                        'body': body[start:start + chunk_size],
+                        'more_body': start + chunk_size < len(body)})
+        if not body:
+            await send({'type': 'http.response.body', 'body': b""})
+
+    app.registry = registry
+    return app
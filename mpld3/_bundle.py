@@ -0,0 +1,205 @@
+"""
+Minimal bundles
+===============
+
+The mpld3 library holds every element type and plugin, of which most
+figures use a few.  :func:`build_bundle` builds a library from the
+javascript sources holding only those used by given figures, following the
+imports of the sources as smash does for the full library, and caches it
+by feature set, so that pages load and parse less.
+"""
+import hashlib
+import os
+import posixpath
+import re
+import subprocess
+import tempfile
+
+from . import BASE_PATH, BIN_PATH
+from ._display import fig_to_dict
+
+__all__ = ["bundle_features", "build_bundle"]
+
+SRC_DIR = os.path.join(BASE_PATH, "src")
+
+# the source of each element type, by its key in the axes representation
+ELEMENT_SOURCES = {"paths": "elements/path.js",
+                   "bars": "elements/bars.js",
+                   "errorbars": "elements/errorbars.js",
+                   "lines": "elements/line.js",
+                   "markers": "elements/markers.js",
+                   "texts": "elements/text.js",
+                   "collections": "elements/path_collection.js",
+                   "linecollections": "elements/line_collection.js",
+                   "quivers": "elements/quiver.js",
+                   "quadmeshes": "elements/quadmesh.js",
+                   "tiledimages": "elements/tiled_image.js",
+                   "images": "elements/image.js"}
+
+# the plugins defined by the library, rather than by the javascript of
+# their python plugin, and those of figures which don't list their plugins
+BUILTIN_PLUGINS = ["reset", "zoom", "boxzoom", "tooltip", "linkedbrush",
+                   "mouseposition"]
+DEFAULT_PLUGINS = ["reset", "zoom", "boxzoom"]
+
+# the sources importing all the element types and plugins, of which a
+# bundle only follows the imports of its features
+INDEX_SOURCES = ["elements/index.js", "plugins/index.js"]
+OPTIONAL_SOURCES = set(list(ELEMENT_SOURCES.values()) +
+                       ["plugins/{0}.js".format(plugin)
+                        for plugin in BUILTIN_PLUGINS])
+
+IMPORT_PATTERN = re.compile(r'^import\s+"([^"]+)";?\s*$', re.MULTILINE)
+
+
+def figure_dict(fig):
+    """The dictionary representation of a figure, spec or dictionary"""
+    if isinstance(fig, dict):
+        return fig
+    if hasattr(fig, 'to_dict'):
+        return fig.to_dict()
+    return fig_to_dict(fig)
+
+
+def bundle_features(figures):
+    """The element types and plugins used by figures
+
+    Parameters
+    ----------
+    figures : list
+        Matplotlib figures, :class:`mpld3.spec.Figure` instances or figure
+        dictionaries, or a single one of these.
+
+    Returns
+    -------
+    features : list of strings
+        The sources of the element types and plugins used, relative to the
+        source directory, e.g. ``"elements/line.js"``.
+    """
+    if not isinstance(figures, (list, tuple)):
+        figures = [figures]
+    features = set()
+    for fig in figures:
+        fig = figure_dict(fig)
+        for ax in fig['axes']:
+            features.update(source for key, source in ELEMENT_SOURCES.items()
+                            if ax.get(key))
+        if 'plugins' in fig:
+            plugins = [plugin.get('type') for plugin in fig['plugins']]
+        else:
+            plugins = DEFAULT_PLUGINS
+        features.update("plugins/{0}.js".format(plugin) for plugin in plugins
+                        if plugin in BUILTIN_PLUGINS)
+    return sorted(features)
+
+
+def resolve(path, name):
+    """The source imported as name by the source at path, as smash does"""
+    path = posixpath.normpath(posixpath.join(posixpath.dirname(path), name))
+    if name.endswith("/"):
+        return path + "/index.js"
+    return path + ".js"
+
+
+def concatenate(features, src_dir):
+    """The sources of the library holding features, in import order"""
+    included = set()
+    sources = []
+
+    def include(path):
+        if path in included:
+            return
+        included.add(path)
+        with open(os.path.join(src_dir, path)) as f:
+            code = f.read()
+        for name in IMPORT_PATTERN.findall(code):
+            name = resolve(path, name)
+            if (path in INDEX_SOURCES and name in OPTIONAL_SOURCES and
+                    name not in features):
+                continue
+            include(name)
+        sources.append(IMPORT_PATTERN.sub("", code))
+
+    include("mpld3.js")
+    return "\n".join(sources)
+
+
+def minify(code):
+    """Minify javascript as the minified library is, with bin/uglify"""
+    handle, filename = tempfile.mkstemp(suffix=".js")
+    try:
+        with os.fdopen(handle, 'w') as f:
+            f.write(code)
+        try:
+            return subprocess.check_output(
+                ["node", os.path.join(BIN_PATH, "uglify"), filename],
+                stderr=subprocess.STDOUT).decode('utf-8')
+        except OSError as error:
+            detail = str(error)
+        except subprocess.CalledProcessError as error:
+            detail = error.output.decode('utf-8', 'replace')
+        raise RuntimeError("Minifying requires node and uglify-js (npm "
+                           "install in {0}):\n{1}".format(BASE_PATH, detail))
+    finally:
+        os.remove(filename)
+
+
+def build_bundle(figures, minified=True, src_dir=None, cache_dir=None):
+    """Build an mpld3 library holding only what figures use
+
+    The bundle holds the element types and builtin plugins used by the
+    figures, along with the figure, axes and toolbar code every figure
+    needs.  Bundles are cached by feature set and sources, so building the
+    bundle of figures with the same features again is cheap.
+
+    Parameters
+    ----------
+    figures : list
+        Matplotlib figures, :class:`mpld3.spec.Figure` instances or figure
+        dictionaries, or a single one of these.
+    minified : boolean (optional)
+        If true (default), minify the bundle as the minified library is,
+        which requires node and the npm dependencies of mpld3.
+    src_dir : string (optional)
+        The directory of the javascript sources.  Defaults to the src/
+        directory of the mpld3 source tree.
+    cache_dir : string (optional)
+        The directory in which to keep bundles.  Defaults to a directory
+        of the system's temporary directory.
+
+    Returns
+    -------
+    filename : string
+        The file of the bundle, to serve in place of :data:`urls.MPLD3_LOCAL`
+        or to pass as ``mpld3_src`` to :func:`mpld3.save_html`.
+
+    Notes
+    -----
+    The d3 library is unchanged: figures still load all of it.
+    Plugins whose javascript is defined by their python class may use any
+    part of mpld3, and must be checked with the bundle.
+    """
+    src_dir = src_dir or SRC_DIR
+    cache_dir = cache_dir or os.path.join(tempfile.gettempdir(),
+                                          "mpld3-bundles")
+    if not os.path.exists(os.path.join(src_dir, "mpld3.js")):
+        raise IOError("The javascript sources are not in {0}: building "
+                      "bundles requires the mpld3 source tree".format(src_dir))
+
+    features = bundle_features(figures)
+    code = concatenate(features, src_dir)
+    key = hashlib.sha1(code.encode('utf-8')).hexdigest()[:16]
+    filename = os.path.join(cache_dir, "mpld3.{0}{1}.js".format(
+        key, ".min" if minified else ""))
+    if os.path.exists(filename):
+        return filename
+
+    if minified:
+        code = minify(code)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    handle, partial = tempfile.mkstemp(suffix=".part", dir=cache_dir)
+    with os.fdopen(handle, 'w') as f:
+        f.write(code)
+    getattr(os, 'replace', os.rename)(partial, filename)
+    return filename
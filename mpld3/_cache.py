@@ -0,0 +1,498 @@
+"""
+Export cache
+============
+
+An optional disk cache of exported figures, enabled with
+:func:`mpld3.set_cache_dir`, so that re-running a notebook or report which
+produces the same figures reads their exports rather than repeating them.
+
+Figures are keyed by a fingerprint of what their export reads: the data,
+style and transforms of the exported artists, the limits and ticks of the
+axes, the plugins, the export options, the matplotlib rcParams and the
+versions of mpld3 and matplotlib.  Only these inputs are hashed, arrays
+from their buffers, rather than every object reachable from the figure, so
+the fingerprint costs a small fraction of an export.  Element ids are
+random, so entries store those of the artists of the fingerprint by
+position, and ids are replaced by those of the matching artists of the
+figure on loading.
+
+Entries are written atomically, so that several processes may share a
+cache directory, and the least recently used entries are removed once the
+directory grows beyond its size limit.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import uuid
+
+import numpy as np
+import matplotlib
+from matplotlib.cbook import flatten
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.colors import Colormap, Normalize
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.path import Path
+from matplotlib.quiver import Quiver
+from matplotlib.text import Text
+from matplotlib.transforms import Transform
+
+from .__about__ import __version__
+from . import utils
+
+try:
+    from enum import Enum
+except ImportError:
+    # Python 2 without the enum34 backport
+    Enum = ()
+
+__all__ = ["set_cache_dir"]
+
+# the directory and size limit of the cache, set by set_cache_dir
+cache_settings = {"dir": None, "max_bytes": None}
+cache_lock = threading.Lock()
+
+# values hashed as their repr
+PLAIN_TYPES = frozenset([type(None), bool, int, float, str])
+
+# the getters of the state the export reads from every artist
+COMMON_GETTERS = ['get_visible', 'get_zorder', 'get_alpha', 'get_label',
+                  'get_transform']
+
+COLLECTION_GETTERS = ['get_offsets', 'get_offset_transform', 'get_paths',
+                      'get_transforms', 'get_facecolors', 'get_edgecolors',
+                      'get_linewidths', 'get_linestyles', 'get_array',
+                      'get_cmap', 'get_clim']
+
+# the further getters and attributes the export reads, by artist type, of
+# which the first matching type applies
+ARTIST_STATE = [
+    (Line2D, ['get_xydata', 'get_color', 'get_linewidth', 'get_linestyle',
+              'get_drawstyle', 'get_marker', 'get_markersize',
+              'get_markerfacecolor', 'get_markeredgecolor',
+              'get_markeredgewidth'], ['_dashSeq']),
+    (Text, ['get_text', 'get_position', 'get_size', 'get_color',
+            'get_rotation', 'get_horizontalalignment',
+            'get_verticalalignment'], ['_multialignment']),
+    (Patch, ['get_path', 'get_patch_transform', 'get_facecolor',
+             'get_edgecolor', 'get_linewidth', 'get_linestyle', 'get_fill'],
+     ['_dashSeq']),
+    (QuadMesh, ['get_coordinates', 'get_array', 'get_cmap', 'get_clim',
+                'get_facecolors', 'get_edgecolors', 'get_linewidths'],
+     ['norm']),
+    (Quiver, COLLECTION_GETTERS,
+     ['X', 'Y', 'U', 'V', 'scale', 'scale_units', 'angles', 'width',
+      'headwidth', 'headlength', 'headaxislength', 'minshaft', 'minlength',
+      'pivot']),
+    (Collection, COLLECTION_GETTERS, ['norm']),
+    (AxesImage, ['get_array', 'get_extent', 'get_cmap', 'get_clim'],
+     ['norm', 'origin'])]
+
+# the id of an element: "el", the process id, a uuid and a suffix
+UUID_PATTERN = ("[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}"
+                "-[0-9a-f]{12}")
+
+# the suffix of the files of entries in the cache directory
+ENTRY_SUFFIX = ".mpld3"
+
+replace_file = getattr(os, 'replace', os.rename)
+
+
+def set_cache_dir(path, max_bytes=2 ** 30):
+    """Cache the exports of figures on disk
+
+    Once set, :func:`fig_to_html` and :func:`fig_to_dict` read the export
+    of a figure from the cache when a figure with the same state was
+    exported with the same options before, in this process or another.
+    Exports writing image tiles to files, and incremental exports, are not
+    cached.
+
+    Parameters
+    ----------
+    path : string or None
+        The cache directory, created if needed, which several processes may
+        share.  None disables the cache.
+    max_bytes : int (optional)
+        The size beyond which the least recently used entries are removed.
+    """
+    with cache_lock:
+        if path is not None and not os.path.isdir(path):
+            os.makedirs(path)
+        cache_settings["dir"] = path
+        cache_settings["max_bytes"] = max_bytes
+
+
+def cache_dir():
+    return cache_settings["dir"]
+
+
+class Fingerprint(object):
+    """A hash of the state of a figure read by its export
+
+    Artists are visited in the order of the export, and kept with the
+    figure, its axes and the objects referenced by element ids in
+    ``objects``, in the order of their first visit.
+    """
+    def __init__(self):
+        self.sha = hashlib.sha1()
+        self.pieces = []
+        self.objects = []
+        self.index = {}
+        self.hashed = set()
+        # element ids are resolved to their objects, to be fingerprinted
+        # by position rather than by their random uuid
+        with utils.uuid_lock:
+            self.id_objects = dict((str(entry['uuid']), entry['ref'])
+                                   for entry in utils.uuid_cache.values())
+        self.id_pattern = re.compile(
+            re.escape(str(os.getpid())) + "(" + UUID_PATTERN + ")")
+
+    def hexdigest(self):
+        self.flush()
+        return self.sha.hexdigest()
+
+    def flush(self):
+        self.sha.update("\0".join(self.pieces).encode('utf-8',
+                                                      'surrogatepass'))
+        self.pieces = []
+
+    def write(self, tag, text=""):
+        self.pieces.append("{0}:{1}:{2}".format(tag, len(text), text))
+
+    def write_bytes(self, tag, data):
+        self.write(tag, str(len(data)))
+        self.flush()
+        self.sha.update(data)
+
+    def plain(self, value):
+        """Whether a value is hashed as its repr, holding no element id"""
+        kind = type(value)
+        return kind in PLAIN_TYPES and (kind is not str or '-' not in value or
+                                        not self.id_pattern.search(value))
+
+    def reference(self, obj):
+        """Hash the position of an object, adding it to the objects"""
+        position = self.index.get(id(obj))
+        if position is None:
+            position = self.index[id(obj)] = len(self.objects)
+            self.objects.append(obj)
+        self.write("ref", str(position))
+
+    def update_figure(self, fig):
+        """Hash the size, axes and plugins of a figure"""
+        from .plugins import get_plugins
+
+        self.reference(fig)
+        self.update([fig.get_figwidth(), fig.get_figheight(), fig.dpi])
+        # axes are referenced by the axes sharing them
+        for ax in fig.axes:
+            self.reference(ax)
+        for ax in fig.axes:
+            self.update_axes(ax)
+        for plugin in get_plugins(fig):
+            self.write("plugin", type(plugin).__name__)
+            self.update([plugin.get_dict(), plugin.css(),
+                         plugin.javascript()])
+
+    def update_axes(self, ax):
+        """Hash the geometry, axes and artists of an axes"""
+        self.reference(ax)
+        self.update([ax.get_position().bounds, ax.get_xlim(), ax.get_ylim(),
+                     ax.get_navigate(), ax.axison, ax.get_frame_on()])
+        for axis in [ax.xaxis, ax.yaxis]:
+            self.update_axis(axis)
+        for shared in [ax.get_shared_x_axes(), ax.get_shared_y_axes()]:
+            self.write("shared")
+            for sibling in shared.get_siblings(ax):
+                self.reference(sibling)
+
+        for artists in [ax.lines, ax.texts,
+                        [ax.xaxis.label, ax.yaxis.label, ax.title],
+                        ax.artists, ax.patches, ax.collections, ax.images,
+                        [ax.patch]]:
+            self.write("artists", str(len(artists)))
+            for artist in artists:
+                self.update_artist(artist)
+        for container in ax.containers:
+            self.write("container", type(container).__name__)
+            for artist in flatten(container):
+                if artist is None:
+                    self.write("none")
+                else:
+                    self.reference(artist)
+        legend = ax.get_legend()
+        if legend is not None:
+            for artist in legend.findobj():
+                self.update_artist(artist)
+
+    def update_axis(self, axis):
+        """Hash the scale, ticks and tick labels of an axis"""
+        locator, formatter = (axis.get_major_locator(),
+                              axis.get_major_formatter())
+        ticks = locator()
+        if hasattr(formatter, 'format_ticks'):
+            labels = formatter.format_ticks(ticks)
+        else:
+            # matplotlib < 3.1
+            labels = [formatter(tick, i) for i, tick in enumerate(ticks)]
+        converter = (axis.get_converter() if hasattr(axis, 'get_converter')
+                     else axis.converter)
+        self.write("axis", "{0} {1} {2}".format(
+            type(locator).__name__, type(formatter).__name__,
+            type(converter).__name__))
+        self.update([axis.get_scale(), axis.get_visible(),
+                     axis._major_tick_kw, ticks, labels])
+        # the export reads the style of the first tick label and gridline
+        if len(ticks):
+            tick = axis.majorTicks[0]
+            self.update_artist(tick.label1)
+            self.update_artist(tick.gridline)
+
+    def update_artist(self, artist):
+        """Hash the state the export reads from an artist"""
+        if id(artist) in self.hashed:
+            return self.reference(artist)
+        self.hashed.add(id(artist))
+        self.reference(artist)
+        self.write("artist", type(artist).__name__)
+        for artist_type, getters, attributes in ARTIST_STATE:
+            if isinstance(artist, artist_type):
+                break
+        else:
+            getters, attributes = [], []
+        self.update([getattr(artist, name)()
+                     for name in COMMON_GETTERS + getters
+                     if hasattr(artist, name)] +
+                    [getattr(artist, name, None) for name in attributes])
+
+    def update(self, value):
+        """Hash a value of plain values, arrays and matplotlib values"""
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            children = self.visit(value)
+            if children:
+                stack.extend(reversed(children))
+
+    def visit(self, value):
+        """Hash a value, returning the values it contains"""
+        kind = type(value)
+        if kind in PLAIN_TYPES:
+            if kind is str and not self.plain(value):
+                return self.visit_string(value)
+            self.write("plain", repr(value))
+        elif isinstance(value, np.ndarray):
+            self.write("ndarray", "{0}{1}".format(value.dtype.str,
+                                                  value.shape))
+            if np.ma.isMaskedArray(value):
+                return [np.ma.getdata(value), np.ma.getmaskarray(value)]
+            if value.dtype.hasobject:
+                return list(value.ravel())
+            self.flush()
+            self.sha.update(np.ascontiguousarray(value).view(np.uint8))
+        elif isinstance(value, np.generic):
+            self.write_bytes(value.dtype.str, value.tobytes())
+        elif isinstance(value, (list, tuple)):
+            # lists of plain values are hashed as their repr, at once
+            if all(type(item) in PLAIN_TYPES for item in value):
+                text = repr(value)
+                if '-' not in text or not self.id_pattern.search(text):
+                    self.write(kind.__name__, text)
+                    return
+            self.write(kind.__name__, str(len(value)))
+            return list(value)
+        elif isinstance(value, dict):
+            return self.visit_dict(value)
+        elif isinstance(value, (set, frozenset)):
+            # set order varies between processes: only sets of plain values
+            # are hashed in full
+            items = list(value)
+            if all(type(item) in PLAIN_TYPES for item in items):
+                self.write("set", repr(sorted(items, key=repr)))
+            else:
+                self.write("set", str(len(items)))
+        elif isinstance(value, (bytes, bytearray)):
+            self.write_bytes("bytes", bytes(value))
+        elif isinstance(value, Path):
+            self.write("path")
+            return [value.vertices, value.codes]
+        elif isinstance(value, Transform):
+            # the non-affine part of transforms of the data is given by the
+            # scales of the axes
+            self.write("transform", kind.__name__)
+            return [value.get_affine().get_matrix()]
+        elif isinstance(value, Colormap):
+            self.write("colormap", "{0}:{1}".format(value.name, value.N))
+        elif isinstance(value, Normalize):
+            self.write("norm", kind.__name__)
+            return [value.vmin, value.vmax, value.clip]
+        elif isinstance(value, (complex, Enum)):
+            self.write(kind.__name__, repr(value))
+        else:
+            self.write("opaque", kind.__name__)
+
+    def visit_string(self, value):
+        """Hash a string holding element ids, by the positions of their
+        objects"""
+        parts, objects = [], []
+        start = 0
+        for match in self.id_pattern.finditer(value):
+            ref = self.id_objects.get(match.group(1))
+            obj = ref and ref()
+            if obj is not None:
+                parts.append(value[start:match.start()])
+                objects.append(obj)
+                start = match.end()
+        parts.append(value[start:])
+        self.write("str", repr(parts))
+        for obj in objects:
+            self.reference(obj)
+
+    def visit_dict(self, value):
+        """Hash the plain items of a dict, returning the others"""
+        items = list(value.items())
+        if all(type(key) is str for key, item in items):
+            items.sort(key=lambda item: item[0])
+        self.write(type(value).__name__, str(len(items)))
+        children = []
+        for key, item in items:
+            if type(key) is str and self.plain(item):
+                self.write(key, repr(item))
+            else:
+                # hashed after the plain items
+                self.write("deferred")
+                children.extend([key, item])
+        return children
+
+
+def fingerprint(fig, options):
+    """The cache key of the export of a figure with the given options
+
+    Returns
+    -------
+    key, objects : string, list
+        The fingerprint, and the objects it visited, in order.
+    """
+    from .mpld3renderer import matplotlib_lock
+
+    hasher = Fingerprint()
+    with matplotlib_lock:
+        hasher.update([__version__, matplotlib.__version__,
+                       dict(matplotlib.rcParams), options])
+        hasher.update_figure(fig)
+    return hasher.hexdigest(), hasher.objects
+
+
+def object_ids(objects):
+    """The positions of the objects which have an element id, by uuid"""
+    ids = {}
+    with utils.uuid_lock:
+        for position, obj in enumerate(objects):
+            entry = utils.uuid_cache.get(id(obj))
+            if entry is not None and entry['ref']() is obj:
+                ids.setdefault(str(entry['uuid']), position)
+    return ids
+
+
+def entry_path(key):
+    return os.path.join(cache_settings["dir"], key + ENTRY_SUFFIX)
+
+
+def load(key, objects):
+    """The cached (figure JSON, CSS, javascript) of a key, or None
+
+    The element ids of the entry are replaced by those of the objects.
+    """
+    path = entry_path(key)
+    try:
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline().decode('utf-8'))
+            figure_json = f.read().decode('utf-8')
+        os.utime(path, None)
+    except (IOError, OSError, ValueError):
+        return None
+
+    uuids = {}
+    for old_uuid, position in header['ids'].items():
+        if position < len(objects):
+            uuids[old_uuid] = utils.get_id(
+                objects[position], prefix="",
+                warn_on_invalid=False)[len(str(os.getpid())):]
+    pattern = re.compile(re.escape(str(header['pid'])) +
+                         "(" + UUID_PATTERN + ")")
+
+    def replace(match):
+        # ids of objects missing from this figure are given new uuids
+        old_uuid = match.group(1)
+        if old_uuid not in uuids:
+            uuids[old_uuid] = str(uuid.uuid4())
+        return str(os.getpid()) + uuids[old_uuid]
+
+    return tuple(pattern.sub(replace, text) for text in
+                 [figure_json, header['css'], header['js']])
+
+
+def store(key, objects, figure_json, extra_css, extra_js):
+    """Write an entry atomically, and evict old entries beyond the limit"""
+    header = json.dumps({"pid": os.getpid(), "ids": object_ids(objects),
+                         "css": extra_css, "js": extra_js})
+    directory = cache_settings["dir"]
+    try:
+        handle, partial = tempfile.mkstemp(suffix=".part", dir=directory)
+        with os.fdopen(handle, 'wb') as f:
+            f.write(header.encode('utf-8') + b"\n")
+            f.write(figure_json.encode('utf-8'))
+        replace_file(partial, entry_path(key))
+    except (IOError, OSError):
+        return
+    evict(directory, cache_settings["max_bytes"])
+
+
+def evict(directory, max_bytes):
+    """Remove the least recently used entries beyond max_bytes
+
+    Only finished entries count and are removed: other files of the
+    directory, and the partial entries other processes are writing, are
+    left alone.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(ENTRY_SUFFIX):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for mtime, size, name in entries)
+    for mtime, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            # another process removed it first
+            pass
+        total -= size
+
+
+def cached_export(fig, options, export):
+    """The (figure JSON, CSS, javascript) of a figure, through the cache
+
+    export is called on a miss, to return the figure dictionary, CSS and
+    javascript of the figure.
+    """
+    from ._display import NumpyEncoder
+
+    key, objects = fingerprint(fig, options)
+    cached = load(key, objects)
+    if cached is not None:
+        return cached
+    figure_dict, extra_css, extra_js = export()
+    figure_json = json.dumps(figure_dict, cls=NumpyEncoder)
+    store(key, objects, figure_json, extra_css, extra_js)
+    return figure_json, extra_css, extra_js
@@ -6,9 +6,11 @@ import numpy
 import re
 import os
 from ._server import serve
-from .utils import deprecated, get_id, write_ipynb_local_js
-from .mplexporter import Exporter
-from .mpld3renderer import MPLD3Renderer
+from .utils import (deprecated, get_id, write_ipynb_local_js,
+                    write_ipynb_local_data)
+from .mpld3renderer import MPLD3Renderer, MPLD3Exporter
+from ._incremental import IncrementalRenderer, IncrementalExporter
+from ._cache import cache_dir, cached_export
 from . import urls
 
 __all__ = ["fig_to_html", "fig_to_dict", "fig_to_d3",
@@ -143,13 +145,29 @@ class NumpyEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
-def fig_to_dict(fig, **kwargs):
+def fig_to_dict(fig, simplify_tolerance=None, image_tile_size=None,
+                image_tile_dir=None, incremental=False, **kwargs):
     """Output json-serializable dictionary representation of the figure
 
     Parameters
     ----------
     fig : matplotlib figure
         The figure to display
+    simplify_tolerance : float (optional)
+        If specified, simplify contour, fill and patch paths so that they
+        deviate from the original by at most this many pixels.  This can
+        greatly reduce the size of e.g. fine-grid contour plots.
+    image_tile_size : int (optional)
+        If specified, export images larger than this many pixels along
+        either side as a pyramid of tiles of this size, of which the client
+        only loads those visible at the current zoom.
+    image_tile_dir : string (optional)
+        If specified, write image tiles as PNG files below this directory
+        and reference them by URL, rather than embedding them.
+    incremental : boolean (optional)
+        If true, keep the export of each axes of the figure, and only export
+        again the axes which changed since the last incremental export of
+        the figure.  Datasets are then not shared between axes.
     **kwargs :
         Additional keyword arguments passed to mplexporter.Exporter
 
@@ -168,14 +186,18 @@ def fig_to_dict(fig, **kwargs):
     :func:`display` : embed figure within the IPython notebook
     :func:`enable_notebook` : automatically embed figures in IPython notebook
     """
-    renderer = MPLD3Renderer()
-    Exporter(renderer, close_mpl=False, **kwargs).run(fig)
-    fig, figure_dict, extra_css, extra_js = renderer.finished_figures[0]
-    return figure_dict
+    if use_cache(incremental, image_tile_dir):
+        return json.loads(export_json(
+            fig, simplify_tolerance=simplify_tolerance,
+            image_tile_size=image_tile_size, **kwargs)[0])
+    return export_dict(fig, simplify_tolerance, image_tile_size,
+                       image_tile_dir, incremental, **kwargs)[0]
 
 
 def fig_to_html(fig, d3_url=None, mpld3_url=None, no_extras=False,
-                template_type="general", figid=None, use_http=False, include_libraries=True, **kwargs):
+                template_type="general", figid=None, use_http=False, include_libraries=True,
+                simplify_tolerance=None, image_tile_size=None,
+                image_tile_dir=None, incremental=False, lazy=False, **kwargs):
     """Output html representation of the figure
 
     Parameters
@@ -210,6 +232,29 @@ def fig_to_html(fig, d3_url=None, mpld3_url=None, no_extras=False,
         If true, use http:// instead of https:// for d3_url and mpld3_url.
     include_libraries: boolean (optional)
         Whether to inject <script> tag to load JS libraries. Defaults to True.
+    simplify_tolerance : float (optional)
+        If specified, simplify contour, fill and patch paths so that they
+        deviate from the original by at most this many pixels.
+    image_tile_size : int (optional)
+        If specified, export images larger than this many pixels along
+        either side as a pyramid of tiles of this size, of which the client
+        only loads those visible at the current zoom.
+    image_tile_dir : string (optional)
+        If specified, write image tiles as PNG files below this directory
+        and reference them by URL, rather than embedding them.
+    incremental : boolean (optional)
+        If true, keep the export of each axes of the figure, and only export
+        again the axes which changed since the last incremental export of
+        the figure.  Datasets are then not shared between axes.
+    lazy : boolean or dict (optional)
+        If true, enable the lazy drawing of the page, by which figures are
+        only drawn once their element comes within ``margin`` of the
+        viewport, so that pages of many figures show the first ones at
+        once.  A dict may hold the ``margin`` (default "200px"), and a
+        ``teardown_margin`` beyond which drawn figures are removed again,
+        to bound the size of the page, as CSS margins.  The teardown margin
+        should be the larger: figures are only removed once beyond both.
+        Figures are drawn at once by browsers without IntersectionObserver.
 
     **kwargs :
         Additional keyword arguments passed to mplexporter.Exporter
@@ -228,6 +273,119 @@ def fig_to_html(fig, d3_url=None, mpld3_url=None, no_extras=False,
     :func:`display` : embed figure within the IPython notebook
     :func:`enable_notebook` : automatically embed figures in IPython notebook
     """
+    if figid is None:
+        figid = 'fig_' + get_id(fig) + str(int(random.random() * 1E10))
+    elif re.search(r'\s', figid):
+        raise ValueError("figid must not contain spaces")
+
+    figure_json, extra_css, extra_js = export_json(
+        fig, simplify_tolerance, image_tile_size, image_tile_dir,
+        incremental, **kwargs)
+
+    return json_to_html(figure_json, figid, extra_css, extra_js,
+                        d3_url=d3_url, mpld3_url=mpld3_url,
+                        no_extras=no_extras, template_type=template_type,
+                        use_http=use_http,
+                        include_libraries=include_libraries, lazy=lazy)
+
+
+def use_cache(incremental, image_tile_dir):
+    """Whether an export may be read from and written to the export cache
+
+    Incremental exports keep their own state, and tiles written to files
+    may have been removed since, so these are not cached.
+    """
+    return (cache_dir() is not None and not incremental and
+            image_tile_dir is None)
+
+
+def export_dict(fig, simplify_tolerance=None, image_tile_size=None,
+                image_tile_dir=None, incremental=False, **kwargs):
+    """The figure dictionary, extra CSS and extra javascript of a figure"""
+    renderer_class, exporter_class = (
+        (IncrementalRenderer, IncrementalExporter) if incremental
+        else (MPLD3Renderer, MPLD3Exporter))
+    renderer = renderer_class(simplify_tolerance=simplify_tolerance,
+                              image_tile_size=image_tile_size,
+                              image_tile_dir=image_tile_dir)
+    exporter_class(renderer, close_mpl=False, **kwargs).run(fig)
+    fig, figure_dict, extra_css, extra_js = renderer.finished_figures[0]
+    return figure_dict, extra_css, extra_js
+
+
+def export_json(fig, simplify_tolerance=None, image_tile_size=None,
+                image_tile_dir=None, incremental=False, **kwargs):
+    """The figure JSON, extra CSS and extra javascript of a figure
+
+    These are read from the export cache, when it is enabled and holds an
+    export of the same figure with the same options.
+    """
+    if use_cache(incremental, image_tile_dir):
+        options = dict(kwargs, simplify_tolerance=simplify_tolerance,
+                       image_tile_size=image_tile_size)
+        return cached_export(fig, options, lambda: export_dict(
+            fig, simplify_tolerance, image_tile_size, **kwargs))
+    figure_dict, extra_css, extra_js = export_dict(
+        fig, simplify_tolerance, image_tile_size, image_tile_dir,
+        incremental, **kwargs)
+    return json.dumps(figure_dict, cls=NumpyEncoder), extra_css, extra_js
+
+
+def dict_to_html(figure_dict, extra_css="", extra_js="", d3_url=None,
+                 mpld3_url=None, no_extras=False, template_type="general",
+                 figid=None, use_http=False, include_libraries=True,
+                 lazy=False):
+    """Output html representation of a figure dictionary
+
+    This renders the HTML templates of :func:`fig_to_html` for a figure
+    which is already in its dictionary representation, e.g. one built with
+    :mod:`mpld3.spec`.
+
+    Parameters
+    ----------
+    figure_dict : dict
+        The dictionary representation of the figure.
+    extra_css, extra_js : string (optional)
+        The CSS and javascript of the figure's plugins.
+    **kwargs :
+        The remaining arguments are those of :func:`fig_to_html`.
+
+    Returns
+    -------
+    fig_html : string
+        the HTML representation of the figure
+    """
+    if figid is None:
+        figid = 'fig_' + figure_dict['id'] + str(int(random.random() * 1E10))
+
+    return json_to_html(json.dumps(figure_dict, cls=NumpyEncoder), figid,
+                        extra_css, extra_js, d3_url=d3_url,
+                        mpld3_url=mpld3_url, no_extras=no_extras,
+                        template_type=template_type, use_http=use_http,
+                        include_libraries=include_libraries, lazy=lazy)
+
+
+def lazy_js(lazy):
+    """The javascript enabling lazy drawing, as the lazy argument asks"""
+    if not lazy:
+        return ""
+    options = {}
+    if isinstance(lazy, dict):
+        for key, name in [('margin', 'margin'),
+                          ('teardown_margin', 'teardownMargin')]:
+            if lazy.get(key) is not None:
+                options[name] = lazy[key]
+    return "mpld3.enable_lazy_drawing({0});\n".format(json.dumps(options))
+
+
+def json_to_html(figure_json, figid, extra_css="", extra_js="", d3_url=None,
+                 mpld3_url=None, no_extras=False, template_type="general",
+                 use_http=False, include_libraries=True, lazy=False):
+    """Output html representation of a figure already encoded as JSON
+
+    The arguments are those of :func:`dict_to_html`, with figure_json the
+    JSON encoding of the figure dictionary.
+    """
     if not include_libraries:
         template_type = "simple"
 
@@ -241,30 +399,43 @@ def fig_to_html(fig, d3_url=None, mpld3_url=None, no_extras=False,
         d3_url = d3_url.replace('https://', 'http://')
         mpld3_url = mpld3_url.replace('https://', 'http://')
 
-    if figid is None:
-        figid = 'fig_' + get_id(fig) + str(int(random.random() * 1E10))
-    elif re.search(r'\s', figid):
+    if re.search(r'\s', figid):
         raise ValueError("figid must not contain spaces")
 
-    renderer = MPLD3Renderer()
-    Exporter(renderer, close_mpl=False, **kwargs).run(fig)
-
-    fig, figure_json, extra_css, extra_js = renderer.finished_figures[0]
-
     if no_extras:
         extra_css = ""
         extra_js = ""
+    extra_js = lazy_js(lazy) + extra_js
 
     return template.render(figid=json.dumps(figid),
                            d3_url=d3_url,
                            mpld3_url=mpld3_url,
-                           figure_json=json.dumps(figure_json, cls=NumpyEncoder),
+                           figure_json=figure_json,
                            extra_css=extra_css,
                            extra_js=extra_js,
                            include_libraries=include_libraries)
 
 
-def display(fig=None, closefig=True, local=False, **kwargs):
+def local_data_html(fig, d3_url=None, mpld3_url=None, no_extras=False,
+                    template_type="general", figid=None, use_http=False,
+                    include_libraries=True, lazy=False, **kwargs):
+    """Output html representation of a figure, with its data in files
+
+    The datasets of the figure are written by :func:`write_ipynb_local_data`
+    and fetched by the browser, rather than embedded in the HTML.  The
+    arguments are those of :func:`fig_to_html`.
+    """
+    figure_json, extra_css, extra_js = export_json(fig, **kwargs)
+    figure_dict = write_ipynb_local_data(json.loads(figure_json))
+    return dict_to_html(figure_dict, extra_css, extra_js, d3_url=d3_url,
+                        mpld3_url=mpld3_url, no_extras=no_extras,
+                        template_type=template_type, figid=figid,
+                        use_http=use_http,
+                        include_libraries=include_libraries, lazy=lazy)
+
+
+def display(fig=None, closefig=True, local=False, local_data=False,
+            **kwargs):
     """Display figure in IPython notebook via the HTML display hook
 
     Parameters
@@ -277,6 +448,12 @@ def display(fig=None, closefig=True, local=False, **kwargs):
     local : boolean (optional, default=False)
         if True, then copy the d3 & mpld3 libraries to a location visible to
         the notebook server, and source them from there. See Notes below.
+    local_data : boolean (optional, default=False)
+        if True, then write the datasets of the figure to files named by
+        their content, in the same location as ``local=True``, and have the
+        browser fetch them, so that they are not saved in the notebook.
+        Identical data displayed by several cells, or by a cell run again,
+        is stored and fetched once.
     **kwargs :
         additional keyword arguments are passed through to :func:`fig_to_html`.
 
@@ -313,11 +490,14 @@ def display(fig=None, closefig=True, local=False, **kwargs):
         fig = plt.gcf()
     if closefig:
         plt.close(fig)
+    if local_data:
+        return HTML(local_data_html(fig, **kwargs))
     return HTML(fig_to_html(fig, **kwargs))
 
 
 def show(fig=None, ip='127.0.0.1', port=8888, n_retries=50,
-         local=True, open_browser=True, http_server=None, **kwargs):
+         local=True, open_browser=True, http_server=None, bundle=False,
+         **kwargs):
     """Open figure in a web browser
 
     Similar behavior to plt.show().  This opens the D3 visualization of the
@@ -344,6 +524,10 @@ def show(fig=None, ip='127.0.0.1', port=8888, n_retries=50,
     http_server : class (optional)
         optionally specify an HTTPServer class to use for showing the
         figure. The default is Python's basic HTTPServer.
+    bundle : bool (optional)
+        if True, and local is True, serve a library holding only the
+        elements and plugins the figure uses, built by :func:`build_bundle`
+        (unminified, so as not to require node).
     **kwargs :
         additional keyword arguments are passed through to :func:`fig_to_html`
 
@@ -352,26 +536,32 @@ def show(fig=None, ip='127.0.0.1', port=8888, n_retries=50,
     :func:`display` : embed figure within the IPython notebook
     :func:`enable_notebook` : automatically embed figures in IPython notebook
     """
+    if fig is None:
+        # import here, in case matplotlib.use(...) is called by user
+        import matplotlib.pyplot as plt
+        fig = plt.gcf()
+
     if local:
         kwargs['mpld3_url'] = '/mpld3.js'
         kwargs['d3_url'] = '/d3.js'
+        if bundle:
+            from ._bundle import build_bundle
+            mpld3_src = build_bundle(fig, minified=False)
+        else:
+            mpld3_src = urls.MPLD3_LOCAL
         files = {'/mpld3.js': ["text/javascript",
-                               open(urls.MPLD3_LOCAL, 'r').read()],
+                               open(mpld3_src, 'r').read()],
                  '/d3.js': ["text/javascript",
                             open(urls.D3_LOCAL, 'r').read()]}
     else:
         files = None
-
-    if fig is None:
-        # import here, in case matplotlib.use(...) is called by user
-        import matplotlib.pyplot as plt
-        fig = plt.gcf()
     html = fig_to_html(fig, **kwargs)
     serve(html, ip=ip, port=port, n_retries=n_retries, files=files,
           open_browser=open_browser, http_server=http_server)
 
 
-def enable_notebook(local=False, **kwargs):
+def enable_notebook(local=False, max_points=None, local_data=False,
+                    **kwargs):
     """Enable the automatic display of figures in the IPython Notebook.
 
     This function should be used with the inline Matplotlib backend
@@ -385,6 +575,14 @@ def enable_notebook(local=False, **kwargs):
     local : boolean (optional, default=False)
         if True, then copy the d3 & mpld3 libraries to a location visible to
         the notebook server, and source them from there. See Notes below.
+    max_points : int (optional, default=None)
+        if given, then figures estimated to hold more data points than this
+        are shown as a PNG image, with a button fetching their interactive
+        view from the kernel on demand, so that they don't slow down or
+        bloat the notebook.  By default, all figures are shown interactively.
+    local_data : boolean (optional, default=False)
+        if True, then write the datasets of figures to files, rather than
+        saving them in the notebook, as for :func:`display`.
     **kwargs :
         all keyword parameters are passed through to :func:`fig_to_html`
 
@@ -397,6 +595,14 @@ def enable_notebook(local=False, **kwargs):
     - In IPython 2.0+, ``local=True`` may fail if a url prefix is added
       (e.g. by setting NotebookApp.base_url).
 
+    The same applies to ``local_data=True``, whose files are left in place:
+    the figures of a notebook can only be drawn where its files are, and
+    the files of deleted cells must be removed by hand.
+
+    The interactive views of figures above ``max_points`` are sent by the
+    kernel over a Jupyter comm, so can only be activated while the kernel
+    which showed them runs, in the classic notebook or in Colab.
+
     See Also
     --------
     :func:`disable_notebook` : undo the action of enable_notebook
@@ -415,10 +621,13 @@ def enable_notebook(local=False, **kwargs):
                 "enable_notebook: specified urls are ignored when local=True")
         kwargs['d3_url'], kwargs['mpld3_url'] = write_ipynb_local_js()
 
+    from ._notebook import notebook_html
+
     ip = get_ipython()
     formatter = ip.display_formatter.formatters['text/html']
     formatter.for_type(Figure,
-                       lambda fig, kwds=kwargs: fig_to_html(fig, **kwds))
+                       lambda fig, kwds=kwargs: notebook_html(
+                           fig, max_points, local_data, **kwds))
 
 
 def disable_notebook():
@@ -438,7 +647,7 @@ def disable_notebook():
     formatter.type_printers.pop(Figure, None)
 
 
-def save_html(fig, fileobj, **kwargs):
+def save_html(fig, fileobj, self_contained=False, compress=False, **kwargs):
     """Save a matplotlib figure to an html file
 
     Parameters
@@ -448,8 +657,18 @@ def save_html(fig, fileobj, **kwargs):
     fileobj : filename or file object
         The filename or file-like object in which to write the HTML
         representation of the figure.
+    self_contained : boolean (optional)
+        If true, embed the minified d3 and mpld3 libraries in the file, so
+        that it can be viewed without network access, rather than loading
+        them from d3_url and mpld3_url.
+    compress : boolean (optional)
+        If true, embed the libraries and the figure compressed, to be
+        inflated by the browser, which typically makes the file several
+        times smaller.  Requires self_contained.
     **kwargs :
-        additional keyword arguments will be passed to :func:`fig_to_html`
+        additional keyword arguments will be passed to :func:`fig_to_html`,
+        or if self_contained, those of its arguments other than d3_url,
+        mpld3_url, template_type, use_http and include_libraries.
 
     See Also
     --------
@@ -457,11 +676,17 @@ def save_html(fig, fileobj, **kwargs):
     :func:`fig_to_html` : output html representation of the figure
     :func:`fig_to_dict` : output dictionary representation of the figure
     """
+    if compress and not self_contained:
+        raise ValueError("compress requires self_contained=True")
     if isinstance(fileobj, str):
         fileobj = open(fileobj, 'w')
     if not hasattr(fileobj, 'write'):
         raise ValueError("fileobj should be a filename or a writable file")
-    fileobj.write(fig_to_html(fig, **kwargs))
+    if self_contained:
+        from ._standalone import self_contained_html
+        fileobj.write(self_contained_html(fig, compress=compress, **kwargs))
+    else:
+        fileobj.write(fig_to_html(fig, **kwargs))
 
 
 def save_json(fig, fileobj, **kwargs):
@@ -0,0 +1,454 @@
+"""
+Figure galleries
+================
+
+Browsing of many figures, e.g. those produced by a job, from a web server.
+Only the list of figures is built on startup: each figure is exported on
+its first request, in a pool of workers, and its page is cached on disk,
+keyed by a hash of its source, so that only the figures viewed cost any
+work, once.  The index page loads the list of figures page by page, and
+only renders the rows in view, so that it stays responsive for thousands
+of figures.
+
+This module requires Python 3.
+"""
+import collections
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from urllib.parse import parse_qs
+
+import jinja2
+
+from .__about__ import __version__
+from ._display import dict_to_html
+from ._server import find_open_port
+from ._app import Content, ASSETS, STATUS, asset_content, export_figure
+from .mpld3renderer import matplotlib_lock
+
+__all__ = ["gallery_app", "serve_gallery"]
+
+# the files of a gallery directory
+GALLERY_PATTERNS = ["*.py", "*.pkl", "*.pickle"]
+
+# the number of names in each page of the index
+INDEX_PAGE_SIZE = 500
+
+GALLERY_INDEX = jinja2.Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{{ title|e }}</title>
+<style>
+body { font-family: sans-serif; margin: 0; }
+#header { height: 40px; line-height: 40px; padding: 0 16px;
+          border-bottom: 1px solid #ccc; }
+#list { position: absolute; top: 41px; bottom: 0; left: 0; right: 0;
+        overflow-y: auto; }
+#rows { position: relative; }
+.row { position: absolute; left: 16px; right: 16px;
+       height: {{ row_height }}px; line-height: {{ row_height }}px;
+       white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+</style>
+</head>
+<body>
+<div id="header">{{ title|e }}: {{ count }} figures</div>
+<div id="list"><div id="rows"></div></div>
+<script type="text/javascript">
+(function() {
+  var rowHeight = {{ row_height }}, pageSize = {{ page_size }},
+      count = {{ count }}, pages = {},
+      list = document.getElementById("list"),
+      rows = document.getElementById("rows");
+  rows.style.height = count * rowHeight + "px";
+
+  function escape(text) {
+    return text.replace(/&/g, "&amp;").replace(/</g, "&lt;")
+               .replace(/"/g, "&quot;");
+  }
+
+  function load(page) {
+    pages[page] = null;
+    var request = new XMLHttpRequest();
+    request.open("GET", "index.json?page=" + page);
+    request.onload = function() {
+      pages[page] = JSON.parse(request.responseText).names;
+      render();
+    };
+    request.send();
+  }
+
+  // only the rows in view are rendered, loading their pages as needed
+  function render() {
+    var first = Math.floor(list.scrollTop / rowHeight),
+        last = Math.min(count, first + 2 +
+                        Math.ceil(list.clientHeight / rowHeight)),
+        html = [];
+    for (var i = first; i < last; i++) {
+      var page = Math.floor(i / pageSize);
+      if (!(page in pages)) {
+        load(page);
+      }
+      if (!pages[page]) {
+        continue;
+      }
+      var name = pages[page][i % pageSize];
+      html.push('<div class="row" style="top:' + i * rowHeight + 'px">' +
+                '<a href="figures/' +
+                escape(name.split("/").map(encodeURIComponent).join("/")) +
+                '">' + escape(name) + '</a></div>');
+    }
+    rows.innerHTML = html.join("");
+  }
+
+  list.addEventListener("scroll", render);
+  window.addEventListener("resize", render);
+  render();
+})();
+</script>
+</body>
+</html>
+""")
+
+GALLERY_PAGE = jinja2.Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{{ name|e }}</title>
+<script type="text/javascript" src="{{ root }}assets/d3.js"></script>
+<script type="text/javascript" src="{{ root }}assets/mpld3.js"></script>
+</head>
+<body>
+<p><a href="{{ root }}">index</a> / {{ name|e }}</p>
+{% for figure in figures %}
+{{ figure }}
+{% endfor %}
+</body>
+</html>
+""")
+
+
+def init_worker():
+    """Set up a worker process to export figures"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def file_figures(path):
+    """The figures of a pickle file, or those created by running a script"""
+    import matplotlib.pyplot as plt
+    if not path.endswith('.py'):
+        with open(path, 'rb') as f:
+            figures = pickle.load(f)
+        if isinstance(figures, (list, tuple)):
+            return list(figures)
+        return [figures]
+
+    import mpld3
+    plt.close('all')
+    show, mpld3_show = plt.show, mpld3.show
+    plt.show = mpld3.show = lambda *args, **kwargs: None
+    cwd = os.getcwd()
+    try:
+        os.chdir(os.path.dirname(os.path.abspath(path)))
+        with open(path) as f:
+            code = compile(f.read(), path, 'exec')
+        exec(code, {'__name__': '__main__', '__file__': path})
+        return [plt.figure(n) for n in plt.get_fignums()]
+    finally:
+        os.chdir(cwd)
+        plt.show, mpld3.show = show, mpld3_show
+
+
+def gallery_page(name, figures):
+    """The HTML page of the figures of a gallery entry"""
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    if not isinstance(figures, (list, tuple)):
+        figures = [figures]
+    html = []
+    for fig in figures:
+        # scripts may make many figures, which are drawn as they are seen
+        html.append(dict_to_html(*export_figure(fig), template_type="simple",
+                                 include_libraries=False, lazy=True))
+        if isinstance(fig, Figure):
+            with matplotlib_lock:
+                plt.close(fig)
+    return GALLERY_PAGE.render(name=name, figures=html,
+                               root="../" * (name.count('/') + 1))
+
+
+def export_file(name, path):
+    """The HTML page of a gallery file, run in a worker process"""
+    return gallery_page(name, file_figures(path))
+
+
+def export_factory(name, factory):
+    """The HTML page of the figures returned by a function, in a thread"""
+    with matplotlib_lock:
+        figures = factory()
+    return gallery_page(name, figures)
+
+
+def gallery_entries(source):
+    """The figure files or functions of a gallery source, by name"""
+    if callable(source):
+        return collections.OrderedDict(sorted(source().items()))
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            paths = [path for pattern in GALLERY_PATTERNS
+                     for path in glob.glob(os.path.join(source, pattern))]
+        else:
+            paths = glob.glob(source)
+    else:
+        paths = list(source)
+    paths = sorted(os.path.abspath(path) for path in paths)
+    if not paths:
+        return collections.OrderedDict()
+    root = os.path.dirname(os.path.commonprefix(paths))
+    return collections.OrderedDict(
+        (os.path.relpath(path, root).replace(os.sep, '/'), path)
+        for path in paths)
+
+
+class Gallery(object):
+    """The figures of a gallery, exported on first request
+
+    Parameters are those of :func:`gallery_app`.
+    """
+    def __init__(self, source, cache_dir=None, workers=None, max_pages=32):
+        self.source = source
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(),
+                                                   "mpld3-gallery")
+        self.workers = workers
+        self.max_pages = max_pages
+        self.entries = None
+        self.executor = None
+        self.pending = {}
+        self.pages = collections.OrderedDict()
+        self.lock = threading.RLock()
+
+    def names(self):
+        with self.lock:
+            if self.entries is None:
+                self.entries = gallery_entries(self.source)
+        return list(self.entries)
+
+    def cache_key(self, name):
+        """The hash of the source file of a figure, or None for functions
+
+        The pages of functions are not cached on disk, as they may depend on
+        more than their source, e.g. the values of closures.
+        """
+        entry = self.entries[name]
+        if callable(entry):
+            return None
+        sha = hashlib.sha1(__version__.encode())
+        sha.update(name.encode('utf-8'))
+        with open(entry, 'rb') as f:
+            sha.update(f.read())
+        return sha.hexdigest()
+
+    def export(self, name):
+        """Export a figure in a worker"""
+        with self.lock:
+            if self.executor is None:
+                if callable(self.source):
+                    # functions can't generally be sent to other processes
+                    self.executor = ThreadPoolExecutor(self.workers or 4)
+                else:
+                    self.executor = ProcessPoolExecutor(
+                        self.workers, initializer=init_worker)
+        entry = self.entries[name]
+        if callable(entry):
+            return self.executor.submit(export_factory, name, entry)
+        return self.executor.submit(export_file, name, entry)
+
+    def page(self, name):
+        """The page of a figure, raising a KeyError if there is none"""
+        if name not in self.names():
+            raise KeyError(name)
+        key = self.cache_key(name)
+        # pages are kept in memory by source hash, or by name for functions
+        memory_key = key or (name,)
+        with self.lock:
+            if memory_key in self.pages:
+                content = self.pages.pop(memory_key)
+                self.pages[memory_key] = content
+                return content
+
+        filename = key and os.path.join(self.cache_dir, key + ".html")
+        if filename and os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                body = f.read()
+        else:
+            # concurrent requests for a figure share its export
+            with self.lock:
+                future = self.pending.get(name)
+                if future is None:
+                    future = self.pending[name] = self.export(name)
+            try:
+                body = future.result().encode('utf-8')
+            finally:
+                with self.lock:
+                    self.pending.pop(name, None)
+            if filename:
+                if not os.path.exists(self.cache_dir):
+                    os.makedirs(self.cache_dir)
+                partial = "{0}.{1}.part".format(filename, os.getpid())
+                with open(partial, 'wb') as f:
+                    f.write(body)
+                os.replace(partial, filename)
+
+        content = Content(body, "text/html; charset=utf-8")
+        with self.lock:
+            self.pages[memory_key] = content
+            while len(self.pages) > self.max_pages:
+                self.pages.popitem(last=False)
+        return content
+
+    def index(self, title):
+        names = self.names()
+        return Content(GALLERY_INDEX.render(
+            title=title, count=len(names), page_size=INDEX_PAGE_SIZE,
+            row_height=24).encode('utf-8'), "text/html; charset=utf-8")
+
+    def index_page(self, page):
+        names = self.names()
+        start = page * INDEX_PAGE_SIZE
+        return Content(json.dumps({
+            "count": len(names),
+            "names": names[start:start + INDEX_PAGE_SIZE]}).encode('utf-8'),
+            "application/json")
+
+
+def gallery_app(source, cache_dir=None, workers=None, title="mpld3 gallery"):
+    """A WSGI application serving a gallery of figures
+
+    Parameters
+    ----------
+    source : string, list or callable
+        The figures: a directory, whose scripts (``*.py``) and pickled
+        figures (``*.pkl``, ``*.pickle``) are shown, a glob pattern or a
+        list of such files, or a function returning a dict of functions
+        returning a figure or list of figures, by name.  Scripts are run in
+        their directory, with ``plt.show`` and ``mpld3.show`` disabled, and
+        the figures they leave open are shown.  Pickle files hold a figure
+        or a list of figures.
+    cache_dir : string (optional)
+        The directory in which to cache the pages of files, keyed by a hash
+        of their contents.  Defaults to a directory in the temporary
+        directory.  The pages of functions are only kept in memory.
+    workers : int (optional)
+        The number of worker processes exporting files (threads for
+        functions).  Defaults to the number of processors.
+    title : string (optional)
+        The title of the index page.
+
+    Returns
+    -------
+    app : callable
+        The WSGI application, serving the index at ``/`` and the page of
+        each figure at ``/figures/<name>``.
+    """
+    gallery = Gallery(source, cache_dir, workers)
+
+    def app(environ, start_response):
+        path = environ.get('PATH_INFO', '') or '/'
+        if not isinstance(path, bytes):
+            # WSGI paths are latin-1 decoded bytes
+            path = path.encode('latin-1')
+        path = path.decode('utf-8')
+        headers = dict((key[5:].replace('_', '-').lower(), value)
+                       for key, value in environ.items()
+                       if key.startswith('HTTP_'))
+        query = parse_qs(environ.get('QUERY_STRING', ''))
+
+        page = query.get('page', ['0'])[0]
+        name = path[len('/figures/'):]
+        try:
+            if path == '/':
+                content = gallery.index(title)
+            elif path == '/index.json' and page.isdigit():
+                content = gallery.index_page(int(page))
+            elif path in ASSETS:
+                content = asset_content(path)
+            elif path.startswith('/figures/') and name in gallery.names():
+                content = gallery.page(name)
+            else:
+                content = None
+            if content is None:
+                status, body = STATUS[404], STATUS[404].encode()
+            else:
+                status, response_headers, body = content.response(headers)
+        except Exception:
+            # the traceback goes to the server's log, not to clients
+            environ['wsgi.errors'].write(traceback.format_exc())
+            status = "500 Internal Server Error"
+            body = b"Internal Server Error"
+        if status[0] in "45":
+            response_headers = [("Content-Type", "text/plain"),
+                                ("Content-Length", str(len(body)))]
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            body = b""
+        start_response(status, response_headers)
+        return [body]
+
+    app.gallery = gallery
+    return app
+
+
+def serve_gallery(source, ip='127.0.0.1', port=8888, n_retries=50,
+                  open_browser=True, cache_dir=None, workers=None,
+                  title="mpld3 gallery"):
+    """Start a server showing a gallery of figures, and open a browser
+
+    Figures are exported on first request, in a pool of worker processes,
+    and their pages cached on disk, so that the server starts instantly and
+    only the figures viewed are exported.
+
+    Parameters
+    ----------
+    source : string, list or callable
+        The figures, e.g. a directory of scripts and pickled figures, or a
+        glob pattern such as ``"examples/*.py"``.  See :func:`gallery_app`.
+    ip : string (default = '127.0.0.1')
+        ip address at which the gallery will be served.
+    port : int (default = 8888)
+        the port at which to serve the gallery
+    n_retries : int (default = 50)
+        the number of nearby ports to search if the specified port is in use.
+    open_browser : bool (optional)
+        if True (default), then open a web browser to the gallery
+    cache_dir, workers, title :
+        see :func:`gallery_app`
+    """
+    import webbrowser
+    from wsgiref.simple_server import make_server, WSGIServer
+    from socketserver import ThreadingMixIn
+
+    class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+
+    port = find_open_port(ip, port, n_retries)
+    app = gallery_app(source, cache_dir, workers, title)
+    srvr = make_server(ip, port, app, server_class=ThreadingWSGIServer)
+
+    print("Serving to http://{0}:{1}/    [Ctrl-C to exit]".format(ip, port))
+    if open_browser:
+        threading.Thread(target=lambda: webbrowser.open(
+            'http://{0}:{1}'.format(ip, port))).start()
+    try:
+        srvr.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        print("\nstopping Server...")
+    srvr.server_close()
+    if app.gallery.executor is not None:
+        app.gallery.executor.shutdown(wait=False)
@@ -0,0 +1,152 @@
+"""
+Incremental export
+==================
+
+Repeated export of a figure of which only some axes change between exports,
+e.g. when the data of one of many subplots are updated.  The export of each
+axes is kept along with the datasets it references, and reused for as long
+as matplotlib doesn't report a change of the axes, so that only the axes
+which changed are drawn by matplotlib and crawled again.  The cost of a
+refresh is then proportional to what changed rather than to the size of the
+figure.
+"""
+import io
+import weakref
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .utils import get_id
+from .mpld3renderer import MPLD3Renderer, MPLD3Exporter, matplotlib_lock
+
+__all__ = ["IncrementalRenderer", "IncrementalExporter"]
+
+# the exported axes of each figure, with the figure properties they depend on
+export_states = weakref.WeakKeyDictionary()
+
+
+def has_layout_engine(fig):
+    """Whether drawing the figure may move its axes"""
+    if hasattr(fig, 'get_layout_engine'):
+        return fig.get_layout_engine() is not None
+    return fig.get_tight_layout() or fig.get_constrained_layout()
+
+
+class StaleRecorder(object):
+    """Stale callback of an axes, recording whether it changed
+
+    matplotlib calls the stale callback of an axes whenever the axes or one
+    of its artists is modified, whether or not the axes was stale already,
+    so that changes are recorded even if the figure is drawn in between.
+    """
+    def __init__(self, callback):
+        self.callback = callback
+        self.changed = True
+
+    def __call__(self, artist, val):
+        self.changed = True
+        if self.callback is not None:
+            self.callback(artist, val)
+
+
+def changed_axes(fig):
+    """The axes of a figure changed since its last export
+
+    These are the axes which recorded a change, and those sharing an axis
+    with them, as autoscaling an axes updates the limits of the axes it
+    shares an axis with.
+    """
+    changed = set()
+    for ax in fig.axes:
+        if not isinstance(ax.stale_callback, StaleRecorder):
+            ax.stale_callback = StaleRecorder(ax.stale_callback)
+        if ax.stale_callback.changed:
+            changed.add(ax)
+            changed.update(ax.get_shared_x_axes().get_siblings(ax))
+            changed.update(ax.get_shared_y_axes().get_siblings(ax))
+    return changed
+
+
+class IncrementalRenderer(MPLD3Renderer):
+    """Renderer of self-contained axes
+
+    Datasets are not shared between axes, and are labelled by axes, so that
+    the export of an axes can be reused in later exports of its figure.
+    """
+    def open_axes(self, ax, props):
+        self.axes_label = "ax{0:02d}".format(len(self.figure_json['axes']) + 1)
+        self.datasets = []
+        super(IncrementalRenderer, self).open_axes(ax, props)
+
+    def datalabel(self, i):
+        return "{0}data{1:02d}".format(self.axes_label, i)
+
+    def close_axes(self, ax):
+        super(IncrementalRenderer, self).close_axes(ax)
+        self.axes_data = dict((self.datalabel(i + 1),
+                               np.asarray(dataset).tolist())
+                              for i, dataset in enumerate(self.datasets))
+        self.figure_json['data'].update(self.axes_data)
+        self.datasets = []
+
+    def reuse_axes(self, axes_json, axes_data):
+        """Add an axes exported by a previous run to the current figure"""
+        self.figure_json['axes'].append(axes_json)
+        self.figure_json['data'].update(axes_data)
+
+
+class IncrementalExporter(MPLD3Exporter):
+    """Exporter reusing the export of the axes which didn't change
+
+    The export of each axes of a figure is kept from one run to the next.
+    Only axes which matplotlib reported as changed, or which moved, are
+    drawn and crawled again, unless the size of the figure or the export
+    options changed, or a layout engine may move its axes, in which case the
+    whole figure is drawn.  As drawing an axes updates its ticks, drawing or
+    exporting the figure by other means counts as a change of every axes.
+    The renderer must be an :class:`IncrementalRenderer`.
+    """
+    def run(self, fig):
+        with matplotlib_lock:
+            if fig.canvas is None:
+                FigureCanvasAgg(fig)
+            renderer = self.renderer
+            options = (tuple(fig.get_size_inches()), fig.dpi,
+                       renderer.simplify_tolerance, renderer.image_tile_size,
+                       renderer.image_tile_dir)
+            state = export_states.get(fig)
+            changed = changed_axes(fig)
+            if (state is None or state[0] != options
+                    or has_layout_engine(fig)
+                    or not hasattr(fig.canvas, 'get_renderer')):
+                fig.savefig(io.BytesIO(), format='png', dpi=fig.dpi)
+                self.previous = {}
+            else:
+                self.previous = dict(state[1])
+                mpl_renderer = fig.canvas.get_renderer()
+                for ax in changed:
+                    self.previous.pop(get_id(ax), None)
+                    ax.draw(mpl_renderer)
+            if self.close_mpl:
+                import matplotlib.pyplot as plt
+                plt.close(fig)
+
+            self.exported = {}
+            self.crawl_fig(fig)
+            # crawling modifies the axes: changes are recorded from now on
+            for ax in fig.axes:
+                ax.stale_callback.changed = False
+            export_states[fig] = (options, self.exported)
+
+    def crawl_ax(self, ax):
+        key = get_id(ax)
+        figure_json = self.renderer.figure_json
+        placement = (len(figure_json['axes']), tuple(ax.get_position().bounds))
+        exported = self.previous.get(key)
+        if exported is not None and exported[0] == placement:
+            self.renderer.reuse_axes(*exported[1:])
+        else:
+            super(IncrementalExporter, self).crawl_ax(ax)
+            exported = (placement, figure_json['axes'][-1],
+                        self.renderer.axes_data)
+        self.exported[key] = exported
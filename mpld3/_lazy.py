@@ -0,0 +1,261 @@
+"""
+Chunked data sources
+====================
+
+Plotting of arrays too large to hold in memory, such as ``np.memmap``
+arrays or HDF5 and zarr datasets.  The data are read in fixed-size chunks
+and reduced chunk by chunk, so that only the reduced points ever reach
+matplotlib and the exporter, and peak memory use is bounded by the chunk
+size and the reduction rather than by the size of the data.
+
+Lines are reduced by keeping the first, last, minimum and maximum points
+of each of a fixed number of consecutive buckets (the "M4" reduction),
+which preserves the envelope of the line as drawn.  Scatter points are
+reduced by keeping the first point falling in each cell of a regular grid
+over the data.
+"""
+import numpy as np
+
+
+__all__ = ["ChunkedSource", "lazy_line", "lazy_scatter"]
+
+
+def as_array(values):
+    """Values as an array, unless they can be sliced as they are
+
+    Objects with a shape, such as arrays, ``np.memmap`` arrays and HDF5
+    datasets, are kept, so that only the chunks read are loaded.
+    """
+    if values is None or hasattr(values, 'shape'):
+        return values
+    return np.asarray(values)
+
+
+class ChunkedSource(object):
+    """Chunk-wise reader of x, y data
+
+    Parameters
+    ----------
+    x : array_like
+        The x values, or if y is not specified, either a shape [N, 2] array
+        of x, y pairs or a length N array of y values, plotted against their
+        index.  Any object with a ``shape`` which can be sliced into numpy
+        arrays may be used, e.g. a ``np.memmap`` or an HDF5 dataset.  Other
+        sequences, such as lists, are converted to arrays.
+    y : array_like (optional)
+        The y values, of the same length as x.
+    chunk_size : int (optional)
+        The number of points to read at a time.
+    """
+    def __init__(self, x, y=None, chunk_size=2 ** 16):
+        x, y = as_array(x), as_array(y)
+        if y is None and len(x.shape) == 2:
+            if x.shape[1] != 2:
+                raise ValueError("Data is expected to be of size [N, 2]")
+            self.xy = x
+            self.x = self.y = None
+        else:
+            if y is None:
+                x, y = None, x
+            elif x.shape[0] != y.shape[0]:
+                raise ValueError("x and y must have the same length")
+            self.xy = None
+            self.x, self.y = x, y
+        self.chunk_size = int(chunk_size)
+
+    def __len__(self):
+        return (self.xy if self.xy is not None else self.y).shape[0]
+
+    def read(self, start, stop):
+        """Read the x and y values of points start to stop as float arrays"""
+        if self.xy is not None:
+            xy = np.asarray(self.xy[start:stop], dtype=float)
+            return xy[:, 0], xy[:, 1]
+        y = np.asarray(self.y[start:stop], dtype=float)
+        if self.x is None:
+            x = np.arange(start, start + len(y), dtype=float)
+        else:
+            x = np.asarray(self.x[start:stop], dtype=float)
+        return x, y
+
+    def chunks(self, chunk_size=None):
+        """Iterate over (start, x, y) for consecutive chunks of the data"""
+        chunk_size = chunk_size or self.chunk_size
+        for start in range(0, len(self), chunk_size):
+            x, y = self.read(start, start + chunk_size)
+            yield start, x, y
+
+
+def as_source(source):
+    if isinstance(source, ChunkedSource):
+        return source
+    elif isinstance(source, tuple):
+        return ChunkedSource(*source)
+    return ChunkedSource(source)
+
+
+def m4_indices(y, bucket_size):
+    """Indices of the points of y to keep in the M4 reduction
+
+    Within each bucket of ``bucket_size`` consecutive points, keep the first
+    and last points, those of minimum and maximum y, and the first
+    non-finite point, so that gaps in the line are preserved.
+    """
+    n = len(y)
+    n_buckets = -(-n // bucket_size)
+    starts = np.arange(n_buckets) * bucket_size
+    blocks = np.full(n_buckets * bucket_size, np.nan)
+    blocks[:n] = y
+    blocks = blocks.reshape(n_buckets, bucket_size)
+    finite = np.isfinite(blocks)
+
+    # the padding of the last bucket is neither a gap nor an extremum
+    missing = ~finite
+    missing[-1, n - starts[-1]:] = False
+    gaps = missing.any(axis=1)
+
+    indices = [starts, np.minimum(starts + bucket_size, n) - 1,
+               starts + np.where(finite, blocks, np.inf).argmin(axis=1),
+               starts + np.where(finite, blocks, -np.inf).argmax(axis=1),
+               starts[gaps] + missing[gaps].argmax(axis=1)]
+    return np.unique(np.concatenate(indices))
+
+
+def reduce_line(source, max_points=10000):
+    """Reduce a chunked source to at most about max_points points
+
+    Parameters
+    ----------
+    source : ChunkedSource
+        The data to reduce.
+    max_points : int (optional)
+        The number of points to keep: the data are split into max_points / 4
+        buckets, of which the M4 reduction keeps at most four points each.
+
+    Returns
+    -------
+    x, y : arrays
+        The reduced data.
+    """
+    n = len(source)
+    if n <= max_points:
+        bucket_size = 1
+        chunk_size = source.chunk_size
+    else:
+        bucket_size = -(-n // max(1, max_points // 4))
+        # chunks hold whole buckets
+        chunk_size = max(1, source.chunk_size // bucket_size) * bucket_size
+
+    xs, ys = [], []
+    for start, x, y in source.chunks(chunk_size):
+        if bucket_size > 1:
+            keep = m4_indices(y, bucket_size)
+            x, y = x[keep], y[keep]
+        xs.append(x)
+        ys.append(y)
+    if not xs:
+        return np.zeros(0), np.zeros(0)
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def reduce_points(source, bins=256):
+    """Reduce a chunked source of scatter points on a regular grid
+
+    Parameters
+    ----------
+    source : ChunkedSource
+        The data to reduce.
+    bins : int (optional)
+        The number of grid cells along each axis.  The first point falling
+        in each cell is kept, so that at most bins ** 2 points remain.
+
+    Returns
+    -------
+    x, y : arrays
+        The reduced data, in their original order.
+    """
+    # a first pass for the extent of the grid
+    lower = np.array([np.inf, np.inf])
+    upper = -lower
+    for start, x, y in source.chunks():
+        finite = np.isfinite(x) & np.isfinite(y)
+        if finite.any():
+            lower = np.minimum(lower, [x[finite].min(), y[finite].min()])
+            upper = np.maximum(upper, [x[finite].max(), y[finite].max()])
+    if not np.all(upper >= lower):
+        return np.zeros(0), np.zeros(0)
+    scale = bins / np.where(upper > lower, upper - lower, 1)
+
+    occupied = np.zeros(bins * bins, dtype=bool)
+    xs, ys = [], []
+    for start, x, y in source.chunks():
+        finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        ix = np.minimum((x[finite] - lower[0]) * scale[0], bins - 1)
+        iy = np.minimum((y[finite] - lower[1]) * scale[1], bins - 1)
+        cells = ix.astype(int) * bins + iy.astype(int)
+        cells, first = np.unique(cells, return_index=True)
+        new = ~occupied[cells]
+        occupied[cells[new]] = True
+        keep = np.sort(finite[first[new]])
+        xs.append(x[keep])
+        ys.append(y[keep])
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def lazy_line(ax, source, max_points=10000, **kwargs):
+    """Plot a line from a chunked source of data too large for memory
+
+    The data are read and reduced chunk by chunk, keeping the first, last,
+    minimum and maximum points of each of max_points / 4 consecutive
+    buckets, which preserves the envelope of the line.  Only the reduced
+    points are plotted, so neither matplotlib nor mpld3 ever holds a full
+    copy of the data.
+
+    Parameters
+    ----------
+    ax : matplotlib Axes
+        The axes in which to plot.
+    source : ChunkedSource, array_like or tuple
+        The data: a :class:`ChunkedSource`, an (x, y) tuple of arrays, or
+        any argument accepted by :class:`ChunkedSource`, e.g. a
+        ``np.memmap`` array of shape [N, 2].
+    max_points : int (optional)
+        The maximum number of points to plot.
+    **kwargs :
+        Additional keyword arguments passed to ``ax.plot``.
+
+    Returns
+    -------
+    line : matplotlib Line2D
+        The plotted line.
+    """
+    x, y = reduce_line(as_source(source), max_points)
+    line, = ax.plot(x, y, **kwargs)
+    return line
+
+
+def lazy_scatter(ax, source, bins=256, **kwargs):
+    """Scatter plot a chunked source of data too large for memory
+
+    The data are read and reduced chunk by chunk, keeping the first point
+    in each cell of a bins x bins grid over the data.  Styles are applied to
+    the reduced points, so they must not be given per point.
+
+    Parameters
+    ----------
+    ax : matplotlib Axes
+        The axes in which to plot.
+    source : ChunkedSource, array_like or tuple
+        The data, as for :func:`lazy_line`.
+    bins : int (optional)
+        The number of grid cells along each axis.
+    **kwargs :
+        Additional keyword arguments passed to ``ax.scatter``.
+
+    Returns
+    -------
+    collection : matplotlib PathCollection
+        The plotted points.
+    """
+    x, y = reduce_points(as_source(source), bins)
+    return ax.scatter(x, y, **kwargs)
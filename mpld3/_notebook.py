@@ -0,0 +1,259 @@
+"""
+Notebook display of large figures
+=================================
+
+The HTML formatter of :func:`mpld3.enable_notebook` exports every figure
+into the notebook, which for figures of millions of points freezes the
+browser and bloats the saved notebook.  Given a maximum number of points,
+larger figures are instead shown as a PNG image, with a button activating
+the interactive view: the figure is kept in the kernel, and its export is
+only sent when asked for, over a Jupyter comm, so it never enters the
+notebook.
+"""
+import base64
+import collections
+import json
+import random
+import threading
+import traceback
+import uuid
+from io import BytesIO
+
+import jinja2
+import numpy as np
+
+from . import urls
+from .plugins import get_plugins
+from .mpld3renderer import matplotlib_lock
+from ._display import fig_to_dict, fig_to_html, local_data_html, NumpyEncoder
+
+__all__ = ["estimate_points", "notebook_html"]
+
+# the number of deferred figures kept for activation, beyond which the
+# oldest can no longer be activated
+MAX_DEFERRED_FIGURES = 64
+
+# the comm target through which deferred figures are activated
+COMM_TARGET = "mpld3_deferred_figure"
+
+DEFERRED_HTML = jinja2.Template("""
+<style>
+{{ extra_css }}
+</style>
+
+<div id={{ figid }}>
+<img src="data:image/png;base64,{{ png }}" width="{{ width }}">
+<div>
+<button type="button" id={{ button_id }}>Activate interactive view</button>
+<span>{{ points }} points</span>
+</div>
+</div>
+<script>
+!function(){
+  var button = document.getElementById({{ button_id }});
+
+  function mpld3_load_lib(url, callback){
+    var s = document.createElement('script');
+    s.src = url;
+    s.async = true;
+    s.onreadystatechange = s.onload = callback;
+    s.onerror = function(){console.warn("failed to load library " + url);};
+    document.getElementsByTagName("head")[0].appendChild(s);
+  }
+
+  function draw(figure){
+    document.getElementById({{ figid }}).innerHTML = "";
+    {{ extra_js }}
+    mpld3.draw_figure({{ figid }}, figure);
+  }
+
+  function load(figure){
+    if(typeof(mpld3) !== "undefined" && mpld3._mpld3IsLoaded){
+      draw(figure);
+    }else if(typeof define === "function" && define.amd){
+      require.config({paths: {d3: "{{ d3_url[:-3] }}"}});
+      require(["d3"], function(d3){
+        window.d3 = d3;
+        mpld3_load_lib("{{ mpld3_url }}", function(){ draw(figure); });
+      });
+    }else{
+      mpld3_load_lib("{{ d3_url }}", function(){
+        mpld3_load_lib("{{ mpld3_url }}", function(){ draw(figure); });
+      });
+    }
+  }
+
+  function activate(callback, fail){
+    var data = {figure: {{ name }}};
+    if(typeof Jupyter !== "undefined" && Jupyter.notebook &&
+       Jupyter.notebook.kernel){
+      var comm = Jupyter.notebook.kernel.comm_manager.new_comm(
+        {{ target }}, data);
+      comm.on_msg(function(msg){ callback(msg.content.data); });
+    }else if(typeof google !== "undefined" && google.colab &&
+             google.colab.kernel){
+      google.colab.kernel.comms.open({{ target }}, data).then(function(comm){
+        return comm.messages[Symbol.asyncIterator]().next();
+      }).then(function(result){ callback(result.value.data); }, fail);
+    }else{
+      fail();
+    }
+  }
+
+  button.onclick = function(){
+    button.disabled = true;
+    button.textContent = "Loading...";
+    activate(function(reply){
+      if(reply.figure === undefined){
+        console.warn("mpld3: " + reply.error);
+        button.textContent = "Interactive view unavailable: re-run the cell";
+        return;
+      }
+      load(JSON.parse(reply.figure));
+    }, function(){
+      button.textContent = "Interactive view unavailable";
+    });
+  };
+}();
+</script>
+""")
+
+
+def estimate_points(fig):
+    """Estimate the number of data points of the export of a figure
+
+    This counts the points of lines, the offsets and path vertices of
+    collections, the vertices of patches and the pixels of images, without
+    exporting anything, as a measure of the cost of exporting and drawing
+    the figure.
+    """
+    points = 0
+    with matplotlib_lock:
+        for ax in fig.axes:
+            for line in ax.lines:
+                points += np.size(line.get_xdata(orig=True))
+            for collection in ax.collections:
+                points += len(collection.get_offsets())
+                points += sum(len(path.vertices)
+                              for path in collection.get_paths())
+            for patch in ax.patches:
+                points += len(patch.get_path().vertices)
+            for image in ax.images:
+                array = image.get_array()
+                if array is not None:
+                    points += np.prod(array.shape[:2])
+    return int(points)
+
+
+class DeferredFigures(object):
+    """The figures awaiting activation, sent to the notebook over a comm
+
+    Activating a figure opens a comm to the kernel, naming the figure, on
+    which the kernel replies with the JSON of the figure, so that figures
+    are only sent to the page asking for them, through the connection of
+    the notebook to its kernel.  Figures are registered under random names.
+    """
+    def __init__(self, target=COMM_TARGET):
+        self.target = target
+        self.figures = collections.OrderedDict()
+        self.comm_manager = None
+        self.lock = threading.Lock()
+
+    def register(self, fig, **kwargs):
+        """Register a figure, returning its name"""
+        name = uuid.uuid4().hex
+        with self.lock:
+            self.figures[name] = lambda: fig_to_dict(fig, **kwargs)
+            while len(self.figures) > MAX_DEFERRED_FIGURES:
+                self.figures.popitem(last=False)
+        self.start()
+        return name
+
+    def start(self):
+        """Register the comm target with the running kernel, if any"""
+        try:
+            from IPython import get_ipython
+        except ImportError:
+            return
+        kernel = getattr(get_ipython(), 'kernel', None)
+        comm_manager = getattr(kernel, 'comm_manager', None)
+        with self.lock:
+            if comm_manager is None or comm_manager is self.comm_manager:
+                return
+            comm_manager.register_target(self.target, self.open)
+            self.comm_manager = comm_manager
+
+    def open(self, comm, msg):
+        """Reply to the opening of a comm with the figure it names"""
+        name = msg['content']['data'].get('figure')
+        with self.lock:
+            export = self.figures.get(name)
+        if export is None:
+            reply = {'error': "unknown figure {0!r}".format(name)}
+        else:
+            try:
+                reply = {'figure': json.dumps(export(), cls=NumpyEncoder)}
+            except Exception:
+                reply = {'error': traceback.format_exc()}
+        comm.send(reply)
+        comm.close()
+
+
+deferred_figures = DeferredFigures()
+
+
+def deferred_html(fig, points, d3_url=None, mpld3_url=None, use_http=False,
+                  figid=None, **kwargs):
+    """The PNG placeholder of a figure, activating its interactive view"""
+    d3_url = d3_url or urls.D3_URL
+    mpld3_url = mpld3_url or urls.MPLD3_URL
+    if use_http:
+        d3_url = d3_url.replace('https://', 'http://')
+        mpld3_url = mpld3_url.replace('https://', 'http://')
+    if figid is None:
+        figid = 'fig_deferred' + str(int(random.random() * 1E10))
+
+    buffer = BytesIO()
+    with matplotlib_lock:
+        fig.savefig(buffer, format='png', dpi=fig.dpi)
+    plugins = get_plugins(fig)
+    return DEFERRED_HTML.render(
+        figid=json.dumps(figid), button_id=json.dumps(figid + "_activate"),
+        png=base64.b64encode(buffer.getvalue()).decode('ascii'),
+        width=int(round(fig.get_figwidth() * fig.dpi)), points=points,
+        name=json.dumps(deferred_figures.register(fig, **kwargs)),
+        target=json.dumps(deferred_figures.target),
+        d3_url=d3_url, mpld3_url=mpld3_url,
+        extra_css="".join(plugin.css() for plugin in plugins),
+        extra_js="".join(plugin.javascript() for plugin in plugins))
+
+
+def notebook_html(fig, max_points=None, local_data=False, **kwargs):
+    """The HTML of a figure in the notebook, deferring large figures
+
+    Parameters
+    ----------
+    fig : matplotlib figure
+        The figure to display
+    max_points : int (optional)
+        Figures estimated by :func:`estimate_points` to hold more points
+        than this are shown as a PNG image, whose interactive view is only
+        exported on activation.  If None, figures are always exported.
+    local_data : boolean (optional)
+        If true, the datasets of exported figures are written to files, by
+        :func:`mpld3.utils.write_ipynb_local_data`.  Deferred figures are
+        never saved in the notebook, so ignore this.
+    **kwargs :
+        Additional keyword arguments passed to :func:`fig_to_html`, or on
+        activation of deferred figures, those of its arguments which are
+        also arguments of :func:`fig_to_dict`.
+    """
+    points = estimate_points(fig) if max_points is not None else 0
+    if max_points is None or points <= max_points:
+        if local_data:
+            return local_data_html(fig, **kwargs)
+        return fig_to_html(fig, **kwargs)
+    # deferred figures are drawn on activation, so never lazily
+    for key in ['no_extras', 'template_type', 'include_libraries', 'lazy']:
+        kwargs.pop(key, None)
+    return deferred_html(fig, points, **kwargs)
@@ -24,6 +24,12 @@ except ImportError:
     from http import server
 
 
+def html_page(html):
+    """Wrap the HTML of a figure in a page of its own"""
+    return ("<html><head><title>mpld3 plot</title></head><body>\n" +
+            html + "</body></html>")
+
+
 def generate_handler(html, files=None):
     if files is None:
         files = {}
@@ -35,11 +41,7 @@ def generate_handler(html, files=None):
                 self.send_response(200)
                 self.send_header("Content-type", "text/html")
                 self.end_headers()
-                self.wfile.write("<html><head>"
-                                 "<title>mpld3 plot</title>"
-                                 "</head><body>\n".encode())
-                self.wfile.write(html.encode())
-                self.wfile.write("</body></html>".encode())
+                self.wfile.write(html_page(html).encode())
             elif self.path in files:
                 content_type, content = files[self.path]
                 self.send_response(200)
@@ -0,0 +1,200 @@
+"""
+Path simplification
+===================
+
+Export-time simplification of polygon and polyline paths, with a tolerance
+given in display pixels.  Boundaries shared between paths (e.g. between the
+filled regions of adjacent contour levels) are simplified identically, so
+that no gaps or overlaps appear between them.
+"""
+import itertools
+
+import numpy as np
+
+
+SIMPLIFIABLE_CODES = {'M', 'L', 'Z'}
+
+# vertices closer than this many pixels are considered identical
+SNAP_PIXELS = 1E-6
+
+
+def douglas_peucker(points, tolerance):
+    """Douglas-Peucker simplification of a polyline
+
+    Parameters
+    ----------
+    points : array_like
+        A shape [N, 2] array of points.  The first and last points may
+        coincide, in which case the polyline is a closed ring.
+    tolerance : float
+        The maximum distance between the polyline and its simplification.
+
+    Returns
+    -------
+    keep : array
+        A length N boolean mask of the points to keep.  The first and last
+        points are always kept.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        a = points[i]
+        seg = points[j] - a
+        rel = points[i + 1:j] - a
+        norm2 = seg.dot(seg)
+        if norm2 > 0:
+            t = np.clip(rel.dot(seg) / norm2, 0, 1)
+            rel = rel - t[:, None] * seg
+        dist2 = (rel ** 2).sum(1)
+        k = np.argmax(dist2)
+        if dist2[k] > tolerance ** 2:
+            k += i + 1
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    return keep
+
+
+def _subpaths(vertices, codes):
+    """Split SVG path codes into (start, stop, closed) vertex ranges"""
+    subpaths = []
+    start = i = 0
+    for code in codes:
+        if code == 'M':
+            if i > start:
+                subpaths.append([start, i, False])
+            start = i
+            i += 1
+        elif code == 'L':
+            i += 1
+        elif i > start:
+            subpaths.append([start, i, True])
+            start = i
+    if i > start:
+        subpaths.append([start, i, False])
+
+    # drop explicit closing vertices: the Z code closes the ring anyway
+    for sub in subpaths:
+        if (sub[2] and sub[1] - sub[0] > 1
+                and np.all(vertices[sub[1] - 1] == vertices[sub[0]])):
+            sub[1] -= 1
+    return subpaths
+
+
+def simplify_paths(paths, transform, tolerance):
+    """Simplify paths to within a tolerance in display pixels
+
+    Paths made only of moveto, lineto and closepoly codes are simplified;
+    other paths are returned unchanged.  Vertices where paths meet or
+    branch are never removed, and each stretch of boundary between such
+    junctions is simplified once and reused by every path containing it,
+    so shared boundaries stay shared.  Closed rings which become degenerate
+    (fewer than three vertices, i.e. smaller than the tolerance) are
+    dropped.
+
+    Parameters
+    ----------
+    paths : list
+        A list of (vertices, pathcodes) tuples, as produced by
+        mplexporter's ``SVG_path``.
+    transform : matplotlib transform
+        The transform mapping the vertices to display pixels.
+    tolerance : float
+        The simplification tolerance in display pixels.
+
+    Returns
+    -------
+    paths : list
+        The simplified list of (vertices, pathcodes) tuples.
+    """
+    eligible = [i for i, (vertices, codes) in enumerate(paths)
+                if (len(codes) and SIMPLIFIABLE_CODES.issuperset(codes)
+                    and len(vertices) == len(codes) - codes.count('Z'))]
+    if not eligible:
+        return paths
+
+    # Label coincident vertices across all paths.  Boundaries shared by two
+    # paths may have been computed separately for each, so compare vertices
+    # on a fine pixel grid rather than exactly.
+    offsets = np.cumsum([0] + [len(paths[i][0]) for i in eligible])
+    vertices = np.concatenate([np.asarray(paths[i][0], dtype=float)
+                               for i in eligible])
+    pixels = transform.transform(vertices)
+    snapped = np.round(pixels / SNAP_PIXELS).astype(np.int64)
+    _, first, ids = np.unique(snapped, axis=0, return_index=True,
+                              return_inverse=True)
+    ids = ids.ravel()
+    unique, pixels = vertices[first], pixels[first]
+
+    subpaths = [[(offsets[k] + start, offsets[k] + stop, closed)
+                 for start, stop, closed in _subpaths(paths[i][0],
+                                                      paths[i][1])]
+                for k, i in enumerate(eligible)]
+
+    # Junctions are vertices without exactly two distinct neighbours, and
+    # the endpoints of open subpaths.
+    edges = []
+    junction = np.zeros(len(unique), dtype=bool)
+    for start, stop, closed in itertools.chain(*subpaths):
+        sub = ids[start:stop]
+        edges.append(np.column_stack([sub[:-1], sub[1:]]))
+        if closed:
+            edges.append([[sub[-1], sub[0]]])
+        else:
+            junction[sub[[0, -1]]] = True
+    edges = np.concatenate(edges + [np.zeros((0, 2), dtype=ids.dtype)])
+    edges = np.concatenate([edges, edges[:, ::-1]])
+    edges = np.unique(edges[edges[:, 0] != edges[:, 1]], axis=0)
+    degree = np.bincount(edges[:, 0], minlength=len(unique))
+    junction |= (degree != 2)
+
+    cache = {}
+
+    def simplify_chain(chain):
+        key = tuple(chain)
+        rkey = key[::-1]
+        if rkey < key:
+            return simplify_chain(chain[::-1])[::-1]
+        if key not in cache:
+            cache[key] = chain[douglas_peucker(pixels[chain], tolerance)]
+        return cache[key]
+
+    def simplify_subpath(sub, cuts):
+        kept = [sub[:1]]
+        for a, b in zip(cuts[:-1], cuts[1:]):
+            kept.append(simplify_chain(sub[a:b + 1])[1:])
+        return np.concatenate(kept)
+
+    simplified = list(paths)
+    for k, i in enumerate(eligible):
+        new_vertices = []
+        new_codes = []
+        for start, stop, closed in subpaths[k]:
+            kept = ids[start:stop]
+            if not closed:
+                kept = simplify_subpath(kept, np.flatnonzero(junction[kept]))
+            elif len(kept) >= 3:
+                # rotate the ring to start at a junction, or at the
+                # smallest vertex label if it has none, and close it
+                cuts = np.flatnonzero(junction[kept])
+                first = cuts[0] if len(cuts) else np.argmin(kept)
+                cuts = np.unique(np.concatenate([(cuts - first) % len(kept),
+                                                 [0, len(kept)]]))
+                ring = np.concatenate([kept[first:], kept[:first + 1]])
+                kept = simplify_subpath(ring, cuts)[:-1]
+                if len(kept) < 3:
+                    continue
+            new_vertices.append(unique[kept])
+            new_codes.extend(['M'] + ['L'] * (len(kept) - 1)
+                             + (['Z'] if closed else []))
+        if new_vertices:
+            simplified[i] = (np.concatenate(new_vertices), new_codes)
+        else:
+            simplified[i] = (np.zeros((0, 2)), [])
+    return simplified
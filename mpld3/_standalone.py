@@ -0,0 +1,321 @@
+"""
+Self-contained HTML
+===================
+
+Single HTML files which draw a figure without network access, for offline
+reports: the d3 and mpld3 libraries are embedded in the page, rather than
+loaded from their URLs.  As these are several times larger than most
+figures, they and the figure can be embedded compressed, as base64 zlib
+streams which the browser inflates with ``DecompressionStream``, or with a
+small inflater in the page where that isn't available.
+"""
+import base64
+import json
+import random
+import re
+import zlib
+
+import jinja2
+
+from . import urls
+from .utils import get_id
+
+__all__ = ["self_contained_html"]
+
+# A raw deflate (RFC 1951) decoder, for browsers without DecompressionStream.
+# Its tables and decoding loop follow zlib's puff.c.
+INFLATE_JS = """
+function mpld3_inflate(data){
+  var pos = 0, bitBuf = 0, bitCnt = 0;
+  var out = new Uint8Array(Math.max(1024, 4 * data.length)), outLen = 0;
+  var LBASE = [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31, 35,
+               43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258];
+  var LEXT = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4,
+              4, 4, 4, 5, 5, 5, 5, 0];
+  var DBASE = [1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193,
+               257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145, 8193,
+               12289, 16385, 24577];
+  var DEXT = [0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9,
+              9, 10, 10, 11, 11, 12, 12, 13, 13];
+  var ORDER = [16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1,
+               15];
+
+  function bits(n){
+    while(bitCnt < n){
+      if(pos >= data.length) throw "mpld3_inflate: unexpected end of data";
+      bitBuf |= data[pos++] << bitCnt;
+      bitCnt += 8;
+    }
+    var value = bitBuf & ((1 << n) - 1);
+    bitBuf >>>= n;
+    bitCnt -= n;
+    return value;
+  }
+
+  function huffman(lengths){
+    var counts = new Uint16Array(16), offsets = new Uint16Array(16);
+    var symbols = new Uint16Array(lengths.length);
+    for(var i = 0; i < lengths.length; i++) counts[lengths[i]]++;
+    counts[0] = 0;
+    for(var i = 1; i < 16; i++) offsets[i] = offsets[i - 1] + counts[i - 1];
+    for(var i = 0; i < lengths.length; i++){
+      if(lengths[i]) symbols[offsets[lengths[i]]++] = i;
+    }
+    return {counts: counts, symbols: symbols};
+  }
+
+  function decode(h){
+    var code = 0, first = 0, index = 0;
+    for(var len = 1; len < 16; len++){
+      code |= bits(1);
+      var count = h.counts[len];
+      if(code - count < first) return h.symbols[index + code - first];
+      index += count;
+      first = (first + count) << 1;
+      code <<= 1;
+    }
+    throw "mpld3_inflate: invalid code";
+  }
+
+  function reserve(n){
+    if(outLen + n > out.length){
+      var grown = new Uint8Array(Math.max(2 * out.length, outLen + n));
+      grown.set(out);
+      out = grown;
+    }
+  }
+
+  function inflateBlock(lencode, distcode){
+    for(;;){
+      var symbol = decode(lencode);
+      if(symbol < 256){
+        reserve(1);
+        out[outLen++] = symbol;
+      }else if(symbol === 256){
+        return;
+      }else{
+        symbol -= 257;
+        var len = LBASE[symbol] + bits(LEXT[symbol]);
+        symbol = decode(distcode);
+        var dist = DBASE[symbol] + bits(DEXT[symbol]);
+        reserve(len);
+        for(var i = 0; i < len; i++, outLen++) out[outLen] = out[outLen - dist];
+      }
+    }
+  }
+
+  var fixed = null, last = 0;
+  while(!last){
+    last = bits(1);
+    var type = bits(2);
+    if(type === 0){
+      bitBuf = bitCnt = 0;
+      var len = data[pos] | (data[pos + 1] << 8);
+      pos += 4;
+      reserve(len);
+      out.set(data.subarray(pos, pos + len), outLen);
+      pos += len;
+      outLen += len;
+    }else if(type === 1){
+      if(fixed === null){
+        var lengths = [];
+        for(var i = 0; i < 288; i++){
+          lengths.push(i < 144 ? 8 : i < 256 ? 9 : i < 280 ? 7 : 8);
+        }
+        var distances = [];
+        for(var i = 0; i < 30; i++) distances.push(5);
+        fixed = [huffman(lengths), huffman(distances)];
+      }
+      inflateBlock(fixed[0], fixed[1]);
+    }else if(type === 2){
+      var nlen = bits(5) + 257, ndist = bits(5) + 1, ncode = bits(4) + 4;
+      var lengths = [];
+      for(var i = 0; i < 19; i++) lengths.push(0);
+      for(var i = 0; i < ncode; i++) lengths[ORDER[i]] = bits(3);
+      var lencode = huffman(lengths);
+      lengths = [];
+      while(lengths.length < nlen + ndist){
+        var symbol = decode(lencode);
+        if(symbol < 16){
+          lengths.push(symbol);
+        }else{
+          var repeat = 0, count;
+          if(symbol === 16){
+            repeat = lengths[lengths.length - 1];
+            count = 3 + bits(2);
+          }else if(symbol === 17){
+            count = 3 + bits(3);
+          }else{
+            count = 11 + bits(7);
+          }
+          while(count--) lengths.push(repeat);
+        }
+      }
+      inflateBlock(huffman(lengths.slice(0, nlen)),
+                   huffman(lengths.slice(nlen)));
+    }else{
+      throw "mpld3_inflate: invalid block type";
+    }
+  }
+  return out.subarray(0, outLen);
+}
+"""
+
+SELF_CONTAINED_HTML = jinja2.Template("""
+<style>
+{{ extra_css }}
+</style>
+
+<div id={{ figid }}></div>
+{% if compress %}
+<script>
+!function(){
+  {{ inflate_js }}
+
+  function mpld3_decode(payload, callback){
+    var binary = atob(payload), bytes = new Uint8Array(binary.length);
+    for(var i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+
+    function text(bytes){
+      if(typeof TextDecoder !== "undefined"){
+        return new TextDecoder().decode(bytes);
+      }
+      var binary = "";
+      for(var i = 0; i < bytes.length; i += 8192){
+        binary += String.fromCharCode.apply(
+          null, Array.prototype.slice.call(bytes, i, i + 8192));
+      }
+      return decodeURIComponent(escape(binary));
+    }
+
+    function fallback(){
+      // skip the two bytes of the zlib header
+      callback(text(mpld3_inflate(bytes.subarray(2))));
+    }
+
+    if(typeof DecompressionStream === "undefined"){
+      return fallback();
+    }
+    try{
+      var stream = new Blob([bytes]).stream().pipeThrough(
+        new DecompressionStream("deflate"));
+      new Response(stream).text().then(callback, fallback);
+    }catch(e){
+      fallback();
+    }
+  }
+
+  function mpld3_run(code){
+    var s = document.createElement("script");
+    s.text = code;
+    document.getElementsByTagName("head")[0].appendChild(s);
+  }
+
+  var libraries = {{ libraries }};
+  var payloads = libraries.concat([{{ figure_json }}]);
+  var decoded = [], remaining = payloads.length;
+  payloads.forEach(function(payload, i){
+    mpld3_decode(payload, function(text){
+      decoded[i] = text;
+      if(--remaining) return;
+      if(typeof(mpld3) === "undefined" || !mpld3._mpld3IsLoaded){
+        decoded.slice(0, libraries.length).forEach(mpld3_run);
+      }
+      !function(mpld3){
+        {{ extra_js }}
+        mpld3.draw_figure({{ figid }}, JSON.parse(decoded[libraries.length]));
+      }(mpld3);
+    });
+  });
+}();
+</script>
+{% else %}
+{% for library in libraries %}
+<script>
+{{ library }}
+</script>
+{% endfor %}
+<script>
+!function(mpld3){
+  {{ extra_js }}
+  mpld3.draw_figure({{ figid }}, {{ figure_json }});
+}(mpld3);
+</script>
+{% endif %}
+""")
+
+
+def compress_payload(text):
+    """The base64 encoding of the zlib stream of a string"""
+    return base64.b64encode(
+        zlib.compress(text.encode('utf-8'), 9)).decode('ascii')
+
+
+def escape_unicode(match):
+    """The javascript escape of a character, as UTF-16 code units"""
+    units = bytearray(match.group(0).encode('utf-16-be'))
+    return ''.join('\\u{0:02x}{1:02x}'.format(units[i], units[i + 1])
+                   for i in range(0, len(units), 2))
+
+
+def script_safe(code):
+    """Javascript which can be embedded in a script element of any page
+
+    Closing script tags can only appear in strings, regular expressions and
+    comments, in all of which ``<\\/`` is the same as ``</``.  Non-ASCII
+    characters are escaped likewise, so that the page doesn't depend on
+    the encoding the browser assumes for it.
+    """
+    code = re.sub(r'</(script)', r'<\\/\1', code, flags=re.IGNORECASE)
+    return re.sub(u'[^\x00-\x7f]', escape_unicode, code)
+
+
+def self_contained_html(fig, compress=False, d3_src=None, mpld3_src=None,
+                        no_extras=False, figid=None, lazy=False, **kwargs):
+    """Output html representation of a figure, which needs no network
+
+    Parameters
+    ----------
+    fig : matplotlib figure
+        The figure to display
+    compress : boolean (optional)
+        If true, embed the libraries and the figure as base64 zlib streams,
+        inflated by the browser.
+    d3_src, mpld3_src : string (optional)
+        The files of the d3 and mpld3 libraries to embed.  Default to the
+        minified libraries shipped with mpld3.
+    no_extras, figid, lazy :
+        As for :func:`fig_to_html`.
+    **kwargs :
+        Additional keyword arguments passed to :func:`fig_to_dict`.
+    """
+    # imported here, as _display imports this module on use
+    from ._display import export_json, lazy_js
+
+    if figid is None:
+        figid = 'fig_' + get_id(fig) + str(int(random.random() * 1E10))
+    elif re.search(r'\s', figid):
+        raise ValueError("figid must not contain spaces")
+
+    figure_json, extra_css, extra_js = export_json(fig, **kwargs)
+    if no_extras:
+        extra_css = extra_js = ""
+    extra_js = lazy_js(lazy) + extra_js
+
+    libraries = []
+    for src in [d3_src or urls.D3_LOCAL, mpld3_src or urls.MPLD3MIN_LOCAL]:
+        with open(src, 'rb') as f:
+            libraries.append(f.read().decode('utf-8'))
+
+    if compress:
+        libraries = json.dumps([compress_payload(library)
+                                for library in libraries])
+        figure_json = json.dumps(compress_payload(figure_json))
+    else:
+        libraries = [script_safe(library) for library in libraries]
+        figure_json = script_safe(figure_json)
+
+    return SELF_CONTAINED_HTML.render(
+        figid=json.dumps(figid), compress=compress, inflate_js=INFLATE_JS,
+        libraries=libraries, figure_json=figure_json, extra_css=extra_css,
+        extra_js=extra_js)
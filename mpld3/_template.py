@@ -0,0 +1,237 @@
+"""
+Figure templates
+================
+
+Re-rendering of an exported figure with new data.  A :class:`Template`
+exports a matplotlib figure once, and then only swaps the data of its lines,
+markers and scatter collections, and the limits of their autoscaled axes,
+for each rendering.  The cost of a rendering is thus proportional to the
+size of the new data, and matplotlib is not involved.
+"""
+import json
+
+import numpy as np
+
+from .utils import get_id
+from .mpld3renderer import MPLD3Renderer, MPLD3Exporter
+from ._display import NumpyEncoder, dict_to_html
+from .spec import autoscale, data_bounds
+
+__all__ = ["Template"]
+
+# the elements whose data may be replaced: the key of their dataset, and
+# that of their coordinates
+BINDABLE_ELEMENTS = {"lines": ("data", "coordinates"),
+                     "markers": ("data", "coordinates"),
+                     "collections": ("offsets", "offsetcoordinates")}
+
+
+def as_columns(value):
+    """Return the x and y columns of an (x, y) tuple or an [N, 2] array"""
+    if isinstance(value, tuple):
+        x, y = value
+    else:
+        value = np.asarray(value)
+        if value.ndim != 2 or value.shape[1] != 2:
+            raise ValueError("Data is expected to be an (x, y) tuple "
+                             "or of size [N, 2]")
+        x, y = value.T
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional and of the same "
+                         "length")
+    return x, y
+
+
+class Template(object):
+    """A figure whose data can be replaced without re-exporting it
+
+    Create templates with :meth:`Template.from_figure`.
+    """
+    def __init__(self, figure_dict, extra_css="", extra_js="", labels=None,
+                 autoscale=None):
+        self.figure_dict = figure_dict
+        self.extra_css = extra_css
+        self.extra_js = extra_js
+        # element ids by artist label
+        self.labels = labels or {}
+        # the (x, y) autoscaling and margins of each axes
+        self.autoscale = autoscale or [(False, False, 0, 0)
+                                       for ax in figure_dict['axes']]
+
+        # the (axes index, element list, element index) of each element by
+        # id, and of the elements referencing each dataset
+        self.elements = {}
+        self.references = {}
+        self.bounds = {}
+        data = figure_dict['data']
+        for i, ax in enumerate(figure_dict['axes']):
+            for kind, elements in ax.items():
+                if not isinstance(elements, list):
+                    continue
+                for j, element in enumerate(elements):
+                    if not isinstance(element, dict):
+                        continue
+                    for value in element.values():
+                        if isinstance(value, str) and value in data:
+                            self.references.setdefault(value, set()).add(
+                                (i, kind, j))
+                    if kind in BINDABLE_ELEMENTS:
+                        self.elements.setdefault(element['id'], []).append(
+                            (i, kind, j))
+                        self.bounds[i, kind, j] = self.element_bounds(
+                            ax, kind, element, data)
+
+    @classmethod
+    def from_figure(cls, fig, **kwargs):
+        """Export a matplotlib figure as a template
+
+        Parameters
+        ----------
+        fig : matplotlib figure
+            The figure.  Lines and scatter plots whose data is to be
+            replaced may be given a label to refer to them.
+        **kwargs :
+            Additional keyword arguments passed to :class:`MPLD3Renderer`
+            or to mplexporter.Exporter, as for :func:`mpld3.fig_to_dict`.
+
+        Returns
+        -------
+        template : Template
+        """
+        renderer_kwargs = {}
+        for key in ['simplify_tolerance', 'image_tile_size',
+                    'image_tile_dir']:
+            if key in kwargs:
+                renderer_kwargs[key] = kwargs.pop(key)
+        renderer = MPLD3Renderer(**renderer_kwargs)
+        MPLD3Exporter(renderer, close_mpl=False, **kwargs).run(fig)
+        fig, figure_dict, extra_css, extra_js = renderer.finished_figures[0]
+
+        labels = {}
+        autoscaling = []
+        for ax in fig.axes:
+            for artist in ax.lines + ax.collections:
+                label = artist.get_label()
+                if label and not label.startswith('_'):
+                    labels.setdefault(label, []).extend(
+                        [get_id(artist), get_id(artist, 'pts')])
+            autoscaling.append((ax.get_autoscalex_on(),
+                                ax.get_autoscaley_on()) + ax.margins())
+        return cls(figure_dict, extra_css, extra_js, labels, autoscaling)
+
+    @staticmethod
+    def element_bounds(ax, kind, element, data):
+        """The (min, max, margin) x and y bounds of an element's data"""
+        key, coordinates = BINDABLE_ELEMENTS[kind]
+        if element.get(coordinates) != "data":
+            return None
+        dataset = np.asarray(data[element[key]], dtype=float)
+        return (data_bounds(dataset[:, element['xindex']], ax['xscale']),
+                data_bounds(dataset[:, element['yindex']], ax['yscale']))
+
+    def element_ids(self, key):
+        """The ids of the elements of an artist, label or element id"""
+        if isinstance(key, str):
+            ids = self.labels.get(key, [key])
+        else:
+            ids = [get_id(key), get_id(key, 'pts')]
+        ids = [i for i in ids if i in self.elements]
+        if not ids:
+            raise ValueError("No line or collection of the template "
+                             "matches {0!r}".format(key))
+        return ids
+
+    def render_dict(self, datasets=None):
+        """The dictionary representation of the figure with new data
+
+        Parameters
+        ----------
+        datasets : dict (optional)
+            The new data, as (x, y) tuples or [N, 2] arrays, keyed by
+            matplotlib artist, by artist label or by element id.  The limits
+            of autoscaled axes are updated to the new data.
+
+        Returns
+        -------
+        fig_dict : dict
+            The figure dictionary, as returned by :func:`mpld3.fig_to_dict`.
+            It shares its unchanged parts with the template, so it should
+            not be modified.
+        """
+        figure = dict(self.figure_dict)
+        data = dict(figure['data'])
+        axes = list(figure['axes'])
+        bounds = dict(self.bounds)
+        rebound = set()
+
+        for key, value in (datasets or {}).items():
+            x, y = as_columns(value)
+            label = "data{0:02d}".format(len(data) + 1)
+            while label in data:
+                label += "_"
+            data[label] = np.column_stack([x, y]).tolist()
+            for element_id in self.element_ids(key):
+                for i, kind, j in self.elements[element_id]:
+                    if axes[i] is figure['axes'][i]:
+                        axes[i] = dict(axes[i])
+                    ax = axes[i]
+                    if ax[kind] is figure['axes'][i][kind]:
+                        ax[kind] = list(ax[kind])
+                    element = ax[kind][j] = dict(ax[kind][j])
+                    datakey, coordinates = BINDABLE_ELEMENTS[kind]
+                    element.update({datakey: label, 'xindex': 0,
+                                    'yindex': 1})
+                    if element.get(coordinates) == "data":
+                        bounds[i, kind, j] = (data_bounds(x, ax['xscale']),
+                                              data_bounds(y, ax['yscale']))
+                    rebound.add((i, kind, j))
+
+        # drop the datasets no longer referenced
+        for label, references in self.references.items():
+            if references <= rebound:
+                del data[label]
+
+        # update the limits of autoscaled axes
+        for i, ax in enumerate(axes):
+            if ax is figure['axes'][i]:
+                continue
+            scale_x, scale_y, margin_x, margin_y = self.autoscale[i]
+            for axis, scale, margin in [(0, scale_x, margin_x),
+                                        (1, scale_y, margin_y)]:
+                name = "xy"[axis]
+                if not scale or ax[name + 'scale'] not in ('linear', 'log'):
+                    continue
+                limits = [b[axis] for (k, kind, j), b in bounds.items()
+                          if k == i and b is not None]
+                limits.extend((min(image['extent'][2 * axis:2 * axis + 2]),
+                               max(image['extent'][2 * axis:2 * axis + 2]),
+                               0)
+                              for image in ax['images']
+                              if image['coordinates'] == "data")
+                lim = autoscale(limits, ax[name + 'scale'], margin)
+                if ax[name + 'lim'][0] > ax[name + 'lim'][1]:
+                    lim = lim[::-1]
+                ax[name + 'lim'] = ax[name + 'domain'] = lim
+
+        figure['data'] = data
+        figure['axes'] = axes
+        return figure
+
+    def render_json(self, datasets=None):
+        """The JSON representation of the figure with new data"""
+        return json.dumps(self.render_dict(datasets), cls=NumpyEncoder)
+
+    def render(self, datasets=None, **kwargs):
+        """The HTML representation of the figure with new data
+
+        Parameters
+        ----------
+        datasets : dict (optional)
+            The new data, as for :meth:`render_dict`.
+        **kwargs :
+            Keyword arguments of :func:`mpld3.fig_to_html`, except those
+            controlling the export of matplotlib figures.
+        """
+        return dict_to_html(self.render_dict(datasets), self.extra_css,
+                            self.extra_js, **kwargs)
@@ -0,0 +1,170 @@
+"""
+Image tile pyramids
+===================
+
+Export of large images as a pyramid of fixed-size PNG tiles: level 0 holds
+the image at full resolution, and each further level halves the resolution
+of the previous one by block-mean downsampling, until the whole image fits
+in a single tile.  The client only loads the tiles of the level matching
+the current zoom which lie within the viewport.
+
+Tiles are built depth-first from chunks of the image array and handed on
+as soon as they are built, so that memory use is bounded by the tile size
+and the number of levels rather than by the image size, e.g. for images of
+memory-mapped arrays.  (Embedded tiles are of course kept.)
+"""
+import io
+import os
+import base64
+
+import numpy as np
+from matplotlib.image import imsave
+
+
+def block_mean(rgba):
+    """Halve the resolution of an RGBA image by averaging 2x2 blocks
+
+    Colors are averaged with alpha weighting, so that transparent pixels
+    don't darken their neighbours.  Images with an odd number of rows or
+    columns are averaged over the partial blocks at their edges.
+
+    Parameters
+    ----------
+    rgba : array_like
+        A shape [H, W, 4] RGBA image of floats or bytes.
+
+    Returns
+    -------
+    rgba : array
+        The shape [ceil(H / 2), ceil(W / 2), 4] float RGBA image.
+    """
+    rgba = np.asarray(rgba, dtype=float)
+    H, W = rgba.shape[:2]
+    h, w = -(-H // 2), -(-W // 2)
+    alpha = rgba[..., 3:]
+    weighted = np.zeros((2 * h, 2 * w, 4))
+    weighted[:H, :W, :3] = rgba[..., :3] * alpha
+    weighted[:H, :W, 3:] = alpha
+    counts = np.zeros((2 * h, 2 * w, 1))
+    counts[:H, :W] = 1
+
+    weighted = weighted.reshape(h, 2, w, 2, 4).sum(axis=(1, 3))
+    counts = counts.reshape(h, 2, w, 2, 1).sum(axis=(1, 3))
+    totals = weighted[..., 3:]
+    result = np.empty((h, w, 4))
+    result[..., :3] = np.where(totals > 0, weighted[..., :3] /
+                               np.where(totals > 0, totals, 1), 0)
+    result[..., 3:] = totals / counts
+    return result
+
+
+def n_levels(shape, tile_size):
+    """Number of pyramid levels needed for the coarsest to fit in a tile"""
+    levels = 1
+    size = max(shape[:2])
+    while size > tile_size:
+        size = -(-size // 2)
+        levels += 1
+    return levels
+
+
+def build_tiles(rgba_chunk, shape, tile_size, emit):
+    """Build the tiles of an image pyramid
+
+    Parameters
+    ----------
+    rgba_chunk : callable
+        ``rgba_chunk(rows, cols)`` returns the [H, W, 4] uint8 RGBA image of
+        the given slices of the full resolution image.
+    shape : tuple
+        The (rows, columns) shape of the full resolution image.
+    tile_size : int
+        The size of the (square) tiles in pixels.
+    emit : callable
+        Called as ``emit(level, row, col, rgba)`` with each uint8 RGBA tile
+        as soon as it is built.  Level 0 is the full resolution.
+    """
+    def build(level, row, col):
+        span = tile_size << level
+        if row * span >= shape[0] or col * span >= shape[1]:
+            return None
+        if level == 0:
+            rgba = rgba_chunk(slice(row * tile_size, (row + 1) * tile_size),
+                              slice(col * tile_size, (col + 1) * tile_size))
+            rgba = np.asarray(rgba, dtype=np.uint8)
+        else:
+            children = [[build(level - 1, 2 * row + i, 2 * col + j)
+                         for j in range(2)] for i in range(2)]
+            rgba = np.concatenate([
+                np.concatenate([c for c in pair if c is not None], axis=1)
+                for pair in children if pair[0] is not None], axis=0)
+            rgba = np.round(block_mean(rgba)).astype(np.uint8)
+        emit(level, row, col, rgba)
+        return rgba
+
+    build(n_levels(shape, tile_size) - 1, 0, 0)
+
+
+def encode_png(rgba):
+    """Encode a uint8 RGBA array as PNG bytes"""
+    buf = io.BytesIO()
+    imsave(buf, rgba, format='png')
+    return buf.getvalue()
+
+
+def image_pyramid(image, tile_size, tile_dir=None, name=None):
+    """Export a matplotlib image as a tile pyramid
+
+    Parameters
+    ----------
+    image : matplotlib.image.AxesImage
+        The image to export.
+    tile_size : int
+        The size of the (square) tiles in pixels.
+    tile_dir : string (optional)
+        If specified, write the tiles as PNG files to the directory
+        ``tile_dir/name/level/row_col.png`` and reference them by URL,
+        relative to the page if tile_dir is a relative path.  Otherwise,
+        embed the tiles as base64 strings.
+    name : string (optional)
+        The subdirectory of tile_dir for this image.
+
+    Returns
+    -------
+    props : dictionary
+        The tiled image element properties: "shape", "tilesize" and either
+        "tiles" (a list per level of the base64 tiles in row-major order) or
+        "url" (a template with {level}, {row} and {col} fields).
+    """
+    data = image.get_array()
+    if image.origin == 'lower':
+        data = data[::-1]
+    shape = data.shape[:2]
+
+    def rgba_chunk(rows, cols):
+        return image.to_rgba(data[rows, cols], bytes=True, norm=True)
+
+    props = dict(shape=list(shape), tilesize=tile_size)
+    tiles = [[] for i in range(n_levels(shape, tile_size))]
+
+    def emit(level, row, col, rgba):
+        png = encode_png(rgba)
+        if tile_dir is None:
+            tiles[level].append((row, col,
+                                 base64.b64encode(png).decode('utf-8')))
+            return
+        path = os.path.join(tile_dir, name, str(level),
+                            "{0}_{1}.png".format(row, col))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(png)
+
+    build_tiles(rgba_chunk, shape, tile_size, emit)
+    if tile_dir is None:
+        props['tiles'] = [[tile for row, col, tile in sorted(level)]
+                          for level in tiles]
+    else:
+        props['url'] = "/".join([tile_dir.replace(os.sep, "/").rstrip("/"),
+                                 name, "{level}", "{row}_{col}.png"])
+    return props
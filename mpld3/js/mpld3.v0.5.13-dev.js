@@ -37,15 +37,181 @@ mpld3.draw_figure = function(figid, spec, process, clearElem) {
   if (element === null) {
     throw figid + " is not a valid id";
   }
-  var fig = new mpld3.Figure(figid, spec);
+  if (mpld3.lazy !== null) {
+    mpld3_registerLazyFigure(element, spec, process);
+    return null;
+  }
+  return mpld3_drawFigure(element, spec, process);
+};
+
+function mpld3_drawFigure(element, spec, process, isWanted) {
+  if (mpld3_hasExternalData(spec)) {
+    mpld3_loadExternalData(spec, function(spec) {
+      if (!isWanted || isWanted()) {
+        mpld3_drawFigure(element, spec, process);
+      }
+    });
+    return null;
+  }
+  var fig = new mpld3.Figure(element.id, spec);
   if (process) {
     process(fig, element);
   }
   mpld3.figures.push(fig);
   fig.draw();
   return fig;
+}
+
+mpld3.lazy = null;
+
+mpld3.enable_lazy_drawing = function(options) {
+  if (typeof IntersectionObserver === "undefined") {
+    return false;
+  }
+  if (mpld3.lazy !== null) {
+    return true;
+  }
+  options = options || {};
+  var lazy = mpld3.lazy = {
+    figures: {},
+    teardownObserver: null
+  };
+  lazy.drawObserver = new IntersectionObserver(function(entries) {
+    entries.forEach(function(entry) {
+      var figure = lazy.figures[entry.target.id];
+      if (figure) {
+        figure.near = entry.isIntersecting;
+        mpld3_updateLazyFigure(entry.target, figure);
+      }
+    });
+  }, {
+    rootMargin: options.margin || "200px"
+  });
+  if (options.teardownMargin) {
+    lazy.teardownObserver = new IntersectionObserver(function(entries) {
+      entries.forEach(function(entry) {
+        var figure = lazy.figures[entry.target.id];
+        if (figure) {
+          figure.kept = entry.isIntersecting;
+          mpld3_updateLazyFigure(entry.target, figure);
+        }
+      });
+    }, {
+      rootMargin: options.teardownMargin
+    });
+  }
+  return true;
 };
 
+function mpld3_registerLazyFigure(element, spec, process) {
+  var lazy = mpld3.lazy;
+  lazy.figures[element.id] = {
+    spec: spec,
+    process: process,
+    drawn: false,
+    draws: 0,
+    near: false,
+    kept: true
+  };
+  element.style.minHeight = spec.height + "px";
+  var observers = [ lazy.drawObserver, lazy.teardownObserver ];
+  observers.forEach(function(observer) {
+    if (observer !== null) {
+      observer.unobserve(element);
+      observer.observe(element);
+    }
+  });
+}
+
+function mpld3_updateLazyFigure(element, figure) {
+  if (figure.near && !figure.drawn) {
+    figure.drawn = true;
+    var draws = ++figure.draws;
+    mpld3_drawFigure(element, figure.spec, figure.process, function() {
+      return mpld3.lazy.figures[element.id] === figure && figure.drawn && figure.draws === draws;
+    });
+  } else if (!figure.near && !figure.kept && figure.drawn) {
+    figure.drawn = false;
+    mpld3.remove_figure(element.id);
+  }
+}
+
+mpld3.dataCache = {};
+
+function mpld3_isExternalDataset(dataset) {
+  return !isUndefinedOrNull(dataset) && !Array.isArray(dataset) && "href" in dataset && "sha1" in dataset;
+}
+
+function mpld3_hasExternalData(spec) {
+  for (var label in spec.data) {
+    if (mpld3_isExternalDataset(spec.data[label])) {
+      return true;
+    }
+  }
+  return false;
+}
+
+function mpld3_loadExternalData(spec, callback) {
+  var labels = Object.keys(spec.data).filter(function(label) {
+    return mpld3_isExternalDataset(spec.data[label]);
+  });
+  var data = mpld3_cloneObj(spec.data);
+  var remaining = labels.length;
+  labels.forEach(function(label) {
+    mpld3_fetchDataset(spec.data[label], function(rows) {
+      data[label] = rows;
+      remaining--;
+      if (remaining === 0) {
+        var loaded = mpld3_cloneObj(spec);
+        loaded.data = data;
+        callback(loaded);
+      }
+    });
+  });
+}
+
+function mpld3_fetchDataset(ref, callback) {
+  var entry = mpld3.dataCache[ref.sha1];
+  if (entry) {
+    if (entry.rows) {
+      callback(entry.rows);
+    } else {
+      entry.callbacks.push(callback);
+    }
+    return;
+  }
+  entry = mpld3.dataCache[ref.sha1] = {
+    rows: null,
+    callbacks: [ callback ]
+  };
+  var request = new XMLHttpRequest();
+  request.open("GET", ref.href);
+  request.responseType = "arraybuffer";
+  request.onload = function() {
+    if (request.status !== 200) {
+      return failed();
+    }
+    var values = new Float64Array(request.response);
+    var columns = ref.shape[1];
+    var rows = [];
+    for (var i = 0; i < values.length; i += columns) {
+      rows.push(Array.prototype.slice.call(values, i, i + columns));
+    }
+    entry.rows = rows;
+    var callbacks = entry.callbacks;
+    entry.callbacks = [];
+    callbacks.forEach(function(callback) {
+      callback(rows);
+    });
+  };
+  request.onerror = failed;
+  request.send();
+  function failed() {
+    delete mpld3.dataCache[ref.sha1];
+    console.warn("failed to load dataset " + ref.href);
+  }
+}
+
 mpld3.cloneObj = mpld3_cloneObj;
 
 function mpld3_cloneObj(oldObj) {
@@ -75,7 +241,14 @@ mpld3.getTransformation = function(transform) {
   var g = document.createElementNS("http://www.w3.org/2000/svg", "g");
   g.setAttributeNS(null, "transform", transform);
   var matrix = g.transform.baseVal.consolidate().matrix;
-  var a = matrix.a, b = matrix.b, c = matrix.c, d = matrix.d, e = matrix.e, f = matrix.f;
+  return mpld3_matrixTransformation([ matrix.a, matrix.b, matrix.c, matrix.d, matrix.e, matrix.f ]);
+};
+
+mpld3.matrixTransformation = mpld3_matrixTransformation;
+
+function mpld3_matrixTransformation(matrix, scale) {
+  scale = isUndefined(scale) ? 1 : scale;
+  var a = matrix[0] * scale, b = matrix[1] * scale, c = matrix[2] * scale, d = matrix[3] * scale, e = matrix[4], f = matrix[5];
   var scaleX, scaleY, skewX;
   if (scaleX = Math.sqrt(a * a + b * b)) a /= scaleX, b /= scaleX;
   if (skewX = a * c + b * d) c -= a * skewX, d -= b * skewX;
@@ -91,7 +264,7 @@ mpld3.getTransformation = function(transform) {
   };
   var transformStr = "" + "translate(" + transformObj.translateX + "," + transformObj.translateY + ")" + "rotate(" + transformObj.rotate + ")" + "skewX(" + transformObj.skewX + ")" + "scale(" + transformObj.scaleX + "," + transformObj.scaleY + ")";
   return transformStr;
-};
+}
 
 mpld3.merge_objects = function(_) {
   var output = {};
@@ -141,7 +314,7 @@ mpld3.get_element = function(id, fig) {
       }
       for (var k = 0; k < ax.elements.length; k++) {
         el = ax.elements[k];
-        if (el.props.id === id) {
+        if (el.props.id === id || el.props.ids && el.props.ids.indexOf(id) !== -1) {
           return el;
         }
       }
@@ -202,6 +375,106 @@ function getMod(L, i) {
   return L.length > 0 ? L[i % L.length] : null;
 }
 
+mpld3.decodeArray = mpld3_decodeArray;
+
+var mpld3_typedArrays = {
+  int8: Int8Array,
+  uint8: Uint8Array,
+  int16: Int16Array,
+  uint16: Uint16Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  float32: Float32Array,
+  float64: Float64Array
+};
+
+var mpld3_base64Lookup = new Uint8Array(128);
+
+(function() {
+  var chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+  for (var i = 0; i < chars.length; i++) {
+    mpld3_base64Lookup[chars.charCodeAt(i)] = i;
+  }
+})();
+
+function mpld3_decodeArray(arr) {
+  if (isUndefinedOrNull(arr) || !("base64" in arr)) {
+    return arr;
+  }
+  var b64 = arr.base64;
+  var n = b64.length;
+  while (n > 0 && b64.charAt(n - 1) === "=") {
+    n--;
+  }
+  var bytes = new Uint8Array(Math.floor(n * 3 / 4));
+  for (var i = 0, j = 0; i < n; i += 4) {
+    var a = mpld3_base64Lookup[b64.charCodeAt(i)], b = mpld3_base64Lookup[b64.charCodeAt(i + 1)], c = mpld3_base64Lookup[b64.charCodeAt(i + 2)], d = mpld3_base64Lookup[b64.charCodeAt(i + 3)];
+    bytes[j++] = a << 2 | b >> 4;
+    if (i + 2 < n) bytes[j++] = (b & 15) << 4 | c >> 2;
+    if (i + 3 < n) bytes[j++] = (c & 3) << 6 | d;
+  }
+  return new mpld3_typedArrays[arr.dtype](bytes.buffer);
+}
+
+mpld3.StyleArray = mpld3_StyleArray;
+
+function mpld3_StyleArray(values) {
+  if (isUndefinedOrNull(values) || !("palette" in values)) {
+    this.palette = values;
+    this.index = null;
+    return;
+  }
+  this.palette = values.palette;
+  this.index = mpld3_decodeArray(values.index);
+  if ("runs" in values) {
+    var runs = mpld3_decodeArray(values.runs);
+    var N = 0;
+    for (var i = 0; i < runs.length; i++) {
+      N += runs[i];
+    }
+    var index = new this.index.constructor(N);
+    for (var i = 0, j = 0; i < runs.length; j += runs[i], i++) {
+      index.fill(this.index[i], j, j + runs[i]);
+    }
+    this.index = index;
+  }
+}
+
+mpld3_StyleArray.prototype.get = function(i) {
+  if (this.index === null) {
+    return getMod(this.palette, i);
+  }
+  return this.palette[this.index[i % this.index.length]];
+};
+
+mpld3_StyleArray.prototype.paletteIndex = function(i) {
+  if (this.index === null) {
+    return i % this.palette.length;
+  }
+  return this.index[i % this.index.length];
+};
+
+mpld3_StyleArray.prototype.size = function() {
+  if (this.index === null) {
+    return isUndefinedOrNull(this.palette) ? 0 : this.palette.length;
+  }
+  return this.index.length;
+};
+
+mpld3.decodeVertices = mpld3_decodeVertices;
+
+function mpld3_decodeVertices(vertices) {
+  var flat = mpld3_decodeArray(vertices);
+  if (flat === vertices) {
+    return vertices;
+  }
+  var pairs = new Array(flat.length / 2);
+  for (var i = 0; i < pairs.length; i++) {
+    pairs[i] = [ flat[2 * i], flat[2 * i + 1] ];
+  }
+  return pairs;
+}
+
 mpld3.path = function() {
   return mpld3_path();
 };
@@ -741,15 +1014,36 @@ mpld3_PathCollection.prototype.defaultProps = {
 
 function mpld3_PathCollection(ax, props) {
   mpld3_PlotElement.call(this, ax, props);
-  if (this.props.facecolors == null || this.props.facecolors.length == 0) {
-    this.props.facecolors = [ "none" ];
-  }
-  if (this.props.edgecolors == null || this.props.edgecolors.length == 0) {
-    this.props.edgecolors = [ "none" ];
+  this.edgecolors = new mpld3_StyleArray(this.props.edgecolors);
+  this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+  this.edgewidths = new mpld3_StyleArray(this.props.edgewidths);
+  this.alphas = new mpld3_StyleArray(this.props.alphas);
+  if (this.facecolors.palette == null || this.facecolors.palette.length == 0) {
+    this.facecolors.palette = [ "none" ];
+  }
+  if (this.edgecolors.palette == null || this.edgecolors.palette.length == 0) {
+    this.edgecolors.palette = [ "none" ];
+  }
+  this.props.facecolors = this.facecolors.palette;
+  this.props.edgecolors = this.edgecolors.palette;
+  this.props.edgewidths = this.edgewidths.palette;
+  this.props.alphas = this.alphas.palette;
+  this.paths = new mpld3_StyleArray(this.props.paths);
+  this.paths.palette = this.paths.palette.map(function(path) {
+    return [ mpld3_decodeVertices(path[0]), path[1] ];
+  });
+  this.props.paths = this.paths.palette;
+  this.pathCache = {};
+  var t = this.props.pathtransforms;
+  this.transformScales = null;
+  if (!isUndefinedOrNull(t) && "scales" in t) {
+    this.transformScales = mpld3_decodeArray(t.scales);
+    this.props.pathtransforms = [ t.matrix ];
   }
+  this.transformCache = {};
   var offsets = this.ax.fig.get_data(this.props.offsets);
   if (offsets === null || offsets.length === 0) offsets = [ null ];
-  var N = Math.max(this.props.paths.length, offsets.length);
+  var N = Math.max(this.paths.size(), offsets.length);
   if (offsets.length === N) {
     this.offsets = offsets;
   } else {
@@ -760,28 +1054,46 @@ function mpld3_PathCollection(ax, props) {
   this.offsetcoords = new mpld3_Coordinates(this.props.offsetcoordinates, this.ax);
 }
 
-mpld3_PathCollection.prototype.transformFunc = function(d, i) {
+mpld3_PathCollection.prototype.pathTransform = function(i) {
   var t = this.props.pathtransforms;
-  var transform = t.length == 0 ? "" : mpld3.getTransformation("matrix(" + getMod(t, i) + ")").toString();
+  if (t.length == 0) {
+    return "";
+  }
+  if (this.transformScales !== null) {
+    return mpld3_matrixTransformation(t[0], this.transformScales[i % this.transformScales.length]);
+  }
+  var k = i % t.length;
+  if (!(k in this.transformCache)) {
+    this.transformCache[k] = mpld3_matrixTransformation(t[k]);
+  }
+  return this.transformCache[k];
+};
+
+mpld3_PathCollection.prototype.transformFunc = function(d, i) {
+  var transform = this.pathTransform(i);
   var offset = d === null || typeof d === "undefined" ? "translate(0, 0)" : "translate(" + this.offsetcoords.xy(d, this.props.xindex, this.props.yindex) + ")";
   return this.props.offsetorder === "after" ? transform + offset : offset + transform;
 };
 
 mpld3_PathCollection.prototype.pathFunc = function(d, i) {
-  return mpld3_path().x(function(d) {
-    return this.pathcoords.x(d[0]);
-  }.bind(this)).y(function(d) {
-    return this.pathcoords.y(d[1]);
-  }.bind(this)).apply(this, getMod(this.props.paths, i));
+  var k = this.paths.paletteIndex(i);
+  if (!(k in this.pathCache)) {
+    this.pathCache[k] = mpld3_path().x(function(d) {
+      return this.pathcoords.x(d[0]);
+    }.bind(this)).y(function(d) {
+      return this.pathcoords.y(d[1]);
+    }.bind(this)).apply(this, this.paths.palette[k]);
+  }
+  return this.pathCache[k];
 };
 
 mpld3_PathCollection.prototype.styleFunc = function(d, i) {
-  var stroke = getMod(this.props.edgecolors, i);
-  var fill = getMod(this.props.facecolors, i);
-  var alpha = getMod(this.props.alphas, i);
+  var stroke = this.edgecolors.get(i);
+  var fill = this.facecolors.get(i);
+  var alpha = this.alphas.get(i);
   var styles = {
     stroke: stroke,
-    "stroke-width": getMod(this.props.edgewidths, i),
+    "stroke-width": this.edgewidths.get(i),
     fill: fill
   };
   if (stroke.slice(0, 5) != "rgba(") {
@@ -818,6 +1130,600 @@ mpld3_PathCollection.prototype.elements = function(d) {
   return this.group.selectAll("path");
 };
 
+mpld3.LineCollection = mpld3_LineCollection;
+
+mpld3_LineCollection.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_LineCollection.prototype.constructor = mpld3_LineCollection;
+
+mpld3_LineCollection.prototype.requiredProps = [ "vertices", "starts" ];
+
+mpld3_LineCollection.prototype.defaultProps = {
+  coordinates: "data",
+  edgecolors: [ "#000000" ],
+  edgewidths: [ 1 ],
+  alpha: 1,
+  zorder: 2
+};
+
+function mpld3_LineCollection(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.vertices = mpld3_decodeVertices(this.props.vertices);
+  this.starts = mpld3_decodeArray(this.props.starts);
+  this.edgecolors = new mpld3_StyleArray(this.props.edgecolors);
+  this.edgewidths = new mpld3_StyleArray(this.props.edgewidths);
+  if (this.edgecolors.palette == null || this.edgecolors.palette.length == 0) {
+    this.edgecolors.palette = [ "none" ];
+  }
+  this.props.edgecolors = this.edgecolors.palette;
+  this.props.edgewidths = this.edgewidths.palette;
+  this.coords = new mpld3_Coordinates(this.props.coordinates, this.ax);
+}
+
+mpld3_LineCollection.prototype.styleGroups = function() {
+  var groups = [];
+  var lookup = {};
+  var n = this.starts.length;
+  for (var i = 0; i < n; i++) {
+    var ci = this.edgecolors.paletteIndex(i), wi = this.edgewidths.paletteIndex(i);
+    var key = ci + "," + wi;
+    if (!(key in lookup)) {
+      lookup[key] = groups.length;
+      groups.push({
+        color: this.edgecolors.palette[ci],
+        width: this.edgewidths.palette[wi],
+        d: []
+      });
+    }
+    var d = groups[lookup[key]].d;
+    var stop = i + 1 < n ? this.starts[i + 1] : this.vertices.length;
+    var command = "M ";
+    for (var j = this.starts[i]; j < stop; j++) {
+      var x = this.coords.x(this.vertices[j][0]), y = this.coords.y(this.vertices[j][1]);
+      if (isFinite(x) && isFinite(y)) {
+        d.push(command + x + " " + y);
+        command = "L ";
+      } else {
+        command = "M ";
+      }
+    }
+  }
+  groups.forEach(function(group) {
+    group.d = group.d.join(" ");
+  });
+  return groups;
+};
+
+mpld3_LineCollection.prototype.draw = function() {
+  if (this.coords.zoomable) {
+    this.group = this.ax.paths.append("svg:g");
+  } else {
+    this.group = this.ax.staticPaths.append("svg:g");
+  }
+  var alpha = this.props.alpha;
+  this.pathsobj = this.group.selectAll("paths").data(this.styleGroups()).enter().append("svg:path").attr("d", function(d) {
+    return d.d;
+  }).attr("class", "mpld3-path").style("stroke", function(d) {
+    return d.color;
+  }).style("stroke-width", function(d) {
+    return d.width;
+  }).style("stroke-opacity", function(d) {
+    return d.color.slice(0, 5) != "rgba(" ? alpha : null;
+  }).style("fill", "none").attr("vector-effect", "non-scaling-stroke");
+};
+
+mpld3_LineCollection.prototype.elements = function(d) {
+  return this.group.selectAll("path");
+};
+
+mpld3.Bars = mpld3_Bars;
+
+mpld3_Bars.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_Bars.prototype.constructor = mpld3_Bars;
+
+mpld3_Bars.prototype.requiredProps = [ "data" ];
+
+mpld3_Bars.prototype.defaultProps = {
+  xindex: 0,
+  yindex: 1,
+  widthindex: 2,
+  heightindex: 3,
+  facecolors: [ "green" ],
+  edgecolor: "black",
+  edgewidth: 1,
+  dasharray: "none",
+  alpha: 1,
+  zorder: 1,
+  ids: []
+};
+
+function mpld3_Bars(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.data = ax.fig.get_data(this.props.data);
+  this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+  this.props.facecolors = this.facecolors.palette;
+  this.coords = new mpld3_Coordinates("data", this.ax);
+}
+
+mpld3_Bars.prototype.pathStrings = function() {
+  var props = this.props;
+  var paths = this.facecolors.palette.map(function() {
+    return [];
+  });
+  for (var i = 0; i < this.data.length; i++) {
+    var d = this.data[i];
+    var x0 = this.coords.x(d[props.xindex]), x1 = this.coords.x(d[props.xindex] + d[props.widthindex]), y0 = this.coords.y(d[props.yindex]), y1 = this.coords.y(d[props.yindex] + d[props.heightindex]);
+    if (isFinite(x0) && isFinite(x1) && isFinite(y0) && isFinite(y1)) {
+      paths[this.facecolors.paletteIndex(i)].push("M " + x0 + " " + y0 + " H " + x1 + " V " + y1 + " H " + x0 + " Z");
+    }
+  }
+  return paths.map(function(path) {
+    return path.join(" ");
+  });
+};
+
+mpld3_Bars.prototype.draw = function() {
+  this.group = this.ax.paths.append("svg:g");
+  var paths = this.pathStrings();
+  for (var i = 0; i < paths.length; i++) {
+    if (paths[i].length === 0) {
+      continue;
+    }
+    var facecolor = this.props.facecolors[i];
+    var path = this.group.append("svg:path").attr("d", paths[i]).attr("class", "mpld3-path").style("stroke", this.props.edgecolor).style("stroke-width", this.props.edgewidth).style("stroke-dasharray", this.props.dasharray).style("fill", facecolor).attr("vector-effect", "non-scaling-stroke");
+    if (this.props.edgecolor.slice(0, 5) != "rgba(") {
+      path.style("stroke-opacity", this.props.alpha);
+    }
+    if (facecolor.slice(0, 5) != "rgba(") {
+      path.style("fill-opacity", this.props.alpha);
+    }
+  }
+};
+
+mpld3_Bars.prototype.elements = function(d) {
+  return this.group.selectAll("path");
+};
+
+mpld3.Errorbars = mpld3_Errorbars;
+
+mpld3_Errorbars.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_Errorbars.prototype.constructor = mpld3_Errorbars;
+
+mpld3_Errorbars.prototype.requiredProps = [ "data" ];
+
+mpld3_Errorbars.prototype.defaultProps = {
+  xindex: 0,
+  yindex: 1,
+  xerrindex: null,
+  yerrindex: null,
+  color: "black",
+  linewidth: 1,
+  alpha: 1,
+  capsize: 0,
+  capwidth: 1,
+  zorder: 2
+};
+
+function mpld3_Errorbars(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.data = ax.fig.get_data(this.props.data);
+}
+
+mpld3_Errorbars.prototype.pathStrings = function(transform) {
+  transform = transform || d3.zoomIdentity;
+  var ax = this.ax;
+  var x = function(d) {
+    return transform.applyX(ax.x(d));
+  };
+  var y = function(d) {
+    return transform.applyY(ax.y(d));
+  };
+  var props = this.props;
+  var c = 0.5 * props.capsize;
+  var whiskers = [];
+  var caps = [];
+  for (var i = 0; i < this.data.length; i++) {
+    var d = this.data[i];
+    if (props.xerrindex !== null) {
+      var x0 = x(d[props.xerrindex[0]]), x1 = x(d[props.xerrindex[1]]), yc = y(d[props.yindex]);
+      if (isFinite(x0) && isFinite(x1) && isFinite(yc)) {
+        whiskers.push("M " + x0 + " " + yc + " H " + x1);
+        caps.push("M " + x0 + " " + (yc - c) + " v " + 2 * c + " M " + x1 + " " + (yc - c) + " v " + 2 * c);
+      }
+    }
+    if (props.yerrindex !== null) {
+      var y0 = y(d[props.yerrindex[0]]), y1 = y(d[props.yerrindex[1]]), xc = x(d[props.xindex]);
+      if (isFinite(y0) && isFinite(y1) && isFinite(xc)) {
+        whiskers.push("M " + xc + " " + y0 + " V " + y1);
+        caps.push("M " + (xc - c) + " " + y0 + " h " + 2 * c + " M " + (xc - c) + " " + y1 + " h " + 2 * c);
+      }
+    }
+  }
+  return [ whiskers.join(" "), c > 0 ? caps.join(" ") : "" ];
+};
+
+mpld3_Errorbars.prototype.draw = function() {
+  this.group = this.ax.pathsContainer.append("svg:g");
+  var paths = this.pathStrings();
+  var widths = [ this.props.linewidth, this.props.capwidth ];
+  for (var i = 0; i < paths.length; i++) {
+    var path = this.group.append("svg:path").attr("d", paths[i]).attr("class", "mpld3-path").style("stroke", this.props.color).style("stroke-width", widths[i]).style("fill", "none");
+    if (this.props.color.slice(0, 5) != "rgba(") {
+      path.style("stroke-opacity", this.props.alpha);
+    }
+  }
+};
+
+mpld3_Errorbars.prototype.elements = function(d) {
+  return this.group.selectAll("path");
+};
+
+mpld3_Errorbars.prototype.zoomed = function(transform) {
+  var paths = this.pathStrings(transform);
+  this.elements().attr("d", function(d, i) {
+    return paths[i];
+  });
+};
+
+mpld3.Quiver = mpld3_Quiver;
+
+mpld3_Quiver.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_Quiver.prototype.constructor = mpld3_Quiver;
+
+mpld3_Quiver.prototype.requiredProps = [ "data", "glyph", "scale" ];
+
+mpld3_Quiver.prototype.defaultProps = {
+  xindex: 0,
+  yindex: 1,
+  uindex: 2,
+  vindex: 3,
+  angles: "uv",
+  scaleunits: null,
+  pivot: "tail",
+  shortlength: 0,
+  dotlength: 0,
+  facecolors: [ "black" ],
+  edgecolor: "none",
+  edgewidth: 0,
+  alpha: 1,
+  zorder: 1
+};
+
+var mpld3_quiverPivots = {
+  tail: 0,
+  middle: .5,
+  tip: 1
+};
+
+function mpld3_Quiver(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.data = ax.fig.get_data(this.props.data);
+  this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+  this.props.facecolors = this.facecolors.palette;
+}
+
+mpld3_Quiver.prototype.arrow = function(length) {
+  var props = this.props;
+  var vertices = [];
+  if (length < props.dotlength) {
+    var r = .5 * props.dotlength;
+    for (var k = 0; k < 6; k++) {
+      vertices.push([ r * Math.cos(k * Math.PI / 3), r * Math.sin(k * Math.PI / 3) ]);
+    }
+    return vertices;
+  }
+  var shift = mpld3_quiverPivots[props.pivot] * length;
+  var shrink = 1;
+  var shaft = length;
+  if (length < props.shortlength) {
+    shrink = length / props.shortlength;
+    shaft = props.shortlength;
+  }
+  for (var i = 0; i < props.glyph.length; i++) {
+    var g = props.glyph[i];
+    vertices.push([ (g[0] + g[2] * shaft) * shrink - shift, g[1] * shrink ]);
+  }
+  return vertices;
+};
+
+mpld3_Quiver.prototype.pathStrings = function(transform) {
+  transform = transform || d3.zoomIdentity;
+  var ax = this.ax;
+  var x = function(d) {
+    return transform.applyX(ax.x(d));
+  };
+  var y = function(d) {
+    return transform.applyY(ax.y(d));
+  };
+  var props = this.props;
+  var paths = this.facecolors.palette.map(function() {
+    return [];
+  });
+  for (var i = 0; i < this.data.length; i++) {
+    var d = this.data[i];
+    var u = d[props.uindex], v = d[props.vindex];
+    var px = x(d[props.xindex]), py = y(d[props.yindex]);
+    if (!(isFinite(px) && isFinite(py) && isFinite(u) && isFinite(v))) {
+      continue;
+    }
+    var dx = u, dy = v;
+    if (props.angles === "xy" || props.scaleunits === "xy") {
+      dx = x(d[props.xindex] + u) - px;
+      dy = py - y(d[props.yindex] + v);
+    }
+    var theta = props.angles === "xy" ? Math.atan2(dy, dx) : Math.atan2(v, u);
+    var length = props.scale * (props.scaleunits === "xy" ? Math.sqrt(dx * dx + dy * dy) : Math.sqrt(u * u + v * v));
+    var c = Math.cos(theta), s = Math.sin(theta);
+    var arrow = this.arrow(length).map(function(p) {
+      return px + c * p[0] - s * p[1] + " " + (py - s * p[0] - c * p[1]);
+    });
+    paths[this.facecolors.paletteIndex(i)].push("M " + arrow.join(" L ") + " Z");
+  }
+  return paths.map(function(path) {
+    return path.join(" ");
+  });
+};
+
+mpld3_Quiver.prototype.draw = function() {
+  this.group = this.ax.pathsContainer.append("svg:g");
+  var paths = this.pathStrings();
+  for (var i = 0; i < paths.length; i++) {
+    var facecolor = this.props.facecolors[i];
+    var edgecolor = this.props.edgecolor === "face" ? facecolor : this.props.edgecolor;
+    var path = this.group.append("svg:path").attr("d", paths[i]).attr("class", "mpld3-path").style("stroke", edgecolor).style("stroke-width", this.props.edgewidth).style("fill", facecolor);
+    if (edgecolor.slice(0, 5) != "rgba(") {
+      path.style("stroke-opacity", this.props.alpha);
+    }
+    if (facecolor.slice(0, 5) != "rgba(") {
+      path.style("fill-opacity", this.props.alpha);
+    }
+  }
+};
+
+mpld3_Quiver.prototype.elements = function(d) {
+  return this.group.selectAll("path");
+};
+
+mpld3_Quiver.prototype.zoomed = function(transform) {
+  var paths = this.pathStrings(transform);
+  this.elements().attr("d", function(d, i) {
+    return paths[i];
+  });
+};
+
+mpld3.QuadMesh = mpld3_QuadMesh;
+
+mpld3_QuadMesh.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_QuadMesh.prototype.constructor = mpld3_QuadMesh;
+
+mpld3_QuadMesh.prototype.requiredProps = [ "x", "y", "values", "lut" ];
+
+mpld3_QuadMesh.prototype.defaultProps = {
+  scale: "linear",
+  vmin: 0,
+  vmax: 1,
+  zorder: 1
+};
+
+var mpld3_quadMeshMaxSVGCells = 4096;
+
+function mpld3_QuadMesh(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.ny = this.props.values.shape[0];
+  this.nx = this.props.values.shape[1];
+  this.rectilinear = this.props.x.shape.length == 1;
+  this.x = mpld3_decodeArray(this.props.x);
+  this.y = mpld3_decodeArray(this.props.y);
+  this.lut = mpld3_decodeArray(this.props.lut);
+  this.N = this.lut.length / 4 - 3;
+  var values = mpld3_decodeArray(this.props.values);
+  this.colors = new Uint16Array(values.length);
+  for (var i = 0; i < values.length; i++) {
+    this.colors[i] = this.colorIndex(values[i]);
+  }
+}
+
+mpld3_QuadMesh.prototype.colorIndex = function(value) {
+  var props = this.props;
+  var N = this.N;
+  var xa = value;
+  if (props.scale !== "index") {
+    var vmin = props.vmin, vmax = props.vmax;
+    if (props.scale === "log") {
+      value = value > 0 ? Math.log(value) : NaN;
+      vmin = Math.log(vmin);
+      vmax = Math.log(vmax);
+    }
+    xa = N * (vmax == vmin ? 0 : (value - vmin) / (vmax - vmin));
+    if (xa == N) {
+      xa = N - 1;
+    }
+  }
+  if (isNaN(xa)) {
+    return N + 2;
+  } else if (xa < 0) {
+    return N;
+  } else if (xa >= N) {
+    return N + 1;
+  }
+  return Math.floor(xa);
+};
+
+mpld3_QuadMesh.prototype.colorString = function(k) {
+  var lut = this.lut;
+  return "rgba(" + lut[4 * k] + "," + lut[4 * k + 1] + "," + lut[4 * k + 2] + "," + lut[4 * k + 3] / 255 + ")";
+};
+
+mpld3_QuadMesh.prototype.corners = function(i, j) {
+  var nx = this.nx;
+  var x = this.ax.x, y = this.ax.y;
+  if (this.rectilinear) {
+    var x0 = x(this.x[i]), x1 = x(this.x[i + 1]), y0 = y(this.y[j]), y1 = y(this.y[j + 1]);
+    return [ [ x0, y0 ], [ x1, y0 ], [ x1, y1 ], [ x0, y1 ] ];
+  }
+  var k = j * (nx + 1) + i;
+  var vertices = [ k, k + 1, k + nx + 2, k + nx + 1 ];
+  return vertices.map(function(k) {
+    return [ x(this.x[k]), y(this.y[k]) ];
+  }, this);
+};
+
+mpld3_QuadMesh.prototype.cellsByColor = function() {
+  var cells = {};
+  for (var j = 0; j < this.ny; j++) {
+    for (var i = 0; i < this.nx; i++) {
+      var k = this.colors[j * this.nx + i];
+      if (this.lut[4 * k + 3] === 0) {
+        continue;
+      }
+      var corners = this.corners(i, j);
+      if (!corners.every(function(p) {
+        return isFinite(p[0]) && isFinite(p[1]);
+      })) {
+        continue;
+      }
+      if (!(k in cells)) {
+        cells[k] = [];
+      }
+      cells[k].push(corners);
+    }
+  }
+  return cells;
+};
+
+mpld3_QuadMesh.prototype.pathStrings = function() {
+  var cells = this.cellsByColor();
+  var paths = [];
+  for (var k in cells) {
+    paths.push({
+      color: this.colorString(k),
+      d: cells[k].map(function(corners) {
+        return "M " + corners.map(function(p) {
+          return p[0] + " " + p[1];
+        }).join(" L ") + " Z";
+      }).join(" ")
+    });
+  }
+  return paths;
+};
+
+mpld3_QuadMesh.prototype.pixelGrid = function() {
+  if (!this.rectilinear) {
+    return null;
+  }
+  var ax = this.ax;
+  var even = function(edges, scale) {
+    var p0 = scale(edges[0]), p1 = scale(edges[edges.length - 1]);
+    var step = (p1 - p0) / (edges.length - 1);
+    for (var i = 1; i < edges.length - 1; i++) {
+      if (Math.abs(scale(edges[i]) - p0 - i * step) > .001 * Math.abs(step)) {
+        return null;
+      }
+    }
+    return [ p0, p1 ];
+  };
+  var x = even(this.x, ax.x), y = even(this.y, ax.y);
+  return x === null || y === null ? null : [ x, y ];
+};
+
+mpld3_QuadMesh.prototype.rasterize = function() {
+  if (typeof document === "undefined") {
+    return null;
+  }
+  var canvas = document.createElement("canvas");
+  var ctx = canvas.getContext && canvas.getContext("2d");
+  if (!ctx) {
+    return null;
+  }
+  var grid = this.pixelGrid();
+  var nx = this.nx, ny = this.ny;
+  if (grid !== null) {
+    canvas.width = nx;
+    canvas.height = ny;
+    var image = ctx.createImageData(nx, ny);
+    var flipx = grid[0][1] < grid[0][0], flipy = grid[1][1] < grid[1][0];
+    for (var j = 0; j < ny; j++) {
+      for (var i = 0; i < nx; i++) {
+        var k = 4 * this.colors[j * nx + i];
+        var p = 4 * ((flipy ? ny - 1 - j : j) * nx + (flipx ? nx - 1 - i : i));
+        for (var c = 0; c < 4; c++) {
+          image.data[p + c] = this.lut[k + c];
+        }
+      }
+    }
+    ctx.putImageData(image, 0, 0);
+    return {
+      canvas: canvas,
+      pixelated: true,
+      extent: [ Math.min(grid[0][0], grid[0][1]), Math.max(grid[0][0], grid[0][1]), Math.min(grid[1][0], grid[1][1]), Math.max(grid[1][0], grid[1][1]) ]
+    };
+  }
+  var cells = this.cellsByColor();
+  var extent = [ Infinity, -Infinity, Infinity, -Infinity ];
+  for (var k in cells) {
+    cells[k].forEach(function(corners) {
+      corners.forEach(function(p) {
+        extent[0] = Math.min(extent[0], p[0]);
+        extent[1] = Math.max(extent[1], p[0]);
+        extent[2] = Math.min(extent[2], p[1]);
+        extent[3] = Math.max(extent[3], p[1]);
+      });
+    });
+  }
+  if (!(extent[1] > extent[0] && extent[3] > extent[2])) {
+    return null;
+  }
+  canvas.width = Math.ceil(extent[1] - extent[0]);
+  canvas.height = Math.ceil(extent[3] - extent[2]);
+  ctx.translate(-extent[0], -extent[2]);
+  for (var k in cells) {
+    var color = this.colorString(k);
+    ctx.beginPath();
+    cells[k].forEach(function(corners) {
+      ctx.moveTo(corners[0][0], corners[0][1]);
+      for (var n = 1; n < 4; n++) {
+        ctx.lineTo(corners[n][0], corners[n][1]);
+      }
+      ctx.closePath();
+    });
+    ctx.fillStyle = color;
+    ctx.fill();
+    if (this.lut[4 * k + 3] === 255) {
+      ctx.strokeStyle = color;
+      ctx.lineWidth = .5;
+      ctx.stroke();
+    }
+  }
+  return {
+    canvas: canvas,
+    pixelated: false,
+    extent: extent
+  };
+};
+
+mpld3_QuadMesh.prototype.draw = function() {
+  this.group = this.ax.paths.append("svg:g");
+  var raster = this.nx * this.ny > mpld3_quadMeshMaxSVGCells ? this.rasterize() : null;
+  if (raster !== null) {
+    var extent = raster.extent;
+    this.group.append("svg:image").attr("class", "mpld3-image").attr("xlink:href", raster.canvas.toDataURL("image/png")).attr("x", extent[0]).attr("y", extent[2]).attr("width", extent[1] - extent[0]).attr("height", extent[3] - extent[2]).attr("preserveAspectRatio", "none").style("image-rendering", raster.pixelated ? "pixelated" : null);
+    return;
+  }
+  this.group.selectAll("paths").data(this.pathStrings()).enter().append("svg:path").attr("d", function(d) {
+    return d.d;
+  }).attr("class", "mpld3-path").style("fill", function(d) {
+    return d.color;
+  }).style("stroke", "none").attr("shape-rendering", "crispEdges");
+};
+
+mpld3_QuadMesh.prototype.elements = function(d) {
+  return this.group.selectAll("path, image");
+};
+
 mpld3.Line = mpld3_Line;
 
 mpld3_Line.prototype = Object.create(mpld3_Path.prototype);
@@ -956,6 +1862,116 @@ mpld3_Image.prototype.updateDimensions = function() {
   this.image.attr("x", this.coords.x(extent[0])).attr("y", this.coords.y(extent[3])).attr("width", this.coords.x(extent[1]) - this.coords.x(extent[0])).attr("height", this.coords.y(extent[2]) - this.coords.y(extent[3]));
 };
 
+mpld3.TiledImage = mpld3_TiledImage;
+
+mpld3_TiledImage.prototype = Object.create(mpld3_PlotElement.prototype);
+
+mpld3_TiledImage.prototype.constructor = mpld3_TiledImage;
+
+mpld3_TiledImage.prototype.requiredProps = [ "extent", "shape", "tilesize" ];
+
+mpld3_TiledImage.prototype.defaultProps = {
+  tiles: null,
+  url: null,
+  alpha: 1,
+  coordinates: "data",
+  zorder: 1
+};
+
+function mpld3_TiledImage(ax, props) {
+  mpld3_PlotElement.call(this, ax, props);
+  this.coords = new mpld3_Coordinates(this.props.coordinates, this.ax);
+  this.levels = 1;
+  var size = Math.max(this.props.shape[0], this.props.shape[1]);
+  while (size > this.props.tilesize) {
+    size = Math.ceil(size / 2);
+    this.levels++;
+  }
+}
+
+mpld3_TiledImage.prototype.grid = function(level) {
+  var span = this.props.tilesize * Math.pow(2, level);
+  return [ Math.ceil(this.props.shape[0] / span), Math.ceil(this.props.shape[1] / span) ];
+};
+
+mpld3_TiledImage.prototype.tileUrl = function(level, row, col) {
+  if (this.props.tiles !== null) {
+    var cols = this.grid(level)[1];
+    return "data:image/png;base64," + this.props.tiles[level][row * cols + col];
+  }
+  return this.props.url.replace("{level}", level).replace("{row}", row).replace("{col}", col);
+};
+
+mpld3_TiledImage.prototype.bounds = function() {
+  var extent = this.props.extent;
+  return [ this.coords.x(extent[0]), this.coords.x(extent[1]), this.coords.y(extent[3]), this.coords.y(extent[2]) ];
+};
+
+mpld3_TiledImage.prototype.tileRect = function(level, row, col) {
+  var b = this.bounds();
+  var H = this.props.shape[0], W = this.props.shape[1];
+  var span = this.props.tilesize * Math.pow(2, level);
+  var x0 = b[0] + (b[1] - b[0]) * col * span / W, x1 = b[0] + (b[1] - b[0]) * Math.min((col + 1) * span, W) / W, y0 = b[2] + (b[3] - b[2]) * row * span / H, y1 = b[2] + (b[3] - b[2]) * Math.min((row + 1) * span, H) / H;
+  return [ Math.min(x0, x1), Math.min(y0, y1), Math.abs(x1 - x0), Math.abs(y1 - y0) ];
+};
+
+mpld3_TiledImage.prototype.visibleTiles = function(transform) {
+  transform = transform || d3.zoomIdentity;
+  var H = this.props.shape[0], W = this.props.shape[1];
+  var b = this.bounds();
+  var top = this.levels - 1;
+  var tiles = [ {
+    level: top,
+    row: 0,
+    col: 0
+  } ];
+  var pixels = transform.k * Math.max(Math.abs(b[1] - b[0]) / W, Math.abs(b[3] - b[2]) / H);
+  var level = Math.floor(Math.log(1 / pixels) / Math.LN2);
+  level = Math.max(0, Math.min(top, level));
+  if (level == top) {
+    return tiles;
+  }
+  var cols = [ (transform.invertX(0) - b[0]) / (b[1] - b[0]) * W, (transform.invertX(this.ax.width) - b[0]) / (b[1] - b[0]) * W ], rows = [ (transform.invertY(0) - b[2]) / (b[3] - b[2]) * H, (transform.invertY(this.ax.height) - b[2]) / (b[3] - b[2]) * H ];
+  var span = this.props.tilesize * Math.pow(2, level);
+  var grid = this.grid(level);
+  var range = function(limits, n) {
+    var start = Math.floor(Math.min(limits[0], limits[1]) / span), stop = Math.ceil(Math.max(limits[0], limits[1]) / span);
+    return [ Math.max(0, start), Math.min(n, stop) ];
+  };
+  var r = range(rows, grid[0]), c = range(cols, grid[1]);
+  for (var row = r[0]; row < r[1]; row++) {
+    for (var col = c[0]; col < c[1]; col++) {
+      tiles.push({
+        level: level,
+        row: row,
+        col: col
+      });
+    }
+  }
+  return tiles;
+};
+
+mpld3_TiledImage.prototype.draw = function() {
+  this.group = this.ax.paths.append("svg:g").style("opacity", this.props.alpha);
+  this.zoomed(d3.zoomIdentity);
+};
+
+mpld3_TiledImage.prototype.elements = function(d) {
+  return this.group.selectAll("image");
+};
+
+mpld3_TiledImage.prototype.zoomed = function(transform) {
+  var that = this;
+  var images = this.group.selectAll("image").data(this.visibleTiles(transform), function(d) {
+    return d.level + "/" + d.row + "/" + d.col;
+  });
+  images.exit().remove();
+  images.enter().append("svg:image").attr("class", "mpld3-image").attr("preserveAspectRatio", "none").each(function(d) {
+    var rect = that.tileRect(d.level, d.row, d.col);
+    d3.select(this).attr("xlink:href", that.tileUrl(d.level, d.row, d.col)).attr("x", rect[0]).attr("y", rect[1]).attr("width", rect[2]).attr("height", rect[3]);
+  });
+};
+
 mpld3.Text = mpld3_Text;
 
 mpld3_Text.prototype = Object.create(mpld3_PlotElement.prototype);
@@ -1037,7 +2053,13 @@ mpld3_Axes.prototype.defaultProps = {
   collections: [],
   sharex: [],
   sharey: [],
-  images: []
+  images: [],
+  bars: [],
+  errorbars: [],
+  linecollections: [],
+  quivers: [],
+  quadmeshes: [],
+  tiledimages: []
 };
 
 function mpld3_Axes(fig, props) {
@@ -1095,6 +2117,14 @@ function mpld3_Axes(fig, props) {
   for (var i = 0; i < paths.length; i++) {
     this.elements.push(new mpld3.Path(this, paths[i]));
   }
+  var bars = this.props.bars;
+  for (var i = 0; i < bars.length; i++) {
+    this.elements.push(new mpld3.Bars(this, bars[i]));
+  }
+  var errorbars = this.props.errorbars;
+  for (var i = 0; i < errorbars.length; i++) {
+    this.elements.push(new mpld3.Errorbars(this, errorbars[i]));
+  }
   var lines = this.props.lines;
   for (var i = 0; i < lines.length; i++) {
     this.elements.push(new mpld3.Line(this, lines[i]));
@@ -1111,6 +2141,22 @@ function mpld3_Axes(fig, props) {
   for (var i = 0; i < collections.length; i++) {
     this.elements.push(new mpld3.PathCollection(this, collections[i]));
   }
+  var linecollections = this.props.linecollections;
+  for (var i = 0; i < linecollections.length; i++) {
+    this.elements.push(new mpld3.LineCollection(this, linecollections[i]));
+  }
+  var quivers = this.props.quivers;
+  for (var i = 0; i < quivers.length; i++) {
+    this.elements.push(new mpld3.Quiver(this, quivers[i]));
+  }
+  var quadmeshes = this.props.quadmeshes;
+  for (var i = 0; i < quadmeshes.length; i++) {
+    this.elements.push(new mpld3.QuadMesh(this, quadmeshes[i]));
+  }
+  var tiledimages = this.props.tiledimages;
+  for (var i = 0; i < tiledimages.length; i++) {
+    this.elements.push(new mpld3.TiledImage(this, tiledimages[i]));
+  }
   var images = this.props.images;
   for (var i = 0; i < images.length; i++) {
     this.elements.push(new mpld3.Image(this, images[i]));
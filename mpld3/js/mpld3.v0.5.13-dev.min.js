@@ -1,2 +1 @@
-function mpld3_cloneObj(t){var e={};for(var i in t)e[i]=t[i];return e}function mpld3_generateId(t,e){t="undefined"!=typeof t?t:10,e="undefined"!=typeof e?e:"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789";for(var i=e.charAt(Math.round(Math.random()*(e.length-11))),s=1;t>s;s++)i+=e.charAt(Math.round(Math.random()*(e.length-1)));return i}function mpld3_interpolateDates(t,e){var i=d3.interpolate([t[0].valueOf(),t[1].valueOf()],[e[0].valueOf(),e[1].valueOf()]);return function(t){var e=i(t);return[new Date(e[0]),new Date(e[1])]}}function isUndefined(t){return"undefined"==typeof t}function isUndefinedOrNull(t){return null==t||isUndefined(t)}function getMod(t,e){return t.length>0?t[e%t.length]:null}function mpld3_path(t){function e(t,e){var n=function(t){return"function"==typeof t?t:function(){return t}},p=n(i),a=n(s),l=[],h=[],d=0,c=-1,u=0,m=!1;if(!e){e=["M"];for(var f=1;f<t.length;f++)e.push("L")}for(;++c<e.length;){for(u=d+r[e[c]],l=[];u>d;)o.call(this,t[d],d)?(l.push(p.call(this,t[d],d),a.call(this,t[d],d)),d++):(l=null,d=u);l?m&&l.length>0?(h.push("M",l[0],l[1]),m=!1):(h.push(e[c]),h=h.concat(l)):m=!0}return d!=t.length&&console.warn("Warning: not all vertices used in Path"),h.join(" ")}var i=function(t,e){return t[0]},s=function(t,e){return t[1]},o=function(t,e){return!0},r={M:1,m:1,L:1,l:1,Q:2,q:2,T:1,t:1,S:2,s:2,C:3,c:3,Z:0,z:0};return e.x=function(t){return arguments.length?(i=t,e):i},e.y=function(t){return arguments.length?(s=t,e):s},e.defined=function(t){return arguments.length?(o=t,e):o},e.call=e,e}function mpld3_multiscale(t){function e(t){return i.forEach(function(e){t=e(t)}),t}var i=Array.prototype.slice.call(arguments,0),s=i.length;return e.domain=function(t){return arguments.length?(i[0].domain(t),e):i[0].domain()},e.range=function(t){return arguments.length?(i[s-1].range(t),e):i[s-1].range()},e.step=function(t){return i[t]},e}function mpld3_Grid(t,e){if(mpld3_PlotElement.call(this,t,e),this.cssclass="mpld3-"+this.props.xy+"grid","x"==this.props.xy)this.transform="translate(0,"+this.ax.height+")",this.position="bottom",this.scale=this.ax.xdom,this.tickSize=-this.ax.height;else{if("y"!=this.props.xy)throw"unrecognized grid xy specifier: should be 'x' or 'y'";this.transform="translate(0,0)",this.position="left",this.scale=this.ax.ydom,this.tickSize=-this.ax.width}}function mpld3_Axis(t,e){mpld3_PlotElement.call(this,t,e);var i={bottom:[0,this.ax.height],top:[0,0],left:[0,0],right:[this.ax.width,0]},s={bottom:"x",top:"x",left:"y",right:"y"};this.ax=t,this.transform="translate("+i[this.props.position]+")",this.props.xy=s[this.props.position],this.cssclass="mpld3-"+this.props.xy+"axis",this.scale=this.ax[this.props.xy+"dom"],this.tickNr=null,this.tickFormat=null}function mpld3_Coordinates(t,e){if(this.trans=t,"undefined"==typeof e){if(this.ax=null,this.fig=null,"display"!==this.trans)throw"ax must be defined if transform != 'display'"}else this.ax=e,this.fig=e.fig;if(this.zoomable="data"===this.trans,this.x=this["x_"+this.trans],this.y=this["y_"+this.trans],"undefined"==typeof this.x||"undefined"==typeof this.y)throw"unrecognized coordinate code: "+this.trans}function mpld3_Path(t,e){mpld3_PlotElement.call(this,t,e),this.data=t.fig.get_data(this.props.data),this.pathcodes=this.props.pathcodes,this.pathcoords=new mpld3_Coordinates(this.props.coordinates,this.ax),this.offsetcoords=new mpld3_Coordinates(this.props.offsetcoordinates,this.ax),this.datafunc=mpld3_path()}function mpld3_PathCollection(t,e){mpld3_PlotElement.call(this,t,e),(null==this.props.facecolors||0==this.props.facecolors.length)&&(this.props.facecolors=["none"]),(null==this.props.edgecolors||0==this.props.edgecolors.length)&&(this.props.edgecolors=["none"]);var i=this.ax.fig.get_data(this.props.offsets);(null===i||0===i.length)&&(i=[null]);var s=Math.max(this.props.paths.length,i.length);if(i.length===s)this.offsets=i;else{this.offsets=[];for(var o=0;s>o;o++)this.offsets.push(getMod(i,o))}this.pathcoords=new mpld3_Coordinates(this.props.pathcoordinates,this.ax),this.offsetcoords=new mpld3_Coordinates(this.props.offsetcoordinates,this.ax)}function mpld3_Line(t,e){mpld3_PlotElement.call(this,t,e);var i=this.props;i.facecolor="none",i.edgecolor=i.color,delete i.color,i.edgewidth=i.linewidth,delete i.linewidth;const s=i.drawstyle;switch(delete i.drawstyle,this.defaultProps=mpld3_Path.prototype.defaultProps,mpld3_Path.call(this,t,i),s){case"steps":case"steps-pre":this.datafunc=d3.line().curve(d3.curveStepBefore);break;case"steps-post":this.datafunc=d3.line().curve(d3.curveStepAfter);break;case"steps-mid":this.datafunc=d3.line().curve(d3.curveStep);break;default:this.datafunc=d3.line().curve(d3.curveLinear)}}function mpld3_Markers(t,e){mpld3_PlotElement.call(this,t,e),null!==this.props.markerpath?this.marker=0==this.props.markerpath[0].length?null:mpld3.path().call(this.props.markerpath[0],this.props.markerpath[1]):this.marker=null===this.props.markername?null:d3.symbol(this.props.markername).size(Math.pow(this.props.markersize,2))();var i={paths:[this.props.markerpath],offsets:t.fig.parse_offsets(t.fig.get_data(this.props.data,!0)),xindex:this.props.xindex,yindex:this.props.yindex,offsetcoordinates:this.props.coordinates,edgecolors:[this.props.edgecolor],edgewidths:[this.props.edgewidth],facecolors:[this.props.facecolor],alphas:[this.props.alpha],zorder:this.props.zorder,id:this.props.id};this.requiredProps=mpld3_PathCollection.prototype.requiredProps,this.defaultProps=mpld3_PathCollection.prototype.defaultProps,mpld3_PathCollection.call(this,t,i)}function mpld3_Image(t,e){mpld3_PlotElement.call(this,t,e),this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax)}function mpld3_Text(t,e){mpld3_PlotElement.call(this,t,e),this.text=this.props.text,this.position=this.props.position,this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax)}function mpld3_Axes(t,e){function i(t){return new Date(t[0],t[1],t[2],t[3],t[4],t[5])}function s(t,e){return"date"!==t?e:[i(e[0]),i(e[1])]}function o(t,e,i){var s="date"===t?d3.scaleTime():"log"===t?d3.scaleLog():d3.scaleLinear();return s.domain(e).range(i)}mpld3_PlotElement.call(this,t,e),this.axnum=this.fig.axes.length,this.axid=this.fig.figid+"_ax"+(this.axnum+1),this.clipid=this.axid+"_clip",this.props.xdomain=this.props.xdomain||this.props.xlim,this.props.ydomain=this.props.ydomain||this.props.ylim,this.sharex=[],this.sharey=[],this.elements=[],this.axisList=[];var r=this.props.bbox;this.position=[r[0]*this.fig.width,(1-r[1]-r[3])*this.fig.height],this.width=r[2]*this.fig.width,this.height=r[3]*this.fig.height,this.isZoomEnabled=null,this.zoom=null,this.lastTransform=d3.zoomIdentity,this.isBoxzoomEnabled=null,this.isLinkedBrushEnabled=null,this.isCurrentLinkedBrushTarget=!1,this.brushG=null,this.props.xdomain=s(this.props.xscale,this.props.xdomain),this.props.ydomain=s(this.props.yscale,this.props.ydomain),this.x=this.xdom=o(this.props.xscale,this.props.xdomain,[0,this.width]),this.y=this.ydom=o(this.props.yscale,this.props.ydomain,[this.height,0]),"date"===this.props.xscale&&(this.x=mpld3.multiscale(d3.scaleLinear().domain(this.props.xlim).range(this.props.xdomain.map(Number)),this.xdom)),"date"===this.props.yscale&&(this.y=mpld3.multiscale(d3.scaleLinear().domain(this.props.ylim).range(this.props.ydomain.map(Number)),this.ydom));for(var n=this.props.axes,p=0;p<n.length;p++){var a=new mpld3.Axis(this,n[p]);this.axisList.push(a),this.elements.push(a),(this.props.gridOn||a.props.grid.gridOn)&&this.elements.push(a.getGrid())}for(var l=this.props.paths,p=0;p<l.length;p++)this.elements.push(new mpld3.Path(this,l[p]));for(var h=this.props.lines,p=0;p<h.length;p++)this.elements.push(new mpld3.Line(this,h[p]));for(var d=this.props.markers,p=0;p<d.length;p++)this.elements.push(new mpld3.Markers(this,d[p]));for(var c=this.props.texts,p=0;p<c.length;p++)this.elements.push(new mpld3.Text(this,c[p]));for(var u=this.props.collections,p=0;p<u.length;p++)this.elements.push(new mpld3.PathCollection(this,u[p]));for(var m=this.props.images,p=0;p<m.length;p++)this.elements.push(new mpld3.Image(this,m[p]));this.elements.sort(function(t,e){return t.props.zorder-e.props.zorder})}function mpld3_Toolbar(t,e){mpld3_PlotElement.call(this,t,e),this.buttons=[],this.props.buttons.forEach(this.addButton.bind(this))}function mpld3_Button(t,e){mpld3_PlotElement.call(this,t),this.toolbar=t,this.fig=this.toolbar.fig,this.cssclass="mpld3-"+e+"button",this.active=!1}function mpld3_Plugin(t,e){mpld3_PlotElement.call(this,t,e)}function mpld3_ResetPlugin(t,e){mpld3_Plugin.call(this,t,e);var i=mpld3.ButtonFactory({buttonID:"reset",sticky:!1,onActivate:function(){this.toolbar.fig.reset()},icon:function(){return mpld3.icons.reset}});this.fig.buttons.push(i)}function mpld3_ZoomPlugin(t,e){mpld3_Plugin.call(this,t,e),null===this.props.enabled&&(this.props.enabled=!this.props.button);var i=this.props.enabled;if(this.props.button){var s=mpld3.ButtonFactory({buttonID:"zoom",sticky:!0,actions:["scroll","drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(i)},icon:function(){return mpld3.icons.move}});this.fig.buttons.push(s)}}function mpld3_BoxZoomPlugin(t,e){mpld3_Plugin.call(this,t,e),null===this.props.enabled&&(this.props.enabled=!this.props.button);var i=this.props.enabled;if(this.props.button){var s=mpld3.ButtonFactory({buttonID:"boxzoom",sticky:!0,actions:["drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(i)},icon:function(){return mpld3.icons.zoom}});this.fig.buttons.push(s)}this.extentClass="boxzoombrush"}function mpld3_TooltipPlugin(t,e){mpld3_Plugin.call(this,t,e)}function mpld3_LinkedBrushPlugin(t,e){mpld3.Plugin.call(this,t,e),null===this.props.enabled&&(this.props.enabled=!this.props.button);var i=this.props.enabled;if(this.props.button){var s=mpld3.ButtonFactory({buttonID:"linkedbrush",sticky:!0,actions:["drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(i)},icon:function(){return mpld3.icons.brush}});this.fig.buttons.push(s)}this.pathCollectionsByAxes=[],this.objectsByAxes=[],this.allObjects=[],this.extentClass="linkedbrush",this.dataKey="offsets",this.objectClass=null}function MousePositionPlugin(t,e){mpld3.Plugin.call(this,t,e)}function mpld3_Figure(t,e){mpld3_PlotElement.call(this,null,e),this.figid=t,this.width=this.props.width,this.height=this.props.height,this.data=this.props.data,this.buttons=[],this.root=d3.select("#"+t).append("div").style("position","relative"),this.axes=[];for(var i=0;i<this.props.axes.length;i++)this.axes.push(new mpld3_Axes(this,this.props.axes[i]));this.plugins=[],this.pluginsByType={},this.props.plugins.forEach(function(t){this.addPlugin(t)}.bind(this)),this.toolbar=new mpld3.Toolbar(this,{buttons:this.buttons})}function mpld3_PlotElement(t,e){this.parent=isUndefinedOrNull(t)?null:t,this.props=isUndefinedOrNull(e)?{}:this.processProps(e),this.fig=t instanceof mpld3_Figure?t:t&&"fig"in t?t.fig:null,this.ax=t instanceof mpld3_Axes?t:t&&"ax"in t?t.ax:null}if(!d3)var d3=require("d3");var mpld3={_mpld3IsLoaded:!0,figures:[],plugin_map:{}};mpld3.version="0.5.13-dev",mpld3.register_plugin=function(t,e){mpld3.plugin_map[t]=e},mpld3.remove_figure=function(t){var e=document.getElementById(t);null!==e&&(e.innerHTML="");for(var i=0;i<mpld3.figures.length;i++){var s=mpld3.figures[i];s.figid===t&&mpld3.figures.splice(i,1)}return!0},mpld3.draw_figure=function(t,e,i,s){var o=document.getElementById(t);if(s="undefined"!=typeof s?s:!1,s&&mpld3.remove_figure(t),null===o)throw t+" is not a valid id";var r=new mpld3.Figure(t,e);return i&&i(r,o),mpld3.figures.push(r),r.draw(),r},mpld3.cloneObj=mpld3_cloneObj,mpld3.boundsToTransform=function(t,e){var i=t.width,s=t.height,o=e[1][0]-e[0][0],r=e[1][1]-e[0][1],n=(e[0][0]+e[1][0])/2,p=(e[0][1]+e[1][1])/2,a=Math.max(1,Math.min(8,.9/Math.max(o/i,r/s))),l=[i/2-a*n,s/2-a*p];return{translate:l,scale:a}},mpld3.getTransformation=function(t){var e=document.createElementNS("http://www.w3.org/2000/svg","g");e.setAttributeNS(null,"transform",t);var i,s,o,r=e.transform.baseVal.consolidate().matrix,n=r.a,p=r.b,a=r.c,l=r.d,h=r.e,d=r.f;(i=Math.sqrt(n*n+p*p))&&(n/=i,p/=i),(o=n*a+p*l)&&(a-=n*o,l-=p*o),(s=Math.sqrt(a*a+l*l))&&(a/=s,l/=s,o/=s),p*a>n*l&&(n=-n,p=-p,o=-o,i=-i);var c={translateX:h,translateY:d,rotate:180*Math.atan2(p,n)/Math.PI,skewX:180*Math.atan(o)/Math.PI,scaleX:i,scaleY:s},u="translate("+c.translateX+","+c.translateY+")rotate("+c.rotate+")skewX("+c.skewX+")scale("+c.scaleX+","+c.scaleY+")";return u},mpld3.merge_objects=function(t){for(var e,i={},s=0;s<arguments.length;s++){e=arguments[s];for(var o in e)i[o]=e[o]}return i},mpld3.generate_id=function(t,e){return console.warn("mpld3.generate_id is deprecated. Use mpld3.generateId instead."),mpld3_generateId(t,e)},mpld3.generateId=mpld3_generateId,mpld3.get_element=function(t,e){var i,s,o;i="undefined"==typeof e?mpld3.figures:"undefined"==typeof e.length?[e]:e;for(var r=0;r<i.length;r++){if(e=i[r],e.props.id===t)return e;for(var n=0;n<e.axes.length;n++){if(s=e.axes[n],s.props.id===t)return s;for(var p=0;p<s.elements.length;p++)if(o=s.elements[p],o.props.id===t)return o}}return null},mpld3.insert_css=function(t,e){var i=document.head||document.getElementsByTagName("head")[0],s=document.createElement("style"),o=t+" {";for(var r in e)o+=r+":"+e[r]+"; ";o+="}",s.type="text/css",s.styleSheet?s.styleSheet.cssText=o:s.appendChild(document.createTextNode(o)),i.appendChild(s)},mpld3.process_props=function(t,e,i,s){function o(t){mpld3_PlotElement.call(this,null,t)}console.warn("mpld3.process_props is deprecated. Plot elements should derive from mpld3.PlotElement"),o.prototype=Object.create(mpld3_PlotElement.prototype),o.prototype.constructor=o,o.prototype.requiredProps=s,o.prototype.defaultProps=i;var r=new o(e);return r.props},mpld3.interpolateDates=mpld3_interpolateDates,mpld3.path=function(){return mpld3_path()},mpld3.multiscale=mpld3_multiscale,mpld3.icons={reset:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gIcACMoD/OzIwAAAJhJREFUOMtjYKAx4KDUgNsMDAx7\nyNV8i4GB4T8U76VEM8mGYNNMtCH4NBM0hBjNMIwSsMzQ0MamcDkDA8NmQi6xggpUoikwQbIkHk2u\nE0rLI7vCBknBSyxeRDZAE6qHgQkq+ZeBgYERSfFPAoHNDNUDN4BswIRmKgxwEasP2dlsDAwMYlA/\n/mVgYHiBpkkGKscIDaPfVMmuAGnOTaGsXF0MAAAAAElFTkSuQmCC\n",move:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gIcACQMfLHBNQAAANZJREFUOMud07FKA0EQBuAviaKB\nlFr7COJrpAyYRlKn8hECEkFEn8ROCCm0sBMRYgh5EgVFtEhsRjiO27vkBoZd/vn5d3b+XcrjFI9q\nxgXWkc8pUjOB93GMd3zgB9d1unjDSxmhWSHQqOJki+MtOuv/b3ZifUqctIrMxwhHuG1gim4Ma5kR\nWuEkXFgU4B0MW1Ho4TeyjX3s4TDq3zn8ALvZ7q5wX9DqLOHCDA95cFBAnOO1AL/ZdNopgY3fQcqF\nyriMe37hM9w521ZkkvlMo7o/8g7nZYQ/QDctp1nTCf0AAAAASUVORK5CYII=\n",zoom:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gMPDiIRPL/2oQAAANBJREFUOMvF0b9KgzEcheHHVnCT\nKoI4uXbtLXgB3oJDJxevw1VwkoJ/NjepQ2/BrZRCx0ILFURQKV2kyOeSQpAmn7WDB0Lg955zEhLy\n2scdXlBggits+4WOQqjAJ3qYR7NGLrwXGU9+sGbEtlIF18FwmuBngZ+nCt6CIacC3Rx8LSl4xzgF\nn0tusBn4UyVhuA/7ZYIv5g+pE3ail25hN/qdmzCfpsJVjKKCZesDBwtzrAqGOMQj6vhCDRsY4ALH\nmOVObltR/xeG/jph6OD2r+Fv5lZBWEhMx58AAAAASUVORK5CYII=\n",brush:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAEQkAABEJAFAZ8RUAAAAB3RJTUUH3gMCEiQKB9YaAgAAAWtJREFUOMuN0r1qVVEQhuFn700k\nnfEvBq0iNiIiOKXgH4KCaBeIhWARK/EibLwFCwVLjyAWaQzRGG9grC3URkHUBKKgRuWohWvL5pjj\nyTSLxcz7rZlZHyMiItqzFxGTEVF18/UoODNFxDIO4x12dkXqTcBPsCUzD+AK3ndFqhHwEsYz82gn\nN4dbmMRK9R/4KY7jAvbiWmYeHBT5Z4QCP8J1rGAeN3GvU3Mbl/Gq3qCDcxjLzOV+v78fq/iFIxFx\nPyJ2lNJpfBy2g59YzMyzEbEVLzGBJjOriLiBq5gaJrCIU3hcRCbwAtuwjm/Yg/V6I9NgDA1OR8RC\nZq6Vcd7iUwtn5h8fdMBdETGPE+Xe4ExELDRNs4bX2NfCUHe+7UExyfkCP8MhzOA7PuAkvrbwXyNF\nxF3MDqxiqlhXC7SPdaOKiN14g0u4g3H0MvOiTUSNY3iemb0ywmfMdfYyUmAJ2yPiBx6Wr/oy2Oqw\n+A1SupBzAOuE/AAAAABJRU5ErkJggg==\n"},mpld3.Grid=mpld3_Grid,mpld3_Grid.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Grid.prototype.constructor=mpld3_Grid,mpld3_Grid.prototype.requiredProps=["xy"],mpld3_Grid.prototype.defaultProps={color:"gray",dasharray:"2,2",alpha:"0.5",nticks:10,gridOn:!0,tickvalues:null,zorder:0},mpld3_Grid.prototype.draw=function(){var t={left:"axisLeft",right:"axisRight",top:"axisTop",bottom:"axisBottom"}[this.position];this.grid=d3[t](this.scale).ticks(this.props.nticks).tickValues(this.props.tickvalues).tickSize(this.tickSize,0,0).tickFormat(""),this.elem=this.ax.axes.append("g").attr("class",this.cssclass).attr("transform",this.transform).call(this.grid),mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" .tick",{stroke:this.props.color,"stroke-dasharray":this.props.dasharray,"stroke-opacity":this.props.alpha}),mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" path",{"stroke-width":0}),mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" .domain",{"pointer-events":"none"})},mpld3_Grid.prototype.zoomed=function(t){t?"x"==this.props.xy?this.elem.call(this.grid.scale(t.rescaleX(this.scale))):this.elem.call(this.grid.scale(t.rescaleY(this.scale))):this.elem.call(this.grid)},mpld3.Axis=mpld3_Axis,mpld3_Axis.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Axis.prototype.constructor=mpld3_Axis,mpld3_Axis.prototype.requiredProps=["position"],mpld3_Axis.prototype.defaultProps={nticks:10,tickvalues:null,tickformat:null,filtered_tickvalues:null,filtered_tickformat:null,tickformat_formatter:null,fontsize:"11px",fontcolor:"black",axiscolor:"black",scale:"linear",grid:{},zorder:0,visible:!0},mpld3_Axis.prototype.getGrid=function(){var t={nticks:this.props.nticks,zorder:this.props.zorder,tickvalues:null,xy:this.props.xy};if(this.props.grid)for(var e in this.props.grid)t[e]=this.props.grid[e];return new mpld3_Grid(this.ax,t)},mpld3_Axis.prototype.wrapTicks=function(){function t(t,e,i){i=i||1.2,t.each(function(){for(var t,s=d3.select(this),o=s.node().getBBox(),r=o.height,n=s.text().split(/\s+/).reverse(),p=[],a=0,l=s.attr("y"),h=r,d=s.text(null).append("tspan").attr("x",0).attr("y",l).attr("dy",h);t=n.pop();)p.push(t),d.text(p.join(" ")),d.node().getComputedTextLength()>e&&(p.pop(),d.text(p.join(" ")),p=[t],d=s.append("tspan").attr("x",0).attr("y",l).attr("dy",++a*(r*i)+h).text(t))})}var e=80;"x"==this.props.xy&&this.elem.selectAll("text").call(t,e)},mpld3_Axis.prototype.draw=function(){var t="x"===this.props.xy?this.parent.props.xscale:this.parent.props.yscale;if("date"===t&&this.props.tickvalues){var e="x"===this.props.xy?this.parent.x.domain():this.parent.y.domain(),i="x"===this.props.xy?this.parent.xdom.domain():this.parent.ydom.domain(),s=d3.scaleLinear().domain(e).range(i);this.props.tickvalues=this.props.tickvalues.map(function(t){return new Date(s(t))})}var o={left:"axisLeft",right:"axisRight",top:"axisTop",bottom:"axisBottom"}[this.props.position];this.axis=d3[o](this.scale);var r=this;this.filter_ticks(this.axis.scale().domain()),"index"==this.props.tickformat_formatter?this.axis=this.axis.tickFormat(function(t,e){return r.props.filtered_tickformat[t]}):"percent"==this.props.tickformat_formatter?this.axis=this.axis.tickFormat(function(t,e){var i=t/r.props.tickformat.xmax*100,s=r.props.tickformat.decimals||0,o=d3.format("."+s+"f")(i);return o+r.props.tickformat.symbol}):"str_method"==this.props.tickformat_formatter?this.axis=this.axis.tickFormat(function(t,e){var i=d3.format(r.props.tickformat.format_string)(t);return r.props.tickformat.prefix+i+r.props.tickformat.suffix}):"fixed"==this.props.tickformat_formatter||"func"==this.props.tickformat_formatter?this.axis=this.axis.tickFormat(function(t,e){return r.props.filtered_tickformat[e]}):this.tickFormat&&(this.axis=this.axis.tickFormat(this.tickFormat)),this.tickNr&&(this.axis=this.axis.ticks(this.tickNr)),this.axis=this.axis.tickValues(this.props.filtered_tickvalues),this.elem=this.ax.baseaxes.append("g").attr("transform",this.transform).attr("class",this.cssclass).call(this.axis),this.wrapTicks(),mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" line,  ."+this.cssclass+" path",{"shape-rendering":"crispEdges",stroke:this.props.axiscolor,fill:"none"}),mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" text",{"font-family":"sans-serif","font-size":this.props.fontsize+"px",fill:this.props.fontcolor,stroke:"none"})},mpld3_Axis.prototype.zoomed=function(t){this.filter_ticks(this.axis.scale().domain()),this.axis=this.axis.tickValues(this.props.filtered_tickvalues),t?("x"==this.props.xy?this.elem.call(this.axis.scale(t.rescaleX(this.scale))):this.elem.call(this.axis.scale(t.rescaleY(this.scale))),this.wrapTicks()):this.elem.call(this.axis)},mpld3_Axis.prototype.setTicks=function(t,e){this.tickNr=t,this.tickFormat=e},mpld3_Axis.prototype.filter_ticks=function(t){if(this.props.tickvalues){const e=this,i=this.props.tickvalues.map(function(t,e){return e}).filter(function(i,s){const o=e.props.tickvalues[i];return o>=t[0]&&o<=t[1]});this.props.filtered_tickvalues=this.props.tickvalues.filter(function(t,e){return i.includes(e)}),this.props.tickformat?this.props.filtered_tickformat=this.props.tickformat.filter(function(t,e){return i.includes(e)}):this.props.filtered_tickformat=this.props.tickformat}else this.props.filtered_tickvalues=this.props.tickvalues,this.props.filtered_tickformat=this.props.tickformat},mpld3.Coordinates=mpld3_Coordinates,mpld3_Coordinates.prototype.xy=function(t,e,i){return e="undefined"==typeof e?0:e,i="undefined"==typeof i?1:i,[this.x(t[e]),this.y(t[i])]},mpld3_Coordinates.prototype.x_data=function(t){return this.ax.x(t)},mpld3_Coordinates.prototype.y_data=function(t){return this.ax.y(t)},mpld3_Coordinates.prototype.x_display=function(t){return t},mpld3_Coordinates.prototype.y_display=function(t){return t},mpld3_Coordinates.prototype.x_axes=function(t){return t*this.ax.width},mpld3_Coordinates.prototype.y_axes=function(t){return this.ax.height*(1-t)},mpld3_Coordinates.prototype.x_figure=function(t){return t*this.fig.width-this.ax.position[0]},mpld3_Coordinates.prototype.y_figure=function(t){return(1-t)*this.fig.height-this.ax.position[1]},mpld3.Path=mpld3_Path,mpld3_Path.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Path.prototype.constructor=mpld3_Path,mpld3_Path.prototype.requiredProps=["data"],mpld3_Path.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",facecolor:"green",edgecolor:"black",edgewidth:1,dasharray:"none",pathcodes:null,offset:null,offsetcoordinates:"data",alpha:1,drawstyle:"none",zorder:1},mpld3_Path.prototype.finiteFilter=function(t,e){return isFinite(this.pathcoords.x(t[this.props.xindex]))&&isFinite(this.pathcoords.y(t[this.props.yindex]))},mpld3_Path.prototype.draw=function(){if(this.datafunc.defined(this.finiteFilter.bind(this)).x(function(t){return this.pathcoords.x(t[this.props.xindex])}.bind(this)).y(function(t){return this.pathcoords.y(t[this.props.yindex])}.bind(this)),this.pathcoords.zoomable?this.path=this.ax.paths.append("svg:path"):this.path=this.ax.staticPaths.append("svg:path"),this.path=this.path.attr("d",this.datafunc(this.data,this.pathcodes)).attr("class","mpld3-path").style("stroke",this.props.edgecolor).style("stroke-width",this.props.edgewidth).style("stroke-dasharray",this.props.dasharray).style("fill",this.props.facecolor).attr("vector-effect","non-scaling-stroke"),"rgba("!=this.props.edgecolor.slice(0,5)&&(this.path=this.path.style("stroke-opacity",this.props.alpha)),"rgba("!=this.props.facecolor.slice(0,5)&&(this.path=this.path.style("fill-opacity",this.props.alpha)),null!==this.props.offset){var t=this.offsetcoords.xy(this.props.offset);this.path.attr("transform","translate("+t+")")}},mpld3_Path.prototype.elements=function(t){return this.path},mpld3.PathCollection=mpld3_PathCollection,mpld3_PathCollection.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_PathCollection.prototype.constructor=mpld3_PathCollection,mpld3_PathCollection.prototype.requiredProps=["paths","offsets"],mpld3_PathCollection.prototype.defaultProps={xindex:0,yindex:1,pathtransforms:[],pathcoordinates:"display",offsetcoordinates:"data",offsetorder:"before",edgecolors:["#000000"],drawstyle:"none",edgewidths:[1],facecolors:["#0000FF"],alphas:[1],zorder:2},mpld3_PathCollection.prototype.transformFunc=function(t,e){var i=this.props.pathtransforms,s=0==i.length?"":mpld3.getTransformation("matrix("+getMod(i,e)+")").toString(),o=null===t||"undefined"==typeof t?"translate(0, 0)":"translate("+this.offsetcoords.xy(t,this.props.xindex,this.props.yindex)+")";return"after"===this.props.offsetorder?s+o:o+s},mpld3_PathCollection.prototype.pathFunc=function(t,e){return mpld3_path().x(function(t){return this.pathcoords.x(t[0])}.bind(this)).y(function(t){return this.pathcoords.y(t[1])}.bind(this)).apply(this,getMod(this.props.paths,e))},mpld3_PathCollection.prototype.styleFunc=function(t,e){var i=getMod(this.props.edgecolors,e),s=getMod(this.props.facecolors,e),o=getMod(this.props.alphas,e),r={stroke:i,"stroke-width":getMod(this.props.edgewidths,e),fill:s};"rgba("!=i.slice(0,5)&&(r["stroke-opacity"]=o),"rgba("!=s.slice(0,5)&&(r["fill-opacity"]=o);var n="";for(var p in r)n+=p+":"+r[p]+";";return n},mpld3_PathCollection.prototype.allFinite=function(t){return t instanceof Array?t.length==t.filter(isFinite).length:!0},mpld3_PathCollection.prototype.draw=function(){this.offsetcoords.zoomable||this.pathcoords.zoomable?this.group=this.ax.paths.append("svg:g"):this.group=this.ax.staticPaths.append("svg:g"),this.pathsobj=this.group.selectAll("paths").data(this.offsets.filter(this.allFinite)).enter().append("svg:path").attr("d",this.pathFunc.bind(this)).attr("class","mpld3-path").attr("transform",this.transformFunc.bind(this)).attr("style",this.styleFunc.bind(this)).attr("vector-effect","non-scaling-stroke")},mpld3_PathCollection.prototype.elements=function(t){return this.group.selectAll("path")},mpld3.Line=mpld3_Line,mpld3_Line.prototype=Object.create(mpld3_Path.prototype),mpld3_Line.prototype.constructor=mpld3_Line,mpld3_Line.prototype.requiredProps=["data"],mpld3_Line.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",color:"salmon",linewidth:2,dasharray:"none",alpha:1,zorder:2,drawstyle:"none"},mpld3.Markers=mpld3_Markers,mpld3_Markers.prototype=Object.create(mpld3_PathCollection.prototype),mpld3_Markers.prototype.constructor=mpld3_Markers,mpld3_Markers.prototype.requiredProps=["data"],mpld3_Markers.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",facecolor:"salmon",edgecolor:"black",edgewidth:1,alpha:1,markersize:6,markername:"circle",drawstyle:"none",markerpath:null,zorder:3},mpld3_Markers.prototype.pathFunc=function(t,e){return this.marker},mpld3.Image=mpld3_Image,mpld3_Image.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Image.prototype.constructor=mpld3_Image,mpld3_Image.prototype.requiredProps=["data","extent"],mpld3_Image.prototype.defaultProps={alpha:1,coordinates:"data",drawstyle:"none",zorder:1},mpld3_Image.prototype.draw=function(){this.image=this.ax.paths.append("svg:image"),this.image=this.image.attr("class","mpld3-image").attr("xlink:href","data:image/png;base64,"+this.props.data).style("opacity",this.props.alpha).attr("preserveAspectRatio","none"),this.updateDimensions()},mpld3_Image.prototype.elements=function(t){return d3.select(this.image)},mpld3_Image.prototype.updateDimensions=function(){var t=this.props.extent;this.image.attr("x",this.coords.x(t[0])).attr("y",this.coords.y(t[3])).attr("width",this.coords.x(t[1])-this.coords.x(t[0])).attr("height",this.coords.y(t[2])-this.coords.y(t[3]))},mpld3.Text=mpld3_Text,mpld3_Text.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Text.prototype.constructor=mpld3_Text,mpld3_Text.prototype.requiredProps=["text","position"],mpld3_Text.prototype.defaultProps={coordinates:"data",h_anchor:"start",v_baseline:"auto",rotation:0,fontsize:11,drawstyle:"none",color:"black",alpha:1,zorder:3},mpld3_Text.prototype.draw=function(){"data"==this.props.coordinates?this.coords.zoomable?this.obj=this.ax.paths.append("text"):this.obj=this.ax.staticPaths.append("text"):this.obj=this.ax.baseaxes.append("text"),this.obj.attr("class","mpld3-text").attr("xml:space","preserve").text(this.text).style("text-anchor",this.props.h_anchor).style("dominant-baseline",this.props.v_baseline).style("font-size",this.props.fontsize).style("fill",this.props.color).style("opacity",this.props.alpha),this.applyTransform()},mpld3_Text.prototype.elements=function(t){return d3.select(this.obj)},mpld3_Text.prototype.applyTransform=function(){var t=this.coords.xy(this.position);this.obj.attr("x",t[0]).attr("y",t[1]),this.props.rotation&&this.obj.attr("transform","rotate("+this.props.rotation+","+t+")")},mpld3.Axes=mpld3_Axes,mpld3_Axes.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Axes.prototype.constructor=mpld3_Axes,mpld3_Axes.prototype.requiredProps=["xlim","ylim"],mpld3_Axes.prototype.defaultProps={bbox:[.1,.1,.8,.8],axesbg:"#FFFFFF",axesbgalpha:1,gridOn:!1,xdomain:null,ydomain:null,xscale:"linear",yscale:"linear",zoomable:!0,axes:[{position:"left"},{position:"bottom"}],lines:[],paths:[],markers:[],texts:[],collections:[],sharex:[],sharey:[],images:[]},mpld3_Axes.prototype.draw=function(){for(var t=0;t<this.props.sharex.length;t++)this.sharex.push(mpld3.get_element(this.props.sharex[t]));for(var t=0;t<this.props.sharey.length;t++)this.sharey.push(mpld3.get_element(this.props.sharey[t]));this.baseaxes=this.fig.canvas.append("g").attr("transform","translate("+this.position[0]+","+this.position[1]+")").attr("width",this.width).attr("height",this.height).attr("class","mpld3-baseaxes"),this.axes=this.baseaxes.append("g").attr("class","mpld3-axes").style("pointer-events","visiblefill"),this.clip=this.axes.append("svg:clipPath").attr("id",this.clipid).append("svg:rect").attr("x",0).attr("y",0).attr("width",this.width).attr("height",this.height),this.axesbg=this.axes.append("svg:rect").attr("width",this.width).attr("height",this.height).attr("class","mpld3-axesbg").style("fill",this.props.axesbg).style("fill-opacity",this.props.axesbgalpha),this.pathsContainer=this.axes.append("g").attr("clip-path","url(#"+this.clipid+")").attr("x",0).attr("y",0).attr("width",this.width).attr("height",this.height).attr("class","mpld3-paths-container"),this.paths=this.pathsContainer.append("g").attr("class","mpld3-paths"),this.staticPaths=this.axes.append("g").attr("class","mpld3-staticpaths"),this.brush=d3.brush().extent([[0,0],[this.fig.width,this.fig.height]]).on("start",this.brushStart.bind(this)).on("brush",this.brushMove.bind(this)).on("end",this.brushEnd.bind(this)).on("start.nokey",function(){d3.select(window).on("keydown.brush keyup.brush",null)});for(var t=0;t<this.elements.length;t++)this.elements[t].draw()},mpld3_Axes.prototype.bindZoom=function(){this.zoom||(this.zoom=d3.zoom(),this.zoom.on("zoom",this.zoomed.bind(this)),this.axes.call(this.zoom))},mpld3_Axes.prototype.unbindZoom=function(){this.zoom&&(this.zoom.on("zoom",null),this.axes.on(".zoom",null),this.zoom=null)},mpld3_Axes.prototype.bindBrush=function(){this.brushG||(this.brushG=this.axes.append("g").attr("class","mpld3-brush").call(this.brush))},mpld3_Axes.prototype.unbindBrush=function(){this.brushG&&(this.brushG.remove(),this.brushG.on(".brush",null),this.brushG=null)},mpld3_Axes.prototype.reset=function(){this.zoom?this.doZoom(!1,d3.zoomIdentity,750):(this.bindZoom(),this.doZoom(!1,d3.zoomIdentity,750,function(){this.isSomeTypeOfZoomEnabled||this.unbindZoom()}.bind(this)))},mpld3_Axes.prototype.enableOrDisableBrushing=function(){this.isBoxzoomEnabled||this.isLinkedBrushEnabled?this.bindBrush():this.unbindBrush()},mpld3_Axes.prototype.isSomeTypeOfZoomEnabled=function(){return this.isZoomEnabled||this.isBoxzoomEnabled},mpld3_Axes.prototype.enableOrDisableZooming=function(){this.isSomeTypeOfZoomEnabled()?this.bindZoom():this.unbindZoom()},mpld3_Axes.prototype.enableLinkedBrush=function(){
-this.isLinkedBrushEnabled=!0,this.enableOrDisableBrushing()},mpld3_Axes.prototype.disableLinkedBrush=function(){this.isLinkedBrushEnabled=!1,this.enableOrDisableBrushing()},mpld3_Axes.prototype.enableBoxzoom=function(){this.isBoxzoomEnabled=!0,this.enableOrDisableBrushing(),this.enableOrDisableZooming()},mpld3_Axes.prototype.disableBoxzoom=function(){this.isBoxzoomEnabled=!1,this.enableOrDisableBrushing(),this.enableOrDisableZooming()},mpld3_Axes.prototype.enableZoom=function(){this.isZoomEnabled=!0,this.enableOrDisableZooming(),this.axes.style("cursor","move")},mpld3_Axes.prototype.disableZoom=function(){this.isZoomEnabled=!1,this.enableOrDisableZooming(),this.axes.style("cursor",null)},mpld3_Axes.prototype.doZoom=function(t,e,i,s){if(this.props.zoomable&&this.zoom){if(i){var o=this.axes.transition().duration(i).call(this.zoom.transform,e);s&&o.on("end",s)}else this.axes.call(this.zoom.transform,e);t?(this.lastTransform=e,this.sharex.forEach(function(t){t.doZoom(!1,e,i)}),this.sharey.forEach(function(t){t.doZoom(!1,e,i)})):this.lastTransform=e}},mpld3_Axes.prototype.zoomed=function(){var t=d3.event.sourceEvent&&"zoom"!=d3.event.sourceEvent.type;if(t)this.doZoom(!0,d3.event.transform,!1);else{var e=d3.event.transform;this.paths.attr("transform",e),this.elements.forEach(function(t){t.zoomed&&t.zoomed(e)}.bind(this))}},mpld3_Axes.prototype.resetBrush=function(){this.brushG.call(this.brush.move,null)},mpld3_Axes.prototype.doBoxzoom=function(t){if(t&&this.brushG){var e=t.map(this.lastTransform.invert,this.lastTransform),i=e[1][0]-e[0][0],s=e[1][1]-e[0][1],o=(e[0][0]+e[1][0])/2,r=(e[0][1]+e[1][1])/2,n=i>s?this.width/i:this.height/s,p=this.width/2-n*o,a=this.height/2-n*r,l=d3.zoomIdentity.translate(p,a).scale(n);this.doZoom(!0,l,750),this.resetBrush()}},mpld3_Axes.prototype.brushStart=function(){this.isLinkedBrushEnabled&&(this.isCurrentLinkedBrushTarget="MouseEvent"==d3.event.sourceEvent.constructor.name,this.isCurrentLinkedBrushTarget&&this.fig.resetBrushForOtherAxes(this.axid))},mpld3_Axes.prototype.brushMove=function(){var t=d3.event.selection;this.isLinkedBrushEnabled&&this.fig.updateLinkedBrush(t)},mpld3_Axes.prototype.brushEnd=function(){var t=d3.event.selection;this.isBoxzoomEnabled&&this.doBoxzoom(t),this.isLinkedBrushEnabled&&(t||this.fig.endLinkedBrush(),this.isCurrentLinkedBrushTarget=!1)},mpld3_Axes.prototype.setTicks=function(t,e,i){this.axisList.forEach(function(s){s.props.xy==t&&s.setTicks(e,i)})},mpld3.Toolbar=mpld3_Toolbar,mpld3_Toolbar.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Toolbar.prototype.constructor=mpld3_Toolbar,mpld3_Toolbar.prototype.defaultProps={buttons:["reset","move"]},mpld3_Toolbar.prototype.addButton=function(t){this.buttons.push(new t(this))},mpld3_Toolbar.prototype.draw=function(){function t(){this.buttonsobj.transition(750).attr("y",0)}function e(){this.buttonsobj.transition(750).delay(250).attr("y",16)}mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image",{cursor:"pointer",opacity:.2,display:"inline-block",margin:"0px"}),mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image.active",{opacity:.4}),mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image.pressed",{opacity:.6}),this.fig.canvas.on("mouseenter",t.bind(this)).on("mouseleave",e.bind(this)).on("touchenter",t.bind(this)).on("touchstart",t.bind(this)),this.toolbar=this.fig.canvas.append("svg:svg").attr("width",16*this.buttons.length).attr("height",16).attr("x",2).attr("y",this.fig.height-16-2).attr("class","mpld3-toolbar"),this.buttonsobj=this.toolbar.append("svg:g").selectAll("buttons").data(this.buttons).enter().append("svg:image").attr("class",function(t){return t.cssclass}).attr("xlink:href",function(t){return t.icon()}).attr("width",16).attr("height",16).attr("x",function(t,e){return 16*e}).attr("y",16).on("click",function(t){t.click()}).on("mouseenter",function(){d3.select(this).classed("active",!0)}).on("mouseleave",function(){d3.select(this).classed("active",!1)});for(var i=0;i<this.buttons.length;i++)this.buttons[i].onDraw()},mpld3_Toolbar.prototype.deactivate_all=function(){this.buttons.forEach(function(t){t.deactivate()})},mpld3_Toolbar.prototype.deactivate_by_action=function(t){function e(e){return-1!==t.indexOf(e)}t.length>0&&this.buttons.forEach(function(t){t.actions.filter(e).length>0&&t.deactivate()})},mpld3.Button=mpld3_Button,mpld3_Button.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Button.prototype.constructor=mpld3_Button,mpld3_Button.prototype.setState=function(t){t?this.activate():this.deactivate()},mpld3_Button.prototype.click=function(){this.active?this.deactivate():this.activate()},mpld3_Button.prototype.activate=function(){this.toolbar.deactivate_by_action(this.actions),this.onActivate(),this.active=!0,this.toolbar.toolbar.select("."+this.cssclass).classed("pressed",!0),this.sticky||this.deactivate()},mpld3_Button.prototype.deactivate=function(){this.onDeactivate(),this.active=!1,this.toolbar.toolbar.select("."+this.cssclass).classed("pressed",!1)},mpld3_Button.prototype.sticky=!1,mpld3_Button.prototype.actions=[],mpld3_Button.prototype.icon=function(){return""},mpld3_Button.prototype.onActivate=function(){},mpld3_Button.prototype.onDeactivate=function(){},mpld3_Button.prototype.onDraw=function(){},mpld3.ButtonFactory=function(t){function e(t){mpld3_Button.call(this,t,this.buttonID)}if("string"!=typeof t.buttonID)throw"ButtonFactory: buttonID must be present and be a string";e.prototype=Object.create(mpld3_Button.prototype),e.prototype.constructor=e;for(var i in t)e.prototype[i]=t[i];return e},mpld3.Plugin=mpld3_Plugin,mpld3_Plugin.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Plugin.prototype.constructor=mpld3_Plugin,mpld3_Plugin.prototype.requiredProps=[],mpld3_Plugin.prototype.defaultProps={},mpld3_Plugin.prototype.draw=function(){},mpld3.ResetPlugin=mpld3_ResetPlugin,mpld3.register_plugin("reset",mpld3_ResetPlugin),mpld3_ResetPlugin.prototype=Object.create(mpld3_Plugin.prototype),mpld3_ResetPlugin.prototype.constructor=mpld3_ResetPlugin,mpld3_ResetPlugin.prototype.requiredProps=[],mpld3_ResetPlugin.prototype.defaultProps={},mpld3.ZoomPlugin=mpld3_ZoomPlugin,mpld3.register_plugin("zoom",mpld3_ZoomPlugin),mpld3_ZoomPlugin.prototype=Object.create(mpld3_Plugin.prototype),mpld3_ZoomPlugin.prototype.constructor=mpld3_ZoomPlugin,mpld3_ZoomPlugin.prototype.requiredProps=[],mpld3_ZoomPlugin.prototype.defaultProps={button:!0,enabled:null},mpld3_ZoomPlugin.prototype.activate=function(){this.fig.enableZoom()},mpld3_ZoomPlugin.prototype.deactivate=function(){this.fig.disableZoom()},mpld3_ZoomPlugin.prototype.draw=function(){this.props.enabled?this.activate():this.deactivate()},mpld3.BoxZoomPlugin=mpld3_BoxZoomPlugin,mpld3.register_plugin("boxzoom",mpld3_BoxZoomPlugin),mpld3_BoxZoomPlugin.prototype=Object.create(mpld3_Plugin.prototype),mpld3_BoxZoomPlugin.prototype.constructor=mpld3_BoxZoomPlugin,mpld3_BoxZoomPlugin.prototype.requiredProps=[],mpld3_BoxZoomPlugin.prototype.defaultProps={button:!0,enabled:null},mpld3_BoxZoomPlugin.prototype.activate=function(){this.fig.enableBoxzoom()},mpld3_BoxZoomPlugin.prototype.deactivate=function(){this.fig.disableBoxzoom()},mpld3_BoxZoomPlugin.prototype.draw=function(){this.props.enabled?this.activate():this.deactivate()},mpld3.TooltipPlugin=mpld3_TooltipPlugin,mpld3.register_plugin("tooltip",mpld3_TooltipPlugin),mpld3_TooltipPlugin.prototype=Object.create(mpld3_Plugin.prototype),mpld3_TooltipPlugin.prototype.constructor=mpld3_TooltipPlugin,mpld3_TooltipPlugin.prototype.requiredProps=["id"],mpld3_TooltipPlugin.prototype.defaultProps={labels:null,hoffset:0,voffset:10,location:"mouse"},mpld3_TooltipPlugin.prototype.draw=function(){function t(t,e){this.tooltip.style("visibility","visible").text(null===o?"("+t+")":getMod(o,e))}function e(t,e){if("mouse"===r){var i=d3.mouse(this.fig.canvas.node());this.x=i[0]+this.props.hoffset,this.y=i[1]-this.props.voffset}this.tooltip.attr("x",this.x).attr("y",this.y)}function i(t,e){this.tooltip.style("visibility","hidden")}var s=mpld3.get_element(this.props.id,this.fig),o=this.props.labels,r=this.props.location;this.tooltip=this.fig.canvas.append("text").attr("class","mpld3-tooltip-text").attr("x",0).attr("y",0).text("").style("visibility","hidden"),"bottom left"==r||"top left"==r?(this.x=s.ax.position[0]+5+this.props.hoffset,this.tooltip.style("text-anchor","beginning")):"bottom right"==r||"top right"==r?(this.x=s.ax.position[0]+s.ax.width-5+this.props.hoffset,this.tooltip.style("text-anchor","end")):this.tooltip.style("text-anchor","middle"),"bottom left"==r||"bottom right"==r?this.y=s.ax.position[1]+s.ax.height-5+this.props.voffset:("top left"==r||"top right"==r)&&(this.y=s.ax.position[1]+5+this.props.voffset),s.elements().on("mouseover",t.bind(this)).on("mousemove",e.bind(this)).on("mouseout",i.bind(this))},mpld3.LinkedBrushPlugin=mpld3_LinkedBrushPlugin,mpld3.register_plugin("linkedbrush",mpld3_LinkedBrushPlugin),mpld3_LinkedBrushPlugin.prototype=Object.create(mpld3.Plugin.prototype),mpld3_LinkedBrushPlugin.prototype.constructor=mpld3_LinkedBrushPlugin,mpld3_LinkedBrushPlugin.prototype.requiredProps=["id"],mpld3_LinkedBrushPlugin.prototype.defaultProps={button:!0,enabled:null},mpld3_LinkedBrushPlugin.prototype.activate=function(){this.fig.enableLinkedBrush()},mpld3_LinkedBrushPlugin.prototype.deactivate=function(){this.fig.disableLinkedBrush()},mpld3_LinkedBrushPlugin.prototype.isPathInSelection=function(t,e,i,s){var o=s[0][0]<t[e]&&s[1][0]>t[e]&&s[0][1]<t[i]&&s[1][1]>t[i];return o},mpld3_LinkedBrushPlugin.prototype.invertSelection=function(t,e){var i=[e.x.invert(t[0][0]),e.x.invert(t[1][0])],s=[e.y.invert(t[1][1]),e.y.invert(t[0][1])];return[[Math.min.apply(Math,i),Math.min.apply(Math,s)],[Math.max.apply(Math,i),Math.max.apply(Math,s)]]},mpld3_LinkedBrushPlugin.prototype.update=function(t){t&&this.pathCollectionsByAxes.forEach(function(e,i){var s=e[0],o=this.objectsByAxes[i],r=this.invertSelection(t,this.fig.axes[i]),n=s.props.xindex,p=s.props.yindex;o.selectAll("path").classed("mpld3-hidden",function(t,e){return!this.isPathInSelection(t,n,p,r)}.bind(this))}.bind(this))},mpld3_LinkedBrushPlugin.prototype.end=function(){this.allObjects.selectAll("path").classed("mpld3-hidden",!1)},mpld3_LinkedBrushPlugin.prototype.draw=function(){mpld3.insert_css("#"+this.fig.figid+" path.mpld3-hidden",{stroke:"#ccc !important",fill:"#ccc !important"});var t=mpld3.get_element(this.props.id);if(!t)throw new Error("[LinkedBrush] Could not find path collection");if(!("offsets"in t.props))throw new Error("[LinkedBrush] Figure is not a scatter plot.");this.objectClass="mpld3-brushtarget-"+t.props[this.dataKey],this.pathCollectionsByAxes=this.fig.axes.map(function(e){return e.elements.map(function(e){return e.props[this.dataKey]==t.props[this.dataKey]?(e.group.classed(this.objectClass,!0),e):void 0}.bind(this)).filter(function(t){return t})}.bind(this)),this.objectsByAxes=this.fig.axes.map(function(t){return t.axes.selectAll("."+this.objectClass)}.bind(this)),this.allObjects=this.fig.canvas.selectAll("."+this.objectClass)},mpld3.register_plugin("mouseposition",MousePositionPlugin),MousePositionPlugin.prototype=Object.create(mpld3.Plugin.prototype),MousePositionPlugin.prototype.constructor=MousePositionPlugin,MousePositionPlugin.prototype.requiredProps=[],MousePositionPlugin.prototype.defaultProps={fontsize:12,fmt:".3g"},MousePositionPlugin.prototype.draw=function(){for(var t=this.fig,e=d3.format(this.props.fmt),i=t.canvas.append("text").attr("class","mpld3-coordinates").style("text-anchor","end").style("font-size",this.props.fontsize).attr("x",this.fig.width-5).attr("y",this.fig.height-5),s=0;s<this.fig.axes.length;s++){var o=function(){var o=t.axes[s];return function(){var t=d3.mouse(this),s=o.x.invert(t[0]),r=o.y.invert(t[1]);i.text("("+e(s)+", "+e(r)+")")}}();t.axes[s].baseaxes.on("mousemove",o).on("mouseout",function(){i.text("")})}},mpld3.Figure=mpld3_Figure,mpld3_Figure.prototype=Object.create(mpld3_PlotElement.prototype),mpld3_Figure.prototype.constructor=mpld3_Figure,mpld3_Figure.prototype.requiredProps=["width","height"],mpld3_Figure.prototype.defaultProps={data:{},axes:[],plugins:[{type:"reset"},{type:"zoom"},{type:"boxzoom"}]},mpld3_Figure.prototype.addPlugin=function(t){if(!t.type)return console.warn("unspecified plugin type. Skipping this");var e;if(!(t.type in mpld3.plugin_map))return console.warn("Skipping unrecognized plugin: "+e);e=mpld3.plugin_map[t.type],(t.clear_toolbar||t.buttons)&&console.warn("DEPRECATION WARNING: You are using pluginInfo.clear_toolbar or pluginInfo, which have been deprecated. Please see the build-in plugins for the new method to add buttons, otherwise contact the mpld3 maintainers.");var i=mpld3_cloneObj(t);delete i.type;var s=new e(this,i);this.plugins.push(s),this.pluginsByType[t.type]=s},mpld3_Figure.prototype.draw=function(){mpld3.insert_css("div#"+this.figid,{"font-family":"Helvetica, sans-serif"}),this.canvas=this.root.append("svg:svg").attr("class","mpld3-figure").attr("width",this.width).attr("height",this.height);for(var t=0;t<this.axes.length;t++)this.axes[t].draw();this.disableZoom();for(var t=0;t<this.plugins.length;t++)this.plugins[t].draw();this.toolbar.draw()},mpld3_Figure.prototype.resetBrushForOtherAxes=function(t){this.axes.forEach(function(e){e.axid!=t&&e.resetBrush()})},mpld3_Figure.prototype.updateLinkedBrush=function(t){this.pluginsByType.linkedbrush&&this.pluginsByType.linkedbrush.update(t)},mpld3_Figure.prototype.endLinkedBrush=function(){this.pluginsByType.linkedbrush&&this.pluginsByType.linkedbrush.end()},mpld3_Figure.prototype.reset=function(t){this.axes.forEach(function(t){t.reset()})},mpld3_Figure.prototype.enableLinkedBrush=function(){this.axes.forEach(function(t){t.enableLinkedBrush()})},mpld3_Figure.prototype.disableLinkedBrush=function(){this.axes.forEach(function(t){t.disableLinkedBrush()})},mpld3_Figure.prototype.enableBoxzoom=function(){this.axes.forEach(function(t){t.enableBoxzoom()})},mpld3_Figure.prototype.disableBoxzoom=function(){this.axes.forEach(function(t){t.disableBoxzoom()})},mpld3_Figure.prototype.enableZoom=function(){this.axes.forEach(function(t){t.enableZoom()})},mpld3_Figure.prototype.disableZoom=function(){this.axes.forEach(function(t){t.disableZoom()})},mpld3_Figure.prototype.toggleZoom=function(){this.isZoomEnabled?this.disableZoom():this.enableZoom()},mpld3_Figure.prototype.setTicks=function(t,e,i){this.axes.forEach(function(s){s.setTicks(t,e,i)})},mpld3_Figure.prototype.setXTicks=function(t,e){this.setTicks("x",t,e)},mpld3_Figure.prototype.setYTicks=function(t,e){this.setTicks("y",t,e)},mpld3_Figure.prototype.removeNaN=function(t){output=output.map(function(t){return t.map(function(t){return"number"==typeof t&&isNaN(t)?0:t})})},mpld3_Figure.prototype.parse_offsets=function(t){return t.map(function(t){return t.map(function(t){return"number"==typeof t&&isNaN(t)?0:t})})},mpld3_Figure.prototype.get_data=function(t){var e=t;return null===t||"undefined"==typeof t?e=null:"string"==typeof t&&(e=this.data[t]),e},mpld3.PlotElement=mpld3_PlotElement,mpld3_PlotElement.prototype.requiredProps=[],mpld3_PlotElement.prototype.defaultProps={},mpld3_PlotElement.prototype.processProps=function(t){t=mpld3_cloneObj(t);var e={},i=this.name();this.requiredProps.forEach(function(s){if(!(s in t))throw"property '"+s+"' must be specified for "+i;e[s]=t[s],delete t[s]});for(var s in this.defaultProps)s in t?(e[s]=t[s],delete t[s]):e[s]=this.defaultProps[s];"id"in t?(e.id=t.id,delete t.id):"id"in e||(e.id=mpld3.generateId());for(var s in t)console.warn("Unrecognized property '"+s+"' for object "+this.name()+" (value = "+t[s]+").");return e},mpld3_PlotElement.prototype.name=function(){var t=/function (.{1,})\(/,e=t.exec(this.constructor.toString());return e&&e.length>1?e[1]:""},"object"==typeof module&&module.exports?module.exports=mpld3:this.mpld3=mpld3,console.log("Loaded mpld3 version "+mpld3.version);
+if(!d3){var d3=require("d3");}var mpld3={_mpld3IsLoaded:true,figures:[],plugin_map:{}};mpld3.version="0.5.13-dev";mpld3.register_plugin=function(b,a){mpld3.plugin_map[b]=a;};mpld3.remove_figure=function(b){var c=document.getElementById(b);if(c!==null){c.innerHTML="";}for(var a=0; a<mpld3.figures.length; a++){var d=mpld3.figures[a];if(d.figid===b){mpld3.figures.splice(a,1);}}return true;};mpld3.draw_figure=function(b,d,e,a){var c=document.getElementById(b);a=typeof a!=="undefined"?a:false;if(a){mpld3.remove_figure(b);}if(c===null){throw b+" is not a valid id";}if(mpld3.lazy!==null){mpld3_registerLazyFigure(c,d,e);return null;}return mpld3_drawFigure(c,d,e);};function mpld3_drawFigure(d,b,c,e){if(mpld3_hasExternalData(b)){mpld3_loadExternalData(b,function(a){if(!e||e()){mpld3_drawFigure(d,a,c);}});return null;}var a=new mpld3.Figure(d.id,b);if(c){c(a,d);}mpld3.figures.push(a);a.draw();return a;}mpld3.lazy=null;mpld3.enable_lazy_drawing=function(a){if(typeof IntersectionObserver==="undefined"){return false;}if(mpld3.lazy!==null){return true;}a=a||{};var b=mpld3.lazy={figures:{},teardownObserver:null};b.drawObserver=new IntersectionObserver(function(a){a.forEach(function(c){var a=b.figures[c.target.id];if(a){a.near=c.isIntersecting;mpld3_updateLazyFigure(c.target,a);}});},{rootMargin:a.margin||"200px"});if(a.teardownMargin){b.teardownObserver=new IntersectionObserver(function(a){a.forEach(function(c){var a=b.figures[c.target.id];if(a){a.kept=c.isIntersecting;mpld3_updateLazyFigure(c.target,a);}});},{rootMargin:a.teardownMargin});}return true;};function mpld3_registerLazyFigure(a,c,d){var b=mpld3.lazy;b.figures[a.id]={spec:c,process:d,drawn:false,draws:0,near:false,kept:true};a.style.minHeight=c.height+"px";var e=[b.drawObserver,b.teardownObserver];e.forEach(function(b){if(b!==null){b.unobserve(a);b.observe(a);}});}function mpld3_updateLazyFigure(b,a){if(a.near&&!a.drawn){a.drawn=true;var c=++a.draws;mpld3_drawFigure(b,a.spec,a.process,function(){return mpld3.lazy.figures[b.id]===a&&a.drawn&&a.draws===c;});}else if(!a.near&&!a.kept&&a.drawn){a.drawn=false;mpld3.remove_figure(b.id);}}mpld3.dataCache={};function mpld3_isExternalDataset(a){return!isUndefinedOrNull(a)&&!Array.isArray(a)&&"href"in a&&"sha1"in a;}function mpld3_hasExternalData(a){for(var b in a.data){if(mpld3_isExternalDataset(a.data[b])){return true;}}return false;}function mpld3_loadExternalData(a,e){var c=Object.keys(a.data).filter(function(b){return mpld3_isExternalDataset(a.data[b]);});var d=mpld3_cloneObj(a.data);var b=c.length;c.forEach(function(c){mpld3_fetchDataset(a.data[c],function(g){d[c]=g;b--;if(b===0){var f=mpld3_cloneObj(a);f.data=d;e(f);}});});}function mpld3_fetchDataset(c,e){var a=mpld3.dataCache[c.sha1];if(a){if(a.rows){e(a.rows);}else{a.callbacks.push(e);}return;}a=mpld3.dataCache[c.sha1]={rows:null,callbacks:[e]};var b=new XMLHttpRequest();b.open("GET",c.href);b.responseType="arraybuffer";b.onload=function(){if(b.status!==200){return d();}var g=new Float64Array(b.response);var h=c.shape[1];var f=[];for(var e=0; e<g.length; e+=h){f.push(Array.prototype.slice.call(g,e,e+h));}a.rows=f;var i=a.callbacks;a.callbacks=[];i.forEach(function(a){a(f);});};b.onerror=d;b.send();function d(){delete mpld3.dataCache[c.sha1];console.warn("failed to load dataset "+c.href);}}mpld3.cloneObj=mpld3_cloneObj;function mpld3_cloneObj(a){var b={};for(var c in a){b[c]=a[c];}return b;}mpld3.boundsToTransform=function(e,a){var c=e.width;var d=e.height;var j=a[1][0]-a[0][0];var i=a[1][1]-a[0][1];var g=(a[0][0]+a[1][0])/2;var f=(a[0][1]+a[1][1])/2;var b=Math.max(1,Math.min(8,.9/Math.max(j/c,i/d)));var h=[c/2-b*g,d/2-b*f];return{translate:h,scale:b};};mpld3.getTransformation=function(c){var b=document.createElementNS("http://www.w3.org/2000/svg","g");b.setAttributeNS(null,"transform",c);var a=b.transform.baseVal.consolidate().matrix;return mpld3_matrixTransformation([a.a,a.b,a.c,a.d,a.e,a.f]);};mpld3.matrixTransformation=mpld3_matrixTransformation;function mpld3_matrixTransformation(g,d){d=isUndefined(d)?1:d;var b=g[0]*d,a=g[1]*d,i=g[2]*d,h=g[3]*d,m=g[4],l=g[5];var f,j,c;if(f=Math.sqrt(b*b+a*a))b/=f,a/=f;if(c=b*i+a*h)i-=b*c,h-=a*c;if(j=Math.sqrt(i*i+h*h))i/=j,h/=j,c/=j;if(b*h<a*i)b=-b,a=-a,c=-c,f=-f;var e={translateX:m,translateY:l,rotate:Math.atan2(a,b)*180/Math.PI,skewX:Math.atan(c)*180/Math.PI,scaleX:f,scaleY:j};var k=""+"translate("+e.translateX+","+e.translateY+")"+"rotate("+e.rotate+")"+"skewX("+e.skewX+")"+"scale("+e.scaleX+","+e.scaleY+")";return k;}mpld3.merge_objects=function(e){var c={};var a;for(var b=0; b<arguments.length; b++){a=arguments[b];for(var d in a){c[d]=a[d];}}return c;};mpld3.generate_id=function(b,a){console.warn("mpld3.generate_id is deprecated. "+"Use mpld3.generateId instead.");return mpld3_generateId(b,a);};mpld3.generateId=mpld3_generateId;function mpld3_generateId(b,a){b=typeof b!=="undefined"?b:10;a=typeof a!=="undefined"?a:"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789";var c=a.charAt(Math.round(Math.random()*(a.length-11)));for(var d=1; d<b; d++)c+=a.charAt(Math.round(Math.random()*(a.length-1)));return c;}mpld3.get_element=function(e,a){var b,d,c;if(typeof a==="undefined"){b=mpld3.figures;}else if(typeof a.length==="undefined"){b=[a];}else{b=a;}for(var h=0; h<b.length; h++){a=b[h];if(a.props.id===e){return a;}for(var g=0; g<a.axes.length; g++){d=a.axes[g];if(d.props.id===e){return d;}for(var f=0; f<d.elements.length; f++){c=d.elements[f];if(c.props.id===e||c.props.ids&&c.props.ids.indexOf(e)!==-1){return c;}}}}return null;};mpld3.insert_css=function(e,d){var f=document.head||document.getElementsByTagName("head")[0];var a=document.createElement("style");var b=e+" {";for(var c in d){b+=c+":"+d[c]+"; ";}b+="}";a.type="text/css";if(a.styleSheet){a.styleSheet.cssText=b;}else{a.appendChild(document.createTextNode(b));}f.appendChild(a);};mpld3.process_props=function(f,c,e,b){console.warn("mpld3.process_props is deprecated. "+"Plot elements should derive from mpld3.PlotElement");a.prototype=Object.create(mpld3_PlotElement.prototype);a.prototype.constructor=a;a.prototype.requiredProps=b;a.prototype.defaultProps=e;function a(b){mpld3_PlotElement.call(this,null,b);}var d=new a(c);return d.props;};mpld3.interpolateDates=mpld3_interpolateDates;function mpld3_interpolateDates(b,a){var c=d3.interpolate([b[0].valueOf(),b[1].valueOf()],[a[0].valueOf(),a[1].valueOf()]);return function(b){var a=c(b);return[new Date(a[0]),new Date(a[1])];};}function isUndefined(a){return typeof a==="undefined";}function isUndefinedOrNull(a){return a==null||isUndefined(a);}function getMod(a,b){return a.length>0?a[b%a.length]:null;}mpld3.decodeArray=mpld3_decodeArray;var mpld3_typedArrays={int8:Int8Array,uint8:Uint8Array,int16:Int16Array,uint16:Uint16Array,int32:Int32Array,uint32:Uint32Array,float32:Float32Array,float64:Float64Array};var mpld3_base64Lookup=new Uint8Array(128);(function(){var b="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";for(var a=0; a<b.length; a++){mpld3_base64Lookup[b.charCodeAt(a)]=a;}})();function mpld3_decodeArray(d){if(isUndefinedOrNull(d)||!("base64"in d)){return d;}var c=d.base64;var b=c.length;while(b>0&&c.charAt(b-1)==="="){b--;}var e=new Uint8Array(Math.floor(b*3/4));for(var a=0,f=0; a<b; a+=4){var j=mpld3_base64Lookup[c.charCodeAt(a)],h=mpld3_base64Lookup[c.charCodeAt(a+1)],g=mpld3_base64Lookup[c.charCodeAt(a+2)],i=mpld3_base64Lookup[c.charCodeAt(a+3)];e[f++]=j<<2|h>>4;if(a+2<b)e[f++]=(h&15)<<4|g>>2;if(a+3<b)e[f++]=(g&3)<<6|i;}return new mpld3_typedArrays[d.dtype](e.buffer);}mpld3.StyleArray=mpld3_StyleArray;function mpld3_StyleArray(b){if(isUndefinedOrNull(b)||!("palette"in b)){this.palette=b;this.index=null;return;}this.palette=b.palette;this.index=mpld3_decodeArray(b.index);if("runs"in b){var c=mpld3_decodeArray(b.runs);var f=0;for(var a=0; a<c.length; a++){f+=c[a];}var e=new this.index.constructor(f);for(var a=0,d=0; a<c.length; d+=c[a],a++){e.fill(this.index[a],d,d+c[a]);}this.index=e;}}mpld3_StyleArray.prototype.get=function(a){if(this.index===null){return getMod(this.palette,a);}return this.palette[this.index[a%this.index.length]];};mpld3_StyleArray.prototype.paletteIndex=function(a){if(this.index===null){return a%this.palette.length;}return this.index[a%this.index.length];};mpld3_StyleArray.prototype.size=function(){if(this.index===null){return isUndefinedOrNull(this.palette)?0:this.palette.length;}return this.index.length;};mpld3.decodeVertices=mpld3_decodeVertices;function mpld3_decodeVertices(c){var b=mpld3_decodeArray(c);if(b===c){return c;}var d=new Array(b.length/2);for(var a=0; a<d.length; a++){d[a]=[b[2*a],b[2*a+1]];}return d;}mpld3.path=function(){return mpld3_path();};function mpld3_path(f){var c=function(a,b){return a[0];};var b=function(a,b){return a[1];};var d=function(b,a){return true;};var e={M:1,m:1,L:1,l:1,Q:2,q:2,T:1,t:1,S:2,s:2,C:3,c:3,Z:0,z:0};function a(i,h){var o=function(a){if(typeof a=="function"){return a;}return function(){return a;};};var q=o(c),p=o(b);var g=[],j=[],f=0,l=-1,m=0,k=false;if(!h){h=["M"];for(var n=1; n<i.length; n++)h.push("L");}while(++l<h.length){m=f+e[h[l]];g=[];while(f<m){if(d.call(this,i[f],f)){g.push(q.call(this,i[f],f),p.call(this,i[f],f));f++;}else{g=null;f=m;}}if(!g){k=true;}else if(k&&g.length>0){j.push("M",g[0],g[1]);k=false;}else{j.push(h[l]);j=j.concat(g);}}if(f!=i.length)console.warn("Warning: not all vertices used in Path");return j.join(" ");}a.x=function(b){if(!arguments.length)return c;c=b;return a;};a.y=function(c){if(!arguments.length)return b;b=c;return a;};a.defined=function(b){if(!arguments.length)return d;d=b;return a;};a.call=a;return a;}mpld3.multiscale=mpld3_multiscale;function mpld3_multiscale(d){var b=Array.prototype.slice.call(arguments,0);var c=b.length;function a(c){b.forEach(function(a){c=a(c);});return c;}a.domain=function(c){if(!arguments.length)return b[0].domain();b[0].domain(c);return a;};a.range=function(d){if(!arguments.length)return b[c-1].range();b[c-1].range(d);return a;};a.step=function(a){return b[a];};return a;}mpld3.icons={reset:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gIcACMoD/OzIwAAAJhJREFUOMtjYKAx4KDUgNsMDAx7\nyNV8i4GB4T8U76VEM8mGYNNMtCH4NBM0hBjNMIwSsMzQ0MamcDkDA8NmQi6xggpUoikwQbIkHk2u\nE0rLI7vCBknBSyxeRDZAE6qHgQkq+ZeBgYERSfFPAoHNDNUDN4BswIRmKgxwEasP2dlsDAwMYlA/\n/mVgYHiBpkkGKscIDaPfVMmuAGnOTaGsXF0MAAAAAElFTkSuQmCC\n",move:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gIcACQMfLHBNQAAANZJREFUOMud07FKA0EQBuAviaKB\nlFr7COJrpAyYRlKn8hECEkFEn8ROCCm0sBMRYgh5EgVFtEhsRjiO27vkBoZd/vn5d3b+XcrjFI9q\nxgXWkc8pUjOB93GMd3zgB9d1unjDSxmhWSHQqOJki+MtOuv/b3ZifUqctIrMxwhHuG1gim4Ma5kR\nWuEkXFgU4B0MW1Ho4TeyjX3s4TDq3zn8ALvZ7q5wX9DqLOHCDA95cFBAnOO1AL/ZdNopgY3fQcqF\nyriMe37hM9w521ZkkvlMo7o/8g7nZYQ/QDctp1nTCf0AAAAASUVORK5CYII=\n",zoom:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH3gMPDiIRPL/2oQAAANBJREFUOMvF0b9KgzEcheHHVnCT\nKoI4uXbtLXgB3oJDJxevw1VwkoJ/NjepQ2/BrZRCx0ILFURQKV2kyOeSQpAmn7WDB0Lg955zEhLy\n2scdXlBggits+4WOQqjAJ3qYR7NGLrwXGU9+sGbEtlIF18FwmuBngZ+nCt6CIacC3Rx8LSl4xzgF\nn0tusBn4UyVhuA/7ZYIv5g+pE3ail25hN/qdmzCfpsJVjKKCZesDBwtzrAqGOMQj6vhCDRsY4ALH\nmOVObltR/xeG/jph6OD2r+Fv5lZBWEhMx58AAAAASUVORK5CYII=\n",brush:"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI\nWXMAAEQkAABEJAFAZ8RUAAAAB3RJTUUH3gMCEiQKB9YaAgAAAWtJREFUOMuN0r1qVVEQhuFn700k\nnfEvBq0iNiIiOKXgH4KCaBeIhWARK/EibLwFCwVLjyAWaQzRGG9grC3URkHUBKKgRuWohWvL5pjj\nyTSLxcz7rZlZHyMiItqzFxGTEVF18/UoODNFxDIO4x12dkXqTcBPsCUzD+AK3ndFqhHwEsYz82gn\nN4dbmMRK9R/4KY7jAvbiWmYeHBT5Z4QCP8J1rGAeN3GvU3Mbl/Gq3qCDcxjLzOV+v78fq/iFIxFx\nPyJ2lNJpfBy2g59YzMyzEbEVLzGBJjOriLiBq5gaJrCIU3hcRCbwAtuwjm/Yg/V6I9NgDA1OR8RC\nZq6Vcd7iUwtn5h8fdMBdETGPE+Xe4ExELDRNs4bX2NfCUHe+7UExyfkCP8MhzOA7PuAkvrbwXyNF\nxF3MDqxiqlhXC7SPdaOKiN14g0u4g3H0MvOiTUSNY3iemb0ywmfMdfYyUmAJ2yPiBx6Wr/oy2Oqw\n+A1SupBzAOuE/AAAAABJRU5ErkJggg==\n"};mpld3.Grid=mpld3_Grid;mpld3_Grid.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Grid.prototype.constructor=mpld3_Grid;mpld3_Grid.prototype.requiredProps=["xy"];mpld3_Grid.prototype.defaultProps={color:"gray",dasharray:"2,2",alpha:"0.5",nticks:10,gridOn:true,tickvalues:null,zorder:0};function mpld3_Grid(b,a){mpld3_PlotElement.call(this,b,a);this.cssclass="mpld3-"+this.props.xy+"grid";if(this.props.xy=="x"){this.transform="translate(0,"+this.ax.height+")";this.position="bottom";this.scale=this.ax.xdom;this.tickSize=-this.ax.height;}else if(this.props.xy=="y"){this.transform="translate(0,0)";this.position="left";this.scale=this.ax.ydom;this.tickSize=-this.ax.width;}else{throw"unrecognized grid xy specifier: should be 'x' or 'y'";}}mpld3_Grid.prototype.draw=function(){var a={left:"axisLeft",right:"axisRight",top:"axisTop",bottom:"axisBottom"}[this.position];this.grid=d3[a](this.scale).ticks(this.props.nticks).tickValues(this.props.tickvalues).tickSize(this.tickSize,0,0).tickFormat("");this.elem=this.ax.axes.append("g").attr("class",this.cssclass).attr("transform",this.transform).call(this.grid);mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" .tick",{stroke:this.props.color,"stroke-dasharray":this.props.dasharray,"stroke-opacity":this.props.alpha});mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" path",{"stroke-width":0});mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" .domain",{"pointer-events":"none"});};mpld3_Grid.prototype.zoomed=function(a){if(a){if(this.props.xy=="x"){this.elem.call(this.grid.scale(a.rescaleX(this.scale)));}else{this.elem.call(this.grid.scale(a.rescaleY(this.scale)));}}else{this.elem.call(this.grid);}};mpld3.Axis=mpld3_Axis;mpld3_Axis.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Axis.prototype.constructor=mpld3_Axis;mpld3_Axis.prototype.requiredProps=["position"];mpld3_Axis.prototype.defaultProps={nticks:10,tickvalues:null,tickformat:null,filtered_tickvalues:null,filtered_tickformat:null,tickformat_formatter:null,fontsize:"11px",fontcolor:"black",axiscolor:"black",scale:"linear",grid:{},zorder:0,visible:true};function mpld3_Axis(a,d){mpld3_PlotElement.call(this,a,d);var c={bottom:[0,this.ax.height],top:[0,0],left:[0,0],right:[this.ax.width,0]};var b={bottom:"x",top:"x",left:"y",right:"y"};this.ax=a;this.transform="translate("+c[this.props.position]+")";this.props.xy=b[this.props.position];this.cssclass="mpld3-"+this.props.xy+"axis";this.scale=this.ax[this.props.xy+"dom"];this.tickNr=null;this.tickFormat=null;}mpld3_Axis.prototype.getGrid=function(){var b={nticks:this.props.nticks,zorder:this.props.zorder,tickvalues:null,xy:this.props.xy};if(this.props.grid){for(var a in this.props.grid){b[a]=this.props.grid[a];}}return new mpld3_Grid(this.ax,b);};mpld3_Axis.prototype.wrapTicks=function(){function a(d,c,b){b=b||1.2;d.each(function(){var a=d3.select(this);var l=a.node().getBBox();var h=l.height;var j=a.text().split(/\s+/).reverse();var e;var d=[];var k=0;var g=a.attr("y");var i=h;var f=a.text(null).append("tspan").attr("x",0).attr("y",g).attr("dy",i);while(e=j.pop()){d.push(e);f.text(d.join(" "));if(f.node().getComputedTextLength()>c){d.pop();f.text(d.join(" "));d=[e];f=a.append("tspan").attr("x",0).attr("y",g).attr("dy",++k*(h*b)+i).text(e);}}});}var b=80;if(this.props.xy=="x"){this.elem.selectAll("text").call(a,b);}};mpld3_Axis.prototype.draw=function(){var c=this.props.xy==="x"?this.parent.props.xscale:this.parent.props.yscale;if(c==="date"&&this.props.tickvalues){var f=this.props.xy==="x"?this.parent.x.domain():this.parent.y.domain();var d=this.props.xy==="x"?this.parent.xdom.domain():this.parent.ydom.domain();var e=d3.scaleLinear().domain(f).range(d);this.props.tickvalues=this.props.tickvalues.map(function(a){return new Date(e(a));});}var b={left:"axisLeft",right:"axisRight",top:"axisTop",bottom:"axisBottom"}[this.props.position];this.axis=d3[b](this.scale);var a=this;this.filter_ticks(this.axis.scale().domain());if(this.props.tickformat_formatter=="index"){this.axis=this.axis.tickFormat(function(b,c){return a.props.filtered_tickformat[b];});}else if(this.props.tickformat_formatter=="percent"){this.axis=this.axis.tickFormat(function(e,f){var b=e/a.props.tickformat.xmax*100;var d=a.props.tickformat.decimals||0;var c=d3.format("."+d+"f")(b);return c+a.props.tickformat.symbol;});}else if(this.props.tickformat_formatter=="str_method"){this.axis=this.axis.tickFormat(function(c,d){var b=d3.format(a.props.tickformat.format_string)(c);return a.props.tickformat.prefix+b+a.props.tickformat.suffix;});}else if(this.props.tickformat_formatter=="fixed"||this.props.tickformat_formatter=="func"){this.axis=this.axis.tickFormat(function(c,b){return a.props.filtered_tickformat[b];});}else if(this.tickFormat){this.axis=this.axis.tickFormat(this.tickFormat);}if(this.tickNr){this.axis=this.axis.ticks(this.tickNr);}this.axis=this.axis.tickValues(this.props.filtered_tickvalues);this.elem=this.ax.baseaxes.append("g").attr("transform",this.transform).attr("class",this.cssclass).call(this.axis);this.wrapTicks();mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" line, "+" ."+this.cssclass+" path",{"shape-rendering":"crispEdges",stroke:this.props.axiscolor,fill:"none"});mpld3.insert_css("div#"+this.ax.fig.figid+" ."+this.cssclass+" text",{"font-family":"sans-serif","font-size":this.props.fontsize+"px",fill:this.props.fontcolor,stroke:"none"});};mpld3_Axis.prototype.zoomed=function(a){this.filter_ticks(this.axis.scale().domain());this.axis=this.axis.tickValues(this.props.filtered_tickvalues);if(a){if(this.props.xy=="x"){this.elem.call(this.axis.scale(a.rescaleX(this.scale)));}else{this.elem.call(this.axis.scale(a.rescaleY(this.scale)));}this.wrapTicks();}else{this.elem.call(this.axis);}};mpld3_Axis.prototype.setTicks=function(a,b){this.tickNr=a;this.tickFormat=b;};mpld3_Axis.prototype.filter_ticks=function(b){if(this.props.tickvalues){var c=this;var a=this.props.tickvalues.map(function(b,a){return a;}).filter(function(d,e){var a=c.props.tickvalues[d];return a>=b[0]&&a<=b[1];});this.props.filtered_tickvalues=this.props.tickvalues.filter(function(c,b){return a.includes(b);});if(this.props.tickformat){this.props.filtered_tickformat=this.props.tickformat.filter(function(c,b){return a.includes(b);});}else{this.props.filtered_tickformat=this.props.tickformat;}}else{this.props.filtered_tickvalues=this.props.tickvalues;this.props.filtered_tickformat=this.props.tickformat;}};mpld3.Coordinates=mpld3_Coordinates;function mpld3_Coordinates(b,a){this.trans=b;if(typeof a==="undefined"){this.ax=null;this.fig=null;if(this.trans!=="display")throw"ax must be defined if transform != 'display'";}else{this.ax=a;this.fig=a.fig;}this.zoomable=this.trans==="data";this.x=this["x_"+this.trans];this.y=this["y_"+this.trans];if(typeof this.x==="undefined"||typeof this.y==="undefined")throw"unrecognized coordinate code: "+this.trans;}mpld3_Coordinates.prototype.xy=function(c,b,a){b=typeof b==="undefined"?0:b;a=typeof a==="undefined"?1:a;return[this.x(c[b]),this.y(c[a])];};mpld3_Coordinates.prototype.x_data=function(a){return this.ax.x(a);};mpld3_Coordinates.prototype.y_data=function(a){return this.ax.y(a);};mpld3_Coordinates.prototype.x_display=function(a){return a;};mpld3_Coordinates.prototype.y_display=function(a){return a;};mpld3_Coordinates.prototype.x_axes=function(a){return a*this.ax.width;};mpld3_Coordinates.prototype.y_axes=function(a){return this.ax.height*(1-a);};mpld3_Coordinates.prototype.x_figure=function(a){return a*this.fig.width-this.ax.position[0];};mpld3_Coordinates.prototype.y_figure=function(a){return(1-a)*this.fig.height-this.ax.position[1];};mpld3.Path=mpld3_Path;mpld3_Path.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Path.prototype.constructor=mpld3_Path;mpld3_Path.prototype.requiredProps=["data"];mpld3_Path.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",facecolor:"green",edgecolor:"black",edgewidth:1,dasharray:"none",pathcodes:null,offset:null,offsetcoordinates:"data",alpha:1,drawstyle:"none",zorder:1};function mpld3_Path(a,b){mpld3_PlotElement.call(this,a,b);this.data=a.fig.get_data(this.props.data);this.pathcodes=this.props.pathcodes;this.pathcoords=new mpld3_Coordinates(this.props.coordinates,this.ax);this.offsetcoords=new mpld3_Coordinates(this.props.offsetcoordinates,this.ax);this.datafunc=mpld3_path();}mpld3_Path.prototype.finiteFilter=function(a,b){return isFinite(this.pathcoords.x(a[this.props.xindex]))&&isFinite(this.pathcoords.y(a[this.props.yindex]));};mpld3_Path.prototype.draw=function(){this.datafunc.defined(this.finiteFilter.bind(this)).x(function(a){return this.pathcoords.x(a[this.props.xindex]);}.bind(this)).y(function(a){return this.pathcoords.y(a[this.props.yindex]);}.bind(this));if(this.pathcoords.zoomable){this.path=this.ax.paths.append("svg:path");}else{this.path=this.ax.staticPaths.append("svg:path");}this.path=this.path.attr("d",this.datafunc(this.data,this.pathcodes)).attr("class","mpld3-path").style("stroke",this.props.edgecolor).style("stroke-width",this.props.edgewidth).style("stroke-dasharray",this.props.dasharray).style("fill",this.props.facecolor).attr("vector-effect","non-scaling-stroke");if(this.props.edgecolor.slice(0,5)!="rgba("){this.path=this.path.style("stroke-opacity",this.props.alpha);}if(this.props.facecolor.slice(0,5)!="rgba("){this.path=this.path.style("fill-opacity",this.props.alpha);}if(this.props.offset!==null){var a=this.offsetcoords.xy(this.props.offset);this.path.attr("transform","translate("+a+")");}};mpld3_Path.prototype.elements=function(a){return this.path;};mpld3.PathCollection=mpld3_PathCollection;mpld3_PathCollection.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_PathCollection.prototype.constructor=mpld3_PathCollection;mpld3_PathCollection.prototype.requiredProps=["paths","offsets"];mpld3_PathCollection.prototype.defaultProps={xindex:0,yindex:1,pathtransforms:[],pathcoordinates:"display",offsetcoordinates:"data",offsetorder:"before",edgecolors:["#000000"],drawstyle:"none",edgewidths:[1],facecolors:["#0000FF"],alphas:[1],zorder:2};function mpld3_PathCollection(f,e){mpld3_PlotElement.call(this,f,e);this.edgecolors=new mpld3_StyleArray(this.props.edgecolors);this.facecolors=new mpld3_StyleArray(this.props.facecolors);this.edgewidths=new mpld3_StyleArray(this.props.edgewidths);this.alphas=new mpld3_StyleArray(this.props.alphas);if(this.facecolors.palette==null||this.facecolors.palette.length==0){this.facecolors.palette=["none"];}if(this.edgecolors.palette==null||this.edgecolors.palette.length==0){this.edgecolors.palette=["none"];}this.props.facecolors=this.facecolors.palette;this.props.edgecolors=this.edgecolors.palette;this.props.edgewidths=this.edgewidths.palette;this.props.alphas=this.alphas.palette;this.paths=new mpld3_StyleArray(this.props.paths);this.paths.palette=this.paths.palette.map(function(a){return[mpld3_decodeVertices(a[0]),a[1]];});this.props.paths=this.paths.palette;this.pathCache={};var b=this.props.pathtransforms;this.transformScales=null;if(!isUndefinedOrNull(b)&&"scales"in b){this.transformScales=mpld3_decodeArray(b.scales);this.props.pathtransforms=[b.matrix];}this.transformCache={};var a=this.ax.fig.get_data(this.props.offsets);if(a===null||a.length===0)a=[null];var d=Math.max(this.paths.size(),a.length);if(a.length===d){this.offsets=a;}else{this.offsets=[];for(var c=0; c<d; c++)this.offsets.push(getMod(a,c));}this.pathcoords=new mpld3_Coordinates(this.props.pathcoordinates,this.ax);this.offsetcoords=new mpld3_Coordinates(this.props.offsetcoordinates,this.ax);}mpld3_PathCollection.prototype.pathTransform=function(c){var a=this.props.pathtransforms;if(a.length==0){return"";}if(this.transformScales!==null){return mpld3_matrixTransformation(a[0],this.transformScales[c%this.transformScales.length]);}var b=c%a.length;if(!(b in this.transformCache)){this.transformCache[b]=mpld3_matrixTransformation(a[b]);}return this.transformCache[b];};mpld3_PathCollection.prototype.transformFunc=function(a,d){var b=this.pathTransform(d);var c=a===null||typeof a==="undefined"?"translate(0, 0)":"translate("+this.offsetcoords.xy(a,this.props.xindex,this.props.yindex)+")";return this.props.offsetorder==="after"?b+c:c+b;};mpld3_PathCollection.prototype.pathFunc=function(c,b){var a=this.paths.paletteIndex(b);if(!(a in this.pathCache)){this.pathCache[a]=mpld3_path().x(function(a){return this.pathcoords.x(a[0]);}.bind(this)).y(function(a){return this.pathcoords.y(a[1]);}.bind(this)).apply(this,this.paths.palette[a]);}return this.pathCache[a];};mpld3_PathCollection.prototype.styleFunc=function(h,b){var c=this.edgecolors.get(b);var f=this.facecolors.get(b);var g=this.alphas.get(b);var a={stroke:c,"stroke-width":this.edgewidths.get(b),fill:f};if(c.slice(0,5)!="rgba("){a["stroke-opacity"]=g;}if(f.slice(0,5)!="rgba("){a["fill-opacity"]=g;}var d="";for(var e in a){d+=e+":"+a[e]+";";}return d;};mpld3_PathCollection.prototype.allFinite=function(a){if(a instanceof Array){return a.length==a.filter(isFinite).length;}else{return true;}};mpld3_PathCollection.prototype.draw=function(){if(this.offsetcoords.zoomable||this.pathcoords.zoomable){this.group=this.ax.paths.append("svg:g");}else{this.group=this.ax.staticPaths.append("svg:g");}this.pathsobj=this.group.selectAll("paths").data(this.offsets.filter(this.allFinite)).enter().append("svg:path").attr("d",this.pathFunc.bind(this)).attr("class","mpld3-path").attr("transform",this.transformFunc.bind(this)).attr("style",this.styleFunc.bind(this)).attr("vector-effect","non-scaling-stroke");};mpld3_PathCollection.prototype.elements=function(a){return this.group.selectAll("path");};mpld3.LineCollection=mpld3_LineCollection;mpld3_LineCollection.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_LineCollection.prototype.constructor=mpld3_LineCollection;mpld3_LineCollection.prototype.requiredProps=["vertices","starts"];mpld3_LineCollection.prototype.defaultProps={coordinates:"data",edgecolors:["#000000"],edgewidths:[1],alpha:1,zorder:2};function mpld3_LineCollection(b,a){mpld3_PlotElement.call(this,b,a);this.vertices=mpld3_decodeVertices(this.props.vertices);this.starts=mpld3_decodeArray(this.props.starts);this.edgecolors=new mpld3_StyleArray(this.props.edgecolors);this.edgewidths=new mpld3_StyleArray(this.props.edgewidths);if(this.edgecolors.palette==null||this.edgecolors.palette.length==0){this.edgecolors.palette=["none"];}this.props.edgecolors=this.edgecolors.palette;this.props.edgewidths=this.edgewidths.palette;this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax);}mpld3_LineCollection.prototype.styleGroups=function(){var b=[];var d={};var j=this.starts.length;for(var a=0; a<j; a++){var k=this.edgecolors.paletteIndex(a),i=this.edgewidths.paletteIndex(a);var e=k+","+i;if(!(e in d)){d[e]=b.length;b.push({color:this.edgecolors.palette[k],width:this.edgewidths.palette[i],d:[]});}var m=b[d[e]].d;var l=a+1<j?this.starts[a+1]:this.vertices.length;var f="M ";for(var c=this.starts[a];c<l; c++){var h=this.coords.x(this.vertices[c][0]),g=this.coords.y(this.vertices[c][1]);if(isFinite(h)&&isFinite(g)){m.push(f+h+" "+g);f="L ";}else{f="M ";}}}b.forEach(function(a){a.d=a.d.join(" ");});return b;};mpld3_LineCollection.prototype.draw=function(){if(this.coords.zoomable){this.group=this.ax.paths.append("svg:g");}else{this.group=this.ax.staticPaths.append("svg:g");}var a=this.props.alpha;this.pathsobj=this.group.selectAll("paths").data(this.styleGroups()).enter().append("svg:path").attr("d",function(a){return a.d;}).attr("class","mpld3-path").style("stroke",function(a){return a.color;}).style("stroke-width",function(a){return a.width;}).style("stroke-opacity",function(b){return b.color.slice(0,5)!="rgba("?a:null;}).style("fill","none").attr("vector-effect","non-scaling-stroke");};mpld3_LineCollection.prototype.elements=function(a){return this.group.selectAll("path");};mpld3.Bars=mpld3_Bars;mpld3_Bars.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Bars.prototype.constructor=mpld3_Bars;mpld3_Bars.prototype.requiredProps=["data"];mpld3_Bars.prototype.defaultProps={xindex:0,yindex:1,widthindex:2,heightindex:3,facecolors:["green"],edgecolor:"black",edgewidth:1,dasharray:"none",alpha:1,zorder:1,ids:[]};function mpld3_Bars(a,b){mpld3_PlotElement.call(this,a,b);this.data=a.fig.get_data(this.props.data);this.facecolors=new mpld3_StyleArray(this.props.facecolors);this.props.facecolors=this.facecolors.palette;this.coords=new mpld3_Coordinates("data",this.ax);}mpld3_Bars.prototype.pathStrings=function(){var a=this.props;var h=this.facecolors.palette.map(function(){return[];});for(var c=0; c<this.data.length; c++){var b=this.data[c];var d=this.coords.x(b[a.xindex]),g=this.coords.x(b[a.xindex]+b[a.widthindex]),f=this.coords.y(b[a.yindex]),e=this.coords.y(b[a.yindex]+b[a.heightindex]);if(isFinite(d)&&isFinite(g)&&isFinite(f)&&isFinite(e)){h[this.facecolors.paletteIndex(c)].push("M "+d+" "+f+" H "+g+" V "+e+" H "+d+" Z");}}return h.map(function(a){return a.join(" ");});};mpld3_Bars.prototype.draw=function(){this.group=this.ax.paths.append("svg:g");var b=this.pathStrings();for(var a=0; a<b.length; a++){if(b[a].length===0){continue;}var d=this.props.facecolors[a];var c=this.group.append("svg:path").attr("d",b[a]).attr("class","mpld3-path").style("stroke",this.props.edgecolor).style("stroke-width",this.props.edgewidth).style("stroke-dasharray",this.props.dasharray).style("fill",d).attr("vector-effect","non-scaling-stroke");if(this.props.edgecolor.slice(0,5)!="rgba("){c.style("stroke-opacity",this.props.alpha);}if(d.slice(0,5)!="rgba("){c.style("fill-opacity",this.props.alpha);}}};mpld3_Bars.prototype.elements=function(a){return this.group.selectAll("path");};mpld3.Errorbars=mpld3_Errorbars;mpld3_Errorbars.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Errorbars.prototype.constructor=mpld3_Errorbars;mpld3_Errorbars.prototype.requiredProps=["data"];mpld3_Errorbars.prototype.defaultProps={xindex:0,yindex:1,xerrindex:null,yerrindex:null,color:"black",linewidth:1,alpha:1,capsize:0,capwidth:1,zorder:2};function mpld3_Errorbars(a,b){mpld3_PlotElement.call(this,a,b);this.data=a.fig.get_data(this.props.data);}mpld3_Errorbars.prototype.pathStrings=function(f){f=f||d3.zoomIdentity;var p=this.ax;var l=function(a){return f.applyX(p.x(a));};var i=function(a){return f.applyY(p.y(a));};var a=this.props;var b=0.5*a.capsize;var m=[];var o=[];for(var n=0; n<this.data.length; n++){var c=this.data[n];if(a.xerrindex!==null){var k=l(c[a.xerrindex[0]]),j=l(c[a.xerrindex[1]]),d=i(c[a.yindex]);if(isFinite(k)&&isFinite(j)&&isFinite(d)){m.push("M "+k+" "+d+" H "+j);o.push("M "+k+" "+(d-b)+" v "+2*b+" M "+j+" "+(d-b)+" v "+2*b);}}if(a.yerrindex!==null){var h=i(c[a.yerrindex[0]]),g=i(c[a.yerrindex[1]]),e=l(c[a.xindex]);if(isFinite(h)&&isFinite(g)&&isFinite(e)){m.push("M "+e+" "+h+" V "+g);o.push("M "+(e-b)+" "+h+" h "+2*b+" M "+(e-b)+" "+g+" h "+2*b);}}}return[m.join(" "),b>0?o.join(" "):""];};mpld3_Errorbars.prototype.draw=function(){this.group=this.ax.pathsContainer.append("svg:g");var b=this.pathStrings();var c=[this.props.linewidth,this.props.capwidth];for(var a=0; a<b.length; a++){var d=this.group.append("svg:path").attr("d",b[a]).attr("class","mpld3-path").style("stroke",this.props.color).style("stroke-width",c[a]).style("fill","none");if(this.props.color.slice(0,5)!="rgba("){d.style("stroke-opacity",this.props.alpha);}}};mpld3_Errorbars.prototype.elements=function(a){return this.group.selectAll("path");};mpld3_Errorbars.prototype.zoomed=function(a){var b=this.pathStrings(a);this.elements().attr("d",function(c,a){return b[a];});};mpld3.Quiver=mpld3_Quiver;mpld3_Quiver.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Quiver.prototype.constructor=mpld3_Quiver;mpld3_Quiver.prototype.requiredProps=["data","glyph","scale"];mpld3_Quiver.prototype.defaultProps={xindex:0,yindex:1,uindex:2,vindex:3,angles:"uv",scaleunits:null,pivot:"tail",shortlength:0,dotlength:0,facecolors:["black"],edgecolor:"none",edgewidth:0,alpha:1,zorder:1};var mpld3_quiverPivots={tail:0,middle:.5,tip:1};function mpld3_Quiver(a,b){mpld3_PlotElement.call(this,a,b);this.data=a.fig.get_data(this.props.data);this.facecolors=new mpld3_StyleArray(this.props.facecolors);this.props.facecolors=this.facecolors.palette;}mpld3_Quiver.prototype.arrow=function(b){var a=this.props;var c=[];if(b<a.dotlength){var i=.5*a.dotlength;for(var d=0; d<6; d++){c.push([i*Math.cos(d*Math.PI/3),i*Math.sin(d*Math.PI/3)]);}return c;}var j=mpld3_quiverPivots[a.pivot]*b;var e=1;var h=b;if(b<a.shortlength){e=b/a.shortlength;h=a.shortlength;}for(var f=0; f<a.glyph.length; f++){var g=a.glyph[f];c.push([(g[0]+g[2]*h)*e-j,g[1]*e]);}return c;};mpld3_Quiver.prototype.pathStrings=function(e){e=e||d3.zoomIdentity;var q=this.ax;var l=function(a){return e.applyX(q.x(a));};var k=function(a){return e.applyY(q.y(a));};var a=this.props;var o=this.facecolors.palette.map(function(){return[];});for(var f=0; f<this.data.length; f++){var d=this.data[f];var c=d[a.uindex],b=d[a.vindex];var j=l(d[a.xindex]),i=k(d[a.yindex]);if(!(isFinite(j)&&isFinite(i)&&isFinite(c)&&isFinite(b))){continue;}var h=c,g=b;if(a.angles==="xy"||a.scaleunits==="xy"){h=l(d[a.xindex]+c)-j;g=i-k(d[a.yindex]+b);}var m=a.angles==="xy"?Math.atan2(g,h):Math.atan2(b,c);var r=a.scale*(a.scaleunits==="xy"?Math.sqrt(h*h+g*g):Math.sqrt(c*c+b*b));var p=Math.cos(m),n=Math.sin(m);var s=this.arrow(r).map(function(a){return j+p*a[0]-n*a[1]+" "+(i-n*a[0]-p*a[1]);});o[this.facecolors.paletteIndex(f)].push("M "+s.join(" L ")+" Z");}return o.map(function(a){return a.join(" ");});};mpld3_Quiver.prototype.draw=function(){this.group=this.ax.pathsContainer.append("svg:g");var c=this.pathStrings();for(var a=0; a<c.length; a++){var b=this.props.facecolors[a];var e=this.props.edgecolor==="face"?b:this.props.edgecolor;var d=this.group.append("svg:path").attr("d",c[a]).attr("class","mpld3-path").style("stroke",e).style("stroke-width",this.props.edgewidth).style("fill",b);if(e.slice(0,5)!="rgba("){d.style("stroke-opacity",this.props.alpha);}if(b.slice(0,5)!="rgba("){d.style("fill-opacity",this.props.alpha);}}};mpld3_Quiver.prototype.elements=function(a){return this.group.selectAll("path");};mpld3_Quiver.prototype.zoomed=function(a){var b=this.pathStrings(a);this.elements().attr("d",function(c,a){return b[a];});};mpld3.QuadMesh=mpld3_QuadMesh;mpld3_QuadMesh.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_QuadMesh.prototype.constructor=mpld3_QuadMesh;mpld3_QuadMesh.prototype.requiredProps=["x","y","values","lut"];mpld3_QuadMesh.prototype.defaultProps={scale:"linear",vmin:0,vmax:1,zorder:1};var mpld3_quadMeshMaxSVGCells=4096;function mpld3_QuadMesh(d,c){mpld3_PlotElement.call(this,d,c);this.ny=this.props.values.shape[0];this.nx=this.props.values.shape[1];this.rectilinear=this.props.x.shape.length==1;this.x=mpld3_decodeArray(this.props.x);this.y=mpld3_decodeArray(this.props.y);this.lut=mpld3_decodeArray(this.props.lut);this.N=this.lut.length/4-3;var b=mpld3_decodeArray(this.props.values);this.colors=new Uint16Array(b.length);for(var a=0; a<b.length; a++){this.colors[a]=this.colorIndex(b[a]);}}mpld3_QuadMesh.prototype.colorIndex=function(d){var f=this.props;var b=this.N;var a=d;if(f.scale!=="index"){var c=f.vmin,e=f.vmax;if(f.scale==="log"){d=d>0?Math.log(d):NaN;c=Math.log(c);e=Math.log(e);}a=b*(e==c?0:(d-c)/(e-c));if(a==b){a=b-1;}}if(isNaN(a)){return b+2;}else if(a<0){return b;}else if(a>=b){return b+1;}return Math.floor(a);};mpld3_QuadMesh.prototype.colorString=function(b){var a=this.lut;return"rgba("+a[4*b]+","+a[4*b+1]+","+a[4*b+2]+","+a[4*b+3]/255+")";};mpld3_QuadMesh.prototype.corners=function(f,e){var d=this.nx;var c=this.ax.x,b=this.ax.y;if(this.rectilinear){var j=c(this.x[f]),i=c(this.x[f+1]),h=b(this.y[e]),g=b(this.y[e+1]);return[[j,h],[i,h],[i,g],[j,g]];}var a=e*(d+1)+f;var k=[a,a+1,a+d+2,a+d+1];return k.map(function(a){return[c(this.x[a]),b(this.y[a])];},this);};mpld3_QuadMesh.prototype.cellsByColor=function(){var d={};for(var b=0; b<this.ny; b++){for(var c=0; c<this.nx; c++){var a=this.colors[b*this.nx+c];if(this.lut[4*a+3]===0){continue;}var e=this.corners(c,b);if(!e.every(function(a){return isFinite(a[0])&&isFinite(a[1]);})){continue;}if(!(a in d)){d[a]=[];}d[a].push(e);}}return d;};mpld3_QuadMesh.prototype.pathStrings=function(){var c=this.cellsByColor();var a=[];for(var b in c){a.push({color:this.colorString(b),d:c[b].map(function(a){return"M "+a.map(function(a){return a[0]+" "+a[1];}).join(" L ")+" Z";}).join(" ")});}return a;};mpld3_QuadMesh.prototype.pixelGrid=function(){if(!this.rectilinear){return null;}var d=this.ax;var c=function(a,c){var d=c(a[0]),f=c(a[a.length-1]);var e=(f-d)/(a.length-1);for(var b=1; b<a.length-1; b++){if(Math.abs(c(a[b])-d-b*e)>.001*Math.abs(e)){return null;}}return[d,f];};var b=c(this.x,d.x),a=c(this.y,d.y);return b===null||a===null?null:[b,a];};mpld3_QuadMesh.prototype.rasterize=function(){if(typeof document==="undefined"){return null;}var d=document.createElement("canvas");var c=d.getContext&&d.getContext("2d");if(!c){return null;}var b=this.pixelGrid();var f=this.nx,i=this.ny;if(b!==null){d.width=f;d.height=i;var l=c.createImageData(f,i);var p=b[0][1]<b[0][0],o=b[1][1]<b[1][0];for(var g=0; g<i; g++){for(var h=0; h<f; h++){var e=4*this.colors[g*f+h];var n=4*((o?i-1-g:g)*f+(p?f-1-h:h));for(var k=0; k<4; k++){l.data[n+k]=this.lut[e+k];}}}c.putImageData(l,0,0);return{canvas:d,pixelated:true,extent:[Math.min(b[0][0],b[0][1]),Math.max(b[0][0],b[0][1]),Math.min(b[1][0],b[1][1]),Math.max(b[1][0],b[1][1])]};}var j=this.cellsByColor();var a=[Infinity,-Infinity,Infinity,-Infinity];for(var e in j){j[e].forEach(function(b){b.forEach(function(b){a[0]=Math.min(a[0],b[0]);a[1]=Math.max(a[1],b[0]);a[2]=Math.min(a[2],b[1]);a[3]=Math.max(a[3],b[1]);});});}if(!(a[1]>a[0]&&a[3]>a[2])){return null;}d.width=Math.ceil(a[1]-a[0]);d.height=Math.ceil(a[3]-a[2]);c.translate(-a[0],-a[2]);for(var e in j){var m=this.colorString(e);c.beginPath();j[e].forEach(function(b){c.moveTo(b[0][0],b[0][1]);for(var a=1; a<4; a++){c.lineTo(b[a][0],b[a][1]);}c.closePath();});c.fillStyle=m;c.fill();if(this.lut[4*e+3]===255){c.strokeStyle=m;c.lineWidth=.5;c.stroke();}}return{canvas:d,pixelated:false,extent:a};};mpld3_QuadMesh.prototype.draw=function(){this.group=this.ax.paths.append("svg:g");var b=this.nx*this.ny>mpld3_quadMeshMaxSVGCells?this.rasterize():null;if(b!==null){var a=b.extent;this.group.append("svg:image").attr("class","mpld3-image").attr("xlink:href",b.canvas.toDataURL("image/png")).attr("x",a[0]).attr("y",a[2]).attr("width",a[1]-a[0]).attr("height",a[3]-a[2]).attr("preserveAspectRatio","none").style("image-rendering",b.pixelated?"pixelated":null);return;}this.group.selectAll("paths").data(this.pathStrings()).enter().append("svg:path").attr("d",function(a){return a.d;}).attr("class","mpld3-path").style("fill",function(a){return a.color;}).style("stroke","none").attr("shape-rendering","crispEdges");};mpld3_QuadMesh.prototype.elements=function(a){return this.group.selectAll("path, image");};mpld3.Line=mpld3_Line;mpld3_Line.prototype=Object.create(mpld3_Path.prototype);mpld3_Line.prototype.constructor=mpld3_Line;mpld3_Line.prototype.requiredProps=["data"];mpld3_Line.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",color:"salmon",linewidth:2,dasharray:"none",alpha:1,zorder:2,drawstyle:"none"};function mpld3_Line(b,c){mpld3_PlotElement.call(this,b,c);var a=this.props;a.facecolor="none";a.edgecolor=a.color;delete a.color;a.edgewidth=a.linewidth;delete a.linewidth;var d=a.drawstyle;delete a.drawstyle;this.defaultProps=mpld3_Path.prototype.defaultProps;mpld3_Path.call(this,b,a);switch(d){case"steps":case"steps-pre":this.datafunc=d3.line().curve(d3.curveStepBefore);break;case"steps-post":this.datafunc=d3.line().curve(d3.curveStepAfter);break;case"steps-mid":this.datafunc=d3.line().curve(d3.curveStep);break;default:this.datafunc=d3.line().curve(d3.curveLinear);}}mpld3.Markers=mpld3_Markers;mpld3_Markers.prototype=Object.create(mpld3_PathCollection.prototype);mpld3_Markers.prototype.constructor=mpld3_Markers;mpld3_Markers.prototype.requiredProps=["data"];mpld3_Markers.prototype.defaultProps={xindex:0,yindex:1,coordinates:"data",facecolor:"salmon",edgecolor:"black",edgewidth:1,alpha:1,markersize:6,markername:"circle",drawstyle:"none",markerpath:null,zorder:3};function mpld3_Markers(a,b){mpld3_PlotElement.call(this,a,b);if(this.props.markerpath!==null){this.marker=this.props.markerpath[0].length==0?null:mpld3.path().call(this.props.markerpath[0],this.props.markerpath[1]);}else{this.marker=this.props.markername===null?null:d3.symbol(this.props.markername).size(Math.pow(this.props.markersize,2))();}var c={paths:[this.props.markerpath],offsets:a.fig.parse_offsets(a.fig.get_data(this.props.data,true)),xindex:this.props.xindex,yindex:this.props.yindex,offsetcoordinates:this.props.coordinates,edgecolors:[this.props.edgecolor],edgewidths:[this.props.edgewidth],facecolors:[this.props.facecolor],alphas:[this.props.alpha],zorder:this.props.zorder,id:this.props.id};this.requiredProps=mpld3_PathCollection.prototype.requiredProps;this.defaultProps=mpld3_PathCollection.prototype.defaultProps;mpld3_PathCollection.call(this,a,c);}mpld3_Markers.prototype.pathFunc=function(b,a){return this.marker;};mpld3.Image=mpld3_Image;mpld3_Image.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Image.prototype.constructor=mpld3_Image;mpld3_Image.prototype.requiredProps=["data","extent"];mpld3_Image.prototype.defaultProps={alpha:1,coordinates:"data",drawstyle:"none",zorder:1};function mpld3_Image(b,a){mpld3_PlotElement.call(this,b,a);this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax);}mpld3_Image.prototype.draw=function(){this.image=this.ax.paths.append("svg:image");this.image=this.image.attr("class","mpld3-image").attr("xlink:href","data:image/png;base64,"+this.props.data).style("opacity",this.props.alpha).attr("preserveAspectRatio","none");this.updateDimensions();};mpld3_Image.prototype.elements=function(a){return d3.select(this.image);};mpld3_Image.prototype.updateDimensions=function(){var a=this.props.extent;this.image.attr("x",this.coords.x(a[0])).attr("y",this.coords.y(a[3])).attr("width",this.coords.x(a[1])-this.coords.x(a[0])).attr("height",this.coords.y(a[2])-this.coords.y(a[3]));};mpld3.TiledImage=mpld3_TiledImage;mpld3_TiledImage.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_TiledImage.prototype.constructor=mpld3_TiledImage;mpld3_TiledImage.prototype.requiredProps=["extent","shape","tilesize"];mpld3_TiledImage.prototype.defaultProps={tiles:null,url:null,alpha:1,coordinates:"data",zorder:1};function mpld3_TiledImage(c,b){mpld3_PlotElement.call(this,c,b);this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax);this.levels=1;var a=Math.max(this.props.shape[0],this.props.shape[1]);while(a>this.props.tilesize){a=Math.ceil(a/2);this.levels++;}}mpld3_TiledImage.prototype.grid=function(b){var a=this.props.tilesize*Math.pow(2,b);return[Math.ceil(this.props.shape[0]/a),Math.ceil(this.props.shape[1]/a)];};mpld3_TiledImage.prototype.tileUrl=function(a,b,c){if(this.props.tiles!==null){var d=this.grid(a)[1];return"data:image/png;base64,"+this.props.tiles[a][b*d+c];}return this.props.url.replace("{level}",a).replace("{row}",b).replace("{col}",c);};mpld3_TiledImage.prototype.bounds=function(){var a=this.props.extent;return[this.coords.x(a[0]),this.coords.x(a[1]),this.coords.y(a[3]),this.coords.y(a[2])];};mpld3_TiledImage.prototype.tileRect=function(k,i,j){var a=this.bounds();var d=this.props.shape[0],c=this.props.shape[1];var b=this.props.tilesize*Math.pow(2,k);var h=a[0]+(a[1]-a[0])*j*b/c,g=a[0]+(a[1]-a[0])*Math.min((j+1)*b,c)/c,f=a[2]+(a[3]-a[2])*i*b/d,e=a[2]+(a[3]-a[2])*Math.min((i+1)*b,d)/d;return[Math.min(h,g),Math.min(f,e),Math.abs(g-h),Math.abs(e-f)];};mpld3_TiledImage.prototype.visibleTiles=function(b){b=b||d3.zoomIdentity;var i=this.props.shape[0],h=this.props.shape[1];var a=this.bounds();var d=this.levels-1;var e=[{level:d,row:0,col:0}];var p=b.k*Math.max(Math.abs(a[1]-a[0])/h,Math.abs(a[3]-a[2])/i);var c=Math.floor(Math.log(1/p)/Math.LN2);c=Math.max(0,Math.min(d,c));if(c==d){return e;}var q=[(b.invertX(0)-a[0])/(a[1]-a[0])*h,(b.invertX(this.ax.width)-a[0])/(a[1]-a[0])*h],o=[(b.invertY(0)-a[2])/(a[3]-a[2])*i,(b.invertY(this.ax.height)-a[2])/(a[3]-a[2])*i];var j=this.props.tilesize*Math.pow(2,c);var m=this.grid(c);var k=function(a,d){var c=Math.floor(Math.min(a[0],a[1])/j),b=Math.ceil(Math.max(a[0],a[1])/j);return[Math.max(0,c),Math.min(d,b)];};var l=k(o,m[0]),n=k(q,m[1]);for(var f=l[0];f<l[1];f++){for(var g=n[0];g<n[1];g++){e.push({level:c,row:f,col:g});}}return e;};mpld3_TiledImage.prototype.draw=function(){this.group=this.ax.paths.append("svg:g").style("opacity",this.props.alpha);this.zoomed(d3.zoomIdentity);};mpld3_TiledImage.prototype.elements=function(a){return this.group.selectAll("image");};mpld3_TiledImage.prototype.zoomed=function(c){var a=this;var b=this.group.selectAll("image").data(this.visibleTiles(c),function(a){return a.level+"/"+a.row+"/"+a.col;});b.exit().remove();b.enter().append("svg:image").attr("class","mpld3-image").attr("preserveAspectRatio","none").each(function(b){var c=a.tileRect(b.level,b.row,b.col);d3.select(this).attr("xlink:href",a.tileUrl(b.level,b.row,b.col)).attr("x",c[0]).attr("y",c[1]).attr("width",c[2]).attr("height",c[3]);});};mpld3.Text=mpld3_Text;mpld3_Text.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Text.prototype.constructor=mpld3_Text;mpld3_Text.prototype.requiredProps=["text","position"];mpld3_Text.prototype.defaultProps={coordinates:"data",h_anchor:"start",v_baseline:"auto",rotation:0,fontsize:11,drawstyle:"none",color:"black",alpha:1,zorder:3};function mpld3_Text(b,a){mpld3_PlotElement.call(this,b,a);this.text=this.props.text;this.position=this.props.position;this.coords=new mpld3_Coordinates(this.props.coordinates,this.ax);}mpld3_Text.prototype.draw=function(){if(this.props.coordinates=="data"){if(this.coords.zoomable){this.obj=this.ax.paths.append("text");}else{this.obj=this.ax.staticPaths.append("text");}}else{this.obj=this.ax.baseaxes.append("text");}this.obj.attr("class","mpld3-text").attr("xml:space","preserve").text(this.text).style("text-anchor",this.props.h_anchor).style("dominant-baseline",this.props.v_baseline).style("font-size",this.props.fontsize).style("fill",this.props.color).style("opacity",this.props.alpha);this.applyTransform();};mpld3_Text.prototype.elements=function(a){return d3.select(this.obj);};mpld3_Text.prototype.applyTransform=function(){var a=this.coords.xy(this.position);this.obj.attr("x",a[0]).attr("y",a[1]);if(this.props.rotation)this.obj.attr("transform","rotate("+this.props.rotation+","+a+")");};mpld3.Axes=mpld3_Axes;mpld3_Axes.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Axes.prototype.constructor=mpld3_Axes;mpld3_Axes.prototype.requiredProps=["xlim","ylim"];mpld3_Axes.prototype.defaultProps={bbox:[.1,.1,.8,.8],axesbg:"#FFFFFF",axesbgalpha:1,gridOn:false,xdomain:null,ydomain:null,xscale:"linear",yscale:"linear",zoomable:true,axes:[{position:"left"},{position:"bottom"}],lines:[],paths:[],markers:[],texts:[],collections:[],sharex:[],sharey:[],images:[],bars:[],errorbars:[],linecollections:[],quivers:[],quadmeshes:[],tiledimages:[]};function mpld3_Axes(u,t){mpld3_PlotElement.call(this,u,t);this.axnum=this.fig.axes.length;this.axid=this.fig.figid+"_ax"+(this.axnum+1);this.clipid=this.axid+"_clip";this.props.xdomain=this.props.xdomain||this.props.xlim;this.props.ydomain=this.props.ydomain||this.props.ylim;this.sharex=[];this.sharey=[];this.elements=[];this.axisList=[];var b=this.props.bbox;this.position=[b[0]*this.fig.width,(1-b[1]-b[3])*this.fig.height];this.width=b[2]*this.fig.width;this.height=b[3]*this.fig.height;this.isZoomEnabled=null;this.zoom=null;this.lastTransform=d3.zoomIdentity;this.isBoxzoomEnabled=null;this.isLinkedBrushEnabled=null;this.isCurrentLinkedBrushTarget=false;this.brushG=null;function f(a){return new Date(a[0],a[1],a[2],a[3],a[4],a[5]);}function d(b,a){return b!=="date"?a:[f(a[0]),f(a[1])];}this.props.xdomain=d(this.props.xscale,this.props.xdomain);this.props.ydomain=d(this.props.yscale,this.props.ydomain);function e(a,c,b){var d=a==="date"?d3.scaleTime():a==="log"?d3.scaleLog():d3.scaleLinear();return d.domain(c).range(b);}this.x=this.xdom=e(this.props.xscale,this.props.xdomain,[0,this.width]);this.y=this.ydom=e(this.props.yscale,this.props.ydomain,[this.height,0]);if(this.props.xscale==="date"){this.x=mpld3.multiscale(d3.scaleLinear().domain(this.props.xlim).range(this.props.xdomain.map(Number)),this.xdom);}if(this.props.yscale==="date"){this.y=mpld3.multiscale(d3.scaleLinear().domain(this.props.ylim).range(this.props.ydomain.map(Number)),this.ydom);}var s=this.props.axes;for(var a=0; a<s.length; a++){var c=new mpld3.Axis(this,s[a]);this.axisList.push(c);this.elements.push(c);if(this.props.gridOn||c.props.grid.gridOn){this.elements.push(c.getGrid());}}var k=this.props.paths;for(var a=0; a<k.length; a++){this.elements.push(new mpld3.Path(this,k[a]));}var r=this.props.bars;for(var a=0; a<r.length; a++){this.elements.push(new mpld3.Bars(this,r[a]));}var p=this.props.errorbars;for(var a=0; a<p.length; a++){this.elements.push(new mpld3.Errorbars(this,p[a]));}var m=this.props.lines;for(var a=0; a<m.length; a++){this.elements.push(new mpld3.Line(this,m[a]));}var l=this.props.markers;for(var a=0; a<l.length; a++){this.elements.push(new mpld3.Markers(this,l[a]));}var h=this.props.texts;for(var a=0; a<h.length; a++){this.elements.push(new mpld3.Text(this,h[a]));}var q=this.props.collections;for(var a=0; a<q.length; a++){this.elements.push(new mpld3.PathCollection(this,q[a]));}var n=this.props.linecollections;for(var a=0; a<n.length; a++){this.elements.push(new mpld3.LineCollection(this,n[a]));}var i=this.props.quivers;for(var a=0; a<i.length; a++){this.elements.push(new mpld3.Quiver(this,i[a]));}var j=this.props.quadmeshes;for(var a=0; a<j.length; a++){this.elements.push(new mpld3.QuadMesh(this,j[a]));}var g=this.props.tiledimages;for(var a=0; a<g.length; a++){this.elements.push(new mpld3.TiledImage(this,g[a]));}var o=this.props.images;for(var a=0; a<o.length; a++){this.elements.push(new mpld3.Image(this,o[a]));}this.elements.sort(function(b,a){return b.props.zorder-a.props.zorder;});}mpld3_Axes.prototype.draw=function(){for(var a=0; a<this.props.sharex.length; a++){this.sharex.push(mpld3.get_element(this.props.sharex[a]));}for(var a=0; a<this.props.sharey.length; a++){this.sharey.push(mpld3.get_element(this.props.sharey[a]));}this.baseaxes=this.fig.canvas.append("g").attr("transform","translate("+this.position[0]+","+this.position[1]+")").attr("width",this.width).attr("height",this.height).attr("class","mpld3-baseaxes");this.axes=this.baseaxes.append("g").attr("class","mpld3-axes").style("pointer-events","visiblefill");this.clip=this.axes.append("svg:clipPath").attr("id",this.clipid).append("svg:rect").attr("x",0).attr("y",0).attr("width",this.width).attr("height",this.height);this.axesbg=this.axes.append("svg:rect").attr("width",this.width).attr("height",this.height).attr("class","mpld3-axesbg").style("fill",this.props.axesbg).style("fill-opacity",this.props.axesbgalpha);this.pathsContainer=this.axes.append("g").attr("clip-path","url(#"+this.clipid+")").attr("x",0).attr("y",0).attr("width",this.width).attr("height",this.height).attr("class","mpld3-paths-container");this.paths=this.pathsContainer.append("g").attr("class","mpld3-paths");this.staticPaths=this.axes.append("g").attr("class","mpld3-staticpaths");this.brush=d3.brush().extent([[0,0],[this.fig.width,this.fig.height]]).on("start",this.brushStart.bind(this)).on("brush",this.brushMove.bind(this)).on("end",this.brushEnd.bind(this)).on("start.nokey",function(){d3.select(window).on("keydown.brush keyup.brush",null);});for(var a=0; a<this.elements.length; a++){this.elements[a].draw();}};mpld3_Axes.prototype.bindZoom=function(){if(!this.zoom){this.zoom=d3.zoom();this.zoom.on("zoom",this.zoomed.bind(this));this.axes.call(this.zoom);}};mpld3_Axes.prototype.unbindZoom=function(){if(this.zoom){this.zoom.on("zoom",null);this.axes.on(".zoom",null);this.zoom=null;}};mpld3_Axes.prototype.bindBrush=function(){if(!this.brushG){this.brushG=this.axes.append("g").attr("class","mpld3-brush").call(this.brush);}};mpld3_Axes.prototype.unbindBrush=function(){if(this.brushG){this.brushG.remove();this.brushG.on(".brush",null);this.brushG=null;}};mpld3_Axes.prototype.reset=function(){if(this.zoom){this.doZoom(false,d3.zoomIdentity,750);}else{this.bindZoom();this.doZoom(false,d3.zoomIdentity,750,function(){if(this.isSomeTypeOfZoomEnabled){return;}this.unbindZoom();}.bind(this));}};mpld3_Axes.prototype.enableOrDisableBrushing=function(){if(this.isBoxzoomEnabled||this.isLinkedBrushEnabled){this.bindBrush();}else{this.unbindBrush();}};mpld3_Axes.prototype.isSomeTypeOfZoomEnabled=function(){return this.isZoomEnabled||this.isBoxzoomEnabled;};mpld3_Axes.prototype.enableOrDisableZooming=function(){if(this.isSomeTypeOfZoomEnabled()){this.bindZoom();}else{this.unbindZoom();}};mpld3_Axes.prototype.enableLinkedBrush=function(){this.isLinkedBrushEnabled=true;this.enableOrDisableBrushing();};mpld3_Axes.prototype.disableLinkedBrush=function(){this.isLinkedBrushEnabled=false;this.enableOrDisableBrushing();};mpld3_Axes.prototype.enableBoxzoom=function(){this.isBoxzoomEnabled=true;this.enableOrDisableBrushing();this.enableOrDisableZooming();};mpld3_Axes.prototype.disableBoxzoom=function(){this.isBoxzoomEnabled=false;this.enableOrDisableBrushing();this.enableOrDisableZooming();};mpld3_Axes.prototype.enableZoom=function(){this.isZoomEnabled=true;this.enableOrDisableZooming();this.axes.style("cursor","move");};mpld3_Axes.prototype.disableZoom=function(){this.isZoomEnabled=false;this.enableOrDisableZooming();this.axes.style("cursor",null);};mpld3_Axes.prototype.doZoom=function(e,a,b,c){if(!this.props.zoomable||!this.zoom){return;}if(b){var d=this.axes.transition().duration(b).call(this.zoom.transform,a);if(c){d.on("end",c);}}else{this.axes.call(this.zoom.transform,a);}if(e){this.lastTransform=a;this.sharex.forEach(function(c){c.doZoom(false,a,b);});this.sharey.forEach(function(c){c.doZoom(false,a,b);});}else{this.lastTransform=a;}};mpld3_Axes.prototype.zoomed=function(){var b=d3.event.sourceEvent&&d3.event.sourceEvent.type!="zoom";if(b){this.doZoom(true,d3.event.transform,false);}else{var a=d3.event.transform;this.paths.attr("transform",a);this.elements.forEach(function(b){if(b.zoomed){b.zoomed(a);}}.bind(this));}};mpld3_Axes.prototype.resetBrush=function(){this.brushG.call(this.brush.move,null);};mpld3_Axes.prototype.doBoxzoom=function(c){if(!c||!this.brushG){return;}var a=c.map(this.lastTransform.invert,this.lastTransform);var e=a[1][0]-a[0][0];var d=a[1][1]-a[0][1];var j=(a[0][0]+a[1][0])/2;var i=(a[0][1]+a[1][1])/2;var b=e>d?this.width/e:this.height/d;var h=this.width/2-b*j;var g=this.height/2-b*i;var f=d3.zoomIdentity.translate(h,g).scale(b);this.doZoom(true,f,750);this.resetBrush();};mpld3_Axes.prototype.brushStart=function(){if(this.isLinkedBrushEnabled){this.isCurrentLinkedBrushTarget=d3.event.sourceEvent.constructor.name=="MouseEvent";if(this.isCurrentLinkedBrushTarget){this.fig.resetBrushForOtherAxes(this.axid);}}};mpld3_Axes.prototype.brushMove=function(){var a=d3.event.selection;if(this.isLinkedBrushEnabled){this.fig.updateLinkedBrush(a);}};mpld3_Axes.prototype.brushEnd=function(){var a=d3.event.selection;if(this.isBoxzoomEnabled){this.doBoxzoom(a);}if(this.isLinkedBrushEnabled){if(!a){this.fig.endLinkedBrush();}this.isCurrentLinkedBrushTarget=false;}};mpld3_Axes.prototype.setTicks=function(a,b,c){this.axisList.forEach(function(d){if(d.props.xy==a){d.setTicks(b,c);}});};mpld3.Toolbar=mpld3_Toolbar;mpld3_Toolbar.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Toolbar.prototype.constructor=mpld3_Toolbar;mpld3_Toolbar.prototype.defaultProps={buttons:["reset","move"]};function mpld3_Toolbar(b,a){mpld3_PlotElement.call(this,b,a);this.buttons=[];this.props.buttons.forEach(this.addButton.bind(this));}mpld3_Toolbar.prototype.addButton=function(a){this.buttons.push(new a(this));};mpld3_Toolbar.prototype.draw=function(){mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image",{cursor:"pointer",opacity:.2,display:"inline-block",margin:"0px"});mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image.active",{opacity:.4});mpld3.insert_css("div#"+this.fig.figid+" .mpld3-toolbar image.pressed",{opacity:.6});function a(){this.buttonsobj.transition(750).attr("y",0);}function c(){this.buttonsobj.transition(750).delay(250).attr("y",16);}this.fig.canvas.on("mouseenter",a.bind(this)).on("mouseleave",c.bind(this)).on("touchenter",a.bind(this)).on("touchstart",a.bind(this));this.toolbar=this.fig.canvas.append("svg:svg").attr("width",16*this.buttons.length).attr("height",16).attr("x",2).attr("y",this.fig.height-16-2).attr("class","mpld3-toolbar");this.buttonsobj=this.toolbar.append("svg:g").selectAll("buttons").data(this.buttons).enter().append("svg:image").attr("class",function(a){return a.cssclass;}).attr("xlink:href",function(a){return a.icon();}).attr("width",16).attr("height",16).attr("x",function(b,a){return a*16;}).attr("y",16).on("click",function(a){a.click();}).on("mouseenter",function(){d3.select(this).classed("active",true);}).on("mouseleave",function(){d3.select(this).classed("active",false);});for(var b=0; b<this.buttons.length; b++)this.buttons[b].onDraw();};mpld3_Toolbar.prototype.deactivate_all=function(){this.buttons.forEach(function(a){a.deactivate();});};mpld3_Toolbar.prototype.deactivate_by_action=function(b){function a(c){return b.indexOf(c)!==-1;}if(b.length>0){this.buttons.forEach(function(b){if(b.actions.filter(a).length>0)b.deactivate();});}};mpld3.Button=mpld3_Button;mpld3_Button.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Button.prototype.constructor=mpld3_Button;function mpld3_Button(a,b){mpld3_PlotElement.call(this,a);this.toolbar=a;this.fig=this.toolbar.fig;this.cssclass="mpld3-"+b+"button";this.active=false;}mpld3_Button.prototype.setState=function(a){a?this.activate():this.deactivate();};mpld3_Button.prototype.click=function(){this.active?this.deactivate():this.activate();};mpld3_Button.prototype.activate=function(){this.toolbar.deactivate_by_action(this.actions);this.onActivate();this.active=true;this.toolbar.toolbar.select("."+this.cssclass).classed("pressed",true);if(!this.sticky){this.deactivate();}};mpld3_Button.prototype.deactivate=function(){this.onDeactivate();this.active=false;this.toolbar.toolbar.select("."+this.cssclass).classed("pressed",false);};mpld3_Button.prototype.sticky=false;mpld3_Button.prototype.actions=[];mpld3_Button.prototype.icon=function(){return"";};mpld3_Button.prototype.onActivate=function(){};mpld3_Button.prototype.onDeactivate=function(){};mpld3_Button.prototype.onDraw=function(){};mpld3.ButtonFactory=function(b){if(typeof b.buttonID!=="string"){throw"ButtonFactory: buttonID must be present and be a string";}function a(b){mpld3_Button.call(this,b,this.buttonID);}a.prototype=Object.create(mpld3_Button.prototype);a.prototype.constructor=a;for(var c in b){a.prototype[c]=b[c];}return a;};mpld3.Plugin=mpld3_Plugin;mpld3_Plugin.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Plugin.prototype.constructor=mpld3_Plugin;mpld3_Plugin.prototype.requiredProps=[];mpld3_Plugin.prototype.defaultProps={};function mpld3_Plugin(b,a){mpld3_PlotElement.call(this,b,a);}mpld3_Plugin.prototype.draw=function(){};mpld3.ResetPlugin=mpld3_ResetPlugin;mpld3.register_plugin("reset",mpld3_ResetPlugin);mpld3_ResetPlugin.prototype=Object.create(mpld3_Plugin.prototype);mpld3_ResetPlugin.prototype.constructor=mpld3_ResetPlugin;mpld3_ResetPlugin.prototype.requiredProps=[];mpld3_ResetPlugin.prototype.defaultProps={};function mpld3_ResetPlugin(b,a){mpld3_Plugin.call(this,b,a);var c=mpld3.ButtonFactory({buttonID:"reset",sticky:false,onActivate:function(){this.toolbar.fig.reset();},icon:function(){return mpld3.icons["reset"];}});this.fig.buttons.push(c);}mpld3.ZoomPlugin=mpld3_ZoomPlugin;mpld3.register_plugin("zoom",mpld3_ZoomPlugin);mpld3_ZoomPlugin.prototype=Object.create(mpld3_Plugin.prototype);mpld3_ZoomPlugin.prototype.constructor=mpld3_ZoomPlugin;mpld3_ZoomPlugin.prototype.requiredProps=[];mpld3_ZoomPlugin.prototype.defaultProps={button:true,enabled:null};function mpld3_ZoomPlugin(b,a){mpld3_Plugin.call(this,b,a);if(this.props.enabled===null){this.props.enabled=!this.props.button;}var c=this.props.enabled;if(this.props.button){var d=mpld3.ButtonFactory({buttonID:"zoom",sticky:true,actions:["scroll","drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(c);},icon:function(){return mpld3.icons["move"];}});this.fig.buttons.push(d);}}mpld3_ZoomPlugin.prototype.activate=function(){this.fig.enableZoom();};mpld3_ZoomPlugin.prototype.deactivate=function(){this.fig.disableZoom();};mpld3_ZoomPlugin.prototype.draw=function(){if(this.props.enabled){this.activate();}else{this.deactivate();}};mpld3.BoxZoomPlugin=mpld3_BoxZoomPlugin;mpld3.register_plugin("boxzoom",mpld3_BoxZoomPlugin);mpld3_BoxZoomPlugin.prototype=Object.create(mpld3_Plugin.prototype);mpld3_BoxZoomPlugin.prototype.constructor=mpld3_BoxZoomPlugin;mpld3_BoxZoomPlugin.prototype.requiredProps=[];mpld3_BoxZoomPlugin.prototype.defaultProps={button:true,enabled:null};function mpld3_BoxZoomPlugin(b,a){mpld3_Plugin.call(this,b,a);if(this.props.enabled===null){this.props.enabled=!this.props.button;}var c=this.props.enabled;if(this.props.button){var d=mpld3.ButtonFactory({buttonID:"boxzoom",sticky:true,actions:["drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(c);},icon:function(){return mpld3.icons["zoom"];}});this.fig.buttons.push(d);}this.extentClass="boxzoombrush";}mpld3_BoxZoomPlugin.prototype.activate=function(){this.fig.enableBoxzoom();};mpld3_BoxZoomPlugin.prototype.deactivate=function(){this.fig.disableBoxzoom();};mpld3_BoxZoomPlugin.prototype.draw=function(){if(this.props.enabled){this.activate();}else{this.deactivate();}};mpld3.TooltipPlugin=mpld3_TooltipPlugin;mpld3.register_plugin("tooltip",mpld3_TooltipPlugin);mpld3_TooltipPlugin.prototype=Object.create(mpld3_Plugin.prototype);mpld3_TooltipPlugin.prototype.constructor=mpld3_TooltipPlugin;mpld3_TooltipPlugin.prototype.requiredProps=["id"];mpld3_TooltipPlugin.prototype.defaultProps={labels:null,hoffset:0,voffset:10,location:"mouse"};function mpld3_TooltipPlugin(b,a){mpld3_Plugin.call(this,b,a);}mpld3_TooltipPlugin.prototype.draw=function(){var b=mpld3.get_element(this.props.id,this.fig);var f=this.props.labels;var a=this.props.location;this.tooltip=this.fig.canvas.append("text").attr("class","mpld3-tooltip-text").attr("x",0).attr("y",0).text("").style("visibility","hidden");if(a=="bottom left"||a=="top left"){this.x=b.ax.position[0]+5+this.props.hoffset;this.tooltip.style("text-anchor","beginning");}else if(a=="bottom right"||a=="top right"){this.x=b.ax.position[0]+b.ax.width-5+this.props.hoffset;this.tooltip.style("text-anchor","end");}else{this.tooltip.style("text-anchor","middle");}if(a=="bottom left"||a=="bottom right"){this.y=b.ax.position[1]+b.ax.height-5+this.props.voffset;}else if(a=="top left"||a=="top right"){this.y=b.ax.position[1]+5+this.props.voffset;}function c(b,a){this.tooltip.style("visibility","visible").text(f===null?"("+b+")":getMod(f,a));}function e(d,c){if(a==="mouse"){var b=d3.mouse(this.fig.canvas.node());this.x=b[0]+this.props.hoffset;this.y=b[1]-this.props.voffset;}this.tooltip.attr("x",this.x).attr("y",this.y);}function d(b,a){this.tooltip.style("visibility","hidden");}b.elements().on("mouseover",c.bind(this)).on("mousemove",e.bind(this)).on("mouseout",d.bind(this));};mpld3.LinkedBrushPlugin=mpld3_LinkedBrushPlugin;mpld3.register_plugin("linkedbrush",mpld3_LinkedBrushPlugin);mpld3_LinkedBrushPlugin.prototype=Object.create(mpld3.Plugin.prototype);mpld3_LinkedBrushPlugin.prototype.constructor=mpld3_LinkedBrushPlugin;mpld3_LinkedBrushPlugin.prototype.requiredProps=["id"];mpld3_LinkedBrushPlugin.prototype.defaultProps={button:true,enabled:null};function mpld3_LinkedBrushPlugin(b,a){mpld3.Plugin.call(this,b,a);if(this.props.enabled===null){this.props.enabled=!this.props.button;}var c=this.props.enabled;if(this.props.button){var d=mpld3.ButtonFactory({buttonID:"linkedbrush",sticky:true,actions:["drag"],onActivate:this.activate.bind(this),onDeactivate:this.deactivate.bind(this),onDraw:function(){this.setState(c);},icon:function(){return mpld3.icons["brush"];}});this.fig.buttons.push(d);}this.pathCollectionsByAxes=[];this.objectsByAxes=[];this.allObjects=[];this.extentClass="linkedbrush";this.dataKey="offsets";this.objectClass=null;}mpld3_LinkedBrushPlugin.prototype.activate=function(){this.fig.enableLinkedBrush();};mpld3_LinkedBrushPlugin.prototype.deactivate=function(){this.fig.disableLinkedBrush();};mpld3_LinkedBrushPlugin.prototype.isPathInSelection=function(b,d,c,a){var e=a[0][0]<b[d]&&a[1][0]>b[d]&&a[0][1]<b[c]&&a[1][1]>b[c];return e;};mpld3_LinkedBrushPlugin.prototype.invertSelection=function(a,b){var d=[b.x.invert(a[0][0]),b.x.invert(a[1][0])];var c=[b.y.invert(a[1][1]),b.y.invert(a[0][1])];return[[Math.min.apply(Math,d),Math.min.apply(Math,c)],[Math.max.apply(Math,d),Math.max.apply(Math,c)]];};mpld3_LinkedBrushPlugin.prototype.update=function(a){if(!a){return;}this.pathCollectionsByAxes.forEach(function(h,c){var b=h[0];var d=this.objectsByAxes[c];var g=this.invertSelection(a,this.fig.axes[c]);var f=b.props.xindex;var e=b.props.yindex;d.selectAll("path").classed("mpld3-hidden",function(a,b){return!this.isPathInSelection(a,f,e,g);}.bind(this));}.bind(this));};mpld3_LinkedBrushPlugin.prototype.end=function(){this.allObjects.selectAll("path").classed("mpld3-hidden",false);};mpld3_LinkedBrushPlugin.prototype.draw=function(){mpld3.insert_css("#"+this.fig.figid+" path.mpld3-hidden",{stroke:"#ccc !important",fill:"#ccc !important"});var a=mpld3.get_element(this.props.id);if(!a){throw new Error("[LinkedBrush] Could not find path collection");}if(!("offsets"in a.props)){throw new Error("[LinkedBrush] Figure is not a scatter plot.");}this.objectClass="mpld3-brushtarget-"+a.props[this.dataKey];this.pathCollectionsByAxes=this.fig.axes.map(function(b){return b.elements.map(function(b){if(b.props[this.dataKey]==a.props[this.dataKey]){b.group.classed(this.objectClass,true);return b;}}.bind(this)).filter(function(a){return a;});}.bind(this));this.objectsByAxes=this.fig.axes.map(function(a){return a.axes.selectAll("."+this.objectClass);}.bind(this));this.allObjects=this.fig.canvas.selectAll("."+this.objectClass);};mpld3.register_plugin("mouseposition",MousePositionPlugin);MousePositionPlugin.prototype=Object.create(mpld3.Plugin.prototype);MousePositionPlugin.prototype.constructor=MousePositionPlugin;MousePositionPlugin.prototype.requiredProps=[];MousePositionPlugin.prototype.defaultProps={fontsize:12,fmt:".3g"};function MousePositionPlugin(b,a){mpld3.Plugin.call(this,b,a);}MousePositionPlugin.prototype.draw=function(){var b=this.fig;var c=d3.format(this.props.fmt);var d=b.canvas.append("text").attr("class","mpld3-coordinates").style("text-anchor","end").style("font-size",this.props.fontsize).attr("x",this.fig.width-5).attr("y",this.fig.height-5);for(var a=0; a<this.fig.axes.length; a++){var e=function(){var e=b.axes[a];return function(){var a=d3.mouse(this),f=e.x.invert(a[0]),b=e.y.invert(a[1]);d.text("("+c(f)+", "+c(b)+")");};}();b.axes[a].baseaxes.on("mousemove",e).on("mouseout",function(){d.text("");});}};mpld3.Figure=mpld3_Figure;mpld3_Figure.prototype=Object.create(mpld3_PlotElement.prototype);mpld3_Figure.prototype.constructor=mpld3_Figure;mpld3_Figure.prototype.requiredProps=["width","height"];mpld3_Figure.prototype.defaultProps={data:{},axes:[],plugins:[{type:"reset"},{type:"zoom"},{type:"boxzoom"}]};function mpld3_Figure(b,c){mpld3_PlotElement.call(this,null,c);this.figid=b;this.width=this.props.width;this.height=this.props.height;this.data=this.props.data;this.buttons=[];this.root=d3.select("#"+b).append("div").style("position","relative");this.axes=[];for(var a=0; a<this.props.axes.length; a++)this.axes.push(new mpld3_Axes(this,this.props.axes[a]));this.plugins=[];this.pluginsByType={};this.props.plugins.forEach(function(a){this.addPlugin(a);}.bind(this));this.toolbar=new mpld3.Toolbar(this,{buttons:this.buttons});}mpld3_Figure.prototype.addPlugin=function(a){if(!a.type){return console.warn("unspecified plugin type. Skipping this");}var b;if(a.type in mpld3.plugin_map){b=mpld3.plugin_map[a.type];}else{return console.warn("Skipping unrecognized plugin: "+b);}if(a.clear_toolbar||a.buttons){console.warn("DEPRECATION WARNING: "+"You are using pluginInfo.clear_toolbar or pluginInfo, which "+"have been deprecated. Please see the build-in plugins for the new "+"method to add buttons, otherwise contact the mpld3 maintainers.");}var d=mpld3_cloneObj(a);delete d.type;var c=new b(this,d);this.plugins.push(c);this.pluginsByType[a.type]=c;};mpld3_Figure.prototype.draw=function(){mpld3.insert_css("div#"+this.figid,{"font-family":"Helvetica, sans-serif"});this.canvas=this.root.append("svg:svg").attr("class","mpld3-figure").attr("width",this.width).attr("height",this.height);for(var a=0; a<this.axes.length; a++){this.axes[a].draw();}this.disableZoom();for(var a=0; a<this.plugins.length; a++){this.plugins[a].draw();}this.toolbar.draw();};mpld3_Figure.prototype.resetBrushForOtherAxes=function(a){this.axes.forEach(function(b){if(b.axid!=a){b.resetBrush();}});};mpld3_Figure.prototype.updateLinkedBrush=function(a){if(!this.pluginsByType.linkedbrush){return;}this.pluginsByType.linkedbrush.update(a);};mpld3_Figure.prototype.endLinkedBrush=function(){if(!this.pluginsByType.linkedbrush){return;}this.pluginsByType.linkedbrush.end();};mpld3_Figure.prototype.reset=function(a){this.axes.forEach(function(a){a.reset();});};mpld3_Figure.prototype.enableLinkedBrush=function(){this.axes.forEach(function(a){a.enableLinkedBrush();});};mpld3_Figure.prototype.disableLinkedBrush=function(){this.axes.forEach(function(a){a.disableLinkedBrush();});};mpld3_Figure.prototype.enableBoxzoom=function(){this.axes.forEach(function(a){a.enableBoxzoom();});};mpld3_Figure.prototype.disableBoxzoom=function(){this.axes.forEach(function(a){a.disableBoxzoom();});};mpld3_Figure.prototype.enableZoom=function(){this.axes.forEach(function(a){a.enableZoom();});};mpld3_Figure.prototype.disableZoom=function(){this.axes.forEach(function(a){a.disableZoom();});};mpld3_Figure.prototype.toggleZoom=function(){if(this.isZoomEnabled){this.disableZoom();}else{this.enableZoom();}};mpld3_Figure.prototype.setTicks=function(a,b,c){this.axes.forEach(function(d){d.setTicks(a,b,c);});};mpld3_Figure.prototype.setXTicks=function(a,b){this.setTicks("x",a,b);};mpld3_Figure.prototype.setYTicks=function(a,b){this.setTicks("y",a,b);};mpld3_Figure.prototype.removeNaN=function(a){output=output.map(function(a){return a.map(function(a){if(typeof a=="number"&&isNaN(a)){return 0;}else{return a;}});});};mpld3_Figure.prototype.parse_offsets=function(a){return a.map(function(a){return a.map(function(a){if(typeof a=="number"&&isNaN(a)){return 0;}else{return a;}});});};mpld3_Figure.prototype.get_data=function(a){var b=a;if(a===null||typeof a==="undefined"){b=null;}else if(typeof a==="string"){b=this.data[a];}return b;};mpld3.PlotElement=mpld3_PlotElement;function mpld3_PlotElement(a,b){this.parent=isUndefinedOrNull(a)?null:a;this.props=isUndefinedOrNull(b)?{}:this.processProps(b);this.fig=a instanceof mpld3_Figure?a:a&&"fig"in a?a.fig:null;this.ax=a instanceof mpld3_Axes?a:a&&"ax"in a?a.ax:null;}mpld3_PlotElement.prototype.requiredProps=[];mpld3_PlotElement.prototype.defaultProps={};mpld3_PlotElement.prototype.processProps=function(a){a=mpld3_cloneObj(a);var c={};var d=this.name();this.requiredProps.forEach(function(b){if(!(b in a)){throw"property '"+b+"' "+"must be specified for "+d;}c[b]=a[b];delete a[b];});for(var b in this.defaultProps){if(b in a){c[b]=a[b];delete a[b];}else{c[b]=this.defaultProps[b];}}if("id"in a){c.id=a.id;delete a.id;}else if(!("id"in c)){c.id=mpld3.generateId();}for(var b in a){console.warn("Unrecognized property '"+b+"' "+"for object "+this.name()+" (value = "+a[b]+").");}return c;};mpld3_PlotElement.prototype.name=function(){var b=/function (.{1,})\(/;var a=b.exec(this.constructor.toString());return a&&a.length>1?a[1]:"";};if(typeof module==="object"&&module.exports){module.exports=mpld3;}else{this.mpld3=mpld3;}console.log("Loaded mpld3 version "+mpld3.version);
@@ -3,22 +3,258 @@ mpld3 renderer
 ==============
 
 This is the renderer class which implements the mplexporter framework for mpld3
+
+Renderers hold the state of a single export, so that figures may be exported
+from several threads at once.  matplotlib itself is not thread-safe, so the
+exporters draw and crawl figures while holding ``matplotlib_lock``; code
+modifying figures concurrently with their export should hold it as well.
+The rest of an export, e.g. the encoding of the figure as JSON or HTML, runs
+concurrently.
 """
-__all__ = ["MPLD3Renderer"]
+__all__ = ["MPLD3Renderer", "MPLD3Exporter"]
 
 import random
 import json
+import threading
 import jinja2
 import itertools
 
 import numpy as np
+from matplotlib.collections import LineCollection, QuadMesh
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.container import BarContainer, ErrorbarContainer
+from matplotlib.image import AxesImage
+from matplotlib.quiver import Quiver
 
-from .mplexporter.utils import export_color
 from .mplexporter.exporter import Exporter
 from .mplexporter.renderers import Renderer
 
-from .utils import get_id
+from .utils import (get_id, export_colors, encode_palette, encode_style,
+                    encode_paths, encode_transforms, encode_array,
+                    index_dtype)
 from .plugins import get_plugins
+from ._simplify import simplify_paths
+from ._tiles import image_pyramid
+
+
+RECTANGLE_CODES = ['M', 'L', 'L', 'L', 'Z']
+
+# serializes the use of matplotlib by exports running in several threads
+matplotlib_lock = threading.RLock()
+
+
+def is_rectangle(data, pathcodes):
+    """Return True if the path is an axis-aligned rectangle"""
+    data = np.asarray(data)
+    return (list(pathcodes) == RECTANGLE_CODES and data.shape == (4, 2)
+            and data[0, 1] == data[1, 1] and data[1, 0] == data[2, 0]
+            and data[2, 1] == data[3, 1] and data[3, 0] == data[0, 0])
+
+
+def bar_style(style):
+    """The style properties shared by all rectangles of a bars element"""
+    return tuple(style[key] for key in ['dasharray', 'alpha', 'edgecolor',
+                                        'edgewidth', 'zorder'])
+
+
+def is_polylines(paths, path_transforms, offsets):
+    """Return True if the collection paths are plain, untransformed polylines
+    """
+    return (len(path_transforms) == 0 and not np.any(offsets)
+            and all(len(vertices) == len(codes) and codes[:1] == ['M']
+                    and codes.count('L') == len(codes) - 1
+                    for vertices, codes in paths))
+
+
+def quiver_props(quiver):
+    """Extract the arrow glyph and length scaling of a quiver
+
+    Returns
+    -------
+    props : dictionary or None
+        None if the arrows cannot be drawn from a single glyph, e.g.
+        because they have per-arrow angles.  Otherwise, a dictionary of the
+        quiver element properties describing the arrow shape, in pixels.
+    """
+    if (not isinstance(quiver.angles, str)
+            or quiver.angles not in ('uv', 'xy')
+            or quiver.get_offset_transform() is not quiver.axes.transData
+            or quiver.scale is None):
+        return None
+
+    # pixels per unit of arrow width, and per unit of vector magnitude (or
+    # per display pixel of the vector when scale_units is "xy")
+    dots = quiver._trans_scale
+    if quiver.scale_units is None:
+        scale = dots / quiver.scale
+    elif quiver.scale_units == 'xy':
+        scale = 1. / quiver.scale
+    else:
+        scale = quiver._dots_per_unit(quiver.scale_units) / quiver.scale
+    width = quiver.width * dots
+
+    # The glyph of matplotlib's arrows: vertices are (x + t * length, y) for
+    # arrows longer than the shaftless head, which shorter arrows are
+    # shrunk from, and arrows shorter than minlength become dots.
+    head, axis, hw = (quiver.headlength, quiver.headaxislength,
+                      0.5 * quiver.headwidth)
+    glyph = [[0, 0.5, 0], [-axis, 0.5, 1], [-head, hw, 1], [0, 0, 1],
+             [-head, -hw, 1], [-axis, -0.5, 1], [0, -0.5, 0]]
+    glyph = [[x * width, y * width, t] for x, y, t in glyph]
+    return dict(glyph=glyph,
+                scale=scale,
+                angles=quiver.angles,
+                scaleunits=quiver.scale_units,
+                pivot=quiver.pivot,
+                shortlength=quiver.minshaft * head * width,
+                dotlength=quiver.minlength * width)
+
+
+def quadmesh_props(mesh):
+    """Extract the grid, values and colormap of a quadrilateral mesh
+
+    Returns
+    -------
+    props : dictionary or None
+        None if the mesh cannot be drawn as a quadmesh element, e.g. because
+        it has RGB values, Gouraud shading or visible edges.  Otherwise, a
+        dictionary of the quadmesh element properties.  Rectilinear meshes
+        are described by their x and y cell edges, curvilinear meshes by
+        the [ny + 1, nx + 1] arrays of their vertex coordinates.
+    """
+    values = mesh.get_array()
+    coordinates = mesh.get_coordinates()
+    shape = (coordinates.shape[0] - 1, coordinates.shape[1] - 1)
+    if (values is None or np.size(values) != shape[0] * shape[1]
+            or getattr(mesh, '_shading', 'flat') != 'flat'
+            or mesh.get_transform() is not mesh.axes.transData
+            or np.ndim(mesh.get_alpha()) != 0
+            or (len(mesh.get_edgecolor())
+                and np.any(mesh.get_linewidth() > 0))):
+        return None
+
+    x, y = coordinates[..., 0], coordinates[..., 1]
+    if np.all(x == x[:1]) and np.all(y == y[:, :1]):
+        x, y = x[0], y[:, 0]
+
+    # Values are mapped to colors client-side for linear and log norms;
+    # other norms are applied here.  Norms returning integers (such as
+    # BoundaryNorm) give colormap indices rather than values in [0, 1].
+    norm = mesh.norm
+    values = np.ma.masked_invalid(np.ma.asarray(values, dtype=float))
+    values = values.reshape(shape)
+    if type(norm) in (Normalize, LogNorm) and not norm.clip:
+        scale, vmin, vmax = (('log' if type(norm) is LogNorm else 'linear'),
+                             norm.vmin, norm.vmax)
+    else:
+        values = np.ma.asarray(norm(values))
+        scale = 'index' if values.dtype.kind in 'iu' else 'linear'
+        values = values.astype(float)
+        vmin, vmax = 0, 1
+
+    # The lookup table of the colormap, followed by its under, over and bad
+    # colors as in matplotlib's Colormap._lut, with the mesh alpha applied
+    cmap = mesh.get_cmap()
+    alpha = mesh.get_alpha()
+    lut = np.vstack([cmap(np.arange(cmap.N), alpha=alpha),
+                     cmap([-1., 2., np.nan], alpha=alpha)])
+
+    return dict(x=encode_array(x, 'float64'),
+                y=encode_array(y, 'float64'),
+                values=encode_array(values.filled(np.nan), 'float32'),
+                scale=scale,
+                vmin=float(vmin),
+                vmax=float(vmax),
+                lut=encode_array(np.round(255 * lut), 'uint8'),
+                zorder=mesh.get_zorder())
+
+
+def errorbar_props(ax, container):
+    """Extract the columns and style of an errorbar container
+
+    Returns
+    -------
+    props : dictionary or None
+        None if the container cannot be drawn as an errorbars element, e.g.
+        because it has limit arrows or per-bar styles.  Otherwise, a
+        dictionary with the keys "artists" (the caps and bar collections
+        which the element replaces), "columns" (a dictionary of data
+        columns with the keys "x", "y", "xerr" and "yerr", the latter two
+        as (lower, upper) pairs) and "style".
+    """
+    data_line, caplines, barlinecols = container.lines
+    if not barlinecols:
+        return None
+
+    errors = {}
+    styles = set()
+    for collection in barlinecols:
+        segments = collection.get_segments()
+        if (collection.get_transform() is not ax.transData
+                or not segments or any(len(s) != 2 for s in segments)
+                or any(dashes for offset, dashes
+                       in collection.get_linestyle())):
+            return None
+        segments = np.asarray(segments, dtype=float)
+        if np.all(segments[:, 0, 0] == segments[:, 1, 0]):
+            axis, position = 'y', segments[:, 0, 0]
+        elif np.all(segments[:, 0, 1] == segments[:, 1, 1]):
+            axis, position = 'x', segments[:, 0, 1]
+        else:
+            return None
+        if axis in errors:
+            return None
+        lower, upper = segments[:, :, 1 if axis == 'y' else 0].T
+        errors[axis] = (position, lower, upper)
+
+        colors, index = export_colors(collection.get_colors())
+        linewidths = np.unique(collection.get_linewidths())
+        if len(colors) != 1 or len(linewidths) != 1:
+            return None
+        styles.add((colors[0], float(linewidths[0]),
+                    collection.get_alpha(), collection.get_zorder()))
+
+    capstyles = set()
+    for capline in caplines:
+        if capline.get_marker() not in ['_', '|']:
+            return None
+        capcolor = export_colors([capline.get_markeredgecolor()])[0][0]
+        capstyles.add((capcolor, capline.get_markersize(),
+                       capline.get_markeredgewidth()))
+
+    if len(styles) != 1 or len(capstyles) > 1:
+        return None
+    if len(set(len(position) for position, _, _ in errors.values())) != 1:
+        return None
+    color, linewidth, alpha, zorder = styles.pop()
+    capcolor, capsize, capwidth = (capstyles.pop() if capstyles
+                                   else (color, 0, 0))
+    if capcolor != color:
+        return None
+
+    # Bar positions along the error axis are only known from the data line
+    # (unless errorevery skips points); fall back to the bar centers.
+    columns = {}
+    if data_line is not None:
+        xydata = np.asarray(data_line.get_xydata(), dtype=float)
+    for axis, other, i in [('x', 'y', 0), ('y', 'x', 1)]:
+        if other in errors:
+            columns[axis] = errors[other][0]
+        else:
+            position, lower, upper = errors[axis]
+            if (data_line is not None and len(xydata) == len(position)
+                    and np.all(xydata[:, 1 - i] == position)):
+                columns[axis] = xydata[:, i]
+            else:
+                columns[axis] = 0.5 * (lower + upper)
+        if axis in errors:
+            columns[axis + 'err'] = errors[axis][1:]
+
+    artists = set(caplines) | set(barlinecols)
+    style = dict(color=color, linewidth=linewidth,
+                 alpha=1 if alpha is None else alpha, capsize=capsize,
+                 capwidth=capwidth, zorder=zorder)
+    return dict(artists=artists, columns=columns, style=style)
 
 
 class MPLD3Renderer(Renderer):
@@ -27,9 +263,32 @@ class MPLD3Renderer(Renderer):
     This renderer class plugs into the ``mplexporter`` package in order to
     convert matplotlib figures into a JSON-serializable dictionary
     representation which can be read by mpld3.js.
+
+    Parameters
+    ----------
+    simplify_tolerance : float (optional)
+        If specified, simplify paths in data coordinates (contours, fills,
+        patches) so that they deviate from the original by at most this
+        many display pixels.  Boundaries shared between paths of the same
+        collection are preserved.
+    image_tile_size : int (optional)
+        If specified, export images larger than this many pixels in either
+        dimension as a pyramid of tiles of this size, of which the client
+        only loads those needed for the current view.
+    image_tile_dir : string (optional)
+        If specified, write image tiles as PNG files to this directory and
+        reference them by URL (relative to the page for relative paths),
+        rather than embedding them.
     """
-    def __init__(self):
+    def __init__(self, simplify_tolerance=None, image_tile_size=None,
+                 image_tile_dir=None):
+        self.simplify_tolerance = simplify_tolerance
+        self.image_tile_size = image_tile_size
+        self.image_tile_dir = image_tile_dir
         self.figure_json = None
+        self.bar_run = []
+        self.bar_containers = {}
+        self.errorbar_artists = set()
         self.axes_json = None
         self.finished_figures = []
 
@@ -37,7 +296,7 @@ class MPLD3Renderer(Renderer):
     def datalabel(i):
         return "data{0:02d}".format(i)
 
-    def add_data(self, data, key="data"):
+    def add_data(self, data, key="data", names=("xindex", "yindex")):
         """Add a dataset to the current figure
 
         If the dataset matches any already added data, we use that instead.
@@ -45,21 +304,24 @@ class MPLD3Renderer(Renderer):
         Parameters
         ----------
         data : array_like
-            a shape [N,2] array of data
+            a shape [N,M] array of data, with M = len(names)
         key : string (optional)
             the key to use for the data
+        names : tuple of strings (optional)
+            the keys to use for the column indices of the data
 
         Returns
         -------
         datadict : dictionary
-            datadict has the keys "data", "xindex", "yindex", which will
-            be passed to the mpld3 JSON object.
+            datadict has the keys "data", "xindex", "yindex" (or the given
+            names), which will be passed to the mpld3 JSON object.
         """
         # Check if any column of the data exists elsewhere
         # If so, we'll use that dataset rather than duplicating it.
         data = np.asarray(data)
-        if data.ndim != 2 and data.shape[1] != 2:
-            raise ValueError("Data is expected to be of size [N, 2]")
+        if data.ndim != 2 and data.shape[1] != len(names):
+            raise ValueError("Data is expected to be of size "
+                             "[N, {0}]".format(len(names)))
 
         for (i, d) in enumerate(self.datasets):
             if data.shape[0] != d.shape[0]:
@@ -84,18 +346,18 @@ class MPLD3Renderer(Renderer):
 
             self.datasets[i] = np.asarray(new_data).T
             datalabel = self.datalabel(i + 1)
-            xindex, yindex = map(int, indices)
             break
         else:
             # else here can be thought of as "if no break"
             # if we get here, then there were no matching datasets
             self.datasets.append(data)
             datalabel = self.datalabel(len(self.datasets))
-            xindex = 0
-            yindex = 1
+            indices = range(len(names))
 
         self.datalabels.append(datalabel)
-        return {key: datalabel, "xindex": xindex, "yindex": yindex}
+        datadict = {key: datalabel}
+        datadict.update(zip(names, map(int, indices)))
+        return datadict
 
     def open_figure(self, fig, props):
         self.datasets = []
@@ -139,8 +401,30 @@ class MPLD3Renderer(Renderer):
                               markers=[],
                               texts=[],
                               collections=[],
-                              images=[])
+                              images=[],
+                              bars=[],
+                              errorbars=[],
+                              linecollections=[],
+                              quivers=[],
+                              quadmeshes=[],
+                              tiledimages=[])
         self.figure_json['axes'].append(self.axes_json)
+        self.bar_run = []
+
+        # only the rectangles of a bar container (e.g. from bar or hist) are
+        # merged into bars elements, not patches added by the user
+        self.bar_containers = {}
+        for i, container in enumerate(ax.containers):
+            if isinstance(container, BarContainer):
+                self.bar_containers.update((patch, i)
+                                           for patch in container.patches)
+
+        # errorbars are drawn from their containers, and their caps and bar
+        # collections are skipped when the exporter reaches them.
+        self.errorbar_artists = set()
+        for container in ax.containers:
+            if isinstance(container, ErrorbarContainer):
+                self.draw_errorbars(ax, container)
 
         # Get shared axes info
         xsib = ax.get_shared_x_axes().get_siblings(ax)
@@ -151,11 +435,38 @@ class MPLD3Renderer(Renderer):
                                     if axi is not ax]
 
     def close_axes(self, ax):
+        self.flush_bars()
         self.axes_json = None
 
+    def draw_errorbars(self, ax, container):
+        props = errorbar_props(ax, container)
+        if props is None:
+            return
+        columns = props['columns']
+        names = ["xindex", "yindex"]
+        data = [columns['x'], columns['y']]
+        for key in ['xerr', 'yerr']:
+            if key in columns:
+                names.extend([key + 'lower', key + 'upper'])
+                data.extend(columns[key])
+
+        errorbars = self.add_data(np.column_stack(data), names=names)
+        for key in ['xerr', 'yerr']:
+            errorbars[key + 'index'] = (
+                [errorbars.pop(key + 'lower'), errorbars.pop(key + 'upper')]
+                if key in columns else None)
+        errorbars.update(props['style'])
+        # containers can't be weakly referenced: use the first bar
+        # collection for the id
+        errorbars['id'] = get_id(container.lines[2][0])
+        self.axes_json['errorbars'].append(errorbars)
+        self.errorbar_artists.update(props['artists'])
+
     # If draw_line() is not implemented, it will be delegated to draw_path
     # Should we get rid of this? There's not really any advantage here
     def draw_line(self, data, coordinates, style, label, mplobj=None):
+        if mplobj in self.errorbar_artists:
+            return
         line = self.add_data(data)
         line['coordinates'] = coordinates
         line['id'] = get_id(mplobj)
@@ -171,8 +482,69 @@ class MPLD3Renderer(Renderer):
 
         self.axes_json['lines'].append(line)
 
+    def simplify(self, paths, coordinates, mplobj=None):
+        """Simplify a list of (vertices, pathcodes) to the pixel tolerance"""
+        ax = getattr(mplobj, 'axes', None)
+        if not self.simplify_tolerance or coordinates != "data" or ax is None:
+            return paths
+        return simplify_paths(paths, ax.transData, self.simplify_tolerance)
+
     def draw_path(self, data, coordinates, pathcodes, style,
                   offset=None, offset_coordinates="data", mplobj=None):
+        # Runs of axis-aligned rectangles of a bar container which only
+        # differ by their facecolor are drawn as one bars element.
+        container = self.bar_containers.get(mplobj)
+        if (container is not None and coordinates == "data"
+                and offset is None and is_rectangle(data, pathcodes)):
+            if self.bar_run and (
+                    self.bar_run[0][3] != container or
+                    bar_style(self.bar_run[0][1]) != bar_style(style)):
+                self.flush_bars()
+            self.bar_run.append((data, style, mplobj, container))
+            return
+
+        self.flush_bars()
+        self.draw_single_path(data, coordinates, pathcodes, style,
+                              offset, offset_coordinates, mplobj)
+
+    def flush_bars(self):
+        """Draw the pending run of rectangles from draw_path"""
+        run, self.bar_run = self.bar_run, []
+        if len(run) == 1:
+            data, style, mplobj, container = run[0]
+            self.draw_single_path(data, "data", RECTANGLE_CODES, style,
+                                  mplobj=mplobj)
+        elif run:
+            data = np.array([data for data, style, mplobj, container
+                             in run])
+            x, bottom = data[:, 0].T
+            width, height = (data[:, 2] - data[:, 0]).T
+            bars = self.add_data(np.column_stack([x, bottom, width, height]),
+                                 names=("xindex", "yindex",
+                                        "widthindex", "heightindex"))
+            style = run[0][1]
+            bars['facecolors'] = encode_style([style['facecolor']
+                                               for data, style, mplobj,
+                                               container in run])
+            for key in ['dasharray', 'alpha', 'edgecolor', 'edgewidth',
+                        'zorder']:
+                bars[key] = style[key]
+            if bars['dasharray'] == "10,0":
+                bars['dasharray'] = "none"
+            # the id of each bar, by which plugins find the element
+            bars['ids'] = [get_id(mplobj) for data, style, mplobj, container
+                           in run]
+            bars['id'] = bars['ids'][0]
+            self.axes_json['bars'].append(bars)
+
+    def draw_single_path(self, data, coordinates, pathcodes, style,
+                         offset=None, offset_coordinates="data",
+                         mplobj=None):
+        if offset is None:
+            [(data, pathcodes)] = self.simplify([(data, pathcodes)],
+                                                coordinates, mplobj)
+            if not pathcodes:
+                return
         path = self.add_data(data)
         path['coordinates'] = coordinates
         path['pathcodes'] = pathcodes
@@ -194,6 +566,8 @@ class MPLD3Renderer(Renderer):
 
     # If draw_markers is not implemented, it will be delegated to draw_path
     def draw_markers(self, data, coordinates, style, label, mplobj=None):
+        if mplobj in self.errorbar_artists:
+            return
         markers = self.add_data(data)
         markers["coordinates"] = coordinates
         markers['id'] = get_id(mplobj, 'pts')
@@ -210,27 +584,97 @@ class MPLD3Renderer(Renderer):
     def draw_path_collection(self, paths, path_coordinates, path_transforms,
                              offsets, offset_coordinates, offset_order,
                              styles, mplobj=None):
+        if mplobj in self.errorbar_artists:
+            return
         if len(paths) != 0:
+            if isinstance(mplobj, Quiver) and self.draw_quiver(styles,
+                                                               mplobj):
+                return
+            if all(np.all(t == np.eye(3)) for t in path_transforms):
+                paths = self.simplify(paths, path_coordinates, mplobj)
+            if (isinstance(mplobj, LineCollection)
+                    and is_polylines(paths, path_transforms, offsets)):
+                self.draw_line_collection(paths, path_coordinates, styles,
+                                          mplobj)
+                return
             styles = dict(alphas=[styles['alpha']],
-                          edgecolors=[export_color(ec)
-                                      for ec in styles['edgecolor']],
-                          facecolors=[export_color(fc)
-                                      for fc in styles['facecolor']],
-                          edgewidths=[lw for lw in styles['linewidth']],
+                          edgecolors=encode_palette(
+                              *export_colors(styles['edgecolor'])),
+                          facecolors=encode_palette(
+                              *export_colors(styles['facecolor'])),
+                          edgewidths=encode_style(styles['linewidth']),
                           offsetcoordinates=offset_coordinates,
                           pathcoordinates=path_coordinates,
                           zorder=styles['zorder'])
 
             pathsdict = self.add_data(offsets, "offsets")
-            pathsdict['paths'] = [(v.tolist(), p) for (v, p) in paths]
-            pathsdict['pathtransforms'] = [(t[0, :2].tolist()
-                                            + t[1, :2].tolist()
-                                            + t[2, :2].tolist())
-                                           for t in path_transforms]
+            pathsdict['paths'] = encode_paths(paths)
+            pathsdict['pathtransforms'] = encode_transforms(path_transforms)
             pathsdict.update(styles)
             pathsdict['id'] = get_id(mplobj)
             self.axes_json['collections'].append(pathsdict)
 
+    def draw_quiver(self, styles, quiver):
+        """Draw a quiver as a quiver element, returning False if it can't be
+        """
+        props = quiver_props(quiver)
+        if props is None:
+            return False
+        edgecolors, index = export_colors(styles['edgecolor'])
+        if len(edgecolors) == 0:
+            edgecolor = "none"
+        elif np.array_equal(styles['edgecolor'], styles['facecolor']):
+            edgecolor = "face"
+        elif len(edgecolors) == 1:
+            edgecolor = edgecolors[0]
+        else:
+            return False
+        linewidths = np.unique(styles['linewidth'])
+        if len(linewidths) > 1:
+            return False
+
+        uv = [np.ma.filled(np.ma.asarray(c, dtype=float), np.nan)
+              for c in (quiver.U, quiver.V)]
+        quiverdict = self.add_data(np.column_stack([quiver.X, quiver.Y] + uv),
+                                   names=["xindex", "yindex",
+                                          "uindex", "vindex"])
+        quiverdict.update(props)
+        quiverdict.update(
+            facecolors=encode_palette(*export_colors(styles['facecolor'])),
+            edgecolor=edgecolor,
+            edgewidth=float(linewidths[0]) if len(linewidths) else 0,
+            alpha=1 if styles['alpha'] is None else styles['alpha'],
+            zorder=styles['zorder'],
+            id=get_id(quiver))
+        self.axes_json['quivers'].append(quiverdict)
+        return True
+
+    def draw_quadmesh(self, mesh):
+        """Draw a QuadMesh as a quadmesh element, returning False if it can't
+        """
+        props = quadmesh_props(mesh)
+        if props is None:
+            return False
+        props['id'] = get_id(mesh)
+        self.axes_json['quadmeshes'].append(props)
+        return True
+
+    def draw_line_collection(self, paths, coordinates, styles, mplobj=None):
+        """Draw polylines as one flat vertex buffer with segment starts"""
+        vertices = np.concatenate([np.reshape(v, (-1, 2)) for v, c in paths])
+        lengths = [len(v) for v, c in paths]
+        starts = np.cumsum([0] + lengths[:-1])
+        linecollection = dict(
+            vertices=encode_array(vertices, 'float64'),
+            starts=encode_array(starts, index_dtype(len(vertices))),
+            coordinates=coordinates,
+            edgecolors=encode_palette(*export_colors(styles['edgecolor'])),
+            edgewidths=encode_style(styles['linewidth']),
+            alpha=1 if styles['alpha'] is None else styles['alpha'],
+            zorder=styles['zorder'],
+            id=get_id(mplobj))
+        self.axes_json['linecollections'].append(linecollection)
+
     def draw_text(self, text, position, coordinates, style,
                   text_type=None, mplobj=None):
         text = dict(text=text,
@@ -252,6 +696,59 @@ class MPLD3Renderer(Renderer):
         image['id'] = get_id(mplobj)
         self.axes_json['images'].append(image)
 
+    def draw_tiled_image(self, image):
+        """Draw an image as a tile pyramid if it is larger than a tile
+
+        Returns False for images which should be exported as usual.
+        """
+        if (self.image_tile_size is None or type(image) is not AxesImage
+                or np.ndim(image.get_alpha()) != 0
+                or max(image.get_array().shape[:2]) <= self.image_tile_size):
+            return False
+        image_id = get_id(image)
+        tiledimage = image_pyramid(image, self.image_tile_size,
+                                   self.image_tile_dir, name=image_id)
+        alpha = image.get_alpha()
+        tiledimage.update(extent=[float(e) for e in image.get_extent()],
+                          coordinates="data",
+                          alpha=1 if alpha is None else alpha,
+                          zorder=image.get_zorder(),
+                          id=image_id)
+        self.axes_json['tiledimages'].append(tiledimage)
+        return True
+
+
+class MPLD3Exporter(Exporter):
+    """Exporter class for mpld3
+
+    This extends the ``mplexporter`` Exporter to hand QuadMeshes to the
+    renderer as a whole, rather than as one path per cell, and images to
+    the renderer before they are encoded at full resolution, so that large
+    ones can be tiled.  Meshes and images which :class:`MPLD3Renderer`
+    can't draw this way are exported as usual.
+
+    Figures are drawn and crawled while holding ``matplotlib_lock``.
+    """
+    def run(self, fig):
+        with matplotlib_lock:
+            super(MPLD3Exporter, self).run(fig)
+
+    def draw_collection(self, ax, collection,
+                        force_pathtrans=None,
+                        force_offsettrans=None):
+        if (isinstance(collection, QuadMesh)
+                and force_pathtrans is None and force_offsettrans is None
+                and self.renderer.draw_quadmesh(collection)):
+            return
+        super(MPLD3Exporter, self).draw_collection(
+            ax, collection, force_pathtrans=force_pathtrans,
+            force_offsettrans=force_offsettrans)
+
+    def draw_image(self, ax, image):
+        if self.renderer.draw_tiled_image(image):
+            return
+        super(MPLD3Exporter, self).draw_image(ax, image)
+
 
 TEXT_VA_DICT = {'bottom': 'auto',
                 'baseline': 'auto',
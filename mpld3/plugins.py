@@ -14,6 +14,7 @@ __all__ = ['connect', 'clear', 'get_plugins', 'PluginBase',
 
 import collections
 import json
+import threading
 import uuid
 import matplotlib
 try:
@@ -23,6 +24,9 @@ except ImportError:
 
 from .utils import get_id
 
+# guards the plugin lists of figures, which are created when first needed
+plugins_lock = threading.RLock()
+
 
 def get_plugins(fig):
     """Get the list of plugins in the figure"""
@@ -52,10 +56,11 @@ def connect(fig, *plugins):
     """
     if not isinstance(fig, matplotlib.figure.Figure):
         raise ValueError("plugins.connect: first argument must be a figure")
-    if not hasattr(fig, 'mpld3_plugins'):
-        fig.mpld3_plugins = DEFAULT_PLUGINS[:]
-    for plugin in plugins:
-        fig.mpld3_plugins.append(plugin)
+    with plugins_lock:
+        if not hasattr(fig, 'mpld3_plugins'):
+            fig.mpld3_plugins = DEFAULT_PLUGINS[:]
+        for plugin in plugins:
+            fig.mpld3_plugins.append(plugin)
 
 
 def clear(fig):
@@ -631,6 +636,13 @@ class InteractiveLegendPlugin(PluginBase):
                                                 (d.visible ? current_alpha : current_alpha_unsel))
                         .style("fill-opacity", is_over ? current_alpha_over :
                                                 (d.visible ? current_alpha : current_alpha_unsel));
+                } else if(type=="mpld3_LineCollection"){
+                    var current_alpha = d.mpld3_elements[i].props.alpha;
+                    var current_alpha_unsel = current_alpha * alpha_unsel;
+                    var current_alpha_over = current_alpha * alpha_over;
+                    d.mpld3_elements[i].pathsobj
+                        .style("stroke-opacity", is_over ? current_alpha_over :
+                                                (d.visible ? current_alpha : current_alpha_unsel));
                 } else{
                     console.log(type + " not yet supported");
                 }
@@ -647,6 +659,8 @@ class InteractiveLegendPlugin(PluginBase):
             } else if((type=="mpld3_PathCollection")||
                       (type=="mpld3_Markers")){
                 color = d.mpld3_elements[0].props.facecolors[0];
+            } else if(type=="mpld3_LineCollection"){
+                color = d.mpld3_elements[0].props.edgecolors[0];
             } else{
                 console.log(type + " not yet supported");
             }
@@ -0,0 +1,574 @@
+"""
+Figure specifications
+=====================
+
+Direct construction of mpld3 figures from NumPy arrays, without creating
+and crawling matplotlib figures.  This produces the same dictionary
+representation as :func:`mpld3.fig_to_dict`, at a fraction of the cost,
+which suits services rendering many simple charts::
+
+    from mpld3 import spec
+
+    fig = spec.Figure(width=640, height=480)
+    ax = fig.add_axes(xlabel="time", ylabel="value", grid=True)
+    ax.line(t, y, color="steelblue")
+    ax.scatter(t[::10], y[::10], s=20)
+    html = fig.to_html()
+
+Colors are passed to the browser as they are, so any CSS color may be used.
+Limits not given explicitly are computed from the data with matplotlib's
+default margins.  Elements returned by the plotting methods can be passed
+to plugins in place of matplotlib artists.
+"""
+import base64
+import json
+import struct
+import zlib
+
+import numpy as np
+
+from .plugins import DEFAULT_PLUGINS
+from .utils import get_id, encode_style, encode_transforms
+from .mpld3renderer import TEXT_HA_DICT, TEXT_VA_DICT
+from ._display import NumpyEncoder, dict_to_html
+
+__all__ = ["Figure", "Axes", "Element"]
+
+
+# matplotlib's default color cycle, subplot position and axes margins
+COLOR_CYCLE = ["#1F77B4", "#FF7F0E", "#2CA02C", "#D62728", "#9467BD",
+               "#8C564B", "#E377C2", "#7F7F7F", "#BCBD22", "#17BECF"]
+AXES_BBOX = [0.125, 0.11, 0.775, 0.77]
+MARGIN = 0.05
+GRID_STYLE = dict(gridOn=True, color="#B0B0B0", dasharray="none", alpha=1.0)
+
+# figures are laid out as matplotlib's at 100 dpi: pixels per point
+PIXELS_PER_POINT = 100. / 72
+
+# unit marker paths, in pixels with y pointing down
+_K = 0.5 * 0.5522847498
+MARKER_PATHS = {
+    'o': ([[0, -0.5], [_K, -0.5], [0.5, -_K], [0.5, 0], [0.5, _K],
+           [_K, 0.5], [0, 0.5], [-_K, 0.5], [-0.5, _K], [-0.5, 0],
+           [-0.5, -_K], [-_K, -0.5], [0, -0.5]],
+          ['M', 'C', 'C', 'C', 'C', 'Z']),
+    's': ([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]],
+          ['M', 'L', 'L', 'L', 'Z']),
+    'D': ([[0, -0.5], [0.5, 0], [0, 0.5], [-0.5, 0]],
+          ['M', 'L', 'L', 'L', 'Z']),
+    '^': ([[0, -0.5], [-0.5, 0.5], [0.5, 0.5]], ['M', 'L', 'L', 'Z']),
+    'v': ([[0, 0.5], [-0.5, -0.5], [0.5, -0.5]], ['M', 'L', 'L', 'Z']),
+}
+
+
+def png_bytes(image):
+    """Encode an image array as PNG bytes
+
+    Parameters
+    ----------
+    image : array_like
+        A shape [H, W] grayscale, [H, W, 3] RGB or [H, W, 4] RGBA image of
+        floats in [0, 1] or of bytes.
+    """
+    image = np.asarray(image)
+    if image.dtype.kind == 'f':
+        image = np.round(np.clip(image, 0, 1) * 255)
+    image = image.astype(np.uint8)
+    if image.ndim == 2:
+        image = np.repeat(image[:, :, None], 3, axis=2)
+    if image.ndim != 3 or image.shape[2] not in (3, 4):
+        raise ValueError("Images are expected to be of size [H, W], "
+                         "[H, W, 3] or [H, W, 4]")
+    if image.shape[2] == 3:
+        alpha = np.full(image.shape[:2] + (1,), 255, dtype=np.uint8)
+        image = np.concatenate([image, alpha], axis=2)
+    H, W = image.shape[:2]
+
+    # each row is prefixed by its filter type, 0 for none
+    rows = np.zeros((H, 1 + 4 * W), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(H, 4 * W)
+
+    def chunk(tag, data):
+        return (struct.pack('>I', len(data)) + tag + data +
+                struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    return b''.join([b'\x89PNG\r\n\x1a\n',
+                     chunk(b'IHDR', struct.pack('>IIBBBBB', W, H, 8, 6,
+                                                0, 0, 0)),
+                     chunk(b'IDAT', zlib.compress(rows.tobytes())),
+                     chunk(b'IEND', b'')])
+
+
+def autoscale(bounds, scale, margin):
+    """Axis limits enclosing the given (min, max, margin) bounds"""
+    if scale == "log":
+        bounds = [(np.log10(lo), np.log10(hi), m) for lo, hi, m in bounds
+                  if hi > 0]
+    bounds = [b for b in bounds if np.isfinite(b[0]) and np.isfinite(b[1])]
+    if not bounds:
+        return [1., 10.] if scale == "log" else [0., 1.]
+    lower = min(lo - (hi - lo) * margin * m for lo, hi, m in bounds)
+    upper = max(hi + (hi - lo) * margin * m for lo, hi, m in bounds)
+    if lower == upper:
+        lower, upper = lower - 1, upper + 1
+    if scale == "log":
+        return [10 ** lower, 10 ** upper]
+    return [float(lower), float(upper)]
+
+
+def data_bounds(values, scale):
+    values = np.asarray(values, dtype=float)
+    if scale == "log":
+        values = values[values > 0]
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return (np.nan, np.nan, 1)
+    return (values.min(), values.max(), 1)
+
+
+class Element(object):
+    """A plot element of an :class:`Axes`
+
+    Attributes
+    ----------
+    kind : string
+        The element list of the axes to which the element belongs, e.g.
+        "lines" or "markers".
+    props : dict
+        The properties of the element, as exported to mpld3.js.
+    """
+    def __init__(self, kind, props):
+        self.kind = kind
+        self.props = props
+        self.props['id'] = get_id(self)
+
+    @property
+    def id(self):
+        return self.props['id']
+
+
+class Axes(object):
+    """Axes of a spec :class:`Figure`
+
+    Create axes with :meth:`Figure.add_axes` rather than directly.
+
+    Parameters
+    ----------
+    fig : Figure
+        The figure of the axes.
+    bbox : list (optional)
+        The [left, bottom, width, height] of the axes, in figure fractions.
+    xlim, ylim : tuple (optional)
+        The axis limits.  By default these enclose the data with a margin.
+    xscale, yscale : string (optional)
+        "linear" or "log".
+    xlabel, ylabel, title : string (optional)
+        The axis labels and title.
+    xticks, yticks : list (optional)
+        Fixed tick positions.  Otherwise about nticks ticks are chosen by
+        the browser.
+    xticklabels, yticklabels : list (optional)
+        Labels of the fixed tick positions.
+    nticks : int (optional)
+        The approximate number of ticks on axes without fixed ticks.
+    fontsize : float (optional)
+        The font size of the tick labels and axis labels.
+    grid : boolean (optional)
+        Whether to draw grid lines.
+    facecolor : string (optional)
+        The background color of the axes.
+    zoomable : boolean (optional)
+        Whether the axes may be zoomed and panned.
+    """
+    def __init__(self, fig, bbox=None, xlim=None, ylim=None,
+                 xscale="linear", yscale="linear", xlabel=None, ylabel=None,
+                 title=None, xticks=None, yticks=None, xticklabels=None,
+                 yticklabels=None, nticks=8, fontsize=10.0, grid=False,
+                 facecolor="#FFFFFF", zoomable=True):
+        self.fig = fig
+        self.bbox = list(bbox or AXES_BBOX)
+        self.xlim = xlim
+        self.ylim = ylim
+        self.xscale = xscale
+        self.yscale = yscale
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.title = title
+        self.ticks = dict(x=(xticks, xticklabels), y=(yticks, yticklabels))
+        self.nticks = nticks
+        self.fontsize = fontsize
+        self.grid = grid
+        self.facecolor = facecolor
+        self.zoomable = zoomable
+        self.elements = []
+        self.bounds = dict(x=[], y=[])
+        self.sharex = []
+        self.sharey = []
+        self.ncolors = 0
+
+    @property
+    def id(self):
+        return get_id(self)
+
+    def next_color(self):
+        color = COLOR_CYCLE[self.ncolors % len(COLOR_CYCLE)]
+        self.ncolors += 1
+        return color
+
+    def add_element(self, kind, props):
+        element = Element(kind, props)
+        self.elements.append(element)
+        return element
+
+    def add_bounds(self, x, y):
+        self.bounds['x'].append(data_bounds(x, self.xscale))
+        self.bounds['y'].append(data_bounds(y, self.yscale))
+
+    def line(self, x, y, color=None, linewidth=1.5, dasharray="none",
+             alpha=1, zorder=2, drawstyle="default"):
+        """Plot a line
+
+        Parameters
+        ----------
+        x, y : array_like
+            The data.  Passing the same x array to several elements of a
+            figure sends it to the browser only once.
+        color : string (optional)
+            The line color.  By default the next color of the color cycle.
+        linewidth, alpha, zorder : float (optional)
+            The line style.
+        dasharray : string (optional)
+            The SVG dash array, e.g. "6,6".
+        drawstyle : string (optional)
+            "default", or "steps-pre", "steps-mid" or "steps-post".
+
+        Returns
+        -------
+        line : Element
+        """
+        props = self.fig.add_data(x, y)
+        props.update(coordinates="data",
+                     color=color or self.next_color(),
+                     linewidth=linewidth, dasharray=dasharray, alpha=alpha,
+                     zorder=zorder, drawstyle=drawstyle)
+        self.add_bounds(x, y)
+        return self.add_element("lines", props)
+
+    def scatter(self, x, y, s=36, color=None, marker='o', edgecolor="face",
+                edgewidth=1.0, alpha=1, zorder=1):
+        """Plot points
+
+        Parameters
+        ----------
+        x, y : array_like
+            The data.
+        s : float or array_like (optional)
+            The marker areas in points squared, as in matplotlib.
+        color : string or list (optional)
+            The marker colors, one for all points or one per point.  By
+            default the next color of the color cycle.
+        marker : string (optional)
+            The marker shape: one of 'o', 's', 'D', '^' and 'v'.
+        edgecolor : string (optional)
+            The marker edge color, or "face" for the marker color.
+        edgewidth, alpha, zorder : float (optional)
+            The marker style.
+
+        Returns
+        -------
+        points : Element
+            A markers element, or a collection element if marker sizes or
+            colors are given per point.
+        """
+        if marker not in MARKER_PATHS:
+            raise ValueError("marker must be one of "
+                             "{0}".format(sorted(MARKER_PATHS)))
+        color = self.next_color() if color is None else color
+        self.add_bounds(x, y)
+
+        if np.ndim(s) == 0 and isinstance(color, str):
+            props = self.fig.add_data(x, y)
+            size = np.sqrt(s) * PIXELS_PER_POINT
+            vertices, codes = MARKER_PATHS[marker]
+            props.update(coordinates="data", facecolor=color,
+                         edgecolor=color if edgecolor == "face" else edgecolor,
+                         edgewidth=edgewidth, alpha=alpha, zorder=zorder,
+                         markerpath=((size * np.array(vertices)).tolist(),
+                                     codes))
+            return self.add_element("markers", props)
+
+        props = self.fig.add_data(x, y, key="offsets")
+        sizes = np.sqrt(np.ravel(s)) * PIXELS_PER_POINT
+        transforms = sizes[:, None, None] * np.eye(3)
+        colors = [color] if isinstance(color, str) else list(color)
+        props.update(paths=[MARKER_PATHS[marker]],
+                     pathtransforms=encode_transforms(transforms),
+                     alphas=[alpha],
+                     facecolors=encode_style(colors),
+                     edgecolors=encode_style(
+                         colors if edgecolor == "face" else [edgecolor]),
+                     edgewidths=[edgewidth],
+                     offsetcoordinates="data",
+                     pathcoordinates="display",
+                     zorder=zorder)
+        return self.add_element("collections", props)
+
+    def image(self, image, extent=None, origin="upper", alpha=None,
+              zorder=0):
+        """Show an image
+
+        Parameters
+        ----------
+        image : array_like or bytes
+            PNG bytes, or an image array as accepted by :func:`png_bytes`.
+        extent : tuple (optional)
+            The (left, right, bottom, top) of the image in data coordinates.
+            By default, (0, width, 0, height) in pixels of array images.
+        origin : string (optional)
+            "upper" to place the first row of array images at the top, or
+            "lower" to place it at the bottom.
+        alpha : float (optional)
+            The image opacity.
+        zorder : float (optional)
+            The image zorder.
+
+        Returns
+        -------
+        image : Element
+        """
+        if isinstance(image, bytes):
+            png = image
+            if extent is None:
+                raise ValueError("extent is required for PNG images")
+        else:
+            image = np.asarray(image)
+            if origin == "lower":
+                image = image[::-1]
+            png = png_bytes(image)
+            if extent is None:
+                extent = (0, image.shape[1], 0, image.shape[0])
+        extent = [float(e) for e in extent]
+        self.bounds['x'].append((min(extent[:2]), max(extent[:2]), 0))
+        self.bounds['y'].append((min(extent[2:]), max(extent[2:]), 0))
+        props = dict(data=base64.b64encode(png).decode('ascii'),
+                     extent=extent, coordinates="data", alpha=alpha,
+                     zorder=zorder)
+        return self.add_element("images", props)
+
+    def text(self, x, y, text, coordinates="data", fontsize=None,
+             color="#000000", ha="left", va="baseline", rotation=0,
+             alpha=1, zorder=3):
+        """Draw text
+
+        Parameters
+        ----------
+        x, y : float
+            The position of the text.
+        text : string
+            The text.
+        coordinates : string (optional)
+            The coordinates of the position: "data", "axes" or "figure".
+        fontsize : float (optional)
+            The font size, by default that of the axes.
+        ha, va : string (optional)
+            The horizontal and vertical alignment, as in matplotlib.
+        color, rotation, alpha, zorder : optional
+            The text style.
+
+        Returns
+        -------
+        text : Element
+        """
+        props = dict(text=text, position=[float(x), float(y)],
+                     coordinates=coordinates, h_anchor=TEXT_HA_DICT[ha],
+                     v_baseline=TEXT_VA_DICT[va], rotation=-rotation,
+                     fontsize=fontsize or self.fontsize, color=color,
+                     alpha=alpha, zorder=zorder)
+        return self.add_element("texts", props)
+
+    def label_texts(self, xlim, ylim):
+        """The text properties of the axis labels and the title"""
+        width = self.bbox[2] * self.fig.width
+        height = self.bbox[3] * self.fig.height
+        # tick length, padding and label padding, in points
+        pad = 3.5 + 3.5 + 4
+        texts = []
+        if self.xlabel:
+            offset = (pad + self.fontsize) * PIXELS_PER_POINT / height
+            texts.append((self.xlabel, [0.5, -offset], "middle", "hanging",
+                          0, self.fontsize))
+        if self.ylabel:
+            chars = max(len("{0:.2g}".format(v)) for v in ylim)
+            offset = ((pad + 0.6 * chars * self.fontsize) *
+                      PIXELS_PER_POINT / width)
+            texts.append((self.ylabel, [-offset, 0.5], "middle", "auto",
+                          -90, self.fontsize))
+        if self.title:
+            offset = 6 * PIXELS_PER_POINT / height
+            texts.append((self.title, [0.5, 1 + offset], "middle", "auto",
+                          0, 1.2 * self.fontsize))
+        return [dict(text=text, position=position, coordinates="axes",
+                     h_anchor=h_anchor, v_baseline=v_baseline,
+                     rotation=rotation, fontsize=fontsize, color="#000000",
+                     alpha=1, zorder=3, id=get_id(self, "label{0}".format(i)))
+                for i, (text, position, h_anchor, v_baseline, rotation,
+                        fontsize) in enumerate(texts)]
+
+    def axis_props(self, axis):
+        ticks, ticklabels = self.ticks[axis]
+        return dict(position="bottom" if axis == "x" else "left",
+                    nticks=self.nticks if ticks is None else len(ticks),
+                    tickvalues=None if ticks is None else list(ticks),
+                    tickformat_formatter="" if ticklabels is None else "fixed",
+                    tickformat=(None if ticklabels is None
+                                else [str(label) for label in ticklabels]),
+                    scale=self.xscale if axis == "x" else self.yscale,
+                    fontsize=self.fontsize,
+                    grid=dict(GRID_STYLE) if self.grid else {"gridOn": False},
+                    visible=True)
+
+    def to_dict(self):
+        """The dictionary representation of the axes, without data"""
+        xlim = list(self.xlim or autoscale(self.bounds['x'], self.xscale,
+                                           MARGIN))
+        ylim = list(self.ylim or autoscale(self.bounds['y'], self.yscale,
+                                           MARGIN))
+        axes = dict(bbox=self.bbox, xlim=xlim, ylim=ylim,
+                    xdomain=xlim, ydomain=ylim,
+                    xscale=self.xscale, yscale=self.yscale,
+                    axes=[self.axis_props("x"), self.axis_props("y")],
+                    axesbg=self.facecolor, axesbgalpha=None,
+                    zoomable=self.zoomable, id=self.id,
+                    lines=[], paths=[], markers=[], texts=[], collections=[],
+                    images=[], bars=[], errorbars=[], linecollections=[],
+                    quivers=[], quadmeshes=[], tiledimages=[],
+                    sharex=[ax.id for ax in self.sharex],
+                    sharey=[ax.id for ax in self.sharey])
+        for element in self.elements:
+            axes[element.kind].append(element.props)
+        axes['texts'].extend(self.label_texts(xlim, ylim))
+        return axes
+
+
+class Figure(object):
+    """A figure built directly from data
+
+    Parameters
+    ----------
+    width, height : int (optional)
+        The size of the figure in pixels.
+    plugins : list (optional)
+        The figure plugins.  By default, those added to matplotlib figures
+        (reset, zoom and box zoom).
+    """
+    def __init__(self, width=640, height=480, plugins=None):
+        self.width = width
+        self.height = height
+        self.axes = []
+        self.plugins = list(DEFAULT_PLUGINS if plugins is None else plugins)
+        self.datasets = []
+
+    @property
+    def id(self):
+        return get_id(self)
+
+    def add_axes(self, bbox=None, sharex=None, sharey=None, **kwargs):
+        """Add axes to the figure
+
+        Parameters
+        ----------
+        bbox : list (optional)
+            The [left, bottom, width, height] of the axes, in figure
+            fractions.  By default, that of a single matplotlib subplot.
+        sharex, sharey : Axes (optional)
+            Axes with which to share the x or y axis when zooming.
+        **kwargs :
+            Additional keyword arguments passed to :class:`Axes`.
+
+        Returns
+        -------
+        ax : Axes
+        """
+        ax = Axes(self, bbox, **kwargs)
+        for other, attr in [(sharex, 'sharex'), (sharey, 'sharey')]:
+            if other is not None:
+                for shared in [other] + getattr(other, attr):
+                    getattr(shared, attr).append(ax)
+                    getattr(ax, attr).append(shared)
+        self.axes.append(ax)
+        return ax
+
+    def add_plugin(self, *plugins):
+        """Add one or more plugins to the figure"""
+        self.plugins.extend(plugins)
+
+    def add_data(self, x, y, key="data"):
+        """Add x and y columns to the figure's datasets
+
+        Columns are shared between elements given the same array object,
+        e.g. the x values of several lines.
+
+        Returns
+        -------
+        datadict : dict
+            The keys key, "xindex" and "yindex" of the element properties.
+        """
+        columns = [x, y]
+        n = len(x)
+        if len(y) != n:
+            raise ValueError("x and y must have the same length")
+        for i, dataset in enumerate(self.datasets):
+            if len(dataset[0]) == n and any(c is x or c is y
+                                            for c in dataset):
+                break
+        else:
+            i = len(self.datasets)
+            self.datasets.append([])
+        dataset = self.datasets[i]
+        indices = []
+        for column in columns:
+            for j, c in enumerate(dataset):
+                if c is column:
+                    break
+            else:
+                j = len(dataset)
+                dataset.append(column)
+            indices.append(j)
+        return {key: "data{0:02d}".format(i + 1),
+                "xindex": indices[0], "yindex": indices[1]}
+
+    def to_dict(self):
+        """The dictionary representation of the figure
+
+        This is the representation produced by :func:`mpld3.fig_to_dict`
+        for matplotlib figures, which is read by ``mpld3.draw_figure``.
+        """
+        data = {}
+        for i, dataset in enumerate(self.datasets):
+            data["data{0:02d}".format(i + 1)] = np.column_stack(
+                [np.asarray(column, dtype=float)
+                 for column in dataset]).tolist()
+        return dict(width=float(self.width), height=float(self.height),
+                    axes=[ax.to_dict() for ax in self.axes],
+                    data=data, id=self.id,
+                    plugins=[plugin.get_dict() for plugin in self.plugins])
+
+    def to_json(self):
+        """The JSON representation of the figure"""
+        return json.dumps(self.to_dict(), cls=NumpyEncoder)
+
+    def to_html(self, **kwargs):
+        """The HTML representation of the figure
+
+        Parameters
+        ----------
+        **kwargs :
+            Keyword arguments of :func:`mpld3.fig_to_html`, except those
+            controlling the export of matplotlib figures.
+        """
+        css = "".join(plugin.css() for plugin in self.plugins)
+        js = "".join(plugin.javascript() for plugin in self.plugins)
+        return dict_to_html(self.to_dict(), css, js, **kwargs)
+
+    def _repr_html_(self):
+        return self.to_html()
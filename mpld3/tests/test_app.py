@@ -0,0 +1,156 @@
+"""
+Test the WSGI and ASGI applications serving figures
+"""
+import asyncio
+import gzip
+import io
+import json
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import wsgi_app, asgi_app, FigureRegistry, spec
+
+
+def get(app, path, method="GET", errors=None, **headers):
+    environ = dict(("HTTP_" + key.upper(), value)
+                   for key, value in headers.items())
+    environ.update(REQUEST_METHOD=method, PATH_INFO=path)
+    environ['wsgi.errors'] = io.StringIO() if errors is None else errors
+    response = {}
+
+    def start_response(status, headers):
+        response['status'] = int(status.split()[0])
+        response['headers'] = dict(headers)
+
+    body = b"".join(app(environ, start_response))
+    return response['status'], response['headers'], body
+
+
+def line_figure():
+    fig, ax = plt.subplots()
+    x = np.arange(5000.)
+    ax.plot(x, x ** 2)
+    return fig
+
+
+def test_figure_paths():
+    app = wsgi_app({"line": line_figure})
+
+    status, headers, body = get(app, "/")
+    assert_equal(status, 200)
+    assert b'href="line"' in body
+
+    status, headers, page = get(app, "/line")
+    assert_equal(status, 200)
+    assert b'src="assets/mpld3.js"' in page
+    status, headers, body = get(app, "/assets/mpld3.js")
+    assert_equal(status, 200)
+    assert_equal(headers['Cache-Control'], "public, max-age=3600")
+
+    status, headers, body = get(app, "/line.json")
+    figure = json.loads(body.decode())
+    [label] = figure['data']
+    status, headers, body = get(app, "/line/data/" + label)
+    assert_equal(headers['X-Array-Shape'], "5000,2")
+    data = np.frombuffer(body, dtype='<f8').reshape(5000, 2)
+    assert_equal(data, figure['data'][label])
+
+    for path in ["/missing", "/line/data/missing", "/line/other"]:
+        assert_equal(get(app, path)[0], 404)
+    assert_equal(get(app, "/line", "POST")[0], 405)
+
+
+def test_caching_headers():
+    app = wsgi_app({"line": line_figure()})
+    status, headers, body = get(app, "/line.json")
+    etag = headers['ETag']
+    status, headers, body = get(app, "/line.json", if_none_match=etag)
+    assert_equal((status, body), (304, b""))
+
+    status, headers, compressed = get(app, "/line.json",
+                                      accept_encoding="gzip, deflate")
+    assert_equal(headers['Content-Encoding'], "gzip")
+    assert len(compressed) < len(get(app, "/line.json")[2])
+    assert_equal(json.loads(gzip.decompress(compressed).decode()),
+                 json.loads(get(app, "/line.json")[2].decode()))
+
+
+def test_range_requests():
+    app = wsgi_app({"line": line_figure()})
+    [label] = json.loads(get(app, "/line.json")[2].decode())['data']
+    path = "/line/data/" + label
+    full = get(app, path)[2]
+
+    status, headers, body = get(app, path, range="bytes=16-31")
+    assert_equal(status, 206)
+    assert_equal(headers['Content-Range'], "bytes 16-31/80000")
+    assert_equal(body, full[16:32])
+    assert_equal(get(app, path, range="bytes=-8")[2], full[-8:])
+    assert_equal(get(app, path, range="bytes=79990-")[2], full[79990:])
+    assert_equal(get(app, path, range="bytes=80000-")[0], 416)
+
+
+def test_registry():
+    built = []
+
+    def lookup(name):
+        if not name.startswith("spec"):
+            raise KeyError(name)
+        built.append(name)
+        fig = spec.Figure()
+        fig.add_axes().line([0, 1], [0, len(name)])
+        return fig
+
+    registry = FigureRegistry(lookup, max_bytes=1)
+    app = wsgi_app(registry)
+    assert_equal(get(app, "/spec1")[0], 200)
+    assert_equal(get(app, "/spec1.json")[0], 200)
+    assert_equal(get(app, "/other")[0], 404)
+    assert_equal(built, ["spec1"])
+
+    # beyond max_bytes, only the last export is kept
+    get(app, "/spec22")
+    assert_equal(list(registry.exports), ["spec22"])
+    get(app, "/spec1")
+    assert_equal(built, ["spec1", "spec22", "spec1"])
+
+
+def test_export_errors():
+    def broken():
+        raise KeyError("color")
+
+    app = wsgi_app({"broken": broken, "line": line_figure})
+    # only figures missing from the registry are not found
+    for path in ["/broken", "/broken.json", "/broken/data/data01"]:
+        errors = io.StringIO()
+        status, headers, body = get(app, path, errors=errors)
+        assert_equal((status, body), (500, b"Internal Server Error"))
+        assert "KeyError: 'color'" in errors.getvalue()
+    assert_equal(get(app, "/missing.json")[0], 404)
+    assert_equal(get(app, "/line/data/missing")[0], 404)
+
+
+def test_asgi_app():
+    app = asgi_app({"line": line_figure()}, chunk_size=1000)
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request'}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': 'GET', 'path': '/line.json',
+             'headers': [(b'accept-encoding', b'identity')]}
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(app(scope, receive, send))
+    finally:
+        loop.close()
+
+    assert_equal(messages[0]['status'], 200)
+    body = b"".join(message['body'] for message in messages[1:])
+    assert len(messages) > 2
+    assert not messages[-1]['more_body']
+    assert_equal(body, get(wsgi_app(app.registry), "/line.json")[2])
@@ -0,0 +1,90 @@
+"""
+Test export and serving of figures from an asyncio event loop
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import (fig_to_html, fig_to_html_async, fig_to_html_chunks,
+                serve_async)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def get(port, path, method="GET"):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write("{0} {1} HTTP/1.0\r\nHost: localhost\r\n\r\n".format(
+        method, path).encode())
+    response = await reader.read()
+    writer.close()
+    head, body = response.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), body.decode()
+
+
+def test_fig_to_html_async():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [1, 0])
+    with ThreadPoolExecutor(2) as executor:
+        html = run(fig_to_html_async(fig, executor=executor, figid="fig1"))
+    assert_equal(html, fig_to_html(fig, figid="fig1"))
+
+
+def test_fig_to_html_chunks():
+    fig, ax = plt.subplots()
+    ax.plot(range(1000))
+
+    async def chunks(**kwargs):
+        return [chunk async for chunk in fig_to_html_chunks(
+            fig, chunk_size=1000, figid="fig1", **kwargs)]
+
+    for template_type in ["general", "simple"]:
+        html_chunks = run(chunks(template_type=template_type))
+        assert max(len(chunk) for chunk in html_chunks) <= 1000
+        assert_equal("".join(html_chunks),
+                     fig_to_html(fig, figid="fig1",
+                                 template_type=template_type))
+
+
+def test_serve_async():
+    figures = {}
+    for i in range(3):
+        fig, ax = plt.subplots()
+        ax.plot([0, i], [i, 0])
+        figures["/fig{0}".format(i)] = fig
+
+    async def page(path):
+        if path == "/fig2":
+            # streamed, without a Content-Length
+            return fig_to_html_chunks(figures[path], chunk_size=1000,
+                                      figid=path[1:])
+        if path in figures:
+            return await fig_to_html_async(figures[path], figid=path[1:])
+
+    async def requests():
+        server = await serve_async(page, port=8889, chunk_size=1000,
+                                   files={"/data.txt": ["text/plain", "x"]})
+        port = server.sockets[0].getsockname()[1]
+        try:
+            responses = await asyncio.gather(
+                *[get(port, path) for path in sorted(figures)] +
+                [get(port, "/missing"), get(port, "/data.txt"),
+                 get(port, "/", "POST")])
+        finally:
+            server.close()
+            await server.wait_closed()
+        return responses
+
+    responses = run(requests())
+    for (status, body), path in zip(responses, sorted(figures)):
+        assert_equal(status, 200)
+        assert fig_to_html(figures[path], figid=path[1:]) in body
+    assert_equal(responses[3][0], 404)
+    assert_equal(responses[4], (200, "x"))
+    assert_equal(responses[5][0], 501)
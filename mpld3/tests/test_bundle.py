@@ -0,0 +1,58 @@
+"""
+Test the minimal bundles of the javascript library
+"""
+import os
+import shutil
+import tempfile
+
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import build_bundle, spec
+from .._bundle import bundle_features
+
+
+def test_bundle_features():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [1, 0])
+    assert_equal(bundle_features(fig),
+                 ["elements/line.js", "plugins/boxzoom.js",
+                  "plugins/reset.js", "plugins/zoom.js"])
+    plt.close(fig)
+
+    fig = spec.Figure(plugins=[])
+    fig.add_axes().scatter([0, 1], [1, 0])
+    figure = {"axes": [{"texts": [{}], "lines": []}],
+              "plugins": [{"type": "tooltip"}, {"type": "custom"}]}
+    assert_equal(bundle_features([fig, figure]),
+                 ["elements/markers.js", "elements/text.js",
+                  "plugins/tooltip.js"])
+
+
+def test_build_bundle():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [1, 0])
+        filename = build_bundle(fig, minified=False, cache_dir=cache_dir)
+        with open(filename) as f:
+            code = f.read()
+        assert "function mpld3_Line(" in code
+        assert "function mpld3_Path(" in code
+        assert "function mpld3_Toolbar(" in code
+        assert "function mpld3_Bars(" not in code
+        assert 'register_plugin("zoom"' in code
+        assert 'register_plugin("tooltip"' not in code
+        assert 'import "' not in code
+
+        # a figure with the same features reuses the bundle
+        ax.plot([0, 1], [0, 1])
+        os.utime(filename, (0, 0))
+        assert_equal(build_bundle(fig, minified=False, cache_dir=cache_dir),
+                     filename)
+        assert_equal(os.path.getmtime(filename), 0)
+        ax.text(0.5, 0.5, "text")
+        assert build_bundle(fig, minified=False,
+                            cache_dir=cache_dir) != filename
+        plt.close(fig)
+    finally:
+        shutil.rmtree(cache_dir)
@@ -0,0 +1,122 @@
+"""
+Test the disk cache of exports
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import fig_to_dict, fig_to_html, plugins, set_cache_dir, _display
+from .._cache import fingerprint
+from ..utils import get_id
+
+
+def scatter_figure(color="red"):
+    fig, ax = plt.subplots()
+    x = np.linspace(0, 1, 50)
+    points = ax.scatter(x, x ** 2, c=x)
+    ax.plot(x, x, color=color)
+    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda v, i: "x%g" % v))
+    plugins.connect(fig, plugins.PointLabelTooltip(
+        points, labels=["point {0}".format(i) for i in range(50)]))
+    return fig
+
+
+def test_fingerprint():
+    key = fingerprint(scatter_figure(), {})[0]
+    assert_equal(fingerprint(scatter_figure(), {})[0], key)
+    assert fingerprint(scatter_figure("blue"), {})[0] != key
+    assert fingerprint(scatter_figure(), {"simplify_tolerance": 1})[0] != key
+
+    fig = scatter_figure()
+    fig.axes[0].collections[0].get_offsets()[10, 1] = 2
+    assert fingerprint(fig, {})[0] != key
+    fig = scatter_figure()
+    fig.axes[0].xaxis.set_major_formatter(
+        plt.FuncFormatter(lambda v, i: "y%g" % v))
+    assert fingerprint(fig, {})[0] != key
+    fig = scatter_figure()
+    fig.axes[0].set_xlim(0, 2)
+    assert fingerprint(fig, {})[0] != key
+    plt.close('all')
+
+
+def test_fingerprint_time():
+    # the fingerprint only hashes what the export reads, so costs a small
+    # fraction of the export
+    fig = scatter_figure()
+    fig.axes[0].plot(np.random.random(10000))
+    fig.axes[0].bar(np.arange(20), np.arange(20))
+
+    def best_time(function, repeat=5):
+        times = []
+        for i in range(repeat):
+            start = time.time()
+            function()
+            times.append(time.time() - start)
+        return min(times)
+
+    export_time = best_time(lambda: fig_to_dict(fig))
+    fingerprint_time = best_time(lambda: fingerprint(fig, {}))
+    assert fingerprint_time < 0.25 * export_time, (fingerprint_time,
+                                                   export_time)
+    plt.close(fig)
+
+
+def test_cache_dir():
+    cache_dir = tempfile.mkdtemp()
+    exports = []
+    export_dict = _display.export_dict
+
+    def counted_export_dict(*args, **kwargs):
+        exports.append(args)
+        return export_dict(*args, **kwargs)
+
+    _display.export_dict = counted_export_dict
+    try:
+        set_cache_dir(cache_dir)
+        html = fig_to_html(scatter_figure(), figid="fig1")
+        assert_equal(len(exports), 1)
+        assert_equal(len(os.listdir(cache_dir)), 1)
+
+        # the ids of the cached export are those of the new figure
+        fig = scatter_figure()
+        figure = fig_to_dict(fig)
+        assert_equal(len(exports), 1)
+        assert_equal(figure['id'], get_id(fig))
+        assert_equal(figure['axes'][0]['id'], get_id(fig.axes[0]))
+        assert_equal(figure['plugins'][-1]['id'],
+                     get_id(fig.axes[0].collections[0]))
+        set_cache_dir(None)
+        assert_equal(fig_to_dict(scatter_figure())['data'], figure['data'])
+        assert_equal(len(exports), 2)
+
+        # the least recently used entries are removed beyond max_bytes
+        set_cache_dir(cache_dir, max_bytes=1.5 * os.path.getsize(
+            os.path.join(cache_dir, os.listdir(cache_dir)[0])))
+        # other files of the directory are neither counted nor removed
+        with open(os.path.join(cache_dir, "notes.txt"), "w") as f:
+            f.write("x" * 10 ** 6)
+        with open(os.path.join(cache_dir, "entry.part"), "w") as f:
+            f.write("partial")
+        fig_to_html(scatter_figure("blue"))
+        assert_equal(len(exports), 3)
+        names = set(os.listdir(cache_dir))
+        assert_equal(names - set(["entry.part", "notes.txt"]),
+                     set(name for name in names if name.endswith(".mpld3")))
+        assert_equal(len(names), 3)
+        fig_to_html(scatter_figure())
+        assert_equal(len(exports), 4)
+        fig = scatter_figure()
+        cached_html = fig_to_html(fig, figid="fig1")
+        assert_equal(len(exports), 4)
+        assert_equal(len(cached_html), len(html))
+        assert get_id(fig.axes[0]) in cached_html
+    finally:
+        _display.export_dict = export_dict
+        set_cache_dir(None)
+        shutil.rmtree(cache_dir)
+        plt.close('all')
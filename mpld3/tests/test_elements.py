@@ -3,7 +3,9 @@ Test creation of basic plot elements
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
 from .. import fig_to_dict, fig_to_html
+from ..utils import decode_array, export_colors, get_id
 from numpy.testing import assert_equal
 
 
@@ -76,6 +78,245 @@ def test_scatter():
                  [[7.607257743127308, 0.0, 0.0, 7.607257743127308, 0.0, 0.0]])
 
 
+def test_scatter_palette():
+    fig, ax = plt.subplots()
+    categories = np.repeat([0, 1, 2, 1], 25)
+    ax.scatter(np.arange(100), np.random.random(100), c=categories,
+               cmap=plt.cm.viridis, linewidths=np.tile([1, 2], 50))
+    rep = fig_to_dict(fig)
+    points = rep['axes'][0]['collections'][0]
+
+    facecolors = points['facecolors']
+    assert_equal(len(facecolors['palette']), 3)
+    assert_equal(decode_array(facecolors['runs']), [25, 25, 25, 25])
+    run_colors = [facecolors['palette'][i]
+                  for i in decode_array(facecolors['index'])]
+    assert_equal(run_colors[1], run_colors[3])
+    assert run_colors[0] != run_colors[1]
+
+    edgewidths = points['edgewidths']
+    assert 'runs' not in edgewidths
+    assert_equal(edgewidths['palette'], [1.0, 2.0])
+    assert_equal(decode_array(edgewidths['index']), np.tile([0, 1], 50))
+
+
+def test_palette_order():
+    # palettes follow the first appearance of each color, so that plugins
+    # reading palette[0] see the color of the first element
+    palette, index = export_colors(['w', 'r', 'none', 'k', 'r', 'w'])
+    assert_equal(palette, ['#FFFFFF', '#FF0000', 'none', '#000000'])
+    assert_equal(index, [0, 1, 2, 3, 1, 0])
+
+    fig, ax = plt.subplots()
+    ax.scatter(np.arange(4), np.arange(4), c=['y', 'b', 'y', 'k'],
+               linewidths=[3, 1, 2, 1])
+    rep = fig_to_dict(fig)
+    points = rep['axes'][0]['collections'][0]
+    for key in ['facecolors', 'edgewidths']:
+        palette = points[key]['palette']
+        index = decode_array(points[key]['index'])
+        assert_equal(palette[index[0]], palette[0])
+    assert_equal(points['facecolors']['palette'],
+                 ['#BFBF00', '#0000FF', '#000000'])
+    assert_equal(points['edgewidths']['palette'], [3.0, 1.0, 2.0])
+
+
+def test_scatter_sizes():
+    fig, ax = plt.subplots()
+    sizes = 10 * np.arange(1, 11)
+    ax.scatter(np.arange(10), np.random.random(10), s=sizes)
+    rep = fig_to_dict(fig)
+    points = rep['axes'][0]['collections'][0]
+
+    assert_equal(len(points['paths']), 1)
+    transforms = points['pathtransforms']
+    assert_equal(transforms['matrix'], [1.0, 0.0, 0.0, 1.0, 0.0, 0.0])
+    np.testing.assert_allclose(decode_array(transforms['scales']),
+                               np.sqrt(sizes) * fig.dpi / 72)
+
+
+def test_repeated_paths():
+    fig, ax = plt.subplots()
+    theta = np.linspace(0, 2 * np.pi, 50)
+    circle = np.column_stack([np.cos(theta), np.sin(theta)])
+    triangle = [[0, 0], [1, 0], [0, 1]]
+    ax.add_collection(PolyCollection([circle, triangle, circle, triangle]))
+    rep = fig_to_dict(fig)
+    paths = rep['axes'][0]['collections'][0]['paths']
+
+    assert_equal(len(paths['palette']), 2)
+    assert_equal(decode_array(paths['index']), [0, 1, 0, 1])
+    vertices, codes = paths['palette'][0]
+    assert_equal(decode_array(vertices).shape, (50, 2))
+    assert_equal(codes[0], 'M')
+    assert_equal(paths['palette'][1][0][:3], [[0, 0], [1, 0], [0, 1]])
+
+
+def test_bars():
+    fig, ax = plt.subplots()
+    ax.bar(np.arange(5), [3, -1, 2, 5, 4], width=0.5,
+           color=['r', 'g', 'r', 'g', 'b'], zorder=3)
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+    bars = axrep['bars'][0]
+
+    assert_equal(axrep['paths'], [])
+    assert_equal(list(sorted(bars.keys())),
+                 ['alpha', 'dasharray', 'data', 'edgecolor', 'edgewidth',
+                  'facecolors', 'heightindex', 'id', 'ids', 'widthindex',
+                  'xindex', 'yindex', 'zorder'])
+    data = np.array(rep['data'][bars['data']])
+    assert_equal(data[:, bars['xindex']], np.arange(5) - 0.25)
+    assert_equal(data[:, bars['yindex']], 0)
+    assert_equal(data[:, bars['widthindex']], 0.5)
+    assert_equal(data[:, bars['heightindex']], [3, -1, 2, 5, 4])
+    facecolors = bars['facecolors']
+    assert_equal([facecolors['palette'][i]
+                  for i in decode_array(facecolors['index'])],
+                 ['#FF0000', '#007F00', '#FF0000', '#007F00', '#0000FF'])
+    assert_equal(bars['zorder'], 3)
+    assert_equal(bars['ids'], [get_id(patch) for patch in ax.patches])
+    assert_equal(bars['id'], bars['ids'][0])
+
+
+def test_bars_containers():
+    fig, ax = plt.subplots()
+    ax.bar(np.arange(3), [1, 2, 3])
+    ax.bar(np.arange(3), [1, 1, 1], bottom=[1, 2, 3])
+    for i in range(2):
+        ax.add_patch(plt.Rectangle((i, 5), 0.5, 0.5))
+    axrep = fig_to_dict(fig)['axes'][0]
+
+    # rectangles are only merged within the container of a bar call
+    assert_equal([len(bars['ids']) for bars in axrep['bars']], [3, 3])
+    assert_equal([path['id'] for path in axrep['paths']],
+                 [get_id(patch) for patch in ax.patches[-2:]])
+
+
+def test_errorbars():
+    fig, ax = plt.subplots()
+    x = np.arange(10)
+    y = np.random.random(10)
+    yerr = [0.1 * np.ones(10), 0.2 * np.ones(10)]
+    ax.errorbar(x, y, xerr=0.5, yerr=yerr, capsize=3, fmt='o')
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+    errorbars = axrep['errorbars'][0]
+
+    assert_equal(axrep['collections'], [])
+    assert_equal(len(axrep['markers']), 1)
+    assert_equal(errorbars['data'], axrep['markers'][0]['data'])
+    data = np.array(rep['data'][errorbars['data']])
+    assert_equal(data[:, errorbars['xindex']], x)
+    assert_equal(data[:, errorbars['yindex']], y)
+    assert_equal(data[:, errorbars['xerrindex']], np.column_stack([x - 0.5,
+                                                                   x + 0.5]))
+    assert_equal(data[:, errorbars['yerrindex']],
+                 np.column_stack([y - yerr[0], y + yerr[1]]))
+    assert_equal(errorbars['capsize'], 6)
+
+
+def test_errorbars_with_limits():
+    fig, ax = plt.subplots()
+    ax.errorbar(np.arange(10), np.random.random(10), yerr=0.1, lolims=True)
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+
+    assert_equal(axrep['errorbars'], [])
+    assert_equal(len(axrep['linecollections']), 1)
+
+
+def test_line_collection():
+    fig, ax = plt.subplots()
+    segments = [np.column_stack([np.arange(n), np.ones(n) * n])
+                for n in (2, 3, 4, 3)]
+    ax.add_collection(LineCollection(segments, linewidths=2,
+                                     colors=['r', 'b', 'r', 'r']))
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+    linecollection = axrep['linecollections'][0]
+
+    assert_equal(axrep['collections'], [])
+    assert_equal(list(sorted(linecollection.keys())),
+                 ['alpha', 'coordinates', 'edgecolors', 'edgewidths', 'id',
+                  'starts', 'vertices', 'zorder'])
+    assert_equal(decode_array(linecollection['vertices']),
+                 np.concatenate(segments))
+    assert_equal(decode_array(linecollection['starts']), [0, 2, 5, 9])
+    edgecolors = linecollection['edgecolors']
+    assert_equal([edgecolors['palette'][i]
+                  for i in decode_array(edgecolors['index'])],
+                 ['#FF0000', '#0000FF', '#FF0000', '#FF0000'])
+    assert_equal(linecollection['edgewidths'], [2])
+
+
+def test_quiver():
+    fig, ax = plt.subplots()
+    x, y = np.meshgrid(np.arange(4), np.arange(3))
+    u, v = np.cos(x), np.sin(y)
+    ax.quiver(x, y, u, v, x + y, pivot='middle')
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+    quiver = axrep['quivers'][0]
+
+    assert_equal(axrep['collections'], [])
+    data = np.array(rep['data'][quiver['data']])
+    assert_equal(data[:, quiver['xindex']], x.ravel())
+    assert_equal(data[:, quiver['yindex']], y.ravel())
+    assert_equal(data[:, quiver['uindex']], u.ravel())
+    assert_equal(data[:, quiver['vindex']], v.ravel())
+    assert_equal(len(quiver['glyph']), 7)
+    assert_equal(quiver['pivot'], 'middle')
+    assert_equal(quiver['angles'], 'uv')
+    assert_equal(len(decode_array(quiver['facecolors']['index'])), 12)
+
+
+def test_quiver_with_angles():
+    fig, ax = plt.subplots()
+    ax.quiver(np.arange(3), np.zeros(3), np.ones(3), np.ones(3),
+              angles=[0, 45, 90])
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+
+    assert_equal(axrep['quivers'], [])
+    assert_equal(len(axrep['collections']), 1)
+
+
+def test_quadmesh():
+    fig, ax = plt.subplots()
+    C = np.arange(12.).reshape(3, 4)
+    C[1, 1] = np.nan
+    ax.pcolormesh(np.arange(5), np.arange(4) ** 2, C, vmin=0, vmax=10)
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+    quadmesh = axrep['quadmeshes'][0]
+
+    assert_equal(axrep['collections'], [])
+    assert_equal(decode_array(quadmesh['x']), np.arange(5))
+    assert_equal(decode_array(quadmesh['y']), np.arange(4) ** 2)
+    assert_equal(decode_array(quadmesh['values']), C)
+    assert_equal(quadmesh['scale'], 'linear')
+    assert_equal([quadmesh['vmin'], quadmesh['vmax']], [0, 10])
+    lut = decode_array(quadmesh['lut'])
+    assert_equal(lut.shape, (256 + 3, 4))
+    assert_equal(lut[-1], [0, 0, 0, 0])
+
+
+def test_curvilinear_quadmesh():
+    fig, ax = plt.subplots()
+    x, y = np.meshgrid(np.arange(5), np.arange(4))
+    ax.pcolormesh(x + 0.1 * y, y, np.ones((3, 4)))
+    ax.pcolormesh(x, y, np.ones((3, 4)), edgecolors='k')
+    rep = fig_to_dict(fig)
+    axrep = rep['axes'][0]
+
+    assert_equal(len(axrep['quadmeshes']), 1)
+    assert_equal(len(axrep['collections']), 1)
+    quadmesh = axrep['quadmeshes'][0]
+    assert_equal(decode_array(quadmesh['x']), x + 0.1 * y)
+    assert_equal(decode_array(quadmesh['y']), y)
+
+
 def test_patch():
     fig, ax = plt.subplots()
     ax.add_patch(plt.Rectangle((0, 0), 1, 2, alpha=0.2, linewidth=2,
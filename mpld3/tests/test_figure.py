@@ -35,12 +35,16 @@ def test_axes():
     axrep = rep['axes'][0]
 
     assert_equal(list(sorted(axrep.keys())),
-                 ['axes', 'axesbg', 'axesbgalpha', 'bbox', 'collections',
-                  'id', 'images', 'lines', 'markers', 'paths', 'sharex',
-                  'sharey', 'texts', 'xdomain', 'xlim', 'xscale', 'ydomain',
+                 ['axes', 'axesbg', 'axesbgalpha', 'bars', 'bbox',
+                  'collections', 'errorbars', 'id', 'images',
+                  'linecollections', 'lines', 'markers', 'paths',
+                  'quadmeshes', 'quivers', 'sharex', 'sharey', 'texts',
+                  'tiledimages', 'xdomain', 'xlim', 'xscale', 'ydomain',
                   'ylim', 'yscale', 'zoomable'])
 
-    for key in ['collections', 'images', 'lines', 'markers', 'paths', 'texts']:
+    for key in ['bars', 'collections', 'errorbars', 'images',
+                'linecollections', 'lines', 'markers', 'paths', 'quadmeshes',
+                'quivers', 'texts', 'tiledimages']:
         assert_equal(axrep[key], [])
 
     for key in ['xlim', 'xdomain']:
@@ -0,0 +1,108 @@
+"""
+Test the gallery server
+"""
+import io
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import gallery_app
+from . import test_app
+
+
+def get(app, path, query="", errors=None):
+    def query_app(environ, start_response):
+        environ['QUERY_STRING'] = query
+        environ['wsgi.errors'] = io.StringIO() if errors is None else errors
+        return app(environ, start_response)
+    return test_app.get(query_app, path)
+
+
+SCRIPT = """
+import matplotlib.pyplot as plt
+fig, ax = plt.subplots()
+ax.plot([0, 1, 2], [2, 0, 1])
+plt.show()
+"""
+
+
+def test_gallery_files():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(tmpdir, "figures")
+        cache_dir = os.path.join(tmpdir, "cache")
+        os.makedirs(os.path.join(source, "sub"))
+        with open(os.path.join(source, "script.py"), "w") as f:
+            f.write(SCRIPT)
+        with open(os.path.join(source, "broken.py"), "w") as f:
+            f.write("raise ValueError('broken')\n")
+        with open(os.path.join(source, "notes.txt"), "w") as f:
+            f.write("not a figure")
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [1, 0])
+        with open(os.path.join(source, "figure.pkl"), "wb") as f:
+            pickle.dump(fig, f)
+        plt.close(fig)
+
+        app = gallery_app(source, cache_dir=cache_dir, workers=1)
+        status, headers, body = get(app, "/")
+        assert_equal(status, 200)
+        assert b"3 figures" in body
+        assert app.gallery.executor is None
+
+        status, headers, body = get(app, "/index.json")
+        assert_equal(json.loads(body.decode()),
+                     {"count": 3,
+                      "names": ["broken.py", "figure.pkl", "script.py"]})
+
+        pages = {}
+        for name in ["script.py", "figure.pkl"]:
+            status, headers, pages[name] = get(app, "/figures/" + name)
+            assert_equal(status, 200)
+            assert b"mpld3.draw_figure" in pages[name]
+            assert b'src="../assets/mpld3.js"' in pages[name]
+        assert_equal(len(os.listdir(cache_dir)), 2)
+        errors = io.StringIO()
+        status, headers, body = get(app, "/figures/broken.py",
+                                    errors=errors)
+        assert_equal((status, body), (500, b"Internal Server Error"))
+        assert "ValueError: broken" in errors.getvalue()
+        assert_equal(get(app, "/figures/notes.txt")[0], 404)
+        assert_equal(get(app, "/assets/mpld3.js")[0], 200)
+        app.gallery.executor.shutdown()
+
+        # a new server reads the pages from the disk cache
+        app = gallery_app(source, cache_dir=cache_dir, workers=1)
+        assert_equal(get(app, "/figures/script.py")[2], pages["script.py"])
+        assert app.gallery.executor is None
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_gallery_functions():
+    calls = []
+
+    def line(n):
+        def figure():
+            calls.append(n)
+            fig, ax = plt.subplots()
+            ax.plot(range(n))
+            return fig
+        return figure
+
+    figures = dict(("line{0}".format(n), line(n)) for n in range(1200))
+    app = gallery_app(lambda: figures)
+    status, headers, body = get(app, "/index.json", "page=2")
+    assert_equal(json.loads(body.decode())['names'], sorted(figures)[1000:])
+    assert_equal(get(app, "/index.json", "page=x")[0], 404)
+
+    for i in range(2):
+        status, headers, page = get(app, "/figures/line7")
+        assert_equal(status, 200)
+        assert b"mpld3.draw_figure" in page
+    assert_equal(calls, [7])
+    app.gallery.executor.shutdown()
@@ -1,10 +1,16 @@
 """
 Test html output
 """
+import base64
+import io
+import json
+import re
+import zlib
+
 import numpy as np
 import matplotlib.pyplot as plt
-from .. import fig_to_html, urls
-from numpy.testing import assert_equal
+from .. import fig_to_html, save_html, urls
+from numpy.testing import assert_equal, assert_raises
 
 
 def test_html():
@@ -34,3 +40,51 @@ def test_no_scripts_added():
 
     assert urls.D3_URL[:-3] not in html
     assert urls.MPLD3_URL[:-3] not in html
+
+
+def test_self_contained():
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(1000), np.sin(np.arange(1000)))
+    with open(urls.MPLD3MIN_LOCAL) as f:
+        mpld3_js = f.read()
+
+    html = {}
+    for compress in [False, True]:
+        f = io.StringIO()
+        save_html(fig, f, self_contained=True, compress=compress)
+        html[compress] = f.getvalue()
+        assert urls.D3_URL not in html[compress]
+        assert urls.MPLD3_URL not in html[compress]
+    assert mpld3_js in html[False]
+    assert len(html[True]) < len(html[False]) / 2
+
+    # the libraries, then the figure, as base64 zlib streams
+    libraries = json.loads(re.search(r"var libraries = (.*);",
+                                     html[True]).group(1))
+    [figure] = re.findall(r"libraries.concat\(\[(.*)\]\)", html[True])
+    payloads = [zlib.decompress(base64.b64decode(payload)).decode('utf-8')
+                for payload in libraries + [json.loads(figure)]]
+    assert_equal(payloads[1], mpld3_js)
+    assert_equal(len(json.loads(payloads[2])['axes']), 1)
+
+    # the embedded library reads the encodings the renderer writes
+    for name in ["StyleArray", "decodeArray", "enable_lazy_drawing"]:
+        assert re.search(r"mpld3\.{0}\s*=".format(name), mpld3_js), name
+
+    assert_raises(ValueError, save_html, fig, io.StringIO(), compress=True)
+    plt.close(fig)
+
+
+def test_lazy():
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(10))
+    assert "enable_lazy_drawing" not in fig_to_html(fig)
+    for template_type in ["simple", "notebook", "general"]:
+        html = fig_to_html(fig, template_type=template_type, lazy=True)
+        assert "mpld3.enable_lazy_drawing({});" in html
+    html = fig_to_html(fig, lazy=dict(margin="100px",
+                                      teardown_margin="2000px"))
+    [options] = re.findall(r"mpld3.enable_lazy_drawing\((.*)\);", html)[:1]
+    assert_equal(json.loads(options),
+                 {"margin": "100px", "teardownMargin": "2000px"})
+    plt.close(fig)
@@ -0,0 +1,57 @@
+"""
+Test incremental export of figures
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal, assert_allclose
+from .. import fig_to_dict
+
+
+def line_data(rep, i):
+    element = rep['axes'][i]['lines'][0]
+    data = np.asarray(rep['data'][element['data']])
+    return data[:, [element['xindex'], element['yindex']]]
+
+
+def test_incremental_export():
+    fig, axes = plt.subplots(2, 3, sharey='row')
+    x = np.arange(10.)
+    lines = [ax.plot(x, (i + 1) * x)[0] for i, ax in enumerate(axes.flat)]
+    axes[1, 2].set_xlabel("x")
+
+    first = fig_to_dict(fig, incremental=True)
+
+    # without changes, every axes is reused
+    rep = fig_to_dict(fig, incremental=True)
+    for i in range(6):
+        assert rep['axes'][i] is first['axes'][i]
+
+    # only the changed axes, and those sharing its y axis, are exported
+    lines[4].set_ydata(-x)
+    rep = fig_to_dict(fig, incremental=True)
+    # for comparison, a full export (after which every axes counts as changed)
+    full = fig_to_dict(fig)
+    for i in range(6):
+        assert (rep['axes'][i] is first['axes'][i]) == (i < 3)
+        assert_equal(line_data(rep, i), line_data(full, i))
+        assert_allclose(rep['axes'][i]['ylim'], full['axes'][i]['ylim'])
+    assert_equal(sorted(rep['data']), sorted(first['data']))
+    assert_equal(rep['axes'][5]['texts'][0]['text'], "x")
+
+    # resizing the figure exports it again
+    fig.set_size_inches(8, 6)
+    resized = fig_to_dict(fig, incremental=True)
+    assert_equal(resized['width'], 800)
+    for i in range(6):
+        assert resized['axes'][i] is not rep['axes'][i]
+
+
+def test_new_axes():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    first = fig_to_dict(fig, incremental=True)
+    ax2 = fig.add_axes([0.6, 0.6, 0.2, 0.2])
+    ax2.scatter([0, 1], [1, 0])
+    rep = fig_to_dict(fig, incremental=True)
+    assert rep['axes'][0] is first['axes'][0]
+    assert_equal(len(rep['axes'][1]['collections']), 1)
@@ -1,7 +1,63 @@
 import os
+import re
+import shutil
+import tempfile
+
+from .. import utils
 from ..urls import MPLD3_LOCAL, MPLD3MIN_LOCAL, D3_LOCAL
+from ..utils import write_ipynb_local_js
 
 
 def test_js_libs_exist():
     for jsfile in [MPLD3_LOCAL, MPLD3MIN_LOCAL, D3_LOCAL]:
         assert os.path.exists(jsfile)
+
+
+def test_js_libs_in_sync():
+    # the minified library must be rebuilt whenever the library changes
+    pattern = re.compile(r"^(mpld3\.\w+) =", re.MULTILINE)
+    with open(MPLD3_LOCAL) as f:
+        members = set(pattern.findall(f.read()))
+    with open(MPLD3MIN_LOCAL) as f:
+        minified = f.read()
+    missing = [member for member in sorted(members)
+               if not re.search(re.escape(member) + r"\s*=", minified)]
+    assert not missing, missing
+
+
+def test_write_local_js():
+    src_dir, location = tempfile.mkdtemp(), tempfile.mkdtemp()
+    try:
+        d3_src = os.path.join(src_dir, "d3.js")
+        mpld3_src = os.path.join(src_dir, "mpld3.js")
+        shutil.copyfile(D3_LOCAL, d3_src)
+        shutil.copyfile(MPLD3_LOCAL, mpld3_src)
+
+        d3_url, mpld3_url = write_ipynb_local_js(location, d3_src, mpld3_src)
+        assert re.match(r"^/files/d3\.[0-9a-f]{10}\.js$", d3_url)
+        assert re.match(r"^/files/mpld3\.[0-9a-f]{10}\.js$", mpld3_url)
+        dest = os.path.join(location, os.path.basename(mpld3_url))
+        with open(dest, 'rb') as f, open(MPLD3_LOCAL, 'rb') as g:
+            assert f.read() == g.read()
+
+        # unchanged libraries are neither copied nor read again
+        os.utime(dest, (0, 0))
+        assert write_ipynb_local_js(location, d3_src,
+                                    mpld3_src) == (d3_url, mpld3_url)
+        assert os.path.getmtime(dest) == 0
+        utils.local_js_urls.clear()
+        assert write_ipynb_local_js(location, d3_src,
+                                    mpld3_src) == (d3_url, mpld3_url)
+        assert os.path.getmtime(dest) == 0
+
+        # a changed library is written to a new file
+        with open(mpld3_src, 'a') as f:
+            f.write("\n// changed\n")
+        new_d3_url, new_mpld3_url = write_ipynb_local_js(
+            location, d3_src, mpld3_src)
+        assert new_d3_url == d3_url
+        assert new_mpld3_url != mpld3_url
+        assert len(os.listdir(location)) == 3
+    finally:
+        shutil.rmtree(src_dir)
+        shutil.rmtree(location)
@@ -0,0 +1,93 @@
+"""
+Test plotting of chunked data sources
+"""
+import os
+import tempfile
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal, assert_raises
+from .. import fig_to_dict, lazy_line, lazy_scatter, ChunkedSource
+from .._lazy import m4_indices, reduce_line, reduce_points
+
+
+def test_chunked_source():
+    y = np.arange(10.) ** 2
+    source = ChunkedSource(y, chunk_size=4)
+    assert_equal(len(source), 10)
+    chunks = list(source.chunks())
+    assert_equal([start for start, x, y in chunks], [0, 4, 8])
+    assert_equal(chunks[2][1], [8, 9])
+    assert_equal(chunks[2][2], [64, 81])
+
+    xy = np.column_stack([y, -y])
+    x, y = ChunkedSource(xy).read(2, 4)
+    assert_equal(x, [4, 9])
+    assert_equal(y, [-4, -9])
+
+
+def test_chunked_source_lists():
+    source = ChunkedSource([1, 2, 3], [4, 5, 6], chunk_size=2)
+    assert_equal(len(source), 3)
+    assert_equal(source.read(1, 3), ([2, 3], [5, 6]))
+    assert_equal(ChunkedSource([(1, 4), (2, 5)]).read(0, 2), ([1, 2], [4, 5]))
+    assert_equal(ChunkedSource((7, 8, 9)).read(1, 3), ([1, 2], [8, 9]))
+    assert_raises(ValueError, ChunkedSource, [1, 2], [1, 2, 3])
+
+
+def test_m4_indices():
+    y = np.array([0, 5, 1, 2, 7, -3, 3, np.nan, 6, 1, 1])
+    # buckets [0, 5, 1], [2, 7, -3], [3, nan, 6], [1, 1]
+    assert_equal(m4_indices(y, 3), [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    y = np.array([3, 1, 1, 1, 2, 2, 0, 2, 2, 2])
+    assert_equal(m4_indices(y, 5), [0, 1, 4, 5, 6, 9])
+
+
+def test_reduce_line():
+    y = np.sin(np.linspace(0, 20, 100000))
+    y[500:520] = np.nan
+    x, yr = reduce_line(ChunkedSource(y, chunk_size=999), max_points=400)
+    assert len(x) <= 400
+    assert_equal(x[0], 0)
+    assert_equal(x[-1], len(y) - 1)
+    assert_equal(np.nanmin(yr), y[~np.isnan(y)].min())
+    assert_equal(np.nanmax(yr), y[~np.isnan(y)].max())
+    assert np.isnan(yr).any()
+
+    # small data are kept as they are
+    x, yr = reduce_line(ChunkedSource(y[:100], chunk_size=7))
+    assert_equal(yr, y[:100])
+
+
+def test_reduce_points():
+    rng = np.random.RandomState(0)
+    xy = rng.normal(size=(50000, 2))
+    x, y = reduce_points(ChunkedSource(xy, chunk_size=1000), bins=16)
+    assert len(x) <= 16 * 16
+    assert_equal(x.min(), xy[:, 0].min())
+    assert_equal(y.max(), xy[:, 1].max())
+
+
+def test_lazy_line_memmap():
+    filename = tempfile.mktemp()
+    try:
+        data = np.memmap(filename, dtype='float32', mode='w+',
+                         shape=(200000, 2))
+        data[:, 0] = np.arange(200000)
+        data[:, 1] = np.cos(data[:, 0] / 1000.)
+        data.flush()
+
+        fig, ax = plt.subplots()
+        line = lazy_line(ax, data, max_points=1000, color='red')
+        lazy_scatter(ax, (data[:, 0], -data[:, 1]), bins=32)
+        rep = fig_to_dict(fig)
+        del data, line
+    finally:
+        os.remove(filename)
+
+    axrep = rep['axes'][0]
+    line = axrep['lines'][0]
+    assert_equal(line['color'], "#FF0000")
+    assert len(rep['data'][line['data']]) <= 1000
+    points = axrep['collections'][0]
+    assert len(rep['data'][points['offsets']]) <= 32 * 32
@@ -0,0 +1,109 @@
+"""
+Test the notebook display of large figures
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+
+from .. import fig_to_dict
+from .._notebook import estimate_points, notebook_html, deferred_figures
+from ..utils import write_ipynb_local_data
+
+
+def test_estimate_points():
+    fig, ax = plt.subplots()
+    ax.plot(np.arange(100))
+    ax.scatter(np.arange(10), np.arange(10))
+    ax.imshow(np.zeros((20, 30)))
+    assert 100 + 10 + 600 <= estimate_points(fig) < 1000
+    plt.close(fig)
+
+
+def test_deferred_figure():
+    fig, ax = plt.subplots()
+    x = np.arange(5000.)
+    ax.plot(x, np.sin(x))
+
+    html = notebook_html(fig, max_points=10000, figid="fig1")
+    assert "mpld3.draw_figure" in html
+    assert "data:image/png" not in html
+
+    html = notebook_html(fig, max_points=1000, figid="fig1")
+    assert "data:image/png;base64," in html
+    assert "5000 points" in html
+    assert "google.colab.kernel.comms" in html
+    [name] = re.findall(r'\{figure: "([0-9a-f]+)"\}', html)
+
+    class Comm(object):
+        def send(self, data):
+            self.data = data
+
+        def close(self):
+            self.closed = True
+
+    comm = Comm()
+    deferred_figures.open(comm, {'content': {'data': {'figure': name}}})
+    assert comm.closed
+    figure = json.loads(comm.data['figure'])
+    [dataset] = figure['data'].values()
+    assert_equal(len(dataset), 5000)
+
+    # only registered figures are sent
+    comm = Comm()
+    deferred_figures.open(comm, {'content': {'data': {'figure': "other"}}})
+    assert 'figure' not in comm.data
+    assert "unknown figure" in comm.data['error']
+    plt.close(fig)
+
+
+def test_local_data():
+    location = tempfile.mkdtemp()
+    try:
+        x = np.arange(500.)
+        figures = []
+        for i in range(2):
+            fig, ax = plt.subplots()
+            ax.plot(x, np.cos(x))
+            ax.plot([0, 1], [1, 0])
+            figures.append(write_ipynb_local_data(fig_to_dict(fig),
+                                                  location))
+            plt.close(fig)
+
+        # identical data is written once, and small datasets stay inline
+        assert_equal(figures[0]['data'], figures[1]['data'])
+        [filename] = os.listdir(os.path.join(location, "mpld3_data"))
+        refs = [dataset for dataset in figures[0]['data'].values()
+                if isinstance(dataset, dict)]
+        assert_equal(len(refs), 1)
+        assert_equal(len(figures[0]['data']), 2)
+        [ref] = refs
+        assert_equal(ref['href'], "/files/mpld3_data/" + filename)
+        assert_equal(filename, ref['sha1'] + ".f64")
+        assert_equal(ref['shape'], [500, 2])
+        values = np.fromfile(os.path.join(location, "mpld3_data", filename),
+                             dtype='<f8').reshape(ref['shape'])
+        assert_equal(values, np.transpose([x, np.cos(x)]))
+    finally:
+        shutil.rmtree(location)
+
+
+def test_local_data_html():
+    cwd, location = os.getcwd(), tempfile.mkdtemp()
+    try:
+        os.chdir(location)
+        fig, ax = plt.subplots()
+        x = np.arange(500.)
+        ax.plot(x, np.sin(x))
+        html = notebook_html(fig, local_data=True)
+        assert "mpld3_data/" in html
+        assert str(np.sin(x[-1])) not in html
+        plt.close(fig)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(location)
@@ -0,0 +1,53 @@
+"""
+Test simplification of exported paths
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.transforms import IdentityTransform
+from numpy.testing import assert_equal
+from .. import fig_to_dict
+from .._simplify import douglas_peucker, simplify_paths
+
+
+def test_douglas_peucker():
+    x = np.linspace(0, 10, 11)
+    y = 0.1 * (-1) ** np.arange(11)
+    keep = douglas_peucker(np.column_stack([x, y]), 0.5)
+    assert_equal(np.flatnonzero(keep), [0, 10])
+
+    y = np.zeros(11)
+    y[5] = 2
+    keep = douglas_peucker(np.column_stack([x, y]), 0.5)
+    assert_equal(np.flatnonzero(keep), [0, 4, 5, 6, 10])
+
+
+def test_shared_boundary():
+    # two squares sharing a finely sampled, slightly wavy boundary
+    y = np.linspace(0, 10, 101)
+    x = 5 + 0.01 * np.sin(np.pi * y / 10)
+    boundary = np.column_stack([x, y])
+    left = np.vstack([[[0, 10], [0, 0]], boundary])
+    right = np.vstack([boundary[::-1], [[10, 0], [10, 10]]])
+    paths = [(left, ['M'] + ['L'] * 102 + ['Z']),
+             (right, ['M'] + ['L'] * 102 + ['Z'])]
+
+    (v1, c1), (v2, c2) = simplify_paths(paths, IdentityTransform(), 0.5)
+    assert_equal(len(v1), 4)
+    assert_equal(c1, ['M', 'L', 'L', 'L', 'Z'])
+    shared = set(map(tuple, v1)) & set(map(tuple, v2))
+    assert_equal(shared, {(5, 0), (5, 10)})
+
+
+def test_simplify_tolerance():
+    fig, ax = plt.subplots()
+    x, y = np.meshgrid(np.linspace(-3, 3, 200), np.linspace(-3, 3, 200))
+    ax.contourf(x, y, np.exp(-x ** 2 - y ** 2), 5)
+
+    def n_vertices(rep):
+        paths = rep['axes'][0]['collections'][0]['paths']
+        return sum(len(codes) for vertices, codes in paths)
+
+    full = n_vertices(fig_to_dict(fig))
+    simplified = n_vertices(fig_to_dict(fig, simplify_tolerance=0.5))
+    plt.close(fig)
+    assert simplified < full / 2
@@ -0,0 +1,113 @@
+"""
+Test figures built with mpld3.spec
+"""
+import io
+import base64
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.image import imread
+from numpy.testing import assert_equal, assert_allclose
+from .. import fig_to_dict, plugins, spec
+from ..utils import decode_array
+
+
+def test_schema():
+    # the spec of a simple chart has the keys of the exported matplotlib one
+    x = np.linspace(0, 10, 50)
+    fig, ax = plt.subplots()
+    ax.plot(x, np.sin(x))
+    ax.plot(x, np.cos(x), 'o')
+    ax.imshow(np.random.random((4, 4)), extent=(0, 1, 0, 1),
+              aspect="auto")
+    ax.set_xlabel("x")
+    expected = fig_to_dict(fig)
+
+    specfig = spec.Figure()
+    specax = specfig.add_axes(xlabel="x")
+    specax.line(x, np.sin(x))
+    specax.scatter(x, np.cos(x))
+    specax.image(np.random.random((4, 4)), extent=(0, 1, 0, 1))
+    rep = specfig.to_dict()
+
+    assert_equal(sorted(rep.keys()), sorted(expected.keys()))
+    axrep, expected = rep['axes'][0], expected['axes'][0]
+    assert_equal(sorted(axrep.keys()), sorted(expected.keys()))
+    assert_allclose(axrep['bbox'], expected['bbox'])
+    assert_equal(sorted(axrep['axes'][0].keys()),
+                 sorted(expected['axes'][0].keys()))
+    for key in ['lines', 'markers', 'images', 'texts']:
+        assert_equal(len(axrep[key]), 1)
+        assert_equal(sorted(axrep[key][0].keys()),
+                     sorted(expected[key][0].keys()))
+    assert_equal(axrep['lines'][0]['color'], expected['lines'][0]['color'])
+    assert_allclose(axrep['texts'][0]['position'],
+                    expected['texts'][0]['position'])
+
+
+def test_data():
+    x = np.arange(5.)
+    fig = spec.Figure()
+    ax = fig.add_axes()
+    line1 = ax.line(x, x ** 2)
+    line2 = ax.line(x, x ** 3)
+    points = ax.scatter(np.arange(3), np.arange(3))
+    rep = fig.to_dict()
+
+    # the x values are only sent once
+    assert_equal(sorted(rep['data'].keys()), ['data01', 'data02'])
+    assert_equal(rep['data']['data01'], np.column_stack([x, x ** 2, x ** 3]))
+    assert_equal([line1.props['yindex'], line2.props['yindex']], [1, 2])
+    assert_equal(points.props['data'], 'data02')
+
+    # matplotlib's default margins
+    assert_allclose(rep['axes'][0]['xlim'], [-0.2, 4.2])
+    assert_allclose(rep['axes'][0]['ylim'], [-3.2, 67.2])
+
+
+def test_log_scale():
+    fig = spec.Figure()
+    ax = fig.add_axes(yscale="log", xlim=(0, 1))
+    ax.line([0, 1], [1, 100])
+    axrep = fig.to_dict()['axes'][0]
+    assert_equal(axrep['xlim'], [0, 1])
+    assert_allclose(np.log10(axrep['ylim']), [-0.1, 2.1])
+    assert_equal(axrep['axes'][1]['scale'], "log")
+
+
+def test_scatter_collection():
+    fig = spec.Figure()
+    ax = fig.add_axes()
+    points = ax.scatter([1, 2, 3], [1, 2, 3], s=[4, 16, 16],
+                        color=["red", "blue", "red"])
+    assert_equal(points.kind, "collections")
+    props = points.props
+    assert_equal(props['facecolors']['palette'], ["red", "blue"])
+    assert_allclose(decode_array(props['pathtransforms']['scales']),
+                    np.array([2, 4, 4]) * 100. / 72)
+
+
+def test_image():
+    data = np.random.random((3, 5, 3))
+    fig = spec.Figure()
+    ax = fig.add_axes()
+    image = ax.image(data, origin="lower")
+    assert_equal(image.props['extent'], [0, 5, 0, 3])
+    png = imread(io.BytesIO(base64.b64decode(image.props['data'])))
+    assert_equal(png.shape, (3, 5, 4))
+    assert_allclose(png[..., :3], data[::-1], atol=1. / 255)
+
+
+def test_plugins():
+    fig = spec.Figure()
+    ax = fig.add_axes()
+    points = ax.scatter([1, 2], [3, 4])
+    fig.add_plugin(plugins.PointLabelTooltip(points, labels=["a", "b"]))
+    rep = fig.to_dict()
+    assert_equal([plugin['type'] for plugin in rep['plugins']],
+                 ['reset', 'zoom', 'boxzoom', 'tooltip'])
+    assert_equal(rep['plugins'][-1]['id'], points.id)
+    assert_equal(rep['axes'][0]['markers'][0]['id'], points.id)
+
+    html = fig.to_html(template_type="simple")
+    assert rep['axes'][0]['id'] in html
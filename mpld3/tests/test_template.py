@@ -0,0 +1,84 @@
+"""
+Test re-rendering of figure templates with new data
+"""
+import json
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal, assert_allclose
+from .. import fig_to_dict, Template
+
+
+def test_render_dict():
+    fig, ax = plt.subplots()
+    x = np.arange(10.)
+    line, = ax.plot(x, x ** 2, 'o-', label="squares")
+    ax.plot(x, -x, label="negatives")
+    points = ax.scatter(x, x)
+    ax.set_xlabel("x")
+    template = Template.from_figure(fig)
+
+    # without new data, the template renders the exported figure
+    rep = template.render_dict()
+    expected = fig_to_dict(fig)
+    assert_equal(rep['axes'][0]['xlim'], expected['axes'][0]['xlim'])
+    assert_equal(rep['data'], expected['data'])
+
+    new_x = np.linspace(0, 100, 5)
+    rep = template.render_dict({line: (new_x, new_x ** 2),
+                                "negatives": np.column_stack([x, x]),
+                                points: (x, 2 * x)})
+    axrep = rep['axes'][0]
+    for element in [axrep['lines'][0], axrep['markers'][0]]:
+        data = np.asarray(rep['data'][element['data']])
+        assert_equal(data[:, element['xindex']], new_x)
+        assert_equal(data[:, element['yindex']], new_x ** 2)
+    element = axrep['collections'][0]
+    data = np.asarray(rep['data'][element['offsets']])
+    assert_equal(data[:, element['yindex']], 2 * x)
+
+    # the original dataset is no longer referenced
+    assert_equal(len(rep['data']), 3)
+
+    # autoscaled limits follow the data, with matplotlib's margins
+    assert_allclose(axrep['xlim'], [-5, 105])
+    assert_allclose(axrep['ylim'], [-500, 10500])
+    assert_equal(axrep['xdomain'], axrep['xlim'])
+
+    # the template itself is unchanged
+    assert_equal(template.render_dict(), template.figure_dict)
+    assert_equal(template.figure_dict['data'], expected['data'])
+
+
+def test_fixed_limits():
+    fig, ax = plt.subplots()
+    line, = ax.plot([0, 1], [0, 1])
+    ax.set_xlim(0, 2)
+    ax.set_ylim(5, -5)
+    template = Template.from_figure(fig)
+    axrep = template.render_dict({line: ([0, 10], [0, 10])})['axes'][0]
+    assert_equal(axrep['xlim'], [0, 2])
+    assert_equal(axrep['ylim'], [5, -5])
+
+
+def test_render():
+    fig, ax = plt.subplots()
+    line, = ax.plot([0, 1], [0, 1])
+    template = Template.from_figure(fig)
+    html = template.render({line: ([0, 1, 2], [3, 4, 5])},
+                           template_type="simple", figid="fig1")
+    assert '"fig1"' in html
+    rep = json.loads(template.render_json({line: ([0, 1, 2], [3, 4, 5])}))
+    assert_equal(list(rep['data'].values()), [[[0, 3], [1, 4], [2, 5]]])
+
+
+def test_unknown_key():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    template = Template.from_figure(fig)
+    try:
+        template.render_dict({"missing": ([0], [0])})
+    except ValueError:
+        pass
+    else:
+        assert False, "expected a ValueError"
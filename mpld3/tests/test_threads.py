@@ -0,0 +1,80 @@
+"""
+Test concurrent export of figures from several threads
+"""
+import threading
+
+import numpy as np
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import fig_to_dict, fig_to_html, plugins
+from ..utils import get_id
+
+
+def run_threads(target, n_threads):
+    errors = []
+
+    def run(i):
+        try:
+            target(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,))
+               for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def test_concurrent_ids():
+    class Object(object):
+        pass
+
+    objects = [Object() for i in range(500)]
+    ids = [None] * 8
+
+    def target(i):
+        ids[i] = [get_id(obj) for obj in objects[::(-1) ** i]][::(-1) ** i]
+
+    run_threads(target, 8)
+    for i in range(1, 8):
+        assert_equal(ids[i], ids[0])
+    assert_equal(len(set(ids[0])), len(objects))
+
+
+def test_concurrent_plugins():
+    fig, ax = plt.subplots()
+    labels = [plugins.MousePosition(fmt=str(i)) for i in range(8)]
+    run_threads(lambda i: plugins.connect(fig, labels[i]), 8)
+    connected = plugins.get_plugins(fig)
+    assert_equal(len(connected), len(plugins.DEFAULT_PLUGINS) + 8)
+    assert all(label in connected for label in labels)
+
+
+def test_concurrent_export():
+    figures = []
+    for i in range(4):
+        fig, axes = plt.subplots(1, 2)
+        for j, ax in enumerate(axes.flat):
+            x = np.linspace(0, 10, 100 * (i + 1))
+            ax.plot(x, np.sin(x + j), label="line")
+            ax.scatter(x[::5], np.cos(x[::5]), c=x[::5])
+            ax.set_title("figure {0} axes {1}".format(i, j))
+        figures.append(fig)
+    expected = [fig_to_dict(fig) for fig in figures]
+
+    results = [None] * 8
+
+    def target(i):
+        fig = figures[i % 4]
+        for repeat in range(2):
+            results[i] = fig_to_dict(fig)
+            html = fig_to_html(fig, incremental=i % 2 == 1)
+            assert get_id(fig) in html
+
+    run_threads(target, 8)
+    for i, rep in enumerate(results):
+        assert_equal(rep, expected[i % 4])
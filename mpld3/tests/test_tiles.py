@@ -0,0 +1,105 @@
+"""
+Test export of large images as tile pyramids
+"""
+import os
+import io
+import base64
+import shutil
+import tempfile
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.image import imread
+from numpy.testing import assert_equal, assert_allclose
+from .. import fig_to_dict
+from .._tiles import block_mean, n_levels, build_tiles
+
+
+def test_block_mean():
+    rgba = np.zeros((3, 3, 4))
+    rgba[..., 0] = 1
+    rgba[..., 3] = 1
+    rgba[0, 0] = [0, 0, 1, 0]
+    result = block_mean(rgba)
+    assert_equal(result.shape, (2, 2, 4))
+
+    # the transparent pixel doesn't contribute its color
+    assert_allclose(result[0, 0], [1, 0, 0, 0.75])
+    # partial blocks at the edges are averaged over their pixels
+    assert_allclose(result[1, 1], [1, 0, 0, 1])
+
+
+def test_build_tiles():
+    shape = (100, 300)
+    assert_equal(n_levels(shape, 64), 4)
+    assert_equal(n_levels(shape, 300), 1)
+
+    chunks = []
+
+    def rgba_chunk(rows, cols):
+        chunks.append((rows, cols))
+        return np.zeros(shape + (4,), dtype=np.uint8)[rows, cols]
+
+    tiles = {}
+
+    def emit(level, row, col, rgba):
+        tiles[level, row, col] = rgba.shape
+
+    build_tiles(rgba_chunk, shape, 64, emit)
+    assert_equal(len(chunks), 2 * 5)
+    assert_equal(sorted(k for k in tiles if k[0] == 0),
+                 [(0, i, j) for i in range(2) for j in range(5)])
+    assert_equal(tiles[0, 1, 4], (36, 44, 4))
+    assert_equal(tiles[1, 0, 2], (50, 22, 4))
+    assert_equal(tiles[3, 0, 0], (13, 38, 4))
+
+
+def test_tiled_image():
+    fig, ax = plt.subplots()
+    data = np.random.random((100, 300))
+    ax.imshow(data, alpha=0.5, zorder=4, extent=(0, 3, 0, 1),
+              origin='lower')
+    rep = fig_to_dict(fig, image_tile_size=64)
+    axrep = rep['axes'][0]
+    assert_equal(axrep['images'], [])
+    image = axrep['tiledimages'][0]
+
+    assert_equal(list(sorted(image.keys())),
+                 ['alpha', 'coordinates', 'extent', 'id', 'shape',
+                  'tiles', 'tilesize', 'zorder'])
+    assert_equal(image['shape'], [100, 300])
+    assert_equal(image['extent'], [0, 3, 0, 1])
+    assert_equal(image['alpha'], 0.5)
+    assert_equal([len(level) for level in image['tiles']], [10, 3, 2, 1])
+
+    # tiles are stored top row first
+    tile = imread(io.BytesIO(base64.b64decode(image['tiles'][0][0])))
+    assert_equal(tile.shape, (64, 64, 4))
+    assert_allclose(tile[..., :3],
+                    plt.cm.viridis(data[:-65:-1, :64])[..., :3], atol=0.02)
+
+
+def test_tile_dir():
+    tile_dir = tempfile.mkdtemp()
+    try:
+        fig, ax = plt.subplots()
+        ax.imshow(np.random.random((100, 300)))
+        rep = fig_to_dict(fig, image_tile_size=64, image_tile_dir=tile_dir)
+        image = rep['axes'][0]['tiledimages'][0]
+        assert 'tiles' not in image
+
+        for level, row, col in [(0, 1, 4), (1, 0, 2), (3, 0, 0)]:
+            url = image['url'].format(level=level, row=row, col=col)
+            assert os.path.exists(url)
+        assert_equal(len(os.listdir(os.path.join(tile_dir, image['id']))), 4)
+    finally:
+        shutil.rmtree(tile_dir)
+
+
+def test_small_image():
+    fig, ax = plt.subplots()
+    ax.imshow(np.random.random((20, 20)))
+    rep = fig_to_dict(fig, image_tile_size=64)
+    axrep = rep['axes'][0]
+    assert_equal(len(axrep['images']), 1)
+    assert_equal(axrep['tiledimages'], [])
@@ -0,0 +1,76 @@
+"""
+Test the pool of export workers
+"""
+import base64
+import io
+import json
+import pickle
+import socket
+import threading
+
+import matplotlib.pyplot as plt
+from numpy.testing import assert_equal
+from .. import fig_to_dict
+from ..worker import WorkerPool, serve_stream, serve_socket
+
+
+def test_worker_pool():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1, 2], [2, 0, 1])
+    figure_pickle = base64.b64encode(pickle.dumps(fig)).decode()
+    requests = [
+        {"id": 1, "pickle": figure_pickle},
+        {"id": 2, "pickle": figure_pickle, "format": "json"},
+        {"id": 3, "spec": {"width": 300, "axes": [
+            {"xlabel": "t", "elements": [
+                {"type": "line", "x": [0, 1], "y": [1, 0]},
+                {"type": "scatter", "x": [0, 1], "y": [0, 1]}]},
+            {"sharex": 0}]}, "format": "json"},
+        {"id": 4, "spec": {"axes": [{"elements": [{"type": "plot"}]}]}},
+        {"id": 5},
+    ]
+    infile = io.BytesIO(b"".join(json.dumps(request).encode() + b"\n"
+                                 for request in requests) +
+                        b"not json\n" + b'{"id": 6, "stats": true}\n')
+    outfile = io.BytesIO()
+
+    pool = WorkerPool(workers=1)
+    try:
+        serve_stream(pool, infile, outfile)
+        responses = dict((response['id'], response) for response in
+                         map(json.loads, outfile.getvalue().splitlines()))
+
+        assert "mpld3.draw_figure" in responses[1]['result']
+        assert_equal(json.loads(responses[2]['result'])['data'],
+                     fig_to_dict(fig)['data'])
+        figure = json.loads(responses[3]['result'])
+        assert_equal(figure['width'], 300)
+        assert_equal([len(ax['sharex']) for ax in figure['axes']], [1, 1])
+        assert "Unknown spec element 'plot'" in responses[4]['error']
+        assert "'pickle', 'path' or 'spec'" in responses[5]['error']
+        assert "error" in responses[None]
+        assert responses[6]['stats']['queue_depth'] >= 0
+
+        stats = pool.stats()
+        assert_equal((stats['queue_depth'], stats['completed'],
+                      stats['failed']), (0, 3, 2))
+        assert_equal(stats['total_ms']['count'], 3)
+        for response in [responses[1], responses[2], responses[3]]:
+            assert response['export_ms'] >= 0
+            assert response['wait_ms'] >= 0
+
+        server = serve_socket(pool, port=0)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            client = socket.create_connection(server.server_address)
+            client.sendall(json.dumps(requests[0]).encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            response = json.loads(client.makefile('rb').readline().decode())
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert "mpld3.draw_figure" in response['result']
+    finally:
+        pool.shutdown()
@@ -9,19 +9,38 @@ from functools import wraps
 from os import path
 from uuid import uuid4
 from weakref import ref
+import base64
 import csv
+import hashlib
 import inspect
 import os
 import re
 import shutil
+import tempfile
+import threading
 import warnings
 
 import numpy as np
+from matplotlib.colors import to_rgba_array
 
 # Make sure that DeprecationWarning gets printed
 warnings.filterwarnings('always', category=DeprecationWarning, module='mpld3')
 
 uuid_cache = {}
+# guards uuid_cache, which exports running in several threads update
+uuid_lock = threading.RLock()
+
+# numpy dtypes which have a javascript typed array equivalent
+TYPED_ARRAY_DTYPES = ["int8", "uint8", "int16", "uint16", "int32", "uint32",
+                      "float32", "float64"]
+
+# paths with at least this many vertices are sent as typed arrays; shorter
+# ones (e.g. marker outlines) are more compact as plain lists.
+TYPED_PATH_MIN_VERTICES = 16
+
+# datasets smaller than this stay in figures written by
+# write_ipynb_local_data, as a reference to a file would save little
+LOCAL_DATA_MIN_BYTES = 1024
 
 
 def html_id_ok(objid, html5=False):
@@ -43,15 +62,17 @@ def get_id(obj, suffix="", prefix="el", warn_on_invalid=True):
         prefix = ""
 
     obj_py_id = id(obj)
-    entry = uuid_cache.get(obj_py_id, None)
-    if entry is None or entry['ref']() is not obj:
-        # The weakref allows obj to be garbage collected as needed.
-        # `pop()` should prune the dictionary as objects are garbage collected.
-        obj_ref = ref(obj, lambda _: uuid_cache.pop(obj_py_id, None))
-        obj_uuid = uuid4()
-        uuid_cache[obj_py_id] = {'ref': obj_ref, 'uuid': obj_uuid}
-
-    obj_id = prefix + str(os.getpid()) + str(uuid_cache[obj_py_id]['uuid']) + suffix
+    with uuid_lock:
+        entry = uuid_cache.get(obj_py_id, None)
+        if entry is None or entry['ref']() is not obj:
+            # The weakref allows obj to be garbage collected as needed, and
+            # its callback prunes the dictionary when it is.
+            obj_uuid = uuid4()
+            obj_ref = ref(obj, lambda _: forget_id(obj_py_id, obj_uuid))
+            entry = uuid_cache[obj_py_id] = {'ref': obj_ref,
+                                             'uuid': obj_uuid}
+
+    obj_id = prefix + str(os.getpid()) + str(entry['uuid']) + suffix
 
     if warn_on_invalid and not html_id_ok(obj_id):
         warnings.warn('"{0}" is not a valid html ID. This may cause problems')
@@ -59,6 +80,241 @@ def get_id(obj, suffix="", prefix="el", warn_on_invalid=True):
     return obj_id
 
 
+def forget_id(obj_py_id, obj_uuid):
+    """Remove the id of a garbage collected object from the cache"""
+    with uuid_lock:
+        entry = uuid_cache.get(obj_py_id, None)
+        # the python id may have been reused by an object since
+        if entry is not None and entry['uuid'] == obj_uuid:
+            del uuid_cache[obj_py_id]
+
+
+def encode_array(arr, dtype=None):
+    """Encode an array as a base64 string of its little-endian bytes.
+
+    mpld3.js decodes the result into the matching typed array (see
+    ``mpld3.decodeArray``), which is far more compact than a JSON list for
+    large numerical arrays.
+
+    Parameters
+    ----------
+    arr : array_like
+        The array to encode.
+    dtype : numpy dtype (optional)
+        If specified, convert the array to this type before encoding.
+
+    Returns
+    -------
+    arrdict : dictionary
+        arrdict has the keys "dtype", "shape" and "base64".
+    """
+    arr = np.asarray(arr, dtype=dtype)
+    if arr.dtype.name not in TYPED_ARRAY_DTYPES:
+        raise ValueError("cannot encode array of type "
+                         "'{0}'".format(arr.dtype.name))
+    arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder('<'))
+    return {"dtype": arr.dtype.name,
+            "shape": list(arr.shape),
+            "base64": base64.b64encode(arr.tobytes()).decode('ascii')}
+
+
+def decode_array(arrdict):
+    """Decode an array encoded with :func:`encode_array`"""
+    dtype = np.dtype(arrdict["dtype"]).newbyteorder('<')
+    arr = np.frombuffer(base64.b64decode(arrdict["base64"]), dtype=dtype)
+    return arr.reshape(arrdict["shape"])
+
+
+def index_dtype(n):
+    """Smallest unsigned integer type able to index n items"""
+    for dtype in (np.uint8, np.uint16):
+        if n <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint32
+
+
+def unique_in_order(values, axis=None):
+    """Like ``np.unique(values, return_inverse=True)``, but with the unique
+    values ordered by their first appearance rather than sorted, so that
+    ``unique[inverse[0]] == unique[0]``."""
+    unique, first, inverse = np.unique(values, axis=axis, return_index=True,
+                                       return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return unique[order], rank[inverse.ravel()]
+
+
+def export_colors(colors):
+    """Vectorized version of ``mplexporter.utils.export_color``
+
+    Each distinct color is converted only once, which makes this suitable
+    for collections with very many elements.
+
+    Parameters
+    ----------
+    colors : array_like
+        A sequence of matplotlib colors, typically a shape [N, 4] RGBA array.
+
+    Returns
+    -------
+    palette : list of strings
+        The distinct exported colors, in order of first appearance.
+    index : ndarray
+        For each input color, the index of its exported color in palette.
+    """
+    rgba = to_rgba_array(colors)
+    if len(rgba) == 0:
+        return [], np.zeros(0, dtype=int)
+    unique, inverse = unique_in_order(rgba, axis=0)
+
+    exported = []
+    for r, g, b, a in unique:
+        if a == 0:
+            exported.append('none')
+        elif a == 1:
+            exported.append('#{0:02X}{1:02X}{2:02X}'.format(
+                int(255 * r), int(255 * g), int(255 * b)))
+        else:
+            exported.append('rgba({0}, {1}, {2}, {3})'.format(
+                int(np.round(r * 255)), int(np.round(g * 255)),
+                int(np.round(b * 255)), float(a)))
+
+    # Distinct RGBA values can map to the same string (e.g. any fully
+    # transparent color is exported as 'none'), so deduplicate once more.
+    palette, remap = unique_in_order(exported)
+    return palette.tolist(), remap[inverse]
+
+
+def encode_style(values):
+    """Encode an array of per-element style values for mpld3.js
+
+    Parameters
+    ----------
+    values : array_like
+        The per-element values (e.g. line widths).  As with all mpld3
+        collection styles, element i uses ``values[i % len(values)]``.
+
+    Returns
+    -------
+    style : list or dictionary
+        See :func:`encode_palette`.
+    """
+    values = np.asarray(values)
+    if len(values) == 0:
+        return []
+    palette, index = unique_in_order(values)
+    return encode_palette(palette.tolist(), index)
+
+
+def encode_palette(palette, index):
+    """Encode per-element style values given as a palette and an index
+
+    Parameters
+    ----------
+    palette : list
+        The distinct style values.
+    index : array_like
+        For each element, the index of its value in palette.
+
+    Returns
+    -------
+    style : list or dictionary
+        If all values are identical, or all distinct, this is the plain list
+        of values.  Otherwise it is a dictionary with the keys "palette" and
+        "index", where "index" is an array encoded with :func:`encode_array`.
+        When values come in long runs, "index" holds the palette index of each
+        run and an additional key "runs" holds the run lengths.
+    """
+    index = np.asarray(index)
+    if len(palette) <= 1:
+        return list(palette)
+    if len(palette) == len(index):
+        return [palette[i] for i in index]
+
+    index = index.astype(index_dtype(len(palette)))
+    run_starts = np.concatenate([[0], np.flatnonzero(np.diff(index)) + 1])
+    if 2 * len(run_starts) <= len(index):
+        runs = np.diff(np.append(run_starts, len(index)))
+        return {"palette": palette,
+                "index": encode_array(index[run_starts]),
+                "runs": encode_array(runs, dtype=np.uint32)}
+    return {"palette": palette,
+            "index": encode_array(index)}
+
+
+def encode_paths(paths):
+    """Encode the paths of a collection for mpld3.js
+
+    Identical paths are only sent once: the result is a table of distinct
+    paths, referenced by index as described in :func:`encode_palette`.
+
+    Parameters
+    ----------
+    paths : list
+        A list of (vertices, pathcodes) tuples.
+
+    Returns
+    -------
+    paths : list or dictionary
+        The encoded paths.  Vertices of long paths are encoded with
+        :func:`encode_array`.
+    """
+    table = []
+    index = []
+    lookup = {}
+    for vertices, pathcodes in paths:
+        vertices = np.asarray(vertices, dtype=float)
+        key = (vertices.shape, vertices.tobytes(), tuple(pathcodes))
+        i = lookup.get(key)
+        if i is None:
+            i = lookup[key] = len(table)
+            if len(vertices) >= TYPED_PATH_MIN_VERTICES:
+                table.append((encode_array(vertices), list(pathcodes)))
+            else:
+                table.append((vertices.tolist(), list(pathcodes)))
+        index.append(i)
+    return encode_palette(table, index)
+
+
+def encode_transforms(transforms):
+    """Encode the path transforms of a collection for mpld3.js
+
+    Parameters
+    ----------
+    transforms : list
+        A list of shape [3, 3] affine transformation matrices.
+
+    Returns
+    -------
+    transforms : list or dictionary
+        A list of 6-element matrices: if all transforms are identical, only
+        one of them.  If they differ only by a scale factor (e.g. scatter
+        plots with varying marker sizes) this is a dictionary with the keys
+        "matrix", a shared 6-element matrix, and "scales", an encoded array
+        of per-element factors applied to its linear part.
+    """
+    if len(transforms) == 0:
+        return []
+    T = np.asarray(transforms, dtype=float)
+    M = np.hstack([T[:, 0, :2], T[:, 1, :2], T[:, 2, :2]])
+    if np.all(M == M[0]):
+        return [M[0].tolist()]
+
+    linear, translation = M[:, :4], M[:, 4:]
+    norms = np.sqrt((linear ** 2).sum(1))
+    ref = linear[np.argmax(norms)]
+    if np.all(translation == translation[0]) and norms.max() > 0:
+        # normalize so that isotropic transforms give the identity matrix
+        det = abs(ref[0] * ref[3] - ref[1] * ref[2])
+        base = ref / (np.sqrt(det) if det > 0 else abs(ref).max())
+        scales = linear.dot(base) / base.dot(base)
+        if np.allclose(linear, scales[:, None] * base, rtol=1E-10, atol=0):
+            return {"matrix": base.tolist() + translation[0].tolist(),
+                    "scales": encode_array(scales)}
+    return M.tolist()
+
+
 def deprecated(func, old_name, new_name):
     """Decorator to mark functions as deprecated."""
     @wraps(func)
@@ -72,12 +328,73 @@ def deprecated(func, old_name, new_name):
     return new_func
 
 
+def file_digest(filename):
+    """The SHA-1 hex digest of the contents of a file"""
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(2 ** 16), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def copy_if_changed(src, dest, digest):
+    """Copy src to dest, unless dest already holds the contents of src
+
+    Returns whether the file was copied.
+    """
+    if (os.path.exists(dest) and
+            os.path.getsize(dest) == os.path.getsize(src) and
+            file_digest(dest) == digest):
+        return False
+    try:
+        shutil.copyfile(src, dest)
+    except IOError:
+        # file may be read only. We'll try deleting it first
+        if os.path.exists(dest):
+            os.remove(dest)
+        shutil.copyfile(src, dest)
+    return True
+
+
+def ipynb_local_location(location=None):
+    """The directory in which to write files for the notebook, and its URL
+
+    If location is not specified, the IPython nbextensions directory is
+    used, or the current working directory if IPython doesn't support
+    nbextensions (< 2.0).
+    """
+    if location is not None:
+        return location, '/files/'
+    try:
+        # only checks that IPython supports nbextensions
+        from IPython.html import install_nbextension
+    except ImportError:
+        # IPython < 2.0, or no nbextensions.
+        # This won't work if users have changed the kernel directory.
+        return os.getcwd(), '/files/'
+    # IPython 2.0+.
+    # This will not work if a url prefix is added
+    from IPython.utils.path import get_ipython_dir
+    return os.path.join(get_ipython_dir(), "nbextensions"), '/nbextensions/'
+
+
+# the URLs returned by write_ipynb_local_js, by its arguments, along with the
+# state of the source files and the files written, so that notebooks
+# displaying many figures don't copy or read the libraries for each
+local_js_urls = {}
+local_js_lock = threading.Lock()
+
+
 def write_ipynb_local_js(location=None, d3_src=None, mpld3_src=None):
     """
     Write the mpld3 and d3 javascript libraries to the given file location.
 
     This utility is used by the IPython notebook tools to enable easy use
-    of mpld3 with no web connection.
+    of mpld3 with no web connection.  The libraries are written to file
+    names holding a hash of their contents, e.g. ``d3.v5.min.1a2b3c4d5e.js``,
+    so that browsers may cache them indefinitely, and only copied when no
+    file with their contents exists.  Later calls with the same sources
+    return the same URLs without copying or reading the libraries again.
 
     Parameters
     ----------
@@ -98,76 +415,104 @@ def write_ipynb_local_js(location=None, d3_src=None, mpld3_src=None):
     d3_url, mpld3_url : string
         The URLs to be used for loading these js files.
     """
-    if location is None:
-        try:
-            from IPython.html import install_nbextension
-        except ImportError:
-            location = os.getcwd()
-            nbextension = False
-        else:
-            nbextension = True
-    else:
-        nbextension = False
+    key = (location, d3_src, mpld3_src)
+    location, prefix = ipynb_local_location(location)
 
     if d3_src is None:
         d3_src = urls.D3_LOCAL
     if mpld3_src is None:
         mpld3_src = urls.MPLD3_LOCAL
 
-    d3js = os.path.basename(d3_src)
-    mpld3js = os.path.basename(mpld3_src)
-
     if not os.path.exists(d3_src):
         raise ValueError("d3 src not found at '{0}'".format(d3_src))
     if not os.path.exists(mpld3_src):
         raise ValueError("mpld3 src not found at '{0}'".format(mpld3_src))
 
-    if nbextension:
-        # IPython 2.0+.
-        # This will not work if a url prefix is added
-        prefix = '/nbextensions/'
-
-        def _install_nbextension(extensions):
-            """Wrapper for IPython.html.install_nbextension."""
-            import IPython
-            if IPython.version_info[0] >= 3:
-                for extension in extensions:
-                    install_nbextension(extension)
-            else:
-                install_nbextension(extensions)
-
-        try:
-            _install_nbextension([d3_src, mpld3_src])
-        except IOError:
-            # files may be read only. We'll try deleting them and re-installing
-            from IPython.utils.path import get_ipython_dir
-            nbext = os.path.join(get_ipython_dir(), "nbextensions")
-
-            for src in [d3_src, mpld3_src]:
-                dest = os.path.join(nbext, os.path.basename(src))
-                if os.path.exists(dest):
-                    os.remove(dest)
-            _install_nbextension([d3_src, mpld3_src])
-
-    else:
-        # IPython < 2.0 or explicit path.
-        # This won't work if users have changed the kernel directory.
-        prefix = '/files/'
-
-        d3_dest = os.path.join(location, d3js)
-        mpld3_dest = os.path.join(location, mpld3js)
+    sources = [(src, os.path.getmtime(src), os.path.getsize(src))
+               for src in [d3_src, mpld3_src]]
+    with local_js_lock:
+        entry = local_js_urls.get(key)
+        if (entry is not None and entry['location'] == location and
+                entry['sources'] == sources and
+                all(os.path.exists(dest) for dest in entry['dests'])):
+            return entry['urls']
+
+        if not os.path.exists(location):
+            os.makedirs(location)
+        dests = []
+        for src in [d3_src, mpld3_src]:
+            digest = file_digest(src)
+            name = os.path.basename(src)
+            if name.endswith('.js'):
+                name = name[:-3]
+            dest = os.path.join(location,
+                                "{0}.{1}.js".format(name, digest[:10]))
+            copy_if_changed(src, dest, digest)
+            dests.append(dest)
+
+        d3_url, mpld3_url = [prefix + os.path.basename(dest)
+                             for dest in dests]
+        local_js_urls[key] = {'location': location, 'sources': sources,
+                              'dests': dests, 'urls': (d3_url, mpld3_url)}
+    return d3_url, mpld3_url
+
+
+def write_ipynb_local_data(figure_dict, location=None):
+    """
+    Write the datasets of a figure to files named by their content.
 
-        for src, dest in [(d3_src, d3_dest), (mpld3_src, mpld3_dest)]:
-            try:
-                shutil.copyfile(src, dest)
-            except IOError:
-                # file may be read only. We'll try deleting it first
-                if os.path.exists(dest):
-                    os.remove(dest)
-                shutil.copyfile(src, dest)
+    This keeps the data of figures displayed in the notebook out of the
+    notebook file: datasets are written to ``mpld3_data/<sha1>.f64`` below
+    the location, as the little-endian float64 bytes of their [N, M]
+    array, and referenced from the figure by URL, hash and shape.
+    Identical datasets, e.g. of a cell run again, are written once, and
+    fetched once by the browser.  Datasets of fewer than
+    ``LOCAL_DATA_MIN_BYTES`` bytes, or which aren't numeric, stay in the
+    figure.
 
+    Parameters
+    ----------
+    figure_dict : dict
+        The dictionary representation of the figure, from fig_to_dict.
+    location : string (optional)
+        The directory below which to write the datasets, as for
+        :func:`write_ipynb_local_js`.
 
-    return prefix + d3js, prefix + mpld3js
+    Returns
+    -------
+    figure_dict : dict
+        A copy of the figure dictionary, referencing the datasets written.
+    """
+    location, prefix = ipynb_local_location(location)
+    data_dir = os.path.join(location, "mpld3_data")
+    data = {}
+    for label, dataset in figure_dict['data'].items():
+        try:
+            array = np.asarray(dataset)
+        except ValueError:
+            # ragged rows
+            array = np.asarray(None)
+        # missing values (None) make object arrays, and stay in the figure
+        if (array.dtype.kind not in 'biuf' or array.ndim != 2 or
+                array.size * 8 < LOCAL_DATA_MIN_BYTES):
+            data[label] = dataset
+            continue
+
+        body = np.ascontiguousarray(array, dtype='<f8').tobytes()
+        digest = hashlib.sha1(body).hexdigest()
+        filename = os.path.join(data_dir, digest + ".f64")
+        if not os.path.exists(filename):
+            if not os.path.exists(data_dir):
+                os.makedirs(data_dir)
+            # written whole under a temporary name, so that other kernels
+            # never see a partial file
+            handle, partial = tempfile.mkstemp(suffix=".part", dir=data_dir)
+            with os.fdopen(handle, 'wb') as f:
+                f.write(body)
+            getattr(os, 'replace', os.rename)(partial, filename)
+        data[label] = {"href": prefix + "mpld3_data/" + digest + ".f64",
+                       "sha1": digest, "shape": list(array.shape)}
+    return dict(figure_dict, data=data)
 
 
 def load_test_dataset(dataset):
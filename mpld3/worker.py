@@ -0,0 +1,318 @@
+"""
+Export workers
+==============
+
+A long-running pool of warm export processes, so that batch jobs pay for
+importing matplotlib and mpld3, compiling the templates and loading the
+font cache once, rather than for every figure::
+
+    python -m mpld3.worker                  # requests on stdin
+    python -m mpld3.worker --port 8890      # requests on a local socket
+
+Requests and responses are JSON objects, one per line.  Each request names
+its figure in one of these ways:
+
+- ``{"id": 1, "pickle": "<base64 pickled matplotlib figure>"}``
+- ``{"id": 2, "path": "/tmp/figure.pkl"}``, a pickle file
+- ``{"id": 3, "spec": {"width": 640, "height": 480, "axes": [{"xlabel": "t",
+  "elements": [{"type": "line", "x": [0, 1], "y": [1, 0]}]}]}}``, the
+  arguments of a :class:`mpld3.spec.Figure`, its axes and their elements.
+
+``"format"`` may be ``"html"`` (the default) or ``"json"``, and
+``"options"`` holds keyword arguments of :func:`mpld3.fig_to_html` or
+:func:`mpld3.fig_to_dict`.  Responses, written as exports complete, are
+``{"id": 1, "result": "...", "wait_ms": 0.1, "export_ms": 12.3}``, or
+``{"id": 1, "error": "<traceback>"}``.  ``{"id": 4, "stats": true}`` is
+answered at once with the queue depth and latency percentiles.
+
+As unpickling runs arbitrary code, the socket only accepts connections from
+the local machine.  This module requires Python 3.
+"""
+import argparse
+import base64
+import collections
+import json
+import os
+import pickle
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+__all__ = ["WorkerPool", "serve_stream", "serve_socket"]
+
+# the spec axes methods which may be requested
+SPEC_ELEMENTS = ["line", "scatter", "image", "text"]
+
+
+def init_worker():
+    """Import and warm up everything an export needs, once per process"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from . import fig_to_html
+
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [1, 0], 'o-', label="line")
+    ax.set_title("title")
+    ax.legend()
+    fig_to_html(fig)
+    plt.close(fig)
+    spec_figure({"axes": [{"elements": [
+        {"type": "line", "x": [0, 1], "y": [1, 0]}]}]}).to_html()
+
+
+def spec_figure(request):
+    """Build a :class:`mpld3.spec.Figure` from its JSON description
+
+    The description holds the arguments of the figure, and a list of axes
+    holding the arguments of :meth:`~mpld3.spec.Figure.add_axes`, with
+    sharex and sharey given as the indices of earlier axes, and a list of
+    elements holding the name of an axes method as ``"type"``, and its
+    arguments.
+    """
+    from . import spec
+
+    request = dict(request)
+    axes = request.pop('axes', [])
+    fig = spec.Figure(**request)
+    for kwargs in axes:
+        kwargs = dict(kwargs)
+        elements = kwargs.pop('elements', [])
+        for share in ['sharex', 'sharey']:
+            if kwargs.get(share) is not None:
+                kwargs[share] = fig.axes[kwargs[share]]
+        ax = fig.add_axes(**kwargs)
+        for element in elements:
+            element = dict(element)
+            kind = element.pop('type')
+            if kind not in SPEC_ELEMENTS:
+                raise ValueError("Unknown spec element {0!r}: expected one "
+                                 "of {1}".format(kind, SPEC_ELEMENTS))
+            if kind == 'image':
+                element['image'] = np.asarray(element['image'])
+            getattr(ax, kind)(**element)
+    return fig
+
+
+def export_request(request):
+    """Export the figure of a request, in a worker process
+
+    Returns
+    -------
+    result, seconds : string, float
+        The HTML or JSON of the figure, and the time taken to export it.
+    """
+    import matplotlib.pyplot as plt
+    from . import fig_to_html, fig_to_dict
+    from ._display import NumpyEncoder
+
+    start = time.perf_counter()
+    options = request.get('options', {})
+    output = request.get('format', 'html')
+    if output not in ('html', 'json'):
+        raise ValueError("format must be 'html' or 'json', not "
+                         "{0!r}".format(output))
+    if 'spec' in request:
+        fig = spec_figure(request['spec'])
+        if output == 'html':
+            result = fig.to_html(**options)
+        else:
+            result = fig.to_json()
+    else:
+        if 'pickle' in request:
+            fig = pickle.loads(base64.b64decode(request['pickle']))
+        elif 'path' in request:
+            with open(request['path'], 'rb') as f:
+                fig = pickle.load(f)
+        else:
+            raise ValueError("Requests must hold a 'pickle', 'path' or "
+                             "'spec' figure")
+        try:
+            if output == 'html':
+                result = fig_to_html(fig, **options)
+            else:
+                result = json.dumps(fig_to_dict(fig, **options),
+                                    cls=NumpyEncoder)
+        finally:
+            plt.close(fig)
+    return result, time.perf_counter() - start
+
+
+def summarize(values):
+    """The count and percentiles of a list of latencies, in milliseconds"""
+    if not values:
+        return {"count": 0}
+    values = 1000 * np.asarray(values)
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {"count": len(values), "mean": float(values.mean()),
+            "p50": float(p50), "p90": float(p90), "p99": float(p99),
+            "max": float(values.max())}
+
+
+class WorkerPool(object):
+    """A pool of warm processes exporting figures
+
+    Parameters
+    ----------
+    workers : int (optional)
+        The number of worker processes.  Defaults to the number of
+        processors.
+    max_latencies : int (optional)
+        The number of recent exports whose latencies are summarized by
+        :meth:`stats`.
+    """
+    def __init__(self, workers=None, max_latencies=1000):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers,
+                                            initializer=init_worker)
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.latencies = collections.deque(maxlen=max_latencies)
+
+    def submit(self, request, callback):
+        """Queue the export of a request
+
+        callback is called with the response, from another thread, once the
+        export completes.
+        """
+        start = time.perf_counter()
+        with self.lock:
+            self.pending += 1
+
+        def done(future):
+            total = time.perf_counter() - start
+            response = {"id": request.get('id')}
+            try:
+                response['result'], seconds = future.result()
+            except Exception:
+                response['error'] = traceback.format_exc()
+                seconds = None
+            with self.lock:
+                self.pending -= 1
+                if seconds is None:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                    self.latencies.append((total - seconds, seconds, total))
+            if seconds is not None:
+                response['wait_ms'] = 1000 * (total - seconds)
+                response['export_ms'] = 1000 * seconds
+            callback(response)
+
+        self.executor.submit(export_request, request).add_done_callback(done)
+
+    def stats(self):
+        """The queue depth, counts and latencies of the pool"""
+        with self.lock:
+            latencies = list(self.latencies)
+            stats = {"workers": self.workers, "queue_depth": self.pending,
+                     "completed": self.completed, "failed": self.failed}
+        for i, key in enumerate(['wait_ms', 'export_ms', 'total_ms']):
+            stats[key] = summarize([latency[i] for latency in latencies])
+        return stats
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+
+def serve_stream(pool, infile, outfile):
+    """Answer the requests read from infile, until its end
+
+    Requests and responses are lines of JSON, read from and written to
+    binary files.  Responses are written as exports complete, so may be out
+    of order.  This returns once all the requests have been answered.
+    """
+    lock = threading.Condition()
+    outstanding = [0]
+
+    def respond(response):
+        line = json.dumps(response).encode('utf-8') + b"\n"
+        with lock:
+            outfile.write(line)
+            outfile.flush()
+
+    def answer(response):
+        respond(response)
+        with lock:
+            outstanding[0] -= 1
+            lock.notify_all()
+
+    for line in infile:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line.decode('utf-8'))
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+        except ValueError:
+            respond({"id": None, "error": traceback.format_exc()})
+            continue
+        if request.get('stats'):
+            respond({"id": request.get('id'), "stats": pool.stats()})
+            continue
+        with lock:
+            outstanding[0] += 1
+        pool.submit(request, answer)
+
+    with lock:
+        while outstanding[0]:
+            lock.wait()
+
+
+def serve_socket(pool, ip='127.0.0.1', port=8890):
+    """A server answering requests on local socket connections
+
+    Each connection is served as by :func:`serve_stream`.  Call
+    ``serve_forever`` on the returned server to start serving.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if self.client_address[0] not in ('127.0.0.1', '::1'):
+                return
+            serve_stream(pool, self.rfile, self.wfile)
+
+    class Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+    return Server((ip, port), Handler)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m mpld3.worker",
+        description="Export figures in a pool of warm worker processes.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="the number of worker processes "
+                        "(default: the number of processors)")
+    parser.add_argument("--port", type=int, default=None,
+                        help="serve requests on this local port, rather "
+                        "than stdin")
+    args = parser.parse_args(args)
+
+    pool = WorkerPool(args.workers)
+    try:
+        if args.port is None:
+            serve_stream(pool, sys.stdin.buffer, sys.stdout.buffer)
+        else:
+            server = serve_socket(pool, port=args.port)
+            sys.stderr.write("Serving on 127.0.0.1:{0}    "
+                             "[Ctrl-C to exit]\n".format(args.port))
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            server.server_close()
+    finally:
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
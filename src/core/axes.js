@@ -31,7 +31,13 @@ mpld3_Axes.prototype.defaultProps = {
     "collections": [],
     "sharex": [],
     "sharey": [],
-    "images": []
+    "images": [],
+    "bars": [],
+    "errorbars": [],
+    "linecollections": [],
+    "quivers": [],
+    "quadmeshes": [],
+    "tiledimages": []
 };
 
 function mpld3_Axes(fig, props) {
@@ -135,6 +141,18 @@ function mpld3_Axes(fig, props) {
         this.elements.push(new mpld3.Path(this, paths[i]));
     }
 
+    // Add bars
+    var bars = this.props.bars;
+    for (var i = 0; i < bars.length; i++) {
+        this.elements.push(new mpld3.Bars(this, bars[i]));
+    }
+
+    // Add errorbars
+    var errorbars = this.props.errorbars;
+    for (var i = 0; i < errorbars.length; i++) {
+        this.elements.push(new mpld3.Errorbars(this, errorbars[i]));
+    }
+
     // Add lines
     var lines = this.props.lines;
     for (var i = 0; i < lines.length; i++) {
@@ -159,6 +177,30 @@ function mpld3_Axes(fig, props) {
         this.elements.push(new mpld3.PathCollection(this, collections[i]));
     }
 
+    // Add line collections
+    var linecollections = this.props.linecollections;
+    for (var i = 0; i < linecollections.length; i++) {
+        this.elements.push(new mpld3.LineCollection(this, linecollections[i]));
+    }
+
+    // Add quivers
+    var quivers = this.props.quivers;
+    for (var i = 0; i < quivers.length; i++) {
+        this.elements.push(new mpld3.Quiver(this, quivers[i]));
+    }
+
+    // Add quadmeshes
+    var quadmeshes = this.props.quadmeshes;
+    for (var i = 0; i < quadmeshes.length; i++) {
+        this.elements.push(new mpld3.QuadMesh(this, quadmeshes[i]));
+    }
+
+    // Add tiled images
+    var tiledimages = this.props.tiledimages;
+    for (var i = 0; i < tiledimages.length; i++) {
+        this.elements.push(new mpld3.TiledImage(this, tiledimages[i]));
+    }
+
     // Add images
     var images = this.props.images;
     for (var i = 0; i < images.length; i++) {
@@ -0,0 +1,88 @@
+import "../core/element";
+import "../core/coordinates";
+import "../utils/";
+
+/**********************************************************************/
+/* Bars Element: axis-aligned rectangles sharing a style */
+mpld3.Bars = mpld3_Bars;
+mpld3_Bars.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_Bars.prototype.constructor = mpld3_Bars;
+mpld3_Bars.prototype.requiredProps = ["data"];
+mpld3_Bars.prototype.defaultProps = {
+    xindex: 0,
+    yindex: 1,
+    widthindex: 2,
+    heightindex: 3,
+    facecolors: ["green"],
+    edgecolor: "black",
+    edgewidth: 1,
+    dasharray: "none",
+    alpha: 1.0,
+    zorder: 1,
+    ids: []
+};
+
+function mpld3_Bars(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.data = ax.fig.get_data(this.props.data);
+
+    // facecolors may be palette encoded: one path is drawn per color
+    this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+    this.props.facecolors = this.facecolors.palette;
+
+    this.coords = new mpld3_Coordinates("data", this.ax);
+}
+
+mpld3_Bars.prototype.pathStrings = function() {
+    var props = this.props;
+    var paths = this.facecolors.palette.map(function() {
+        return [];
+    });
+    for (var i = 0; i < this.data.length; i++) {
+        var d = this.data[i];
+        var x0 = this.coords.x(d[props.xindex]),
+            x1 = this.coords.x(d[props.xindex] + d[props.widthindex]),
+            y0 = this.coords.y(d[props.yindex]),
+            y1 = this.coords.y(d[props.yindex] + d[props.heightindex]);
+        if (isFinite(x0) && isFinite(x1) && isFinite(y0) && isFinite(y1)) {
+            paths[this.facecolors.paletteIndex(i)].push(
+                "M " + x0 + " " + y0 + " H " + x1 + " V " + y1 +
+                " H " + x0 + " Z");
+        }
+    }
+    return paths.map(function(path) {
+        return path.join(" ");
+    });
+};
+
+mpld3_Bars.prototype.draw = function() {
+    this.group = this.ax.paths.append("svg:g");
+
+    var paths = this.pathStrings();
+    for (var i = 0; i < paths.length; i++) {
+        if (paths[i].length === 0) {
+            continue;
+        }
+        var facecolor = this.props.facecolors[i];
+        var path = this.group.append("svg:path")
+            .attr("d", paths[i])
+            .attr("class", "mpld3-path")
+            .style("stroke", this.props.edgecolor)
+            .style("stroke-width", this.props.edgewidth)
+            .style("stroke-dasharray", this.props.dasharray)
+            .style("fill", facecolor)
+            .attr("vector-effect", "non-scaling-stroke");
+
+        // Only set opacity if it's not encoded in the color, otherwise we're doubling it!
+        if (this.props.edgecolor.slice(0, 5) != "rgba(") {
+            path.style("stroke-opacity", this.props.alpha);
+        }
+        if (facecolor.slice(0, 5) != "rgba(") {
+            path.style("fill-opacity", this.props.alpha);
+        }
+    }
+};
+
+mpld3_Bars.prototype.elements = function(d) {
+    return this.group.selectAll("path");
+};
@@ -0,0 +1,100 @@
+import "../core/element";
+import "../utils/";
+
+/**********************************************************************/
+/* Errorbars Element: whiskers and caps of an errorbar plot */
+mpld3.Errorbars = mpld3_Errorbars;
+mpld3_Errorbars.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_Errorbars.prototype.constructor = mpld3_Errorbars;
+mpld3_Errorbars.prototype.requiredProps = ["data"];
+mpld3_Errorbars.prototype.defaultProps = {
+    xindex: 0,
+    yindex: 1,
+    xerrindex: null,
+    yerrindex: null,
+    color: "black",
+    linewidth: 1,
+    alpha: 1.0,
+    capsize: 0,
+    capwidth: 1,
+    zorder: 2
+};
+
+function mpld3_Errorbars(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.data = ax.fig.get_data(this.props.data);
+}
+
+mpld3_Errorbars.prototype.pathStrings = function(transform) {
+    // Return the SVG paths of the whiskers and of the caps.  The bars are
+    // redrawn rather than scaled on zoom, so that the caps keep their size.
+    transform = transform || d3.zoomIdentity;
+    var ax = this.ax;
+    var x = function(d) {
+        return transform.applyX(ax.x(d));
+    };
+    var y = function(d) {
+        return transform.applyY(ax.y(d));
+    };
+
+    var props = this.props;
+    var c = 0.5 * props.capsize;
+    var whiskers = [];
+    var caps = [];
+    for (var i = 0; i < this.data.length; i++) {
+        var d = this.data[i];
+        if (props.xerrindex !== null) {
+            var x0 = x(d[props.xerrindex[0]]),
+                x1 = x(d[props.xerrindex[1]]),
+                yc = y(d[props.yindex]);
+            if (isFinite(x0) && isFinite(x1) && isFinite(yc)) {
+                whiskers.push("M " + x0 + " " + yc + " H " + x1);
+                caps.push("M " + x0 + " " + (yc - c) + " v " + 2 * c +
+                          " M " + x1 + " " + (yc - c) + " v " + 2 * c);
+            }
+        }
+        if (props.yerrindex !== null) {
+            var y0 = y(d[props.yerrindex[0]]),
+                y1 = y(d[props.yerrindex[1]]),
+                xc = x(d[props.xindex]);
+            if (isFinite(y0) && isFinite(y1) && isFinite(xc)) {
+                whiskers.push("M " + xc + " " + y0 + " V " + y1);
+                caps.push("M " + (xc - c) + " " + y0 + " h " + 2 * c +
+                          " M " + (xc - c) + " " + y1 + " h " + 2 * c);
+            }
+        }
+    }
+    return [whiskers.join(" "), (c > 0) ? caps.join(" ") : ""];
+};
+
+mpld3_Errorbars.prototype.draw = function() {
+    // Use the clipped container rather than the zoomed paths group
+    this.group = this.ax.pathsContainer.append("svg:g");
+
+    var paths = this.pathStrings();
+    var widths = [this.props.linewidth, this.props.capwidth];
+    for (var i = 0; i < paths.length; i++) {
+        var path = this.group.append("svg:path")
+            .attr("d", paths[i])
+            .attr("class", "mpld3-path")
+            .style("stroke", this.props.color)
+            .style("stroke-width", widths[i])
+            .style("fill", "none");
+
+        // Only set opacity if it's not encoded in the color, otherwise we're doubling it!
+        if (this.props.color.slice(0, 5) != "rgba(") {
+            path.style("stroke-opacity", this.props.alpha);
+        }
+    }
+};
+
+mpld3_Errorbars.prototype.elements = function(d) {
+    return this.group.selectAll("path");
+};
+
+mpld3_Errorbars.prototype.zoomed = function(transform) {
+    var paths = this.pathStrings(transform);
+    this.elements().attr("d", function(d, i) {
+        return paths[i];
+    });
+};
@@ -1,6 +1,12 @@
 import "path";
 import "path_collection";
+import "line_collection";
+import "bars";
+import "errorbars";
+import "quiver";
+import "quadmesh";
 import "line";
 import "markers";
 import "image";
+import "tiled_image";
 import "text";
\ No newline at end of file
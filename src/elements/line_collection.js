@@ -0,0 +1,108 @@
+import "../core/element";
+import "../core/coordinates";
+import "../utils/";
+
+/**********************************************************************/
+/* Line Collection Element: many polylines in one flat vertex buffer */
+mpld3.LineCollection = mpld3_LineCollection;
+mpld3_LineCollection.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_LineCollection.prototype.constructor = mpld3_LineCollection;
+mpld3_LineCollection.prototype.requiredProps = ["vertices", "starts"];
+mpld3_LineCollection.prototype.defaultProps = {
+    coordinates: "data",
+    edgecolors: ["#000000"],
+    edgewidths: [1.0],
+    alpha: 1.0,
+    zorder: 2
+};
+
+function mpld3_LineCollection(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.vertices = mpld3_decodeVertices(this.props.vertices);
+    this.starts = mpld3_decodeArray(this.props.starts);
+
+    // Styles may be palette encoded: segments sharing a color and a width
+    // are drawn as a single path.
+    this.edgecolors = new mpld3_StyleArray(this.props.edgecolors);
+    this.edgewidths = new mpld3_StyleArray(this.props.edgewidths);
+    if (this.edgecolors.palette == null ||
+        this.edgecolors.palette.length == 0) {
+        this.edgecolors.palette = ["none"];
+    }
+    this.props.edgecolors = this.edgecolors.palette;
+    this.props.edgewidths = this.edgewidths.palette;
+
+    this.coords = new mpld3_Coordinates(this.props.coordinates, this.ax);
+}
+
+mpld3_LineCollection.prototype.styleGroups = function() {
+    // Return one {color, width, d} object per distinct segment style
+    var groups = [];
+    var lookup = {};
+    var n = this.starts.length;
+    for (var i = 0; i < n; i++) {
+        var ci = this.edgecolors.paletteIndex(i),
+            wi = this.edgewidths.paletteIndex(i);
+        var key = ci + "," + wi;
+        if (!(key in lookup)) {
+            lookup[key] = groups.length;
+            groups.push({
+                color: this.edgecolors.palette[ci],
+                width: this.edgewidths.palette[wi],
+                d: []
+            });
+        }
+        var d = groups[lookup[key]].d;
+
+        // non-finite vertices lift the pen, as in a Line element
+        var stop = (i + 1 < n) ? this.starts[i + 1] : this.vertices.length;
+        var command = "M ";
+        for (var j = this.starts[i]; j < stop; j++) {
+            var x = this.coords.x(this.vertices[j][0]),
+                y = this.coords.y(this.vertices[j][1]);
+            if (isFinite(x) && isFinite(y)) {
+                d.push(command + x + " " + y);
+                command = "L ";
+            } else {
+                command = "M ";
+            }
+        }
+    }
+    groups.forEach(function(group) {
+        group.d = group.d.join(" ");
+    });
+    return groups;
+};
+
+mpld3_LineCollection.prototype.draw = function() {
+    if (this.coords.zoomable) {
+        this.group = this.ax.paths.append("svg:g");
+    } else {
+        this.group = this.ax.staticPaths.append("svg:g");
+    }
+
+    var alpha = this.props.alpha;
+    this.pathsobj = this.group.selectAll("paths")
+        .data(this.styleGroups())
+        .enter().append("svg:path")
+        .attr("d", function(d) {
+            return d.d;
+        })
+        .attr("class", "mpld3-path")
+        .style("stroke", function(d) {
+            return d.color;
+        })
+        .style("stroke-width", function(d) {
+            return d.width;
+        })
+        // Only set opacity if it's not encoded in the color, otherwise we're doubling it!
+        .style("stroke-opacity", function(d) {
+            return (d.color.slice(0, 5) != "rgba(") ? alpha : null;
+        })
+        .style("fill", "none")
+        .attr("vector-effect", "non-scaling-stroke");
+};
+
+mpld3_LineCollection.prototype.elements = function(d) {
+    return this.group.selectAll("path");
+};
@@ -25,21 +25,52 @@ mpld3_PathCollection.prototype.defaultProps = {
 function mpld3_PathCollection(ax, props) {
     mpld3_PlotElement.call(this, ax, props);
 
-    if (this.props.facecolors == null ||
-        this.props.facecolors.length == 0) {
-        this.props.facecolors = ["none"];
+    // Styles may be palette encoded, so the props are replaced by the
+    // palettes: these are in order of first appearance, so that
+    // props.facecolors[0] is still the color of the first point, but the
+    // color of point i must be read through this.facecolors.get(i).
+    this.edgecolors = new mpld3_StyleArray(this.props.edgecolors);
+    this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+    this.edgewidths = new mpld3_StyleArray(this.props.edgewidths);
+    this.alphas = new mpld3_StyleArray(this.props.alphas);
+
+    if (this.facecolors.palette == null ||
+        this.facecolors.palette.length == 0) {
+        this.facecolors.palette = ["none"];
     }
-    if (this.props.edgecolors == null ||
-        this.props.edgecolors.length == 0) {
-        this.props.edgecolors = ["none"];
+    if (this.edgecolors.palette == null ||
+        this.edgecolors.palette.length == 0) {
+        this.edgecolors.palette = ["none"];
     }
+    this.props.facecolors = this.facecolors.palette;
+    this.props.edgecolors = this.edgecolors.palette;
+    this.props.edgewidths = this.edgewidths.palette;
+    this.props.alphas = this.alphas.palette;
+
+    // Identical paths are sent once and referenced by index; the path
+    // string of each distinct path is built once and cached.
+    this.paths = new mpld3_StyleArray(this.props.paths);
+    this.paths.palette = this.paths.palette.map(function(path) {
+        return [mpld3_decodeVertices(path[0]), path[1]];
+    });
+    this.props.paths = this.paths.palette;
+    this.pathCache = {};
+
+    // Transforms which only differ by a scale factor share one matrix.
+    var t = this.props.pathtransforms;
+    this.transformScales = null;
+    if (!isUndefinedOrNull(t) && "scales" in t) {
+        this.transformScales = mpld3_decodeArray(t.scales);
+        this.props.pathtransforms = [t.matrix];
+    }
+    this.transformCache = {};
 
     var offsets = this.ax.fig.get_data(this.props.offsets);
     if (offsets === null || offsets.length === 0)
         offsets = [null];
 
     // For use in the draw() command, expand offsets to size N
-    var N = Math.max(this.props.paths.length, offsets.length);
+    var N = Math.max(this.paths.size(), offsets.length);
     if (offsets.length === N) {
         this.offsets = offsets;
     } else {
@@ -54,10 +85,24 @@ function mpld3_PathCollection(ax, props) {
         new mpld3_Coordinates(this.props.offsetcoordinates, this.ax);
 }
 
-mpld3_PathCollection.prototype.transformFunc = function(d, i) {
+mpld3_PathCollection.prototype.pathTransform = function(i) {
     var t = this.props.pathtransforms;
-    var transform = (t.length == 0) ? "" :
-        mpld3.getTransformation("matrix(" + getMod(t, i) + ")").toString();
+    if (t.length == 0) {
+        return "";
+    }
+    if (this.transformScales !== null) {
+        return mpld3_matrixTransformation(t[0],
+            this.transformScales[i % this.transformScales.length]);
+    }
+    var k = i % t.length;
+    if (!(k in this.transformCache)) {
+        this.transformCache[k] = mpld3_matrixTransformation(t[k]);
+    }
+    return this.transformCache[k];
+};
+
+mpld3_PathCollection.prototype.transformFunc = function(d, i) {
+    var transform = this.pathTransform(i);
 
     var offset = (d === null || typeof(d) === "undefined") ?
         "translate(0, 0)" :
@@ -68,24 +113,28 @@ mpld3_PathCollection.prototype.transformFunc = function(d, i) {
 };
 
 mpld3_PathCollection.prototype.pathFunc = function(d, i) {
-    return mpld3_path()
-        .x(function(d) {
-            return this.pathcoords.x(d[0]);
-        }.bind(this))
-        .y(function(d) {
-            return this.pathcoords.y(d[1]);
-        }.bind(this))
-        .apply(this, getMod(this.props.paths, i));
+    var k = this.paths.paletteIndex(i);
+    if (!(k in this.pathCache)) {
+        this.pathCache[k] = mpld3_path()
+            .x(function(d) {
+                return this.pathcoords.x(d[0]);
+            }.bind(this))
+            .y(function(d) {
+                return this.pathcoords.y(d[1]);
+            }.bind(this))
+            .apply(this, this.paths.palette[k]);
+    }
+    return this.pathCache[k];
 };
 
 mpld3_PathCollection.prototype.styleFunc = function(d, i) {
-    var stroke = getMod(this.props.edgecolors, i);
-    var fill = getMod(this.props.facecolors, i);
-    var alpha = getMod(this.props.alphas, i);
+    var stroke = this.edgecolors.get(i);
+    var fill = this.facecolors.get(i);
+    var alpha = this.alphas.get(i);
 
     var styles = {
         "stroke": stroke,
-        "stroke-width": getMod(this.props.edgewidths, i),
+        "stroke-width": this.edgewidths.get(i),
         "fill": fill,
     };
 
@@ -0,0 +1,281 @@
+import "../core/element";
+import "../utils/";
+
+/**********************************************************************/
+/* QuadMesh Element: a colormapped grid of quadrilateral cells, drawn as
+   a raster for large grids and as SVG paths for small ones */
+mpld3.QuadMesh = mpld3_QuadMesh;
+mpld3_QuadMesh.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_QuadMesh.prototype.constructor = mpld3_QuadMesh;
+mpld3_QuadMesh.prototype.requiredProps = ["x", "y", "values", "lut"];
+mpld3_QuadMesh.prototype.defaultProps = {
+    scale: "linear",
+    vmin: 0,
+    vmax: 1,
+    zorder: 1
+};
+
+// meshes with more cells than this are rasterized when possible
+var mpld3_quadMeshMaxSVGCells = 4096;
+
+function mpld3_QuadMesh(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.ny = this.props.values.shape[0];
+    this.nx = this.props.values.shape[1];
+    this.rectilinear = (this.props.x.shape.length == 1);
+    this.x = mpld3_decodeArray(this.props.x);
+    this.y = mpld3_decodeArray(this.props.y);
+
+    // The lookup table holds the colormap colors followed by the under,
+    // over and bad colors, as rgba bytes.
+    this.lut = mpld3_decodeArray(this.props.lut);
+    this.N = this.lut.length / 4 - 3;
+    var values = mpld3_decodeArray(this.props.values);
+    this.colors = new Uint16Array(values.length);
+    for (var i = 0; i < values.length; i++) {
+        this.colors[i] = this.colorIndex(values[i]);
+    }
+}
+
+mpld3_QuadMesh.prototype.colorIndex = function(value) {
+    // Map a value to its lookup table index, as matplotlib's Colormap
+    var props = this.props;
+    var N = this.N;
+    var xa = value;
+    if (props.scale !== "index") {
+        var vmin = props.vmin,
+            vmax = props.vmax;
+        if (props.scale === "log") {
+            value = (value > 0) ? Math.log(value) : NaN;
+            vmin = Math.log(vmin);
+            vmax = Math.log(vmax);
+        }
+        xa = N * ((vmax == vmin) ? 0 : (value - vmin) / (vmax - vmin));
+        if (xa == N) {
+            xa = N - 1;
+        }
+    }
+    if (isNaN(xa)) {
+        return N + 2;
+    } else if (xa < 0) {
+        return N;
+    } else if (xa >= N) {
+        return N + 1;
+    }
+    return Math.floor(xa);
+};
+
+mpld3_QuadMesh.prototype.colorString = function(k) {
+    var lut = this.lut;
+    return "rgba(" + lut[4 * k] + "," + lut[4 * k + 1] + "," +
+        lut[4 * k + 2] + "," + lut[4 * k + 3] / 255 + ")";
+};
+
+mpld3_QuadMesh.prototype.corners = function(i, j) {
+    // Return the pixel corners of the cell in column i and row j
+    var nx = this.nx;
+    var x = this.ax.x,
+        y = this.ax.y;
+    if (this.rectilinear) {
+        var x0 = x(this.x[i]),
+            x1 = x(this.x[i + 1]),
+            y0 = y(this.y[j]),
+            y1 = y(this.y[j + 1]);
+        return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]];
+    }
+    var k = j * (nx + 1) + i;
+    var vertices = [k, k + 1, k + nx + 2, k + nx + 1];
+    return vertices.map(function(k) {
+        return [x(this.x[k]), y(this.y[k])];
+    }, this);
+};
+
+mpld3_QuadMesh.prototype.cellsByColor = function() {
+    // Return the lists of visible cell corners, keyed by color index
+    var cells = {};
+    for (var j = 0; j < this.ny; j++) {
+        for (var i = 0; i < this.nx; i++) {
+            var k = this.colors[j * this.nx + i];
+            if (this.lut[4 * k + 3] === 0) {
+                continue;
+            }
+            var corners = this.corners(i, j);
+            if (!corners.every(function(p) {
+                    return isFinite(p[0]) && isFinite(p[1]);
+                })) {
+                continue;
+            }
+            if (!(k in cells)) {
+                cells[k] = [];
+            }
+            cells[k].push(corners);
+        }
+    }
+    return cells;
+};
+
+mpld3_QuadMesh.prototype.pathStrings = function() {
+    // Return one {color, d} object per color of the mesh
+    var cells = this.cellsByColor();
+    var paths = [];
+    for (var k in cells) {
+        paths.push({
+            color: this.colorString(k),
+            d: cells[k].map(function(corners) {
+                return "M " + corners.map(function(p) {
+                    return p[0] + " " + p[1];
+                }).join(" L ") + " Z";
+            }).join(" ")
+        });
+    }
+    return paths;
+};
+
+mpld3_QuadMesh.prototype.pixelGrid = function() {
+    // For rectilinear meshes with evenly spaced cells in pixels, return
+    // the pixel extent of the mesh, otherwise null.
+    if (!this.rectilinear) {
+        return null;
+    }
+    var ax = this.ax;
+    var even = function(edges, scale) {
+        var p0 = scale(edges[0]),
+            p1 = scale(edges[edges.length - 1]);
+        var step = (p1 - p0) / (edges.length - 1);
+        for (var i = 1; i < edges.length - 1; i++) {
+            if (Math.abs(scale(edges[i]) - p0 - i * step) >
+                1E-3 * Math.abs(step)) {
+                return null;
+            }
+        }
+        return [p0, p1];
+    };
+    var x = even(this.x, ax.x),
+        y = even(this.y, ax.y);
+    return (x === null || y === null) ? null : [x, y];
+};
+
+mpld3_QuadMesh.prototype.rasterize = function() {
+    // Draw the mesh onto a canvas, returning the canvas and its pixel
+    // extent, or null if canvases are not available.
+    if (typeof document === "undefined") {
+        return null;
+    }
+    var canvas = document.createElement("canvas");
+    var ctx = canvas.getContext && canvas.getContext("2d");
+    if (!ctx) {
+        return null;
+    }
+
+    var grid = this.pixelGrid();
+    var nx = this.nx,
+        ny = this.ny;
+    if (grid !== null) {
+        // one canvas pixel per cell, flipped to follow the pixel axes
+        canvas.width = nx;
+        canvas.height = ny;
+        var image = ctx.createImageData(nx, ny);
+        var flipx = grid[0][1] < grid[0][0],
+            flipy = grid[1][1] < grid[1][0];
+        for (var j = 0; j < ny; j++) {
+            for (var i = 0; i < nx; i++) {
+                var k = 4 * this.colors[j * nx + i];
+                var p = 4 * ((flipy ? ny - 1 - j : j) * nx +
+                    (flipx ? nx - 1 - i : i));
+                for (var c = 0; c < 4; c++) {
+                    image.data[p + c] = this.lut[k + c];
+                }
+            }
+        }
+        ctx.putImageData(image, 0, 0);
+        return {
+            canvas: canvas,
+            pixelated: true,
+            extent: [Math.min(grid[0][0], grid[0][1]),
+                     Math.max(grid[0][0], grid[0][1]),
+                     Math.min(grid[1][0], grid[1][1]),
+                     Math.max(grid[1][0], grid[1][1])]
+        };
+    }
+
+    // otherwise fill one canvas path per color
+    var cells = this.cellsByColor();
+    var extent = [Infinity, -Infinity, Infinity, -Infinity];
+    for (var k in cells) {
+        cells[k].forEach(function(corners) {
+            corners.forEach(function(p) {
+                extent[0] = Math.min(extent[0], p[0]);
+                extent[1] = Math.max(extent[1], p[0]);
+                extent[2] = Math.min(extent[2], p[1]);
+                extent[3] = Math.max(extent[3], p[1]);
+            });
+        });
+    }
+    if (!(extent[1] > extent[0] && extent[3] > extent[2])) {
+        return null;
+    }
+    canvas.width = Math.ceil(extent[1] - extent[0]);
+    canvas.height = Math.ceil(extent[3] - extent[2]);
+    ctx.translate(-extent[0], -extent[2]);
+    for (var k in cells) {
+        var color = this.colorString(k);
+        ctx.beginPath();
+        cells[k].forEach(function(corners) {
+            ctx.moveTo(corners[0][0], corners[0][1]);
+            for (var n = 1; n < 4; n++) {
+                ctx.lineTo(corners[n][0], corners[n][1]);
+            }
+            ctx.closePath();
+        });
+        ctx.fillStyle = color;
+        ctx.fill();
+        // cover the antialiasing seams between opaque cells
+        if (this.lut[4 * k + 3] === 255) {
+            ctx.strokeStyle = color;
+            ctx.lineWidth = 0.5;
+            ctx.stroke();
+        }
+    }
+    return {
+        canvas: canvas,
+        pixelated: false,
+        extent: extent
+    };
+};
+
+mpld3_QuadMesh.prototype.draw = function() {
+    this.group = this.ax.paths.append("svg:g");
+
+    var raster = (this.nx * this.ny > mpld3_quadMeshMaxSVGCells) ?
+        this.rasterize() : null;
+    if (raster !== null) {
+        var extent = raster.extent;
+        this.group.append("svg:image")
+            .attr("class", "mpld3-image")
+            .attr("xlink:href", raster.canvas.toDataURL("image/png"))
+            .attr("x", extent[0])
+            .attr("y", extent[2])
+            .attr("width", extent[1] - extent[0])
+            .attr("height", extent[3] - extent[2])
+            .attr("preserveAspectRatio", "none")
+            .style("image-rendering", raster.pixelated ? "pixelated" : null);
+        return;
+    }
+
+    this.group.selectAll("paths")
+        .data(this.pathStrings())
+        .enter().append("svg:path")
+        .attr("d", function(d) {
+            return d.d;
+        })
+        .attr("class", "mpld3-path")
+        .style("fill", function(d) {
+            return d.color;
+        })
+        .style("stroke", "none")
+        .attr("shape-rendering", "crispEdges");
+};
+
+mpld3_QuadMesh.prototype.elements = function(d) {
+    return this.group.selectAll("path, image");
+};
@@ -0,0 +1,158 @@
+import "../core/element";
+import "../utils/";
+
+/**********************************************************************/
+/* Quiver Element: arrows instanced from a single glyph */
+mpld3.Quiver = mpld3_Quiver;
+mpld3_Quiver.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_Quiver.prototype.constructor = mpld3_Quiver;
+mpld3_Quiver.prototype.requiredProps = ["data", "glyph", "scale"];
+mpld3_Quiver.prototype.defaultProps = {
+    xindex: 0,
+    yindex: 1,
+    uindex: 2,
+    vindex: 3,
+    angles: "uv",
+    scaleunits: null,
+    pivot: "tail",
+    shortlength: 0,
+    dotlength: 0,
+    facecolors: ["black"],
+    edgecolor: "none",
+    edgewidth: 0,
+    alpha: 1.0,
+    zorder: 1
+};
+
+var mpld3_quiverPivots = {
+    tail: 0,
+    middle: 0.5,
+    tip: 1
+};
+
+function mpld3_Quiver(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.data = ax.fig.get_data(this.props.data);
+
+    // facecolors may be palette encoded: one path is drawn per color
+    this.facecolors = new mpld3_StyleArray(this.props.facecolors);
+    this.props.facecolors = this.facecolors.palette;
+}
+
+mpld3_Quiver.prototype.arrow = function(length) {
+    // Return the vertices of an arrow of the given length in pixels,
+    // pointing along +x from its pivot, following matplotlib's shapes.
+    var props = this.props;
+    var vertices = [];
+    if (length < props.dotlength) {
+        var r = 0.5 * props.dotlength;
+        for (var k = 0; k < 6; k++) {
+            vertices.push([r * Math.cos(k * Math.PI / 3),
+                           r * Math.sin(k * Math.PI / 3)]);
+        }
+        return vertices;
+    }
+    var shift = mpld3_quiverPivots[props.pivot] * length;
+    var shrink = 1;
+    var shaft = length;
+    if (length < props.shortlength) {
+        shrink = length / props.shortlength;
+        shaft = props.shortlength;
+    }
+    for (var i = 0; i < props.glyph.length; i++) {
+        var g = props.glyph[i];
+        vertices.push([(g[0] + g[2] * shaft) * shrink - shift,
+                       g[1] * shrink]);
+    }
+    return vertices;
+};
+
+mpld3_Quiver.prototype.pathStrings = function(transform) {
+    // Return one SVG path per color.  Arrows keep their size in pixels and
+    // are rebuilt from the glyph on zoom, unless their lengths or angles
+    // are given in data units.
+    transform = transform || d3.zoomIdentity;
+    var ax = this.ax;
+    var x = function(d) {
+        return transform.applyX(ax.x(d));
+    };
+    var y = function(d) {
+        return transform.applyY(ax.y(d));
+    };
+
+    var props = this.props;
+    var paths = this.facecolors.palette.map(function() {
+        return [];
+    });
+    for (var i = 0; i < this.data.length; i++) {
+        var d = this.data[i];
+        var u = d[props.uindex],
+            v = d[props.vindex];
+        var px = x(d[props.xindex]),
+            py = y(d[props.yindex]);
+        if (!(isFinite(px) && isFinite(py) && isFinite(u) && isFinite(v))) {
+            continue;
+        }
+
+        // the vector in pixels, with y pointing up
+        var dx = u,
+            dy = v;
+        if (props.angles === "xy" || props.scaleunits === "xy") {
+            dx = x(d[props.xindex] + u) - px;
+            dy = py - y(d[props.yindex] + v);
+        }
+        var theta = (props.angles === "xy") ? Math.atan2(dy, dx) :
+            Math.atan2(v, u);
+        var length = props.scale * ((props.scaleunits === "xy") ?
+            Math.sqrt(dx * dx + dy * dy) : Math.sqrt(u * u + v * v));
+
+        var c = Math.cos(theta),
+            s = Math.sin(theta);
+        var arrow = this.arrow(length).map(function(p) {
+            return (px + c * p[0] - s * p[1]) + " " +
+                (py - s * p[0] - c * p[1]);
+        });
+        paths[this.facecolors.paletteIndex(i)].push(
+            "M " + arrow.join(" L ") + " Z");
+    }
+    return paths.map(function(path) {
+        return path.join(" ");
+    });
+};
+
+mpld3_Quiver.prototype.draw = function() {
+    // Use the clipped container rather than the zoomed paths group
+    this.group = this.ax.pathsContainer.append("svg:g");
+
+    var paths = this.pathStrings();
+    for (var i = 0; i < paths.length; i++) {
+        var facecolor = this.props.facecolors[i];
+        var edgecolor = (this.props.edgecolor === "face") ?
+            facecolor : this.props.edgecolor;
+        var path = this.group.append("svg:path")
+            .attr("d", paths[i])
+            .attr("class", "mpld3-path")
+            .style("stroke", edgecolor)
+            .style("stroke-width", this.props.edgewidth)
+            .style("fill", facecolor);
+
+        // Only set opacity if it's not encoded in the color, otherwise we're doubling it!
+        if (edgecolor.slice(0, 5) != "rgba(") {
+            path.style("stroke-opacity", this.props.alpha);
+        }
+        if (facecolor.slice(0, 5) != "rgba(") {
+            path.style("fill-opacity", this.props.alpha);
+        }
+    }
+};
+
+mpld3_Quiver.prototype.elements = function(d) {
+    return this.group.selectAll("path");
+};
+
+mpld3_Quiver.prototype.zoomed = function(transform) {
+    var paths = this.pathStrings(transform);
+    this.elements().attr("d", function(d, i) {
+        return paths[i];
+    });
+};
@@ -0,0 +1,151 @@
+import "../core/element";
+import "../core/coordinates";
+import "../utils/";
+
+/**********************************************************************/
+/* Tiled Image Element: a large image as a multi-resolution pyramid of
+   tiles, of which only those visible at the current zoom are loaded.
+   Level 0 is the full resolution, and each level halves the previous. */
+mpld3.TiledImage = mpld3_TiledImage;
+mpld3_TiledImage.prototype = Object.create(mpld3_PlotElement.prototype);
+mpld3_TiledImage.prototype.constructor = mpld3_TiledImage;
+mpld3_TiledImage.prototype.requiredProps = ["extent", "shape", "tilesize"];
+mpld3_TiledImage.prototype.defaultProps = {
+    tiles: null,
+    url: null,
+    alpha: 1.0,
+    coordinates: "data",
+    zorder: 1
+};
+
+function mpld3_TiledImage(ax, props) {
+    mpld3_PlotElement.call(this, ax, props);
+    this.coords = new mpld3_Coordinates(this.props.coordinates, this.ax);
+
+    this.levels = 1;
+    var size = Math.max(this.props.shape[0], this.props.shape[1]);
+    while (size > this.props.tilesize) {
+        size = Math.ceil(size / 2);
+        this.levels++;
+    }
+}
+
+mpld3_TiledImage.prototype.grid = function(level) {
+    // Return the number of rows and columns of tiles of a level
+    var span = this.props.tilesize * Math.pow(2, level);
+    return [Math.ceil(this.props.shape[0] / span),
+            Math.ceil(this.props.shape[1] / span)];
+};
+
+mpld3_TiledImage.prototype.tileUrl = function(level, row, col) {
+    if (this.props.tiles !== null) {
+        var cols = this.grid(level)[1];
+        return "data:image/png;base64," +
+            this.props.tiles[level][row * cols + col];
+    }
+    return this.props.url.replace("{level}", level)
+        .replace("{row}", row)
+        .replace("{col}", col);
+};
+
+mpld3_TiledImage.prototype.bounds = function() {
+    // Return the unzoomed pixel positions of the image's left, right, top
+    // and bottom edges
+    var extent = this.props.extent;
+    return [this.coords.x(extent[0]), this.coords.x(extent[1]),
+            this.coords.y(extent[3]), this.coords.y(extent[2])];
+};
+
+mpld3_TiledImage.prototype.tileRect = function(level, row, col) {
+    // Return the unzoomed pixel x, y, width and height of a tile
+    var b = this.bounds();
+    var H = this.props.shape[0],
+        W = this.props.shape[1];
+    var span = this.props.tilesize * Math.pow(2, level);
+    var x0 = b[0] + (b[1] - b[0]) * col * span / W,
+        x1 = b[0] + (b[1] - b[0]) * Math.min((col + 1) * span, W) / W,
+        y0 = b[2] + (b[3] - b[2]) * row * span / H,
+        y1 = b[2] + (b[3] - b[2]) * Math.min((row + 1) * span, H) / H;
+    return [Math.min(x0, x1), Math.min(y0, y1),
+            Math.abs(x1 - x0), Math.abs(y1 - y0)];
+};
+
+mpld3_TiledImage.prototype.visibleTiles = function(transform) {
+    // Return the tiles to draw for a zoom transform: the coarsest tile as a
+    // backdrop, then the tiles of the level with about one image pixel per
+    // screen pixel which intersect the viewport.
+    transform = transform || d3.zoomIdentity;
+    var H = this.props.shape[0],
+        W = this.props.shape[1];
+    var b = this.bounds();
+    var top = this.levels - 1;
+    var tiles = [{
+        level: top,
+        row: 0,
+        col: 0
+    }];
+
+    var pixels = transform.k * Math.max(Math.abs(b[1] - b[0]) / W,
+                                        Math.abs(b[3] - b[2]) / H);
+    var level = Math.floor(Math.log(1 / pixels) / Math.LN2);
+    level = Math.max(0, Math.min(top, level));
+    if (level == top) {
+        return tiles;
+    }
+
+    // the viewport in image pixels
+    var cols = [(transform.invertX(0) - b[0]) / (b[1] - b[0]) * W,
+                (transform.invertX(this.ax.width) - b[0]) / (b[1] - b[0]) * W],
+        rows = [(transform.invertY(0) - b[2]) / (b[3] - b[2]) * H,
+                (transform.invertY(this.ax.height) - b[2]) / (b[3] - b[2]) * H];
+    var span = this.props.tilesize * Math.pow(2, level);
+    var grid = this.grid(level);
+    var range = function(limits, n) {
+        var start = Math.floor(Math.min(limits[0], limits[1]) / span),
+            stop = Math.ceil(Math.max(limits[0], limits[1]) / span);
+        return [Math.max(0, start), Math.min(n, stop)];
+    };
+    var r = range(rows, grid[0]),
+        c = range(cols, grid[1]);
+    for (var row = r[0]; row < r[1]; row++) {
+        for (var col = c[0]; col < c[1]; col++) {
+            tiles.push({
+                level: level,
+                row: row,
+                col: col
+            });
+        }
+    }
+    return tiles;
+};
+
+mpld3_TiledImage.prototype.draw = function() {
+    this.group = this.ax.paths.append("svg:g")
+        .style("opacity", this.props.alpha);
+    this.zoomed(d3.zoomIdentity);
+};
+
+mpld3_TiledImage.prototype.elements = function(d) {
+    return this.group.selectAll("image");
+};
+
+mpld3_TiledImage.prototype.zoomed = function(transform) {
+    var that = this;
+    var images = this.group.selectAll("image")
+        .data(this.visibleTiles(transform), function(d) {
+            return d.level + "/" + d.row + "/" + d.col;
+        });
+    images.exit().remove();
+    images.enter().append("svg:image")
+        .attr("class", "mpld3-image")
+        .attr("preserveAspectRatio", "none")
+        .each(function(d) {
+            var rect = that.tileRect(d.level, d.row, d.col);
+            d3.select(this)
+                .attr("xlink:href", that.tileUrl(d.level, d.row, d.col))
+                .attr("x", rect[0])
+                .attr("y", rect[1])
+                .attr("width", rect[2])
+                .attr("height", rect[3]);
+        });
+};
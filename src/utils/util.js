@@ -31,15 +31,200 @@ mpld3.draw_figure = function(figid, spec, process, clearElem) {
     if (element === null) {
         throw (figid + " is not a valid id");
     }
-    var fig = new mpld3.Figure(figid, spec);
+    if (mpld3.lazy !== null) {
+        // the figure is drawn once its element nears the viewport
+        mpld3_registerLazyFigure(element, spec, process);
+        return null;
+    }
+    return mpld3_drawFigure(element, spec, process);
+};
+
+function mpld3_drawFigure(element, spec, process, isWanted) {
+    if (mpld3_hasExternalData(spec)) {
+        // the figure is drawn once its datasets are fetched, unless
+        // isWanted tells that it is no longer wanted by then
+        mpld3_loadExternalData(spec, function(spec) {
+            if (!isWanted || isWanted()) {
+                mpld3_drawFigure(element, spec, process);
+            }
+        });
+        return null;
+    }
+    var fig = new mpld3.Figure(element.id, spec);
     if (process) {
         process(fig, element);
     }
     mpld3.figures.push(fig);
     fig.draw();
     return fig;
+}
+
+
+/**********************************************************************/
+/* Lazy Drawing                                                       */
+
+// once enabled, draw_figure only registers figures, which are drawn when
+// their element comes near the viewport, and optionally removed again
+// when it is far from it, so that pages of many figures show the first
+// ones at once, and keep the size of their DOM bounded.
+mpld3.lazy = null;
+
+mpld3.enable_lazy_drawing = function(options) {
+    if (typeof IntersectionObserver === "undefined") {
+        // figures are drawn at once
+        return false;
+    }
+    if (mpld3.lazy !== null) {
+        return true;
+    }
+    options = options || {};
+    var lazy = mpld3.lazy = {figures: {}, teardownObserver: null};
+
+    // a figure is drawn once it is within margin of the viewport, and
+    // removed once it is beyond both margins: a teardownMargin no larger
+    // than margin then behaves as margin, rather than removing figures
+    // which are still to be shown.
+    lazy.drawObserver = new IntersectionObserver(function(entries) {
+        entries.forEach(function(entry) {
+            var figure = lazy.figures[entry.target.id];
+            if (figure) {
+                figure.near = entry.isIntersecting;
+                mpld3_updateLazyFigure(entry.target, figure);
+            }
+        });
+    }, {rootMargin: options.margin || "200px"});
+
+    if (options.teardownMargin) {
+        lazy.teardownObserver = new IntersectionObserver(function(entries) {
+            entries.forEach(function(entry) {
+                var figure = lazy.figures[entry.target.id];
+                if (figure) {
+                    figure.kept = entry.isIntersecting;
+                    mpld3_updateLazyFigure(entry.target, figure);
+                }
+            });
+        }, {rootMargin: options.teardownMargin});
+    }
+    return true;
 };
 
+function mpld3_registerLazyFigure(element, spec, process) {
+    var lazy = mpld3.lazy;
+    lazy.figures[element.id] = {spec: spec, process: process, drawn: false,
+                                draws: 0, near: false, kept: true};
+    // reserve the height of the figure, so that the figures below are
+    // not all in the viewport before they are drawn
+    element.style.minHeight = spec.height + "px";
+    // observing the element again reports whether it is visible now
+    var observers = [lazy.drawObserver, lazy.teardownObserver];
+    observers.forEach(function(observer) {
+        if (observer !== null) {
+            observer.unobserve(element);
+            observer.observe(element);
+        }
+    });
+}
+
+function mpld3_updateLazyFigure(element, figure) {
+    if (figure.near && !figure.drawn) {
+        figure.drawn = true;
+        var draws = ++figure.draws;
+        // a figure waiting for its datasets may be removed, drawn again
+        // or registered anew before they arrive: only the latest draw of
+        // a figure still drawn goes ahead
+        mpld3_drawFigure(element, figure.spec, figure.process, function() {
+            return mpld3.lazy.figures[element.id] === figure &&
+                figure.drawn && figure.draws === draws;
+        });
+    } else if (!figure.near && !figure.kept && figure.drawn) {
+        figure.drawn = false;
+        mpld3.remove_figure(element.id);
+    }
+}
+
+
+/**********************************************************************/
+/* External Datasets                                                  */
+
+// datasets written to files by mpld3.utils.write_ipynb_local_data are
+// referenced by URL and hash, and fetched once per page for all the
+// figures using them.
+mpld3.dataCache = {};
+
+function mpld3_isExternalDataset(dataset) {
+    return !isUndefinedOrNull(dataset) && !Array.isArray(dataset) &&
+        "href" in dataset && "sha1" in dataset;
+}
+
+function mpld3_hasExternalData(spec) {
+    for (var label in spec.data) {
+        if (mpld3_isExternalDataset(spec.data[label])) {
+            return true;
+        }
+    }
+    return false;
+}
+
+function mpld3_loadExternalData(spec, callback) {
+    var labels = Object.keys(spec.data).filter(function(label) {
+        return mpld3_isExternalDataset(spec.data[label]);
+    });
+    var data = mpld3_cloneObj(spec.data);
+    var remaining = labels.length;
+    labels.forEach(function(label) {
+        mpld3_fetchDataset(spec.data[label], function(rows) {
+            data[label] = rows;
+            remaining--;
+            if (remaining === 0) {
+                var loaded = mpld3_cloneObj(spec);
+                loaded.data = data;
+                callback(loaded);
+            }
+        });
+    });
+}
+
+function mpld3_fetchDataset(ref, callback) {
+    var entry = mpld3.dataCache[ref.sha1];
+    if (entry) {
+        if (entry.rows) {
+            callback(entry.rows);
+        } else {
+            entry.callbacks.push(callback);
+        }
+        return;
+    }
+    entry = mpld3.dataCache[ref.sha1] = {rows: null, callbacks: [callback]};
+
+    var request = new XMLHttpRequest();
+    request.open("GET", ref.href);
+    request.responseType = "arraybuffer";
+    request.onload = function() {
+        if (request.status !== 200) {
+            return failed();
+        }
+        var values = new Float64Array(request.response);
+        var columns = ref.shape[1];
+        var rows = [];
+        for (var i = 0; i < values.length; i += columns) {
+            rows.push(Array.prototype.slice.call(values, i, i + columns));
+        }
+        entry.rows = rows;
+        var callbacks = entry.callbacks;
+        entry.callbacks = [];
+        callbacks.forEach(function(callback) {
+            callback(rows);
+        });
+    };
+    request.onerror = failed;
+    request.send();
+
+    function failed() {
+        // a later figure may try again
+        delete mpld3.dataCache[ref.sha1];
+        console.warn("failed to load dataset " + ref.href);
+    }
+}
 
 /**********************************************************************/
 /* Convenience Functions                                              */
@@ -82,9 +267,23 @@ mpld3.getTransformation = function(transform) {
     // its SVGMatrix.
     var matrix = g.transform.baseVal.consolidate().matrix;
 
+    return mpld3_matrixTransformation([matrix.a, matrix.b, matrix.c,
+                                       matrix.d, matrix.e, matrix.f]);
+}
+
+mpld3.matrixTransformation = mpld3_matrixTransformation;
+
+function mpld3_matrixTransformation(matrix, scale) {
+    // Decompose the SVG matrix [a, b, c, d, e, f] into the string returned
+    // by mpld3.getTransformation, without touching the DOM. The optional
+    // scale multiplies the linear part of the matrix.
+    scale = isUndefined(scale) ? 1 : scale;
+
     // Below calculations are taken and adapted from the private function
     // transform/decompose.js of D3's module d3-interpolate.
-    var a = matrix.a, b = matrix.b, c = matrix.c, d = matrix.d, e = matrix.e, f = matrix.f;
+    var a = matrix[0] * scale, b = matrix[1] * scale,
+        c = matrix[2] * scale, d = matrix[3] * scale,
+        e = matrix[4], f = matrix[5];
     var scaleX, scaleY, skewX;
     if (scaleX = Math.sqrt(a * a + b * b)) a /= scaleX, b /= scaleX;
     if (skewX = a * c + b * d) c -= a * skewX, d -= b * skewX;
@@ -163,7 +362,9 @@ mpld3.get_element = function(id, fig) {
             }
             for (var k = 0; k < ax.elements.length; k++) {
                 el = ax.elements[k];
-                if (el.props.id === id) {
+                // bars elements hold the ids of each of their bars
+                if (el.props.id === id ||
+                    (el.props.ids && el.props.ids.indexOf(id) !== -1)) {
                     return el;
                 }
             }
@@ -230,6 +431,119 @@ function getMod(L, i) {
     return (L.length > 0) ? L[i % L.length] : null;
 }
 
+/**********************************************************************/
+/* Encoded arrays: see mpld3.utils.encode_array in the python package */
+mpld3.decodeArray = mpld3_decodeArray;
+
+var mpld3_typedArrays = {
+    int8: Int8Array,
+    uint8: Uint8Array,
+    int16: Int16Array,
+    uint16: Uint16Array,
+    int32: Int32Array,
+    uint32: Uint32Array,
+    float32: Float32Array,
+    float64: Float64Array
+};
+
+var mpld3_base64Lookup = new Uint8Array(128);
+(function() {
+    var chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+    for (var i = 0; i < chars.length; i++) {
+        mpld3_base64Lookup[chars.charCodeAt(i)] = i;
+    }
+})();
+
+function mpld3_decodeArray(arr) {
+    // plain arrays (and null) are passed through unchanged
+    if (isUndefinedOrNull(arr) || !("base64" in arr)) {
+        return arr;
+    }
+    // decode by hand rather than with atob(), which is not available in
+    // every environment and creates an intermediate string.
+    var b64 = arr.base64;
+    var n = b64.length;
+    while (n > 0 && b64.charAt(n - 1) === "=") {
+        n--;
+    }
+    var bytes = new Uint8Array(Math.floor(n * 3 / 4));
+    for (var i = 0, j = 0; i < n; i += 4) {
+        var a = mpld3_base64Lookup[b64.charCodeAt(i)],
+            b = mpld3_base64Lookup[b64.charCodeAt(i + 1)],
+            c = mpld3_base64Lookup[b64.charCodeAt(i + 2)],
+            d = mpld3_base64Lookup[b64.charCodeAt(i + 3)];
+        bytes[j++] = (a << 2) | (b >> 4);
+        if (i + 2 < n) bytes[j++] = ((b & 15) << 4) | (c >> 2);
+        if (i + 3 < n) bytes[j++] = ((c & 3) << 6) | d;
+    }
+    return new mpld3_typedArrays[arr.dtype](bytes.buffer);
+}
+
+/**********************************************************************/
+/* Per-element style values, which are either a plain list of values or a
+   palette of values plus an (optionally run-length encoded) index array.
+   As for plain lists, element i uses entry i modulo the number of entries */
+mpld3.StyleArray = mpld3_StyleArray;
+
+function mpld3_StyleArray(values) {
+    if (isUndefinedOrNull(values) || !("palette" in values)) {
+        this.palette = values;
+        this.index = null;
+        return;
+    }
+    this.palette = values.palette;
+    this.index = mpld3_decodeArray(values.index);
+    if ("runs" in values) {
+        var runs = mpld3_decodeArray(values.runs);
+        var N = 0;
+        for (var i = 0; i < runs.length; i++) {
+            N += runs[i];
+        }
+        var index = new this.index.constructor(N);
+        for (var i = 0, j = 0; i < runs.length; j += runs[i], i++) {
+            index.fill(this.index[i], j, j + runs[i]);
+        }
+        this.index = index;
+    }
+}
+
+mpld3_StyleArray.prototype.get = function(i) {
+    if (this.index === null) {
+        return getMod(this.palette, i);
+    }
+    return this.palette[this.index[i % this.index.length]];
+};
+
+mpld3_StyleArray.prototype.paletteIndex = function(i) {
+    if (this.index === null) {
+        return i % this.palette.length;
+    }
+    return this.index[i % this.index.length];
+};
+
+mpld3_StyleArray.prototype.size = function() {
+    if (this.index === null) {
+        return isUndefinedOrNull(this.palette) ? 0 : this.palette.length;
+    }
+    return this.index.length;
+};
+
+mpld3.decodeVertices = mpld3_decodeVertices;
+
+function mpld3_decodeVertices(vertices) {
+    // Vertices are either a list of [x, y] pairs or an encoded array of
+    // shape [N, 2]; return them as a list of pairs.
+    var flat = mpld3_decodeArray(vertices);
+    if (flat === vertices) {
+        return vertices;
+    }
+    var pairs = new Array(flat.length / 2);
+    for (var i = 0; i < pairs.length; i++) {
+        pairs[i] = [flat[2 * i], flat[2 * i + 1]];
+    }
+    return pairs;
+}
+
 mpld3.path = function() {
     return mpld3_path();
 }
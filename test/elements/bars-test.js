@@ -0,0 +1,49 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert");
+
+var suite = vows.describe("mpld3.Bars");
+
+suite.addBatch({
+    "Bars": {
+        topic: load("elements/bars").document(),
+        "Palette colored bars": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var bars_props = {
+                    data: [[0, 0, 1, 2], [1, 0, 1, 4], [2, 0, 1, -1]],
+                    facecolors: {
+                        palette: ["#FF0000", "#0000FF"],
+                        index: {dtype: "uint8", shape: [3],
+                                base64: "AAEA"}
+                    }
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var bars = new mpld3.Bars(ax, bars_props);
+                ax.elements.push(bars);
+                fig.axes.push(ax);
+                fig.draw();
+                return bars;
+            },
+            "exposes the palette as props.": function(bars) {
+                assert.deepEqual(bars.props.facecolors, ["#FF0000", "#0000FF"]);
+            },
+            "has one SVG path per color.": function(bars) {
+                assert.deepEqual(bars.pathStrings(),
+                                 ["M 0 240 H 80 V 120 H 0 Z M 160 240 H 240 V 300 H 160 Z",
+                                  "M 80 240 H 160 V 0 H 80 Z"]);
+                assert.equal(bars.elements().size(), 2);
+            }
+        }
+    }
+});
+
+suite.export(module);
@@ -0,0 +1,49 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert"),
+    d3 = require("d3");
+
+var suite = vows.describe("mpld3.Errorbars");
+
+suite.addBatch({
+    "Errorbars": {
+        topic: load("elements/errorbars").document(),
+        "Errorbars with caps": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var errorbars_props = {
+                    data: [[1, 2, 0.5, 1.5, 1, 3]],
+                    xerrindex: [2, 3],
+                    yerrindex: [4, 5],
+                    capsize: 4
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var errorbars = new mpld3.Errorbars(ax, errorbars_props);
+                ax.elements.push(errorbars);
+                fig.axes.push(ax);
+                fig.draw();
+                return errorbars;
+            },
+            "has the expected whiskers and caps.": function(errorbars) {
+                assert.deepEqual(errorbars.pathStrings(),
+                                 ["M 40 120 H 120 M 80 180 V 60",
+                                  "M 40 118 v 4 M 120 118 v 4 M 78 180 h 4 M 78 60 h 4"]);
+            },
+            "keeps the cap size on zoom.": function(errorbars) {
+                var transform = d3.zoomIdentity.translate(10, 0).scale(2);
+                assert.equal(errorbars.pathStrings(transform)[1],
+                             "M 90 238 v 4 M 250 238 v 4 M 168 360 h 4 M 168 120 h 4");
+            }
+        }
+    }
+});
+
+suite.export(module);
@@ -0,0 +1,52 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert");
+
+var suite = vows.describe("mpld3.LineCollection");
+
+suite.addBatch({
+    "LineCollection": {
+        topic: load("elements/line_collection").document(),
+        "Palette colored segments": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var lc_props = {
+                    vertices: [[0, 0], [1, 1], [2, 0], [0, 4], [4, 4], [1, 0], [1, 2]],
+                    starts: [0, 3, 5],
+                    edgecolors: {
+                        palette: ["#FF0000", "#0000FF"],
+                        index: {dtype: "uint8", shape: [3],
+                                base64: "AAEA"}
+                    },
+                    edgewidths: [2]
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var lc = new mpld3.LineCollection(ax, lc_props);
+                ax.elements.push(lc);
+                fig.axes.push(ax);
+                fig.draw();
+                return lc;
+            },
+            "exposes the palette as props.": function(lc) {
+                assert.deepEqual(lc.props.edgecolors, ["#FF0000", "#0000FF"]);
+            },
+            "has one SVG path per style.": function(lc) {
+                var groups = lc.styleGroups();
+                assert.deepEqual(groups.map(function(g) { return g.d; }),
+                                 ["M 0 240 L 80 180 L 160 240 M 80 240 L 80 120",
+                                  "M 0 0 L 320 0"]);
+                assert.equal(lc.elements().size(), 2);
+            }
+        }
+    }
+});
+
+suite.export(module);
@@ -44,6 +44,99 @@ suite.addBatch({
             "has the expected style.": function(coll) {
                 assert.equal(coll.styleFunc([0, 0], 0), "stroke:#000000;stroke-width:1;fill:#0000FF;stroke-opacity:0;fill-opacity:0;");
             }
+        },
+        "A palette encoded Path collection": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var coll_props = {
+                    paths: [[[[0, 1], [1, 2], [2, 3]],
+                             ['M', 'L', 'L', 'Z']]],
+                    offsets: [[0, 0], [1, 1], [2, 2], [3, 3]],
+                    facecolors: {
+                        palette: ["#FF0000", "#00FF00"],
+                        index: {dtype: "uint8", shape: [4],
+                                base64: "AAEBAA=="}
+                    },
+                    edgewidths: {
+                        palette: [1, 3],
+                        index: {dtype: "uint8", shape: [2],
+                                base64: "AQA="},
+                        runs: {dtype: "uint32", shape: [2],
+                               base64: "AwAAAAEAAAA="}
+                    }
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var coll = new mpld3.PathCollection(ax, coll_props);
+                ax.elements.push(coll);
+                fig.axes.push(ax);
+                fig.draw();
+                return coll;
+            },
+            "exposes the palette as props.": function(coll) {
+                assert.deepEqual(coll.props.facecolors, ["#FF0000", "#00FF00"]);
+            },
+            "has the expected styles.": function(coll) {
+                assert.equal(coll.styleFunc([0, 0], 0), "stroke:#000000;stroke-width:3;fill:#FF0000;stroke-opacity:1;fill-opacity:1;");
+                assert.equal(coll.styleFunc([1, 1], 1), "stroke:#000000;stroke-width:3;fill:#00FF00;stroke-opacity:1;fill-opacity:1;");
+                assert.equal(coll.styleFunc([3, 3], 3), "stroke:#000000;stroke-width:1;fill:#FF0000;stroke-opacity:1;fill-opacity:1;");
+            }
+        },
+        "A Path collection with shared paths and scaled transforms": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var coll_props = {
+                    paths: {
+                        palette: [[[[0, 0], [1, 1]], ['M', 'L']],
+                                  [{dtype: "float64", shape: [3, 2],
+                                    base64: "AAAAAAAAAAAAAAAAAADwPwAAAAAAAPA/AAAAAAAAAEAAAAAAAAAAQAAAAAAAAAhA"},
+                                   ['M', 'L', 'L']]],
+                        index: {dtype: "uint8", shape: [3],
+                                base64: "AQAB"}
+                    },
+                    offsets: null,
+                    pathtransforms: {
+                        matrix: [1, 0, 0, 1, 0, 0],
+                        scales: {dtype: "float64", shape: [2],
+                                 base64: "AAAAAAAAAEAAAAAAAAAIQA=="}
+                    }
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var coll = new mpld3.PathCollection(ax, coll_props);
+                ax.elements.push(coll);
+                fig.axes.push(ax);
+                fig.draw();
+                return coll;
+            },
+            "has one offset per path.": function(coll) {
+                assert.equal(coll.offsets.length, 3);
+            },
+            "has the expected paths.": function(coll) {
+                assert.equal(coll.pathFunc(null, 0), "M 0 1 L 1 2 L 2 3");
+                assert.equal(coll.pathFunc(null, 1), "M 0 0 L 1 1");
+                assert.equal(coll.pathFunc(null, 2), "M 0 1 L 1 2 L 2 3");
+            },
+            "has the expected transforms.": function(coll) {
+                assert.equal(coll.transformFunc(null, 0),
+                             "translate(0, 0)translate(0,0)rotate(0)skewX(0)scale(2,2)");
+                assert.equal(coll.transformFunc(null, 1),
+                             "translate(0, 0)translate(0,0)rotate(0)skewX(0)scale(3,3)");
+            }
         }
     }
 });
@@ -0,0 +1,59 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert");
+
+var suite = vows.describe("mpld3.QuadMesh");
+
+suite.addBatch({
+    "QuadMesh": {
+        topic: load("elements/quadmesh").document(),
+        "Small rectilinear mesh": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                // cells [0, 1] x [0, 1] and [1, 2] x [0, 1] with values 0
+                // and 1, on a two color lookup table
+                var quadmesh_props = {
+                    x: {dtype: "float64", shape: [3],
+                        base64: "AAAAAAAAAAAAAAAAAADwPwAAAAAAAABA"},
+                    y: {dtype: "float64", shape: [2],
+                        base64: "AAAAAAAAAAAAAAAAAADwPw=="},
+                    values: {dtype: "float32", shape: [1, 2],
+                             base64: "AAAAAAAAgD8="},
+                    lut: {dtype: "uint8", shape: [5, 4],
+                          base64: "/wAA/wAA//8AAAAAAAAAAAD/AP8="}
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var quadmesh = new mpld3.QuadMesh(ax, quadmesh_props);
+                ax.elements.push(quadmesh);
+                fig.axes.push(ax);
+                fig.draw();
+                return quadmesh;
+            },
+            "maps values through the lookup table.": function(quadmesh) {
+                assert.deepEqual(Array.prototype.slice.call(quadmesh.colors),
+                                 [0, 1]);
+                assert.equal(quadmesh.colorIndex(NaN), 4);
+                assert.equal(quadmesh.colorIndex(-1), 2);
+                assert.equal(quadmesh.colorIndex(2), 3);
+            },
+            "has one SVG path per color.": function(quadmesh) {
+                assert.deepEqual(quadmesh.pathStrings(),
+                                 [{color: "rgba(255,0,0,1)",
+                                   d: "M 0 240 L 80 240 L 80 180 L 0 180 Z"},
+                                  {color: "rgba(0,0,255,1)",
+                                   d: "M 80 240 L 160 240 L 160 180 L 80 180 Z"}]);
+                assert.equal(quadmesh.elements().size(), 2);
+            }
+        }
+    }
+});
+
+suite.export(module);
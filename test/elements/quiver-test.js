@@ -0,0 +1,54 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert");
+
+var suite = vows.describe("mpld3.Quiver");
+
+suite.addBatch({
+    "Quiver": {
+        topic: load("elements/quiver").document(),
+        "Single arrow": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var quiver_props = {
+                    data: [[1, 1, 1, 0]],
+                    glyph: [[0, 0.5, 0], [-2, 0.5, 1], [-3, 2, 1], [0, 0, 1],
+                            [-3, -2, 1], [-2, -0.5, 1], [0, -0.5, 0]],
+                    scale: 10,
+                    facecolors: ["#FF0000"]
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var quiver = new mpld3.Quiver(ax, quiver_props);
+                ax.elements.push(quiver);
+                fig.axes.push(ax);
+                fig.draw();
+                return quiver;
+            },
+            "instances the glyph at the arrow length.": function(quiver) {
+                assert.deepEqual(quiver.pathStrings(),
+                                 ["M 80 179.5 L 88 179.5 L 87 178 L 90 180 " +
+                                  "L 87 182 L 88 180.5 L 80 180.5 Z"]);
+                assert.equal(quiver.elements().size(), 1);
+            },
+            "keeps the arrow size on zoom.": function(quiver) {
+                var transform = {
+                    applyX: function(x) { return 2 * x; },
+                    applyY: function(y) { return 2 * y; }
+                };
+                assert.deepEqual(quiver.pathStrings(transform),
+                                 ["M 160 359.5 L 168 359.5 L 167 358 L 170 360 " +
+                                  "L 167 362 L 168 360.5 L 160 360.5 Z"]);
+            }
+        }
+    }
+});
+
+suite.export(module);
@@ -0,0 +1,67 @@
+var vows = require("vows"),
+    load = require("../load"),
+    assert = require("assert"),
+    d3 = require("d3");
+
+var suite = vows.describe("mpld3.TiledImage");
+
+suite.addBatch({
+    "TiledImage": {
+        topic: load("elements/tiled_image").document(),
+        "Image of 1000 x 3000 pixels": {
+            topic: function(mpld3) {
+                var fig_props = {
+                    width: 400,
+                    height: 300
+                };
+                var ax_props = {
+                    xlim: [0, 4],
+                    ylim: [0, 4]
+                };
+                var image_props = {
+                    extent: [0, 4, 0, 4],
+                    shape: [1000, 3000],
+                    tilesize: 64,
+                    url: "tiles/{level}/{row}_{col}.png"
+                };
+                var fig = new mpld3.Figure("chart", fig_props);
+                var ax = new mpld3.Axes(fig, ax_props);
+                var image = new mpld3.TiledImage(ax, image_props);
+                ax.elements.push(image);
+                fig.axes.push(ax);
+                fig.draw();
+                return image;
+            },
+            "has a level per halving.": function(image) {
+                assert.equal(image.levels, 7);
+                assert.deepEqual(image.grid(2), [4, 12]);
+                assert.equal(image.tileUrl(2, 3, 11), "tiles/2/3_11.png");
+            },
+            "positions tiles within the extent.": function(image) {
+                var rect = image.tileRect(0, 0, 0);
+                assert.equal(rect[0], 0);
+                assert.equal(rect[1], 0);
+                assert.inDelta(rect[2], 320 * 64 / 3000, 1E-9);
+                assert.inDelta(rect[3], 240 * 64 / 1000, 1E-9);
+            },
+            "loads the level matching the zoom.": function(image) {
+                var tiles = image.visibleTiles(d3.zoomIdentity);
+                assert.equal(tiles.length, 1 + 48);
+                assert.equal(tiles[1].level, 2);
+                assert.equal(image.elements().size(), 49);
+            },
+            "loads only the tiles in view.": function(image) {
+                var transform = d3.zoomIdentity.scale(4);
+                var tiles = image.visibleTiles(transform);
+                assert.deepEqual(tiles[0], {level: 6, row: 0, col: 0});
+                assert.equal(tiles.length, 1 + 4 * 12);
+                tiles.slice(1).forEach(function(tile) {
+                    assert.equal(tile.level, 0);
+                    assert.ok(tile.row < 4 && tile.col < 12);
+                });
+            }
+        }
+    }
+});
+
+suite.export(module);